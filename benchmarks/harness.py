@@ -0,0 +1,570 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+A harness running the monitor skill against the mock chain.
+
+The skill is loaded from its package with a real agent context. Its
+envelopes are served by the ledger connection's own dispatchers, wired to
+a 'MockEthereumApi', and its signing requests by a decision maker
+stand-in signing with a local Ethereum key. Everything runs in a single
+asyncio loop, ticking the 'Monitoring' behaviour at its tick interval.
+"""
+
+import asyncio
+import logging
+import queue
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, cast
+
+from aea.configurations.base import ComponentType, SkillConfig
+from aea.configurations.loader import load_component_configuration
+from aea.connections.base import ConnectionStates
+from aea.context.base import AgentContext
+from aea.contracts.base import Contract
+from aea.crypto.registries import Registry
+from aea.helpers.async_utils import AsyncState
+from aea.identity.base import Identity
+from aea.mail.base import Envelope
+from aea.multiplexer import MultiplexerStatus, OutBox
+from aea.protocols.base import Message
+from aea.protocols.dialogue.base import Dialogue
+from aea.skills.base import Handler, Skill
+from aea.skills.tasks import TaskManager
+from aea_ledger_ethereum import EthereumCrypto
+
+from benchmarks.mock_chain import MockChain, MockEthereumApi, MockProvider, PACKAGES_DIR
+
+from packages.collectooor.skills.monitor.behaviours import Monitoring, Period
+from packages.collectooor.skills.monitor.signatures import SignatureClient
+from packages.fetchai.connections.ledger.base import RequestDispatcher
+from packages.fetchai.connections.ledger.broadcast import (
+    Broadcaster,
+    get_endpoint_label,
+)
+from packages.fetchai.connections.ledger.contract_dispatcher import (
+    ContractApiRequestDispatcher,
+)
+from packages.fetchai.connections.ledger.fees import FeeOracle
+from packages.fetchai.connections.ledger.ledger_dispatcher import (
+    LedgerApiRequestDispatcher,
+)
+from packages.fetchai.connections.ledger.metrics import LedgerConnectionMetrics
+from packages.fetchai.connections.ledger.pool import EndpointPool
+from packages.fetchai.protocols.contract_api import ContractApiMessage
+from packages.fetchai.protocols.ledger_api import LedgerApiMessage
+from packages.open_aea.protocols.signing import SigningMessage
+from packages.open_aea.protocols.signing.custom_types import (
+    RawMessage,
+    RawTransaction,
+    SignedMessage,
+    SignedMessages,
+    SignedTransaction,
+    SignedTransactions,
+)
+from packages.open_aea.protocols.signing.dialogues import (
+    SigningDialogue as BaseSigningDialogue,
+)
+from packages.open_aea.protocols.signing.dialogues import (
+    SigningDialogues as BaseSigningDialogues,
+)
+
+
+SKILL_DIR = PACKAGES_DIR / "collectooor/skills/monitor"
+CONTRACT_DIRS = [
+    PACKAGES_DIR / "collectooor/contracts/artblocks",
+    PACKAGES_DIR / "collectooor/contracts/artblocks_periphery",
+    PACKAGES_DIR / "valory/contracts/gnosis_safe",
+]
+DECISION_MAKER_ADDRESS = "decision_maker"
+LEDGER_ID = "ethereum"
+# the addresses of the endpoints of the mock chain, the first one being the default
+ENDPOINT_ADDRESS = "http://127.0.0.1:{port}"
+DEFAULT_PORT = 8545
+
+_logger = logging.getLogger("benchmarks.harness")
+
+
+class _MockLedgerApiRegistry:  # pylint: disable=too-few-public-methods
+    """A registry making the mock-backed ledger API of an endpoint, the default one if unknown."""
+
+    def __init__(
+        self,
+        api: MockEthereumApi,
+        apis_by_address: Optional[Dict[str, MockEthereumApi]] = None,
+    ) -> None:
+        """Initialize the registry."""
+        self.api = api
+        self.apis_by_address = apis_by_address or {}
+
+    def make(
+        self, *_args: Any, address: Optional[str] = None, **_kwargs: Any
+    ) -> MockEthereumApi:
+        """Make the ledger API."""
+        return self.apis_by_address.get(cast(str, address), self.api)
+
+
+class MockLedgerApiRequestDispatcher(LedgerApiRequestDispatcher):
+    """The ledger API dispatcher of the connection, on the mock ledger API."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the dispatcher."""
+        self._mock_registry = _MockLedgerApiRegistry(
+            kwargs.pop("api"), kwargs.pop("apis_by_address", None)
+        )
+        self.TIMEOUT = kwargs.pop(  # pylint: disable=invalid-name
+            "receipt_poll_interval", self.TIMEOUT
+        )
+        super().__init__(*args, **kwargs)
+
+    @property
+    def ledger_api_registry(self) -> Registry:
+        """Get the registry."""
+        return cast(Registry, self._mock_registry)
+
+
+class MockContractApiRequestDispatcher(ContractApiRequestDispatcher):
+    """The contract API dispatcher of the connection, on the mock ledger API."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the dispatcher."""
+        self._mock_registry = _MockLedgerApiRegistry(
+            kwargs.pop("api"), kwargs.pop("apis_by_address", None)
+        )
+        super().__init__(*args, **kwargs)
+
+    @property
+    def ledger_api_registry(self) -> Registry:
+        """Get the registry."""
+        return cast(Registry, self._mock_registry)
+
+
+class _Multiplexer:  # pylint: disable=too-few-public-methods
+    """The part of the multiplexer the outbox relies on."""
+
+    def __init__(self) -> None:
+        """Initialize the multiplexer."""
+        self.logger = _logger
+        self.envelopes: "queue.Queue[Envelope]" = queue.Queue()
+
+    def put(self, envelope: Envelope) -> None:
+        """Put an envelope in the out queue."""
+        self.envelopes.put_nowait(envelope)
+
+
+class DecisionMakerDialogues(BaseSigningDialogues):
+    """The signing dialogues, on the decision maker's side."""
+
+    def __init__(self) -> None:
+        """Initialize the dialogues."""
+
+        def role_from_first_message(  # pylint: disable=unused-argument
+            message: Message, receiver_address: str
+        ) -> Dialogue.Role:
+            return BaseSigningDialogue.Role.DECISION_MAKER
+
+        super().__init__(
+            self_address=DECISION_MAKER_ADDRESS,
+            role_from_first_message=role_from_first_message,
+        )
+
+
+class DecisionMaker:  # pylint: disable=too-few-public-methods
+    """A decision maker stand-in, signing every request with a local key."""
+
+    def __init__(self, crypto: EthereumCrypto) -> None:
+        """Initialize the decision maker."""
+        self.crypto = crypto
+        self.dialogues = DecisionMakerDialogues()
+        self.n_requests = 0
+        self.n_signatures = 0
+
+    def handle(self, message: SigningMessage) -> SigningMessage:
+        """Sign the message(s) or transaction(s) of a signing request."""
+        dialogue = self.dialogues.update(message)
+        if dialogue is None:
+            raise ValueError(f"invalid signing request: {message}")
+        self.n_requests += 1
+        performative = message.performative
+        if performative == SigningMessage.Performative.SIGN_MESSAGE:
+            reply: Dict[str, Any] = dict(
+                performative=SigningMessage.Performative.SIGNED_MESSAGE,
+                signed_message=self._sign_message(message.raw_message),
+            )
+        elif performative == SigningMessage.Performative.SIGN_MESSAGES:
+            reply = dict(
+                performative=SigningMessage.Performative.SIGNED_MESSAGES,
+                signed_messages=SignedMessages(
+                    map(self._sign_message, message.raw_messages)
+                ),
+            )
+        elif performative == SigningMessage.Performative.SIGN_TRANSACTION:
+            reply = dict(
+                performative=SigningMessage.Performative.SIGNED_TRANSACTION,
+                signed_transaction=self._sign_transaction(message.raw_transaction),
+            )
+        else:
+            reply = dict(
+                performative=SigningMessage.Performative.SIGNED_TRANSACTIONS,
+                signed_transactions=SignedTransactions(
+                    map(self._sign_transaction, message.raw_transactions)
+                ),
+            )
+        return cast(SigningMessage, dialogue.reply(target_message=message, **reply))
+
+    def _sign_message(self, raw_message: RawMessage) -> SignedMessage:
+        """Sign a message."""
+        self.n_signatures += 1
+        signature = self.crypto.sign_message(
+            raw_message.body, is_deprecated_mode=raw_message.is_deprecated_mode
+        )
+        return SignedMessage(
+            raw_message.ledger_id,
+            signature,
+            is_deprecated_mode=raw_message.is_deprecated_mode,
+        )
+
+    def _sign_transaction(self, raw_transaction: RawTransaction) -> SignedTransaction:
+        """Sign a transaction."""
+        self.n_signatures += 1
+        return SignedTransaction(
+            raw_transaction.ledger_id,
+            self.crypto.sign_transaction(raw_transaction.body),
+        )
+
+
+class CoSigner:  # pylint: disable=too-few-public-methods
+    """A co-owner of the Safe, signing the hashes pending on the signature service."""
+
+    def __init__(
+        self, crypto: EthereumCrypto, client: SignatureClient, delay: float = 0.0
+    ) -> None:
+        """
+        Initialize the co-signer.
+
+        :param crypto: the key of the co-owner.
+        :param client: the client of the signature service.
+        :param delay: seconds the co-owner takes to review and sign a hash.
+        """
+        self.crypto = crypto
+        self.client = client
+        self.delay = delay
+        self.n_signatures = 0
+
+    async def run(self, poll_interval: float = 0.05) -> None:
+        """Sign the pending hashes until cancelled."""
+        loop = asyncio.get_event_loop()
+        while True:
+            pending = await loop.run_in_executor(
+                None, self.client.get_pending, self.crypto.address
+            )
+            for state in pending:
+                await asyncio.sleep(self.delay)
+                signature = self.crypto.sign_message(
+                    bytes.fromhex(state["safe_tx_hash"]), is_deprecated_mode=True
+                )
+                await loop.run_in_executor(
+                    None,
+                    self.client.submit,
+                    state["safe_tx_hash"],
+                    self.crypto.address,
+                    signature,
+                )
+                self.n_signatures += 1
+            await asyncio.sleep(poll_interval)
+
+
+class SkillRunner:  # pylint: disable=too-many-instance-attributes
+    """Run the monitor skill against a mock chain."""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        chain: MockChain,
+        provider: MockProvider,
+        crypto: EthereumCrypto,
+        monitoring_args: Optional[Dict[str, Any]] = None,
+        requests_args: Optional[Dict[str, Any]] = None,
+        receipt_poll_interval: float = 0.5,
+        decision_maker_latency: float = 0.0,
+        fee_oracle: Optional[FeeOracle] = None,
+        broadcast_providers: Optional[List[MockProvider]] = None,
+        pool_providers: Optional[List[MockProvider]] = None,
+        check_interval: float = 1.0,
+    ) -> None:
+        """
+        Initialize the runner.
+
+        :param chain: the mock chain.
+        :param provider: the provider serving the chain.
+        :param crypto: the key of the agent, an owner of the Safe.
+        :param monitoring_args: overrides of the 'Monitoring' behaviour arguments.
+        :param requests_args: overrides of the 'Requests' model arguments.
+        :param receipt_poll_interval: seconds between two receipt polls of the connection.
+        :param decision_maker_latency: seconds the decision maker takes per request, one request at a time.
+        :param fee_oracle: the fee oracle of the ledger connection, if any.
+        :param broadcast_providers: the providers of more endpoints of the chain, which signed transactions are broadcast to as well.
+        :param pool_providers: the providers of more endpoints of the chain, which requests are routed to by an endpoint pool.
+        :param check_interval: seconds between two health checks of the endpoint pool.
+        """
+        self.chain = chain
+        self.provider = provider
+        self.crypto = crypto
+        self.api = MockEthereumApi(provider)
+        self.broadcast_apis = {
+            ENDPOINT_ADDRESS.format(port=DEFAULT_PORT + index): MockEthereumApi(
+                broadcast_provider
+            )
+            for index, broadcast_provider in enumerate(broadcast_providers or [], 1)
+        }
+        self.pool_apis = {
+            ENDPOINT_ADDRESS.format(port=DEFAULT_PORT + index): MockEthereumApi(
+                pool_provider
+            )
+            for index, pool_provider in enumerate(
+                pool_providers or [], len(self.broadcast_apis) + 1
+            )
+        }
+        self.metrics = LedgerConnectionMetrics()
+        self.fee_oracle = fee_oracle
+        self.broadcaster = Broadcaster(self.metrics, logger=_logger)
+        self.endpoint_pool = EndpointPool(
+            self.metrics, check_interval=check_interval, logger=_logger
+        )
+        self.decision_maker = DecisionMaker(crypto)
+        self._multiplexer = _Multiplexer()
+        self._decision_maker_queue: "queue.Queue[Message]" = queue.Queue()
+        self._data_dir = tempfile.TemporaryDirectory()
+        self._tasks: List[asyncio.Task] = []
+        self._connection_state = AsyncState(
+            ConnectionStates.connected, ConnectionStates
+        )
+        self._receipt_poll_interval = receipt_poll_interval
+        self._decision_maker_latency = decision_maker_latency
+        # monotonic time the decision maker is done with its queued requests
+        self._decision_maker_free_at = 0.0
+        self.n_handler_errors = 0
+        self.n_act_errors = 0
+        # the skill only keeps summaries of the finished periods
+        self._periods: Dict[int, Period] = {}
+        for directory in CONTRACT_DIRS:
+            Contract.from_dir(str(directory))
+        self.skill = self._load_skill(monitoring_args or {}, requests_args or {})
+        self._handlers: Dict[str, Handler] = {
+            str(handler.SUPPORTED_PROTOCOL): handler
+            for handler in self.skill.handlers.values()
+        }
+
+    @property
+    def endpoints(self) -> List[str]:
+        """Get the labels of the endpoints of the chain, the default one first."""
+        return [
+            get_endpoint_label(address)
+            for address in [
+                ENDPOINT_ADDRESS.format(port=DEFAULT_PORT),
+                *self.broadcast_apis,
+                *self.pool_apis,
+            ]
+        ]
+
+    @property
+    def providers(self) -> List[MockProvider]:
+        """Get the providers of all the endpoints, in the order of 'endpoints'."""
+        return [
+            cast(MockProvider, api.api.provider)
+            for api in [
+                self.api,
+                *self.broadcast_apis.values(),
+                *self.pool_apis.values(),
+            ]
+        ]
+
+    @property
+    def monitoring(self) -> Monitoring:
+        """Get the monitoring behaviour."""
+        return cast(Monitoring, self.skill.behaviours["monitoring"])
+
+    @property
+    def periods(self) -> List[Period]:
+        """Get the periods started so far."""
+        self._periods.update(self.monitoring.in_flight_periods)
+        return list(self._periods.values())
+
+    def _load_skill(
+        self, monitoring_args: Dict[str, Any], requests_args: Dict[str, Any]
+    ) -> Skill:
+        """Load the monitor skill, with a real agent context."""
+        configuration = cast(
+            SkillConfig,
+            load_component_configuration(
+                ComponentType.SKILL, SKILL_DIR, skip_consistency_check=True
+            ),
+        )
+        configuration.directory = SKILL_DIR
+        configuration.behaviours.read("monitoring").args.update(monitoring_args)
+        configuration.models.read("requests").args.update(requests_args)
+        identity = Identity(
+            "collectooor",
+            address=self.crypto.address,
+            public_key=self.crypto.public_key,
+        )
+        agent_context = AgentContext(
+            identity=identity,
+            connection_status=MultiplexerStatus(),
+            outbox=OutBox(cast(Any, self._multiplexer)),
+            decision_maker_message_queue=self._decision_maker_queue,
+            decision_maker_handler_context=SimpleNamespace(),
+            task_manager=TaskManager(),
+            default_ledger_id=LEDGER_ID,
+            currency_denominations={},
+            default_connection=None,
+            default_routing={},
+            search_service_address="search_service",
+            decision_maker_address=DECISION_MAKER_ADDRESS,
+            data_dir=self._data_dir.name,
+        )
+        return Skill.from_config(configuration, agent_context)
+
+    def _make_dispatchers(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> Dict[str, RequestDispatcher]:
+        """Make the dispatchers of the ledger connection."""
+        state = self._connection_state
+        config: Dict[str, Any] = {
+            "address": ENDPOINT_ADDRESS.format(port=DEFAULT_PORT),
+            "broadcast_addresses": list(self.broadcast_apis),
+        }
+        common: Dict[str, Any] = dict(
+            logger=_logger,
+            loop=loop,
+            api=self.api,
+            apis_by_address={**self.broadcast_apis, **self.pool_apis},
+            api_configs={
+                LEDGER_ID: (
+                    [config, *({"address": address} for address in self.pool_apis)]
+                    if len(self.pool_apis) > 0
+                    else config
+                )
+            },
+            metrics=self.metrics,
+            fee_oracle=self.fee_oracle,
+            endpoint_pool=self.endpoint_pool,
+        )
+        return {
+            LedgerApiMessage.protocol_specification_id: MockLedgerApiRequestDispatcher(
+                connection_state=state,
+                receipt_poll_interval=self._receipt_poll_interval,
+                broadcaster=self.broadcaster,
+                **common,
+            ),
+            ContractApiMessage.protocol_specification_id: MockContractApiRequestDispatcher(
+                connection_state=state, **common
+            ),
+        }
+
+    def _deliver(self, message: Message) -> None:
+        """Deliver a response message to the skill handler of its protocol."""
+        handler = self._handlers.get(str(message.protocol_id))
+        if handler is None:
+            _logger.warning(f"no handler for protocol {message.protocol_id}")
+            return
+        try:
+            handler.handle(message)
+        except Exception as e:  # pylint: disable=broad-except
+            self.n_handler_errors += 1
+            _logger.warning(f"handler of {message.protocol_id} failed: {e!r}")
+
+    async def _serve(self, dispatcher: RequestDispatcher, envelope: Envelope) -> None:
+        """Serve an envelope with the connection dispatcher and deliver the response."""
+        response = await dispatcher.dispatch(envelope)
+        if response is not None:
+            self._deliver(cast(Message, response))
+
+    def _pump(self, dispatchers: Dict[str, RequestDispatcher]) -> None:
+        """Route the requests the skill has sent since the last pump."""
+        while not self._multiplexer.envelopes.empty():
+            envelope = self._multiplexer.envelopes.get_nowait()
+            dispatcher = dispatchers[str(envelope.protocol_specification_id)]
+            self._tasks.append(asyncio.ensure_future(self._serve(dispatcher, envelope)))
+        while not self._decision_maker_queue.empty():
+            message = cast(SigningMessage, self._decision_maker_queue.get_nowait())
+            response = self.decision_maker.handle(message)
+            if self._decision_maker_latency <= 0:
+                self._deliver(response)
+                continue
+            # the decision maker serves its queue in order, in a thread of its own
+            self._decision_maker_free_at = (
+                max(self._decision_maker_free_at, time.monotonic())
+                + self._decision_maker_latency
+            )
+            asyncio.get_event_loop().call_at(
+                self._decision_maker_free_at, self._deliver, response
+            )
+        self._tasks = [task for task in self._tasks if not task.done()]
+
+    async def run(
+        self, duration: float, until: Optional[Callable[[], bool]] = None
+    ) -> float:
+        """
+        Run the skill for a given duration.
+
+        :param duration: the duration, in seconds.
+        :param until: a condition stopping the run early once true.
+        :return: the actual elapsed time, in seconds.
+        """
+        loop = asyncio.get_event_loop()
+        dispatchers = {
+            str(spec_id): dispatcher
+            for spec_id, dispatcher in self._make_dispatchers(loop).items()
+        }
+        for component in [
+            *self.skill.models.values(),
+            *self.skill.handlers.values(),
+            *self.skill.behaviours.values(),
+        ]:
+            component.setup()
+        await self.endpoint_pool.start()
+        monitoring = self.monitoring
+        started_at = time.monotonic()
+        next_tick = started_at
+        while time.monotonic() - started_at < duration and not (
+            until is not None and until()
+        ):
+            now = time.monotonic()
+            if now >= next_tick:
+                try:
+                    monitoring.act()
+                except Exception as e:  # pylint: disable=broad-except
+                    self.n_act_errors += 1
+                    _logger.warning(f"act of the monitoring behaviour failed: {e!r}")
+                next_tick = now + monitoring.tick_interval
+            self._pump(dispatchers)
+            self._periods.update(monitoring.in_flight_periods)
+            await asyncio.sleep(min(0.01, max(next_tick - time.monotonic(), 0)))
+        elapsed = time.monotonic() - started_at
+        for task in self._tasks:
+            task.cancel()
+        # stops the receipt polls of the dispatchers, as on disconnection
+        self._connection_state.set(ConnectionStates.disconnected)
+        monitoring.teardown()
+        await self.endpoint_pool.stop()
+        self.broadcaster.close()
+        self._data_dir.cleanup()
+        return elapsed
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+Load fixture: a chain populated with thousands of ArtBlocks projects.
+
+Usage:
+
+    python -m benchmarks.load_fixture --n-projects 5000 --sold-out 0.7 --seed 7
+
+The build files of the ArtBlocks core and minter only ship their ABI, so
+they cannot be deployed to an EVM; the projects are populated in the mock
+chain instead, which answers the same calls. The project mix and prices
+are drawn from a seeded generator, so the fixture is reproducible.
+
+Three scenarios run against the fixture, each reporting its wall time and
+RPC calls: the scan of all the candidate projects with 'get_active_project',
+'purchase_data' on the first candidate, and the full buy path of the
+monitor skill, up to the receipt of its first purchase.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Tuple
+
+from aea.contracts.base import Contract
+from aea_ledger_ethereum import EthereumCrypto
+
+from benchmarks.harness import CONTRACT_DIRS, SkillRunner
+from benchmarks.mock_chain import (
+    ARTBLOCKS_ADDRESS,
+    MINTER_ADDRESS,
+    MockChain,
+    MockEthereumApi,
+    MockProvider,
+)
+
+from packages.collectooor.contracts.artblocks.contract import ArtBlocksContract
+from packages.collectooor.contracts.artblocks_periphery.contract import (
+    ArtBlocksPeripheryContract,
+)
+
+
+WEI_PER_ETH = 10 ** 18
+PRICE_DISTRIBUTIONS = ("uniform", "lognormal")
+
+
+class ProjectMix:  # pylint: disable=too-few-public-methods
+    """The shares of the project states in a fixture."""
+
+    STATES = ("inactive", "active", "paused", "sold_out")
+
+    def __init__(
+        self,
+        active: float = 0.05,
+        paused: float = 0.05,
+        sold_out: float = 0.7,
+    ) -> None:
+        """
+        Initialize the mix; the remaining share of projects is inactive.
+
+        :param active: the share of active projects with mints left.
+        :param paused: the share of active but paused projects.
+        :param sold_out: the share of active projects with no mints left.
+        """
+        inactive = 1.0 - active - paused - sold_out
+        if min(active, paused, sold_out, inactive) < 0:
+            raise ValueError("the shares of the project states must sum up to <= 1")
+        self.weights = (inactive, active, paused, sold_out)
+
+    def draw(self, rng: random.Random) -> str:
+        """Draw the state of a project."""
+        return rng.choices(self.STATES, weights=self.weights)[0]
+
+
+def draw_price(
+    rng: random.Random, distribution: str, median_eth: float, spread: float
+) -> int:
+    """
+    Draw the price of a project, in wei.
+
+    :param rng: the random generator.
+    :param distribution: 'uniform', between median / spread and median * spread,
+        or 'lognormal', with the given median and log-scale deviation.
+    :param median_eth: the median price, in ETH.
+    :param spread: the spread of the distribution.
+    :return: the price.
+    """
+    if distribution == "uniform":
+        price = rng.uniform(median_eth / spread, median_eth * spread)
+    elif distribution == "lognormal":
+        price = median_eth * rng.lognormvariate(0.0, spread)
+    else:
+        raise ValueError(f"unknown price distribution {distribution}")
+    return int(price * WEI_PER_ETH)
+
+
+def populate(  # pylint: disable=too-many-arguments
+    chain: MockChain,
+    n_projects: int,
+    mix: ProjectMix,
+    distribution: str = "lognormal",
+    median_eth: float = 0.15,
+    spread: float = 1.0,
+    seed: int = 0,
+) -> Counter:
+    """
+    Populate a chain with projects.
+
+    :param chain: the chain.
+    :param n_projects: the number of projects.
+    :param mix: the mix of project states.
+    :param distribution: the price distribution.
+    :param median_eth: the median price, in ETH.
+    :param spread: the spread of the price distribution.
+    :param seed: the seed of the random generator.
+    :return: the number of projects per state.
+    """
+    rng = random.Random(seed)
+    counts: Counter = Counter()
+    for _ in range(n_projects):
+        state = mix.draw(rng)
+        counts[state] += 1
+        max_invocations = rng.choice((128, 256, 512, 1000))
+        chain.add_project(
+            draw_price(rng, distribution, median_eth, spread),
+            active=state != "inactive",
+            paused=state == "paused",
+            max_invocations=max_invocations,
+            invocations=(
+                max_invocations
+                if state == "sold_out"
+                else rng.randrange(max_invocations)
+            ),
+        )
+    return counts
+
+
+def timed(provider: MockProvider, func: Callable[[], Any]) -> Tuple[Any, Dict]:
+    """Call a function, measuring its wall time and the RPC calls it makes."""
+    rpc_calls = sum(provider.rpc_calls.values())
+    started_at = time.perf_counter()
+    result = func()
+    return result, {
+        "wall_time_seconds": round(time.perf_counter() - started_at, 4),
+        "rpc_calls": sum(provider.rpc_calls.values()) - rpc_calls,
+    }
+
+
+def scan_candidates(api: MockEthereumApi) -> Tuple[int, Any]:
+    """
+    Walk all the candidate projects, as the skill does when none is acceptable.
+
+    :param api: the ledger API.
+    :return: the number of candidates and the first one.
+    """
+    first = None
+    n_candidates = 0
+    starting_id = None
+    while True:
+        project = ArtBlocksContract.get_active_project(
+            api, ARTBLOCKS_ADDRESS, starting_id=starting_id
+        )
+        if project["project_id"] is None:
+            return n_candidates, first
+        first = first if first is not None else project
+        n_candidates += 1
+        starting_id = project["project_id"]
+
+
+def run_buy_path(
+    chain: MockChain, provider: MockProvider, crypto: EthereumCrypto, timeout: float
+) -> Dict[str, Any]:
+    """Run the monitor skill until its first purchase has a receipt."""
+    runner = SkillRunner(
+        chain,
+        provider,
+        crypto,
+        monitoring_args={"tick_interval": 0.05},
+        receipt_poll_interval=0.1,
+    )
+    rpc_calls = sum(provider.rpc_calls.values())
+    elapsed = asyncio.get_event_loop().run_until_complete(
+        runner.run(
+            timeout,
+            until=lambda: any(p.tx_receipt is not None for p in runner.periods),
+        )
+    )
+    period = runner.periods[0]
+    project = chain.projects.get(period.active_project or 0)
+    return {
+        "wall_time_seconds": round(elapsed, 4),
+        "rpc_calls": sum(provider.rpc_calls.values()) - rpc_calls,
+        "completed": period.tx_receipt is not None,
+        "project_id": period.active_project,
+        "project_sold_out": (
+            project is not None and project.invocations >= project.max_invocations
+        ),
+        "mint_succeeded": any(chain.safe_executions.values()),
+        "stage_durations": {
+            stage: round(duration, 4)
+            for stage, duration in period.timeline.durations().items()
+        },
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--n-projects", type=int, default=5000)
+    parser.add_argument("--active", type=float, default=0.05)
+    parser.add_argument("--paused", type=float, default=0.05)
+    parser.add_argument("--sold-out", type=float, default=0.7)
+    parser.add_argument(
+        "--price-distribution", choices=PRICE_DISTRIBUTIONS, default="lognormal"
+    )
+    parser.add_argument("--median-price", type=float, default=0.15, help="in ETH")
+    parser.add_argument("--price-spread", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="mean RPC latency, in seconds"
+    )
+    parser.add_argument("--block-time", type=float, default=0.5)
+    parser.add_argument(
+        "--buy-timeout", type=float, default=120.0, help="seconds to wait for a buy"
+    )
+    parser.add_argument("--skip-buy", action="store_true")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Build the fixture and run the scenarios against it."""
+    args = parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    crypto = EthereumCrypto()
+    chain = MockChain([crypto.address], block_time=args.block_time)
+    counts = populate(
+        chain,
+        args.n_projects,
+        ProjectMix(args.active, args.paused, args.sold_out),
+        distribution=args.price_distribution,
+        median_eth=args.median_price,
+        spread=args.price_spread,
+        seed=args.seed,
+    )
+    provider = MockProvider(chain, latency=args.latency, seed=args.seed)
+    api = MockEthereumApi(provider)
+    for directory in CONTRACT_DIRS:
+        Contract.from_dir(str(directory))
+    report: Dict[str, Any] = {"fixture": dict(counts)}
+
+    (n_candidates, first), report["scan"] = timed(
+        provider, lambda: scan_candidates(api)
+    )
+    report["scan"]["candidates"] = n_candidates
+    if first is not None:
+        _, report["purchase_data"] = timed(
+            provider,
+            lambda: ArtBlocksPeripheryContract.purchase_data(
+                api, MINTER_ADDRESS, first["project_id"]
+            ),
+        )
+    if not args.skip_buy and first is not None:
+        report["buy"] = run_buy_path(chain, provider, crypto, args.buy_timeout)
+    report["rpc_calls_by_method"] = dict(provider.rpc_calls.most_common())
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
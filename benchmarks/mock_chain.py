@@ -0,0 +1,978 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+An in-memory chain, served through a latency-injecting web3 provider.
+
+The chain models the state the agent reads and writes: the ArtBlocks core
+projects, the Safe and the accounts' nonces. Every JSON-RPC call made by
+the contract packages and the ledger connection goes through the
+'MockProvider', which counts it, delays it by a configurable latency and
+jitter, and fails it at a configurable rate.
+"""
+
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import rlp
+from aea_ledger_ethereum import EthereumApi
+from eth_abi import decode_abi, encode_abi, encode_single
+from eth_account import Account
+from eth_utils import function_abi_to_4byte_selector, keccak, to_checksum_address
+from hexbytes import HexBytes
+from web3 import Web3
+from web3._utils.abi import get_abi_input_types, get_abi_output_types
+from web3.providers.base import BaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from packages.valory.contracts.gnosis_safe.contract import (
+    MULTISEND_CALL_ONLY_CONTRACT,
+    MULTISEND_SELECTOR,
+)
+
+
+ROOT_DIR = Path(__file__).parent.parent
+PACKAGES_DIR = ROOT_DIR / "packages"
+ARTBLOCKS_BUILD = PACKAGES_DIR / "collectooor/contracts/artblocks/build/artblocks.json"
+MINTER_BUILD = (
+    PACKAGES_DIR / "collectooor/contracts/artblocks_periphery/build/Minter.json"
+)
+SAFE_BUILD = PACKAGES_DIR / "valory/contracts/gnosis_safe/build/GnosisSafe_V1_3_0.json"
+
+# the defaults of the monitor skill
+ARTBLOCKS_ADDRESS = "0x1CD623a86751d4C4f20c96000FEC763941f098A2"
+MINTER_ADDRESS = "0x58727f5Fc3705C30C9aDC2bcCC787AB2BA24c441"
+SAFE_ADDRESS = "0x2caB92c1E9D2a701Ca0411b0ff35A0907Ca31F7f"
+
+SAFE_VERSION = "1.3.0"
+SIGNATURE_LENGTH = 65
+DEFAULT_CHAIN_ID = 1337
+DEFAULT_GAS_PRICE = 20 * 10 ** 9
+DEFAULT_BASE_FEE = 15 * 10 ** 9
+DEFAULT_PRIORITY_FEE = 2 * 10 ** 9
+# the gas used by a Safe transaction, and by each call it makes
+SAFE_BASE_GAS = 50000
+CALL_GAS = 70000
+GAS_ESTIMATE_MARGIN = 30000
+DEFAULT_GAS_USED = SAFE_BASE_GAS + CALL_GAS
+BLOCK_GAS_LIMIT = 30000000
+# the least raise of the fees of a pending transaction replacing another
+MIN_REPLACEMENT_FEE_BUMP = 1.1
+
+
+def load_abi(path: Path) -> List[Dict[str, Any]]:
+    """Load the ABI of a contract build file."""
+    abi = json.loads(path.read_text())["abi"]
+    return json.loads(abi) if isinstance(abi, str) else abi
+
+
+class Project:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """An ArtBlocks project."""
+
+    __slots__ = (
+        "project_id",
+        "name",
+        "artist",
+        "artist_address",
+        "price_per_token_in_wei",
+        "invocations",
+        "max_invocations",
+        "active",
+        "paused",
+        "start_timestamp",
+        "scripts",
+        "ipfs_hash",
+        "description",
+        "website",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        project_id: int,
+        price_per_token_in_wei: int,
+        active: bool = True,
+        paused: bool = False,
+        max_invocations: int = 1000,
+        invocations: int = 0,
+        script: str = "",
+        start_timestamp: Optional[int] = None,
+    ) -> None:
+        """Initialize the project."""
+        self.project_id = project_id
+        self.name = f"Project {project_id}"
+        self.artist = f"Artist {project_id}"
+        self.artist_address = to_checksum_address(
+            keccak(text=f"artist-{project_id}")[:20]
+        )
+        self.price_per_token_in_wei = price_per_token_in_wei
+        self.invocations = invocations
+        self.max_invocations = max_invocations
+        self.active = active
+        self.paused = paused
+        # if set, the project is active from the first block at or after it
+        self.start_timestamp = start_timestamp
+        self.scripts = [script or f"let seed = {project_id}; draw(seed);"]
+        self.ipfs_hash = "Qm" + keccak(text=f"ipfs-{project_id}").hex()[:44]
+        self.description = f"Generative project number {project_id}."
+        self.website = f"https://example.com/{project_id}"
+
+
+class PendingTransaction:  # pylint: disable=too-few-public-methods
+    """A transaction accepted by the chain."""
+
+    __slots__ = (
+        "digest",
+        "sender",
+        "nonce",
+        "to",
+        "value",
+        "data",
+        "gas",
+        "fees",
+        "block",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        digest: str,
+        sender: str,
+        nonce: int,
+        to: str,
+        value: int,
+        data: bytes,
+        gas: int,
+        fees: Dict[str, int],
+        block: int,
+    ) -> None:
+        """Initialize the transaction."""
+        self.digest = digest
+        self.sender = sender
+        self.nonce = nonce
+        self.to = to
+        self.value = value
+        self.data = data
+        self.gas = gas
+        self.fees = fees
+        self.block = block
+
+
+class MockChain:  # pylint: disable=too-many-instance-attributes
+    """The state of an in-memory chain, with blocks produced at a fixed cadence."""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        safe_owners: List[str],
+        safe_threshold: int = 1,
+        block_time: float = 2.0,
+        chain_id: int = DEFAULT_CHAIN_ID,
+        gas_price: int = DEFAULT_GAS_PRICE,
+        min_gas_price: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the chain.
+
+        :param safe_owners: the owners of the Safe.
+        :param safe_threshold: the threshold of the Safe.
+        :param block_time: the seconds between two blocks.
+        :param chain_id: the chain id.
+        :param gas_price: the (legacy) gas price.
+        :param min_gas_price: the least gas price of a transaction included in a block; cheaper ones stay pending, and so do the next ones of their sender.
+        :param clock: the monotonic clock.
+        """
+        self.lock = threading.RLock()
+        self.clock = clock
+        self.genesis = clock()
+        self.genesis_timestamp = int(time.time())
+        self.block_time = block_time
+        self.chain_id = chain_id
+        self.gas_price = gas_price
+        self.min_gas_price = min_gas_price
+        self.safe_owners = [to_checksum_address(owner) for owner in safe_owners]
+        self.safe_threshold = safe_threshold
+        self.safe_nonce = 0
+        self.projects: Dict[int, Project] = {}
+        self.next_project_id = 1
+        # monotonic time at which each project was made active
+        self.drop_times: Dict[int, float] = {}
+        self.nonces: Dict[str, int] = {}
+        # the nonces used by each sender above its next one, sent out of order
+        self.future_nonces: Dict[str, Set[int]] = {}
+        self.pending: Dict[str, PendingTransaction] = {}
+        # the digests of the pending transactions left out of a block they could be in
+        self.stuck: Set[str] = set()
+        self.mined: Dict[str, PendingTransaction] = {}
+        self.receipts: Dict[str, Dict[str, Any]] = {}
+        # list of (project id, monotonic submission time, digest) of accepted purchases
+        self.purchases: List[Tuple[int, float, str]] = []
+        # whether the call made by each mined Safe transaction succeeded
+        self.safe_executions: Dict[str, bool] = {}
+        # the logs emitted by the Safe, in order
+        self.logs: List[Dict[str, Any]] = []
+        self.contracts = {
+            to_checksum_address(ARTBLOCKS_ADDRESS): self._codec(ARTBLOCKS_BUILD),
+            to_checksum_address(MINTER_ADDRESS): self._codec(MINTER_BUILD),
+            to_checksum_address(SAFE_ADDRESS): self._codec(SAFE_BUILD),
+        }
+        # the read-only functions by (address, selector), decoded without web3,
+        # which looks functions up by a linear scan of the ABI
+        self._functions: Dict[Tuple[str, bytes], Tuple[str, List[str], List[str]]] = {
+            (address, function_abi_to_4byte_selector(abi)): (
+                abi["name"],
+                get_abi_input_types(abi),
+                get_abi_output_types(abi),
+            )
+            for address, contract in self.contracts.items()
+            for abi in contract.abi
+            if abi.get("type") == "function"
+        }
+
+    @staticmethod
+    def _codec(path: Path) -> Any:
+        """Get a provider-less contract object, to encode and decode calls."""
+        return Web3().eth.contract(abi=load_abi(path))
+
+    @property
+    def block_number(self) -> int:
+        """Get the number of the latest block."""
+        return int((self.clock() - self.genesis) / self.block_time)
+
+    def block_timestamp(self, number: int) -> int:
+        """Get the timestamp of a block."""
+        return self.genesis_timestamp + int(number * self.block_time)
+
+    def add_project(
+        self, price_per_token_in_wei: int, active: bool = False, **kwargs: Any
+    ) -> Project:
+        """Add a project to the ArtBlocks core."""
+        with self.lock:
+            project = Project(
+                self.next_project_id, price_per_token_in_wei, active=active, **kwargs
+            )
+            self.projects[project.project_id] = project
+            self.next_project_id += 1
+            if active:
+                self.drop_times[project.project_id] = self.clock()
+            elif project.start_timestamp is not None:
+                self.drop_times[project.project_id] = (
+                    self.genesis
+                    + self.first_eligible_block(project.project_id) * self.block_time
+                )
+            return project
+
+    def is_active(self, project: Project, block: int) -> bool:
+        """Check whether a project is active in a block."""
+        return project.active or (
+            project.start_timestamp is not None
+            and self.block_timestamp(block) >= project.start_timestamp
+        )
+
+    def first_eligible_block(self, project_id: int) -> int:
+        """Get the first block a project with a start timestamp is active in."""
+        start_timestamp = self.projects[project_id].start_timestamp
+        if start_timestamp is None:
+            raise ValueError(f"project {project_id} has no start timestamp")
+        number = max(
+            math.floor((start_timestamp - self.genesis_timestamp) / self.block_time), 0
+        )
+        while self.block_timestamp(number) < start_timestamp:
+            number += 1
+        return number
+
+    def drop(self, price_per_token_in_wei: int) -> Project:
+        """Add a project which is immediately active."""
+        return self.add_project(price_per_token_in_wei, active=True)
+
+    def activate(self, project_id: int) -> None:
+        """Make an announced project active."""
+        with self.lock:
+            self.projects[project_id].active = True
+            self.drop_times[project_id] = self.clock()
+
+    def sell_out(self, project_id: int) -> None:
+        """Mint the remaining tokens of a project, as other buyers would."""
+        with self.lock:
+            project = self.projects[project_id]
+            project.invocations = project.max_invocations
+
+    def change_safe_owners(self, owners: List[str], threshold: int) -> None:
+        """Change the owners and the threshold of the Safe, emitting their events."""
+        with self.lock:
+            owners = [to_checksum_address(owner) for owner in owners]
+            events = [
+                ("RemovedOwner(address)", owner)
+                for owner in self.safe_owners
+                if owner not in owners
+            ] + [
+                ("AddedOwner(address)", owner)
+                for owner in owners
+                if owner not in self.safe_owners
+            ]
+            if threshold != self.safe_threshold:
+                events.append(("ChangedThreshold(uint256)", threshold))
+            self.safe_owners = owners
+            self.safe_threshold = threshold
+            for signature, argument in events:
+                self.logs.append(
+                    {
+                        "address": to_checksum_address(SAFE_ADDRESS),
+                        "topics": ["0x" + keccak(text=signature).hex()],
+                        "data": "0x"
+                        + encode_single(
+                            "uint256" if isinstance(argument, int) else "address",
+                            argument,
+                        ).hex(),
+                        "blockNumber": hex(self.block_number),
+                        "blockHash": "0x"
+                        + keccak(text=f"block-{self.block_number}").hex(),
+                        "transactionHash": "0x" + "00" * 32,
+                        "transactionIndex": "0x0",
+                        "logIndex": hex(len(self.logs)),
+                        "removed": False,
+                    }
+                )
+
+    def mine(self) -> None:
+        """Include the pending transactions whose block has been produced."""
+        with self.lock:
+            current = self.block_number
+            # the lowest nonce of each sender whose transaction is not included
+            stuck_nonces: Dict[str, int] = {}
+            for digest, tx in sorted(
+                self.pending.items(), key=lambda item: (item[1].sender, item[1].nonce)
+            ):
+                if tx.block > current:
+                    continue
+                if (
+                    tx.sender in stuck_nonces
+                    or _get_gas_price(tx.fees) < self.min_gas_price
+                ):
+                    stuck_nonces.setdefault(tx.sender, tx.nonce)
+                    self.stuck.add(digest)
+                    continue
+                if digest in self.stuck:
+                    self.stuck.remove(digest)
+                    tx.block = current
+                del self.pending[digest]
+                self.mined[digest] = tx
+                self.receipts[digest] = self._execute(tx)
+
+    def _execute(self, tx: PendingTransaction) -> Dict[str, Any]:
+        """Execute a transaction and build its receipt."""
+        status = 1
+        if tx.to == to_checksum_address(SAFE_ADDRESS):
+            status = self._execute_safe_transaction(tx)
+        gas_used = self.gas_used(tx.to, tx.data)
+        return {
+            "transactionHash": tx.digest,
+            "transactionIndex": "0x0",
+            "blockHash": "0x" + keccak(text=f"block-{tx.block}").hex(),
+            "blockNumber": hex(tx.block),
+            "from": tx.sender,
+            "to": tx.to,
+            "cumulativeGasUsed": hex(gas_used),
+            "gasUsed": hex(min(gas_used, tx.gas)),
+            "effectiveGasPrice": hex(
+                tx.fees.get("gasPrice", tx.fees.get("maxFeePerGas", 0))
+            ),
+            "contractAddress": None,
+            "logs": [],
+            "logsBloom": "0x" + "00" * 256,
+            "status": hex(status),
+            "type": "0x2" if "maxFeePerGas" in tx.fees else "0x0",
+        }
+
+    def gas_used(self, to: Optional[str], data: bytes) -> int:
+        """Get the gas used by a transaction."""
+        if to is None or to_checksum_address(to) != to_checksum_address(SAFE_ADDRESS):
+            return DEFAULT_GAS_USED
+        calls = self._decode_safe_calls(data)
+        return SAFE_BASE_GAS + CALL_GAS * (len(calls) if calls is not None else 1)
+
+    def _has_enough_signatures(self, data: bytes) -> bool:
+        """Check that an 'execTransaction' call carries a signature per required owner."""
+        safe = self.contracts[to_checksum_address(SAFE_ADDRESS)]
+        _, args = safe.decode_function_input(data)
+        return len(args["signatures"]) >= SIGNATURE_LENGTH * self.safe_threshold
+
+    def _decode_safe_calls(self, data: bytes) -> Optional[List[Tuple[str, int, bytes]]]:
+        """
+        Decode the calls made by an 'execTransaction' call on the Safe.
+
+        :param data: the data of the transaction sent to the Safe.
+        :return: the (to, value, data) of each call, or None if not a supported Safe transaction.
+        """
+        safe = self.contracts[to_checksum_address(SAFE_ADDRESS)]
+        try:
+            function, args = safe.decode_function_input(data)
+        except ValueError:
+            return None
+        if function.fn_name != "execTransaction":
+            return None
+        return self._get_safe_calls(args)
+
+    @staticmethod
+    def _get_safe_calls(args: Dict[str, Any]) -> Optional[List[Tuple[str, int, bytes]]]:
+        """Get the calls made by the Safe from the decoded 'execTransaction' arguments."""
+        if args["operation"] == 0:
+            return [(args["to"], args["value"], args["data"])]
+        inner = bytes(args["data"])
+        if (
+            to_checksum_address(args["to"])
+            != to_checksum_address(MULTISEND_CALL_ONLY_CONTRACT)
+            or inner[:4] != MULTISEND_SELECTOR
+        ):
+            return None
+        (packed,) = decode_abi(["bytes"], inner[4:])
+        calls = []
+        offset = 0
+        while offset < len(packed):
+            operation = packed[offset]
+            to = to_checksum_address(packed[offset + 1 : offset + 21])
+            value = int.from_bytes(packed[offset + 21 : offset + 53], "big")
+            length = int.from_bytes(packed[offset + 53 : offset + 85], "big")
+            if operation != 0:
+                # MultiSendCallOnly reverts on delegate calls
+                return []
+            calls.append((to, value, packed[offset + 85 : offset + 85 + length]))
+            offset += 85 + length
+        return calls
+
+    def _execute_safe_transaction(self, tx: PendingTransaction) -> int:
+        """Execute an 'execTransaction' call on the Safe; return the receipt status."""
+        calls = self._decode_safe_calls(tx.data)
+        if calls is None or not self._has_enough_signatures(tx.data):
+            return 0
+        self.safe_nonce += 1
+        # with a non-zero safeTxGas, a failed call does not revert the Safe transaction;
+        # a MultiSend call is reverted as a whole
+        invocations = {
+            project_id: project.invocations
+            for project_id, project in self.projects.items()
+        }
+        is_success = len(calls) > 0 and all(
+            self._execute_call(to, value, data, tx.block) for to, value, data in calls
+        )
+        if not is_success:
+            for project_id, count in invocations.items():
+                self.projects[project_id].invocations = count
+        self.safe_executions[tx.digest] = is_success
+        return 1
+
+    def _execute_call(self, to: str, value: int, data: bytes, block: int) -> bool:
+        """Execute a call made by the Safe in a block."""
+        minter = self.contracts[to_checksum_address(MINTER_ADDRESS)]
+        if to_checksum_address(to) != to_checksum_address(MINTER_ADDRESS):
+            return True
+        function, args = minter.decode_function_input(HexBytes(data))
+        if function.fn_name != "purchase":
+            return False
+        project = self.projects.get(args["_projectId"])
+        if project is None or self._get_purchase_failure(project, block, value):
+            return False
+        project.invocations += 1
+        return True
+
+    def _get_purchase_failure(
+        self, project: Project, block: int, value: Optional[int] = None
+    ) -> Optional[str]:
+        """Get the revert reason of the minter for a purchase of a project in a block, if it fails."""
+        if not self.is_active(project, block):
+            return "Project must exist and be active"
+        if project.paused:
+            return "Purchases are paused."
+        if project.invocations >= project.max_invocations:
+            return "Must not exceed max invocations"
+        if value is not None and value < project.price_per_token_in_wei:
+            return "Must send minimum value to mint!"
+        return None
+
+    def call(self, to: str, data: str) -> str:
+        """Execute a read-only call and get the ABI-encoded result."""
+        call_data = HexBytes(data)
+        selector = (to_checksum_address(to), bytes(call_data[:4]))
+        if selector not in self._functions:
+            return "0x"
+        name, input_types, output_types = self._functions[selector]
+        args = decode_abi(input_types, bytes(call_data[4:]))
+        result = getattr(self, f"_call_{name}")(*args)
+        if len(output_types) == 1:
+            result = (result,)
+        return "0x" + encode_abi(output_types, result).hex()
+
+    def _call_nextProjectId(self) -> int:  # pylint: disable=invalid-name
+        return self.next_project_id
+
+    def _project(self, project_id: int) -> Project:
+        project = self.projects.get(project_id)
+        if project is None:
+            raise ValueError(f"execution reverted: unknown project {project_id}")
+        return project
+
+    def _call_projectTokenInfo(
+        self, project_id: int
+    ) -> Tuple:  # pylint: disable=invalid-name
+        project = self._project(project_id)
+        return (
+            project.artist_address,
+            project.price_per_token_in_wei,
+            project.invocations,
+            project.max_invocations,
+            self.is_active(project, self.block_number),
+            "0x" + "0" * 40,
+            0,
+            "ETH",
+            "0x" + "0" * 40,
+        )
+
+    def _call_projectScriptInfo(
+        self, project_id: int
+    ) -> Tuple:  # pylint: disable=invalid-name
+        project = self._project(project_id)
+        return (
+            "{}",
+            len(project.scripts),
+            False,
+            project.ipfs_hash,
+            False,
+            project.paused,
+        )
+
+    def _call_projectDetails(
+        self, project_id: int
+    ) -> Tuple:  # pylint: disable=invalid-name
+        project = self._project(project_id)
+        return (
+            project.name,
+            project.artist,
+            project.description,
+            project.website,
+            "CC BY-NC 4.0",
+            False,
+        )
+
+    def _call_projectScriptByIndex(  # pylint: disable=invalid-name
+        self, project_id: int, index: int
+    ) -> str:
+        return self._project(project_id).scripts[index]
+
+    def _call_purchase(self, project_id: int) -> int:  # pylint: disable=invalid-name
+        """Make a purchase against the pending block, without side effects; the value sent is not checked."""
+        project = self._project(project_id)
+        reason = self._get_purchase_failure(project, self.block_number + 1)
+        if reason is not None:
+            raise ValueError(f"execution reverted: {reason}")
+        return project_id * 1_000_000 + project.invocations
+
+    def _call_execTransaction(  # pylint: disable=invalid-name,too-many-arguments
+        self,
+        to: str,
+        value: int,
+        data: bytes,
+        operation: int,
+        safe_tx_gas: int,
+        base_gas: int,
+        gas_price: int,
+        gas_token: str,
+        refund_receiver: str,
+        signatures: bytes,
+    ) -> bool:
+        """Simulate an 'execTransaction' call against the pending block, without side effects."""
+        del safe_tx_gas, base_gas, gas_price, gas_token, refund_receiver
+        if len(signatures) < SIGNATURE_LENGTH * self.safe_threshold:
+            raise ValueError("execution reverted: GS020")
+        calls = self._get_safe_calls(
+            {"to": to, "value": value, "data": data, "operation": operation}
+        )
+        if not calls:
+            return False
+        with self.lock:
+            invocations = {
+                project_id: project.invocations
+                for project_id, project in self.projects.items()
+            }
+            block = self.block_number + 1
+            try:
+                return all(
+                    self._execute_call(call_to, call_value, call_data, block)
+                    for call_to, call_value, call_data in calls
+                )
+            finally:
+                for project_id, count in invocations.items():
+                    self.projects[project_id].invocations = count
+
+    def _call_nonce(self) -> int:
+        return self.safe_nonce
+
+    def _call_VERSION(self) -> str:  # pylint: disable=invalid-name
+        return SAFE_VERSION
+
+    def _call_getOwners(self) -> List[str]:  # pylint: disable=invalid-name
+        return self.safe_owners
+
+    def _call_getThreshold(self) -> int:  # pylint: disable=invalid-name
+        return self.safe_threshold
+
+    def send_raw_transaction(self, raw: bytes) -> str:
+        """Accept a signed transaction, to be included in the next block."""
+        sender = Account.recover_transaction(raw)
+        fees: Dict[str, int]
+        if raw[0] == 2:
+            fields = rlp.decode(raw[1:])
+            nonce, priority_fee, max_fee, gas, to, value, data = fields[1:8]
+            fees = {
+                "maxPriorityFeePerGas": _to_int(priority_fee),
+                "maxFeePerGas": _to_int(max_fee),
+            }
+        else:
+            fields = rlp.decode(raw)
+            nonce, gas_price, gas, to, value, data = fields[:6]
+            fees = {"gasPrice": _to_int(gas_price)}
+        digest = "0x" + keccak(raw).hex()
+        with self.lock:
+            self.mine()
+            if digest in self.pending or digest in self.mined:
+                # e.g. sent to several endpoints of the chain
+                raise ValueError("already known")
+            replaced = next(
+                (
+                    tx
+                    for tx in self.pending.values()
+                    if tx.sender == sender and tx.nonce == _to_int(nonce)
+                ),
+                None,
+            )
+            if replaced is not None:
+                self._replace(replaced, fees)
+            else:
+                self._use_nonce(sender, _to_int(nonce))
+            tx = PendingTransaction(
+                digest,
+                sender,
+                _to_int(nonce),
+                to_checksum_address(to),
+                _to_int(value),
+                bytes(data),
+                _to_int(gas),
+                fees,
+                self.block_number + 1,
+            )
+            self.pending[digest] = tx
+            self._record_purchase(tx)
+        return digest
+
+    def _use_nonce(self, sender: str, nonce: int) -> None:
+        """Use a nonce of a sender, which must not have been used yet."""
+        expected_nonce = self.nonces.get(sender, 0)
+        future_nonces = self.future_nonces.setdefault(sender, set())
+        if nonce < expected_nonce or nonce in future_nonces:
+            raise ValueError("nonce too low")
+        # a node would hold a transaction sent ahead of a nonce gap until
+        # the gap is filled; it is included right away here
+        future_nonces.add(nonce)
+        while expected_nonce in future_nonces:
+            future_nonces.remove(expected_nonce)
+            expected_nonce += 1
+        self.nonces[sender] = expected_nonce
+
+    def _replace(self, tx: PendingTransaction, fees: Dict[str, int]) -> None:
+        """Drop a pending transaction for one with the same nonce, if it pays enough more."""
+        if _get_gas_price(fees) < math.ceil(
+            _get_gas_price(tx.fees) * MIN_REPLACEMENT_FEE_BUMP
+        ):
+            raise ValueError("replacement transaction underpriced")
+        del self.pending[tx.digest]
+        self.stuck.discard(tx.digest)
+
+    def _record_purchase(self, tx: PendingTransaction) -> None:
+        """Record the projects a Safe transaction purchases, for the benchmark."""
+        if tx.to != to_checksum_address(SAFE_ADDRESS):
+            return
+        minter = self.contracts[to_checksum_address(MINTER_ADDRESS)]
+        for to, _, data in self._decode_safe_calls(tx.data) or []:
+            if to_checksum_address(to) != to_checksum_address(MINTER_ADDRESS):
+                continue
+            try:
+                function, inner = minter.decode_function_input(HexBytes(data))
+            except ValueError:
+                continue
+            if function.fn_name == "purchase":
+                self.purchases.append((inner["_projectId"], self.clock(), tx.digest))
+
+    def transaction(self, digest: str) -> Optional[Dict[str, Any]]:
+        """Get a transaction by digest."""
+        with self.lock:
+            tx = self.mined.get(digest) or self.pending.get(digest)
+            if tx is None:
+                return None
+            is_mined = digest in self.mined
+            result = {
+                "hash": digest,
+                "from": tx.sender,
+                "to": tx.to,
+                "nonce": hex(tx.nonce),
+                "value": hex(tx.value),
+                "input": "0x" + tx.data.hex(),
+                "gas": hex(tx.gas),
+                "blockNumber": hex(tx.block) if is_mined else None,
+                "blockHash": self.receipts[digest]["blockHash"] if is_mined else None,
+                "transactionIndex": "0x0" if is_mined else None,
+                "v": "0x0",
+                "r": "0x0",
+                "s": "0x0",
+            }
+            result.update({key: hex(value) for key, value in tx.fees.items()})
+            return result
+
+    @staticmethod
+    def rewards(number: int, percentiles: List[float]) -> List[str]:
+        """Get the priority fees paid at some percentiles of a block, varying by block."""
+        scale = 0.5 + keccak(text=f"rewards-{number}")[0] / 255
+        return [
+            hex(int(DEFAULT_PRIORITY_FEE * scale * (0.5 + percentile / 50)))
+            for percentile in percentiles
+        ]
+
+    def block(self, number: int) -> Dict[str, Any]:
+        """Get a block header."""
+        return {
+            "number": hex(number),
+            "hash": "0x" + keccak(text=f"block-{number}").hex(),
+            "parentHash": "0x" + keccak(text=f"block-{number - 1}").hex(),
+            "timestamp": hex(self.block_timestamp(number)),
+            "baseFeePerGas": hex(DEFAULT_BASE_FEE),
+            "gasLimit": hex(BLOCK_GAS_LIMIT),
+            "gasUsed": hex(BLOCK_GAS_LIMIT // 2),
+            "miner": "0x" + "0" * 40,
+            "difficulty": "0x0",
+            "totalDifficulty": "0x0",
+            "extraData": "0x",
+            "size": "0x0",
+            "nonce": "0x0000000000000000",
+            "sha3Uncles": "0x" + "00" * 32,
+            "logsBloom": "0x" + "00" * 256,
+            "transactionsRoot": "0x" + "00" * 32,
+            "stateRoot": "0x" + "00" * 32,
+            "receiptsRoot": "0x" + "00" * 32,
+            "transactions": [],
+            "uncles": [],
+        }
+
+
+def _get_gas_price(fees: Dict[str, int]) -> int:
+    """Get the most a transaction pays per gas."""
+    return fees.get("gasPrice", fees.get("maxFeePerGas", 0))
+
+
+def _to_int(value: bytes) -> int:
+    """Convert a big-endian RLP field to an integer."""
+    return int.from_bytes(value, "big")
+
+
+class MockProvider(BaseProvider):
+    """A web3 provider serving a 'MockChain', with injected latency and failures."""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        chain: MockChain,
+        latency: float = 0.05,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+        lag_blocks: int = 0,
+    ) -> None:
+        """
+        Initialize the provider.
+
+        :param chain: the chain to serve.
+        :param latency: the mean delay of every call, in seconds.
+        :param jitter: the maximum deviation from the mean delay, in seconds.
+        :param failure_rate: the probability that a call fails.
+        :param seed: the seed of the random generator.
+        :param lag_blocks: the number of blocks the head of the provider is behind the chain.
+        """
+        self.chain = chain
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.lag_blocks = lag_blocks
+        # a provider down refuses connections, as an unreachable node
+        self.is_down = False
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.rpc_calls: Counter = Counter()
+        # the log filters by id, with their parameters and the logs seen so far
+        self._filters: Dict[str, Tuple[Dict[str, Any], int]] = {}
+
+    def isConnected(self) -> bool:  # pylint: disable=invalid-name
+        """Check the provider is connected."""
+        return True
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Serve a JSON-RPC request."""
+        with self._lock:
+            self.rpc_calls[method] += 1
+            delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+            is_failure = self._random.random() < self.failure_rate
+        time.sleep(max(delay, 0.0))
+        if self.is_down:
+            raise ConnectionError(f"connection refused serving {method}")
+        if is_failure:
+            return _error(f"injected failure of {method}")
+        handler = getattr(self, f"_{method}", None)
+        if handler is None:
+            return _error(f"method {method} not supported")
+        try:
+            self.chain.mine()
+            result = handler(*params)
+        except ValueError as e:
+            return _error(str(e))
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+    def _eth_chainId(self) -> str:  # pylint: disable=invalid-name
+        return hex(self.chain.chain_id)
+
+    def _net_version(self) -> str:
+        return str(self.chain.chain_id)
+
+    def _eth_blockNumber(self) -> str:  # pylint: disable=invalid-name
+        return hex(self._head)
+
+    @property
+    def _head(self) -> int:
+        """Get the latest block the provider has seen."""
+        return max(self.chain.block_number - self.lag_blocks, 0)
+
+    def _eth_gasPrice(self) -> str:  # pylint: disable=invalid-name
+        return hex(self.chain.gas_price)
+
+    def _eth_estimateGas(  # pylint: disable=invalid-name
+        self, transaction: Dict[str, Any], *_args: Any
+    ) -> str:
+        gas_used = self.chain.gas_used(
+            transaction.get("to"), bytes(HexBytes(transaction.get("data", "0x")))
+        )
+        return hex(gas_used + GAS_ESTIMATE_MARGIN)
+
+    def _eth_feeHistory(  # pylint: disable=invalid-name
+        self, block_count: str, newest_block: str, percentiles: List[float]
+    ) -> Dict[str, Any]:
+        newest = (
+            self.chain.block_number
+            if newest_block in ("latest", "pending")
+            else int(newest_block, 16)
+        )
+        oldest = max(newest - int(block_count, 16) + 1, 0)
+        blocks = range(oldest, newest + 1)
+        return {
+            "oldestBlock": hex(oldest),
+            "baseFeePerGas": [hex(DEFAULT_BASE_FEE)] * (len(blocks) + 1),
+            "gasUsedRatio": [0.5] * len(blocks),
+            "reward": [self.chain.rewards(number, percentiles) for number in blocks],
+        }
+
+    def _eth_getBalance(self, *_args: Any) -> str:  # pylint: disable=invalid-name
+        return hex(10 ** 21)
+
+    def _eth_getCode(
+        self, address: str, *_args: Any
+    ) -> str:  # pylint: disable=invalid-name
+        return "0x60" if to_checksum_address(address) in self.chain.contracts else "0x"
+
+    def _eth_getTransactionCount(  # pylint: disable=invalid-name
+        self, address: str, *_args: Any
+    ) -> str:
+        return hex(self.chain.nonces.get(to_checksum_address(address), 0))
+
+    def _eth_call(self, transaction: Dict[str, Any], *_args: Any) -> str:
+        return self.chain.call(transaction["to"], transaction["data"])
+
+    def _eth_sendRawTransaction(self, raw: str) -> str:  # pylint: disable=invalid-name
+        return self.chain.send_raw_transaction(bytes(HexBytes(raw)))
+
+    def _eth_getTransactionReceipt(  # pylint: disable=invalid-name
+        self, digest: str
+    ) -> Optional[Dict[str, Any]]:
+        return self.chain.receipts.get(digest)
+
+    def _eth_getTransactionByHash(  # pylint: disable=invalid-name
+        self, digest: str
+    ) -> Optional[Dict[str, Any]]:
+        return self.chain.transaction(digest)
+
+    def _eth_newFilter(  # pylint: disable=invalid-name
+        self, params: Dict[str, Any]
+    ) -> str:
+        with self._lock:
+            filter_id = hex(len(self._filters) + 1)
+            self._filters[filter_id] = (params, len(self.chain.logs))
+        return filter_id
+
+    def _eth_getFilterChanges(  # pylint: disable=invalid-name
+        self, filter_id: str
+    ) -> List[Dict[str, Any]]:
+        with self._lock:
+            if filter_id not in self._filters:
+                raise ValueError("filter not found")
+            params, seen = self._filters[filter_id]
+            logs = self.chain.logs[seen:]
+            self._filters[filter_id] = (params, seen + len(logs))
+        addresses = params.get("address") or []
+        addresses = [addresses] if isinstance(addresses, str) else addresses
+        addresses = {to_checksum_address(address) for address in addresses}
+        topics = params.get("topics") or [None]
+        return [
+            log
+            for log in logs
+            if (len(addresses) == 0 or log["address"] in addresses)
+            and (topics[0] is None or log["topics"][0] in topics[0])
+        ]
+
+    def _eth_getBlockByNumber(  # pylint: disable=invalid-name
+        self, number: str, *_args: Any
+    ) -> Dict[str, Any]:
+        latest = self._head
+        block = latest if number in ("latest", "pending") else int(number, 16)
+        return self.chain.block(min(block, latest))
+
+
+def _error(message: str) -> RPCResponse:
+    """Build a JSON-RPC error response."""
+    return {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": message}}
+
+
+class MockEthereumApi(EthereumApi):
+    """An Ethereum API backed by a 'MockProvider' instead of an HTTP node."""
+
+    def __init__(self, provider: MockProvider, **kwargs: Any) -> None:
+        """
+        Initialize the API.
+
+        :param provider: the provider.
+        :param kwargs: the keyword arguments of the Ethereum API.
+        """
+        super().__init__(**kwargs)
+        self._api = Web3(provider)
+        self._chain_id = provider.chain.chain_id
@@ -0,0 +1,561 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+End-to-end benchmark of the purchase period.
+
+Usage:
+
+    python -m benchmarks.period_benchmark --duration 120 --latency 0.1 --jitter 0.05
+
+Projects drop on the mock chain at a fixed interval while the monitor skill
+runs against it. The report gives the periods completed per hour, the
+drop-to-submission latency percentiles and the RPC calls per period.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from aea_ledger_ethereum import EthereumCrypto
+
+from benchmarks.harness import CoSigner, SkillRunner
+from benchmarks.mock_chain import MockChain, MockProvider
+
+from packages.collectooor.skills.monitor.signatures import (
+    SignatureClient,
+    SignatureServer,
+)
+from packages.fetchai.connections.ledger.fees import FeeOracle, URGENCY_LEVELS
+from packages.valory.contracts.gnosis_safe.contract import GnosisSafeContract
+
+
+DEFAULT_PRICE = 10 ** 17
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Get the q-th percentile of the values, by the nearest-rank method."""
+    if len(values) == 0:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+async def drop_projects(
+    chain: MockChain,
+    interval: float,
+    duration: float,
+    price: int,
+    announce_lead: float = 0.0,
+    start_timestamps: Optional[List[int]] = None,
+    drops_per_interval: int = 1,
+    sell_out_after: Optional[float] = None,
+) -> None:
+    """
+    Drop a new project on the chain every 'interval' seconds.
+
+    With 'announce_lead', each project is added inactive that many seconds
+    before it is made active. With 'start_timestamps', the projects are
+    added with the given start timestamps instead, in order. Otherwise,
+    'drops_per_interval' projects are dropped at once, each sold out by
+    other buyers 'sell_out_after' seconds later, if set.
+    """
+    loop = asyncio.get_event_loop()
+    elapsed = 0.0
+    index = 0
+    while elapsed < duration:
+        if start_timestamps is not None:
+            chain.add_project(price, start_timestamp=start_timestamps[index])
+        elif announce_lead > 0:
+            project = chain.add_project(price)
+            loop.call_later(announce_lead, chain.activate, project.project_id)
+        else:
+            for _ in range(drops_per_interval):
+                project = chain.drop(price)
+                if sell_out_after is not None:
+                    loop.call_later(sell_out_after, chain.sell_out, project.project_id)
+        await asyncio.sleep(interval)
+        elapsed += interval
+        index += 1
+
+
+def schedule_drops(
+    chain: MockChain, interval: float, duration: float, lead: float
+) -> List[int]:
+    """Get the start timestamps of the projects dropped by 'drop_projects'."""
+    now = chain.genesis_timestamp + chain.clock() - chain.genesis
+    n_drops = math.ceil(duration / interval)
+    return [math.ceil(now + lead + index * interval) for index in range(n_drops)]
+
+
+def minted_tokens(chain: MockChain) -> Tuple[int, int]:
+    """Get the tokens minted by the mined purchases, and the gas they used."""
+    tokens: Counter = Counter(
+        digest for _, _, digest in chain.purchases if chain.safe_executions.get(digest)
+    )
+    gas_used = sum(int(chain.receipts[digest]["gasUsed"], 16) for digest in tokens)
+    return sum(tokens.values()), gas_used
+
+
+def first_block_purchases(chain: MockChain) -> Dict[str, int]:
+    """Count the scheduled projects by the block their first purchase landed in."""
+    counts = {"first_eligible": 0, "early": 0, "late": 0}
+    seen = set()
+    for project_id, _, digest in chain.purchases:
+        project = chain.projects[project_id]
+        if project.start_timestamp is None or project_id in seen:
+            continue
+        tx = chain.mined.get(digest)
+        if tx is None:
+            continue
+        seen.add(project_id)
+        eligible = chain.first_eligible_block(project_id)
+        if tx.block == eligible:
+            counts["first_eligible"] += 1
+        elif tx.block < eligible:
+            counts["early"] += 1
+        else:
+            counts["late"] += 1
+    return counts
+
+
+def mean_gas_price(chain: MockChain) -> Optional[float]:
+    """Get the mean gas price paid by the mined purchases, in gwei."""
+    prices = [
+        int(chain.receipts[digest]["effectiveGasPrice"], 16)
+        for _, _, digest in chain.purchases
+        if digest in chain.receipts
+    ]
+    return round(sum(prices) / len(prices) / 10 ** 9, 3) if len(prices) > 0 else None
+
+
+def mean_gas_error(periods: List[Any]) -> Optional[float]:
+    """Get the mean relative error of the simulated gas against the gas used."""
+    errors = [
+        abs(period.simulated_gas - period.tx_receipt.receipt["gasUsed"])
+        / period.tx_receipt.receipt["gasUsed"]
+        for period in periods
+        if period.simulated_gas is not None
+    ]
+    return round(sum(errors) / len(errors), 4) if len(errors) > 0 else None
+
+
+def broadcast_latencies(runner: SkillRunner) -> Dict[str, Optional[float]]:
+    """Get the mean time each endpoint took to respond to the broadcast purchases, in seconds."""
+    histogram = runner.metrics.broadcast_latency
+    latencies: Dict[str, Optional[float]] = {}
+    for endpoint in runner.endpoints:
+        outcomes = [
+            dict(endpoint=endpoint, outcome=outcome)
+            for outcome in ("accepted", "rejected")
+        ]
+        count = sum(histogram.count(**labels) for labels in outcomes)
+        latencies[endpoint] = (
+            round(sum(histogram.sum(**labels) for labels in outcomes) / count, 4)
+            if count > 0
+            else None
+        )
+    return latencies
+
+
+def build_report(
+    runner: SkillRunner, chain: MockChain, elapsed: float
+) -> Dict[str, Any]:
+    """Build the report of a run."""
+    periods = runner.periods
+    completed = [period for period in periods if period.tx_receipt is not None]
+    failed = [period for period in periods if period.is_failed]
+    first_submission: Dict[int, float] = {}
+    for project_id, submitted_at, _ in chain.purchases:
+        first_submission.setdefault(project_id, submitted_at)
+    latencies = [
+        submitted_at - chain.drop_times[project_id]
+        for project_id, submitted_at in first_submission.items()
+        if project_id in chain.drop_times
+    ]
+    rpc_calls_by_method: Counter = sum(
+        (provider.rpc_calls for provider in runner.providers), Counter()
+    )
+    rpc_calls = sum(rpc_calls_by_method.values())
+    n_completed = len(completed)
+    n_tokens, gas_used = minted_tokens(chain)
+    return {
+        "elapsed_seconds": round(elapsed, 3),
+        "periods_started": len(periods),
+        "periods_completed": n_completed,
+        "periods_failed": len(failed),
+        "periods_per_hour": round(n_completed / elapsed * 3600, 2),
+        "projects_dropped": len(chain.drop_times),
+        "projects_purchased": len(first_submission),
+        "drop_to_submission_p50": percentile(latencies, 50),
+        "drop_to_submission_p99": percentile(latencies, 99),
+        "tokens_minted": n_tokens,
+        "gas_per_token": round(gas_used / n_tokens) if n_tokens > 0 else None,
+        "rpc_calls": rpc_calls,
+        "rpc_calls_per_period": (
+            round(rpc_calls / n_completed, 2) if n_completed > 0 else None
+        ),
+        "rpc_calls_by_method": dict(rpc_calls_by_method.most_common()),
+        "rpc_calls_by_endpoint": {
+            endpoint: sum(provider.rpc_calls.values())
+            for endpoint, provider in zip(runner.endpoints, runner.providers)
+        },
+        "failovers_by_endpoint": {
+            endpoint: runner.metrics.failovers.get(endpoint=endpoint)
+            for endpoint in runner.endpoints
+        },
+        "connection_requests_per_period": (
+            round(sum(p.timeline.rpc_count for p in completed) / n_completed, 2)
+            if n_completed > 0
+            else None
+        ),
+        "safe_rpcs_saved_per_period": (
+            round(GnosisSafeContract.metadata_cache.rpcs_saved / n_completed, 2)
+            if n_completed > 0
+            else None
+        ),
+        "decision_maker_requests": runner.decision_maker.n_requests,
+        "signatures": runner.decision_maker.n_signatures,
+        "safe_executions_failed": sum(
+            not is_success for is_success in chain.safe_executions.values()
+        ),
+        "gas_burnt_by_failed_executions": sum(
+            int(chain.receipts[digest]["gasUsed"], 16)
+            for digest, is_success in chain.safe_executions.items()
+            if not is_success
+        ),
+        "simulation_failures": sum(p.n_simulation_failures for p in periods),
+        "simulation_cache_hits": GnosisSafeContract.simulation_cache.n_hits,
+        "simulated_gas_error": mean_gas_error(completed),
+        "gas_estimations_saved": runner.skill.models["gas_templates"].n_reused,
+        "mean_gas_price_gwei": mean_gas_price(chain),
+        "fee_history_reads": (
+            runner.fee_oracle.n_samples if runner.fee_oracle is not None else None
+        ),
+        "broadcast_firsts_by_endpoint": {
+            endpoint: runner.metrics.broadcast_firsts.get(endpoint=endpoint)
+            for endpoint in runner.endpoints
+        },
+        "broadcast_latency_by_endpoint": broadcast_latencies(runner),
+        "transaction_replacements": sum(p.n_replacements for p in periods),
+        "replacements_mined": sum(
+            p.tx_digest.body != p.tx_digests[0]
+            for p in completed
+            if len(p.tx_digests) > 0
+        ),
+        "transactions_pending": len(chain.pending),
+        "scheduled_purchases": first_block_purchases(chain),
+        "handler_errors": runner.n_handler_errors,
+        "act_errors": runner.n_act_errors,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """Print a report in a human-readable form."""
+    for key, value in report.items():
+        if isinstance(value, float):
+            value = f"{value:.3f}"
+        if isinstance(value, dict):
+            print(f"{key}:")
+            for method, count in value.items():
+                print(f"    {method:<32} {count}")
+            continue
+        print(f"{key:<32} {value}")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds to run")
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="mean RPC latency, in seconds"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="max RPC latency jitter, in seconds"
+    )
+    parser.add_argument(
+        "--failure-rate", type=float, default=0.0, help="probability an RPC fails"
+    )
+    parser.add_argument("--block-time", type=float, default=2.0)
+    parser.add_argument(
+        "--drop-interval", type=float, default=10.0, help="seconds between drops"
+    )
+    parser.add_argument(
+        "--announce-lead",
+        type=float,
+        default=0.0,
+        help="seconds between the announcement of a project and its drop",
+    )
+    parser.add_argument(
+        "--scheduled-drops",
+        action="store_true",
+        help="announce the start timestamps of the projects to the skill",
+    )
+    parser.add_argument(
+        "--drops-per-interval",
+        type=int,
+        default=1,
+        help="projects dropped at once, without an announcement",
+    )
+    parser.add_argument(
+        "--n-projects", type=int, default=10, help="inactive projects at genesis"
+    )
+    parser.add_argument("--tick-interval", type=float, default=0.1)
+    parser.add_argument("--seconds-between-periods", type=float, default=0.0)
+    parser.add_argument("--max-concurrent-periods", type=int, default=1)
+    parser.add_argument(
+        "--max-projects-per-period",
+        type=int,
+        default=1,
+        help="projects a period can pick and purchase concurrently",
+    )
+    parser.add_argument(
+        "--bundle-projects",
+        action="store_true",
+        help="purchase the projects of a period with one Safe transaction",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=1, help="tokens bought per purchase"
+    )
+    parser.add_argument(
+        "--prepare-purchases",
+        action="store_true",
+        help="prepare the purchase of announced projects",
+    )
+    parser.add_argument(
+        "--sell-out-after",
+        type=float,
+        default=None,
+        help="seconds after which other buyers sell out a dropped project",
+    )
+    parser.add_argument(
+        "--simulate-transactions",
+        action="store_true",
+        help="simulate the purchases against the pending block before signing them",
+    )
+    parser.add_argument(
+        "--fee-urgency",
+        choices=sorted(URGENCY_LEVELS),
+        default=None,
+        help="urgency of the fees handed out by the fee oracle of the connection",
+    )
+    parser.add_argument(
+        "--min-gas-price-gwei",
+        type=float,
+        default=0.0,
+        help="least gas price the chain includes; cheaper transactions get stuck",
+    )
+    parser.add_argument(
+        "--replacement-deadline-blocks",
+        type=int,
+        default=None,
+        help="blocks after which a stuck purchase is replaced with bumped fees",
+    )
+    parser.add_argument(
+        "--broadcast-latency",
+        type=float,
+        nargs="+",
+        default=[],
+        help="mean RPC latency of each more endpoint signed purchases are broadcast to",
+    )
+    parser.add_argument(
+        "--pool-endpoint",
+        nargs="+",
+        default=[],
+        metavar="LATENCY[:LAG]",
+        help="mean RPC latency, and blocks behind, of each more endpoint requests are routed to",
+    )
+    parser.add_argument(
+        "--pool-outage-after",
+        type=float,
+        default=None,
+        help="seconds after which the first more endpoint of the pool goes down",
+    )
+    parser.add_argument(
+        "--batch-signing",
+        action="store_true",
+        help="send the signing requests of concurrent periods in batches",
+    )
+    parser.add_argument(
+        "--decision-maker-latency",
+        type=float,
+        default=0.0,
+        help="seconds the decision maker takes per request",
+    )
+    parser.add_argument(
+        "--safe-threshold",
+        type=int,
+        default=1,
+        help="owners required by the Safe; the agent's co-owners sign via the signature service",
+    )
+    parser.add_argument(
+        "--co-signer-delay",
+        type=float,
+        default=0.0,
+        help="seconds a co-owner takes to sign a hash",
+    )
+    parser.add_argument(
+        "--receipt-poll-interval",
+        type=float,
+        default=0.5,
+        help="seconds between two receipt polls of the ledger connection",
+    )
+    parser.add_argument("--request-timeout", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--verbose", action="store_true")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR)
+    crypto = EthereumCrypto()
+    co_owners = [EthereumCrypto() for _ in range(args.safe_threshold - 1)]
+    chain = MockChain(
+        [crypto.address, *(co_owner.address for co_owner in co_owners)],
+        block_time=args.block_time,
+        safe_threshold=args.safe_threshold,
+        min_gas_price=int(args.min_gas_price_gwei * 10 ** 9),
+    )
+    for _ in range(args.n_projects):
+        chain.add_project(DEFAULT_PRICE)
+    provider = MockProvider(
+        chain,
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+    )
+    broadcast_providers = [
+        MockProvider(
+            chain,
+            latency=latency,
+            jitter=args.jitter,
+            failure_rate=args.failure_rate,
+            seed=None if args.seed is None else args.seed + index,
+        )
+        for index, latency in enumerate(args.broadcast_latency, 1)
+    ]
+    pool_providers = []
+    for index, endpoint in enumerate(args.pool_endpoint, len(broadcast_providers) + 1):
+        latency, _, lag_blocks = endpoint.partition(":")
+        pool_providers.append(
+            MockProvider(
+                chain,
+                latency=float(latency),
+                jitter=args.jitter,
+                failure_rate=args.failure_rate,
+                seed=None if args.seed is None else args.seed + index,
+                lag_blocks=int(lag_blocks or 0),
+            )
+        )
+    monitoring_args: Dict[str, Any] = {
+        "tick_interval": args.tick_interval,
+        "seconds_between_periods": args.seconds_between_periods,
+        "max_concurrent_periods": args.max_concurrent_periods,
+        "prepare_purchases": args.prepare_purchases,
+        "batch_size": args.batch_size,
+        "max_projects_per_period": args.max_projects_per_period,
+        "bundle_projects": args.bundle_projects,
+        "batch_signing": args.batch_signing,
+        "simulate_transactions": args.simulate_transactions,
+        "fee_urgency": args.fee_urgency,
+        "replacement_deadline_blocks": args.replacement_deadline_blocks,
+    }
+    if args.request_timeout is not None:
+        monitoring_args["request_timeout"] = args.request_timeout
+    signature_server = None
+    co_signers: List[CoSigner] = []
+    if co_owners:
+        signature_server = SignatureServer()
+        signature_server.start()
+        monitoring_args["signature_service_url"] = signature_server.url
+        co_signers = [
+            CoSigner(
+                co_owner, SignatureClient(signature_server.url), args.co_signer_delay
+            )
+            for co_owner in co_owners
+        ]
+    start_timestamps = None
+    if args.scheduled_drops:
+        start_timestamps = schedule_drops(
+            chain, args.drop_interval, args.duration, args.announce_lead
+        )
+        monitoring_args["drop_schedule"] = {
+            args.n_projects + 1 + index: {"timestamp": timestamp}
+            for index, timestamp in enumerate(start_timestamps)
+        }
+    runner = SkillRunner(
+        chain,
+        provider,
+        crypto,
+        monitoring_args=monitoring_args,
+        receipt_poll_interval=args.receipt_poll_interval,
+        decision_maker_latency=args.decision_maker_latency,
+        broadcast_providers=broadcast_providers,
+        pool_providers=pool_providers,
+        fee_oracle=(
+            FeeOracle(block_time=args.block_time)
+            if args.fee_urgency is not None
+            else None
+        ),
+    )
+
+    async def run() -> float:
+        co_signing = [asyncio.ensure_future(signer.run()) for signer in co_signers]
+        if args.pool_outage_after is not None and len(pool_providers) > 0:
+            asyncio.get_event_loop().call_later(
+                args.pool_outage_after, setattr, pool_providers[0], "is_down", True
+            )
+        elapsed, _ = await asyncio.gather(
+            runner.run(args.duration),
+            drop_projects(
+                chain,
+                args.drop_interval,
+                args.duration,
+                DEFAULT_PRICE,
+                args.announce_lead,
+                start_timestamps,
+                args.drops_per_interval,
+                args.sell_out_after,
+            ),
+        )
+        for task in co_signing:
+            task.cancel()
+        return elapsed
+
+    elapsed = asyncio.get_event_loop().run_until_complete(run())
+    if signature_server is not None:
+        signature_server.stop()
+    report = build_report(runner, chain, elapsed)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
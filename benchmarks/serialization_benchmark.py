@@ -0,0 +1,611 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+Microbenchmark of the contract_api, ledger_api and signing serializers.
+
+Usage:
+
+    python -m benchmarks.serialization_benchmark
+    python -m benchmarks.serialization_benchmark --save-baseline
+    python -m benchmarks.serialization_benchmark --compare --time-tolerance 0.2
+
+Every case is a message the agent actually exchanges, with a realistic
+payload. For each case, the encode and decode throughput, the bytes
+allocated by one encode and one decode and the encoded size are measured.
+With '--compare', the results are checked against the stored baseline and
+the exit code is 1 on a regression.
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from eth_utils import keccak, to_checksum_address
+from web3 import Web3
+
+from benchmarks.mock_chain import (
+    ARTBLOCKS_ADDRESS,
+    MINTER_ADDRESS,
+    MINTER_BUILD,
+    SAFE_ADDRESS,
+    SAFE_BUILD,
+    load_abi,
+)
+
+from packages.fetchai.protocols.contract_api import ContractApiMessage
+from packages.fetchai.protocols.contract_api import custom_types as contract_api_types
+from packages.fetchai.protocols.ledger_api import LedgerApiMessage
+from packages.fetchai.protocols.ledger_api import custom_types as ledger_api_types
+from packages.open_aea.protocols.signing import SigningMessage
+from packages.open_aea.protocols.signing import custom_types as signing_types
+
+
+BASELINE_FILE = Path(__file__).parent / "baselines" / "serialization.json"
+LEDGER_ID = "ethereum"
+AGENT_ADDRESS = "0x8D7D4DCDb3E4e6D4Ea7f6E1aBE8F0e39eEa0d3D9"
+DIALOGUE_REFERENCE = ("a" * 32, "b" * 32)
+SCRIPT_SIZE = 8 * 1024
+N_RECEIPT_LOGS = 6
+N_REPEATS = 5
+
+Case = Tuple[str, Any]
+
+
+def _address(seed: str) -> str:
+    """Get a deterministic checksum address."""
+    return to_checksum_address(keccak(text=seed)[:20])
+
+
+def _hex(seed: str, n_bytes: int) -> str:
+    """Get deterministic hex data of the given length."""
+    data = b""
+    counter = 0
+    while len(data) < n_bytes:
+        data += keccak(text=f"{seed}-{counter}")
+        counter += 1
+    return "0x" + data[:n_bytes].hex()
+
+
+def project_state() -> Dict[str, Any]:
+    """Get the state of an ArtBlocks project, as returned by 'get_active_project'."""
+    line = "let h = tokenData.hash; let r = parseInt(h.slice(2, 10), 16); draw(r);\n"
+    return {
+        "artist_address": _address("artist"),
+        "price_per_token_in_wei": 250000000000000000,
+        "project_id": 212,
+        "project_name": "Fidenza",
+        "artist": "Tyler Hobbs",
+        "description": "Fidenza is by far my most versatile algorithm to date. " * 6,
+        "website": "https://tylerxhobbs.com/fidenza",
+        "script": (line * (SCRIPT_SIZE // len(line) + 1))[:SCRIPT_SIZE],
+        "ipfs_hash": "QmV9wgaVpd4Jy5UgG9pVrD4dY6fXdnBZFc3KNPH6ymBCoU",
+    }
+
+
+def purchase_data() -> bytes:
+    """
+    Get the call data of a 'purchase' on the minter.
+
+    In kwargs and states it is passed hex-encoded: the dict serializer
+    only round-trips bytes which are valid UTF-8.
+    """
+    minter = Web3().eth.contract(abi=load_abi(MINTER_BUILD))
+    return bytes.fromhex(minter.encodeABI("purchase", args=[212])[2:])
+
+
+def safe_exec_transaction() -> Dict[str, Any]:
+    """Get the raw transaction of a Safe 'execTransaction' of a purchase."""
+    safe = Web3().eth.contract(abi=load_abi(SAFE_BUILD))
+    data = safe.encodeABI(
+        "execTransaction",
+        args=[
+            to_checksum_address(MINTER_ADDRESS),
+            250000000000000000,
+            purchase_data(),
+            0,
+            4000000,
+            0,
+            0,
+            "0x" + "0" * 40,
+            "0x" + "0" * 40,
+            bytes.fromhex(_hex("signature", 65)[2:]),
+        ],
+    )
+    return {
+        "chainId": 1,
+        "from": AGENT_ADDRESS,
+        "to": to_checksum_address(SAFE_ADDRESS),
+        "value": 0,
+        "gas": 4100000,
+        "gasPrice": 85000000000,
+        "nonce": 17,
+        "data": data,
+    }
+
+
+def signed_transaction() -> Dict[str, Any]:
+    """Get a signed transaction, as returned by the Ethereum crypto."""
+    return {
+        "rawTransaction": _hex("raw", 650),
+        "hash": _hex("hash", 32),
+        "r": int(_hex("r", 32), 16),
+        "s": int(_hex("s", 32), 16),
+        "v": 37,
+    }
+
+
+def multi_log_receipt() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Get the receipt of a Safe purchase emitting several logs, and its transaction."""
+    digest = _hex("digest", 32)
+    block_hash = _hex("block", 32)
+    logs = [
+        {
+            "address": to_checksum_address(ARTBLOCKS_ADDRESS),
+            "blockHash": block_hash,
+            "blockNumber": 13500000,
+            "data": _hex(f"log-data-{index}", 64 * (index % 3)),
+            "logIndex": 120 + index,
+            "removed": False,
+            "topics": [
+                _hex(f"log-topic-{index}-{i}", 32) for i in range(1 + index % 4)
+            ],
+            "transactionHash": digest,
+            "transactionIndex": 42,
+        }
+        for index in range(N_RECEIPT_LOGS)
+    ]
+    receipt = {
+        "blockHash": block_hash,
+        "blockNumber": 13500000,
+        "contractAddress": None,
+        "cumulativeGasUsed": 3214532,
+        "effectiveGasPrice": 85000000000,
+        "from": AGENT_ADDRESS,
+        "gasUsed": 187342,
+        "logs": logs,
+        "logsBloom": _hex("bloom", 256),
+        "status": 1,
+        "to": to_checksum_address(SAFE_ADDRESS),
+        "transactionHash": digest,
+        "transactionIndex": 42,
+        "type": "0x0",
+    }
+    transaction = {
+        **safe_exec_transaction(),
+        "blockHash": block_hash,
+        "blockNumber": 13500000,
+        "hash": digest,
+        "input": safe_exec_transaction()["data"],
+        "r": _hex("r", 32),
+        "s": _hex("s", 32),
+        "v": 37,
+        "transactionIndex": 42,
+    }
+    del transaction["data"]
+    return receipt, transaction
+
+
+def _terms() -> signing_types.Terms:
+    """Get the default terms of the skill's requests."""
+    return signing_types.Terms(
+        ledger_id=LEDGER_ID,
+        sender_address=AGENT_ADDRESS,
+        counterparty_address=AGENT_ADDRESS,
+        amount_by_currency_id={},
+        quantities_by_good_id={},
+        nonce="",
+    )
+
+
+def contract_api_cases() -> List[Case]:
+    """Get the contract_api messages."""
+    common: Dict[str, Any] = dict(dialogue_reference=DIALOGUE_REFERENCE, target=0)
+    raw_tx = safe_exec_transaction()
+    return [
+        (
+            "contract_api/get_state",
+            ContractApiMessage(
+                performative=ContractApiMessage.Performative.GET_STATE,
+                message_id=1,
+                ledger_id=LEDGER_ID,
+                contract_id="valory/gnosis_safe:0.1.0",
+                contract_address=SAFE_ADDRESS,
+                callable="get_raw_safe_transaction_hash",
+                kwargs=contract_api_types.Kwargs(
+                    {
+                        "to_address": MINTER_ADDRESS,
+                        "value": 250000000000000000,
+                        "data": "0x" + purchase_data().hex(),
+                        "safe_tx_gas": 4000000,
+                    }
+                ),
+                **common,
+            ),
+        ),
+        (
+            "contract_api/state",
+            ContractApiMessage(
+                performative=ContractApiMessage.Performative.STATE,
+                message_id=2,
+                state=contract_api_types.State(LEDGER_ID, project_state()),
+                **common,
+            ),
+        ),
+        (
+            "contract_api/get_raw_transaction",
+            ContractApiMessage(
+                performative=ContractApiMessage.Performative.GET_RAW_TRANSACTION,
+                message_id=1,
+                ledger_id=LEDGER_ID,
+                contract_id="valory/gnosis_safe:0.1.0",
+                contract_address=SAFE_ADDRESS,
+                callable="get_raw_safe_transaction",
+                kwargs=contract_api_types.Kwargs(
+                    {
+                        "sender_address": AGENT_ADDRESS,
+                        "owners": [AGENT_ADDRESS],
+                        "to_address": MINTER_ADDRESS,
+                        "value": 250000000000000000,
+                        "data": "0x" + purchase_data().hex(),
+                        "signatures_by_owner": {AGENT_ADDRESS: _hex("sig", 65)[2:]},
+                        "safe_tx_gas": 4000000,
+                    }
+                ),
+                **common,
+            ),
+        ),
+        (
+            "contract_api/raw_transaction",
+            ContractApiMessage(
+                performative=ContractApiMessage.Performative.RAW_TRANSACTION,
+                message_id=2,
+                raw_transaction=contract_api_types.RawTransaction(LEDGER_ID, raw_tx),
+                **common,
+            ),
+        ),
+        (
+            "contract_api/error",
+            ContractApiMessage(
+                performative=ContractApiMessage.Performative.ERROR,
+                message_id=2,
+                code=1,
+                message="execution reverted: GS026",
+                data=b"",
+                **common,
+            ),
+        ),
+    ]
+
+
+def ledger_api_cases() -> List[Case]:
+    """Get the ledger_api messages."""
+    common: Dict[str, Any] = dict(dialogue_reference=DIALOGUE_REFERENCE, target=0)
+    receipt, transaction = multi_log_receipt()
+    digest = receipt["transactionHash"]
+    return [
+        (
+            "ledger_api/send_signed_transaction",
+            LedgerApiMessage(
+                performative=LedgerApiMessage.Performative.SEND_SIGNED_TRANSACTION,
+                message_id=1,
+                signed_transaction=ledger_api_types.SignedTransaction(
+                    LEDGER_ID, signed_transaction()
+                ),
+                **common,
+            ),
+        ),
+        (
+            "ledger_api/transaction_digest",
+            LedgerApiMessage(
+                performative=LedgerApiMessage.Performative.TRANSACTION_DIGEST,
+                message_id=2,
+                transaction_digest=ledger_api_types.TransactionDigest(
+                    LEDGER_ID, digest
+                ),
+                **common,
+            ),
+        ),
+        (
+            "ledger_api/get_transaction_receipt",
+            LedgerApiMessage(
+                performative=LedgerApiMessage.Performative.GET_TRANSACTION_RECEIPT,
+                message_id=1,
+                transaction_digest=ledger_api_types.TransactionDigest(
+                    LEDGER_ID, digest
+                ),
+                **common,
+            ),
+        ),
+        (
+            "ledger_api/transaction_receipt",
+            LedgerApiMessage(
+                performative=LedgerApiMessage.Performative.TRANSACTION_RECEIPT,
+                message_id=2,
+                transaction_receipt=ledger_api_types.TransactionReceipt(
+                    LEDGER_ID, receipt, transaction
+                ),
+                **common,
+            ),
+        ),
+    ]
+
+
+def signing_cases() -> List[Case]:
+    """Get the signing messages."""
+    common: Dict[str, Any] = dict(dialogue_reference=DIALOGUE_REFERENCE, target=0)
+    return [
+        (
+            "signing/sign_message",
+            SigningMessage(
+                performative=SigningMessage.Performative.SIGN_MESSAGE,
+                message_id=1,
+                raw_message=signing_types.RawMessage(
+                    LEDGER_ID,
+                    bytes.fromhex(_hex("safe-tx-hash", 32)[2:]),
+                    is_deprecated_mode=True,
+                ),
+                terms=_terms(),
+                **common,
+            ),
+        ),
+        (
+            "signing/signed_message",
+            SigningMessage(
+                performative=SigningMessage.Performative.SIGNED_MESSAGE,
+                message_id=2,
+                signed_message=signing_types.SignedMessage(
+                    LEDGER_ID, _hex("signature", 65), is_deprecated_mode=True
+                ),
+                **common,
+            ),
+        ),
+        (
+            "signing/sign_transaction",
+            SigningMessage(
+                performative=SigningMessage.Performative.SIGN_TRANSACTION,
+                message_id=1,
+                raw_transaction=signing_types.RawTransaction(
+                    LEDGER_ID, safe_exec_transaction()
+                ),
+                terms=_terms(),
+                **common,
+            ),
+        ),
+        (
+            "signing/signed_transaction",
+            SigningMessage(
+                performative=SigningMessage.Performative.SIGNED_TRANSACTION,
+                message_id=2,
+                signed_transaction=signing_types.SignedTransaction(
+                    LEDGER_ID, signed_transaction()
+                ),
+                **common,
+            ),
+        ),
+    ]
+
+
+def all_cases() -> List[Case]:
+    """Get all the benchmark cases."""
+    return [*contract_api_cases(), *ledger_api_cases(), *signing_cases()]
+
+
+def _ops_per_second(
+    func: Callable[[], Any], min_time: float, repeat: int = N_REPEATS
+) -> float:
+    """
+    Measure the throughput of a function.
+
+    The number of calls is calibrated to take at least 'min_time'; the
+    best of 'repeat' timings is kept, as the others are slowed down by noise.
+    """
+    n_runs = 1
+    while True:
+        started_at = time.perf_counter()
+        for _ in range(n_runs):
+            func()
+        elapsed = time.perf_counter() - started_at
+        if elapsed >= min_time:
+            break
+        n_runs *= 2
+    for _ in range(repeat - 1):
+        started_at = time.perf_counter()
+        for _ in range(n_runs):
+            func()
+        elapsed = min(elapsed, time.perf_counter() - started_at)
+    return n_runs / elapsed
+
+
+def _allocated_bytes(func: Callable[[], Any]) -> int:
+    """Measure the peak of the memory allocated by one call of a function."""
+    func()  # warm up caches, e.g. of the protobuf descriptors
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def measure(message: Any, min_time: float) -> Dict[str, Any]:
+    """
+    Measure the serialization of a message.
+
+    :param message: the message.
+    :param min_time: the minimum time to run each throughput measurement for.
+    :return: the measures.
+    """
+    serializer = message.serializer
+    try:
+        encoded = serializer.encode(message)
+    except Exception as e:  # pylint: disable=broad-except
+        # e.g. bytes which are not valid UTF-8 are not supported by the dict serializer
+        return {"error": f"{type(e).__name__}: {e}"}
+    return {
+        # e.g. integers above 2**53 are not preserved by the dict serializer
+        "round_trip": serializer.decode(encoded) == message,
+        "size_bytes": len(encoded),
+        "encode_ops_per_second": round(
+            _ops_per_second(lambda: serializer.encode(message), min_time), 1
+        ),
+        "decode_ops_per_second": round(
+            _ops_per_second(lambda: serializer.decode(encoded), min_time), 1
+        ),
+        "encode_allocated_bytes": _allocated_bytes(lambda: serializer.encode(message)),
+        "decode_allocated_bytes": _allocated_bytes(lambda: serializer.decode(encoded)),
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float,
+    time_tolerance: float,
+) -> List[str]:
+    """
+    Compare results with a baseline.
+
+    Sizes and allocations must not grow by more than the tolerance, and
+    throughput must not drop by more than the time tolerance; a message
+    preserved by a round trip must stay so.
+
+    :param results: the results.
+    :param baseline: the baseline.
+    :param tolerance: the relative tolerance of sizes and allocations.
+    :param time_tolerance: the relative tolerance of throughputs.
+    :return: the regressions found.
+    """
+    regressions = []
+    for name, measures in results.items():
+        if name not in baseline:
+            continue
+        if "error" in measures:
+            if "error" not in baseline[name]:
+                regressions.append(f"{name}: no longer encodable ({measures['error']})")
+            continue
+        for key, value in measures.items():
+            reference = baseline[name].get(key)
+            if isinstance(value, bool):
+                if reference is True and value is False:
+                    regressions.append(f"{name} {key}: no longer preserved")
+                continue
+            if reference is None or reference == 0:
+                continue
+            change = (value - reference) / reference
+            is_regression = (
+                change < -time_tolerance
+                if key.endswith("per_second")
+                else change > tolerance
+            )
+            if is_regression:
+                regressions.append(
+                    f"{name} {key}: {reference} -> {value} ({change:+.1%})"
+                )
+    return regressions
+
+
+def print_results(results: Dict[str, Dict[str, Any]]) -> None:
+    """Print the results as a table."""
+    header = (
+        f"{'case':<38} {'size':>7} {'enc/s':>10} {'dec/s':>10} "
+        f"{'enc B':>9} {'dec B':>9} {'rt':>3}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, measures in results.items():
+        if "error" in measures:
+            print(f"{name:<38} {measures['error'][:50]}")
+            continue
+        print(
+            f"{name:<38} {measures['size_bytes']:>7} "
+            f"{measures['encode_ops_per_second']:>10.0f} "
+            f"{measures['decode_ops_per_second']:>10.0f} "
+            f"{measures['encode_allocated_bytes']:>9} "
+            f"{measures['decode_allocated_bytes']:>9} "
+            f"{'ok' if measures['round_trip'] else 'NO':>3}"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.1,
+        help="minimum seconds to run each throughput measurement for",
+    )
+    parser.add_argument("--filter", default="", help="only run cases containing this")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store the results as baseline"
+    )
+    parser.add_argument(
+        "--compare", action="store_true", help="compare the results with the baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="relative tolerance of sizes and allocations",
+    )
+    parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=0.5,
+        help="relative tolerance of throughputs, which are noisy on shared machines",
+    )
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    args = parse_args()
+    results = {
+        name: measure(message, args.min_time)
+        for name, message in all_cases()
+        if args.filter in name
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_results(results)
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"baseline saved to {args.baseline}")
+    if args.compare:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline, args.tolerance, args.time_tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if len(regressions) > 0:
+            sys.exit(1)
+        print(f"no regression against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
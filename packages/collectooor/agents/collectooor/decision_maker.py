@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the decision maker handler of the collectooor agent."""
+
+from typing import Any, Dict, List
+
+from aea.decision_maker.default import DecisionMakerHandler as BaseDecisionMakerHandler
+from aea.helpers.transaction.base import SignedMessage, SignedTransaction
+
+from packages.open_aea.protocols.signing.custom_types import (
+    SignedMessages,
+    SignedTransactions,
+)
+from packages.open_aea.protocols.signing.dialogues import SigningDialogue
+from packages.open_aea.protocols.signing.message import SigningMessage
+
+
+class DecisionMakerHandler(BaseDecisionMakerHandler):
+    """This class implements the decision maker, signing batches as well."""
+
+    def _handle_signing_message(self, signing_msg: SigningMessage) -> None:
+        """
+        Handle a signing message.
+
+        :param signing_msg: the signing message
+        """
+        if signing_msg.performative not in (
+            SigningMessage.Performative.SIGN_MESSAGES,
+            SigningMessage.Performative.SIGN_TRANSACTIONS,
+        ):
+            super()._handle_signing_message(signing_msg)
+            return
+
+        signing_dialogue = self.signing_dialogues.update(signing_msg)
+        if signing_dialogue is None or not isinstance(
+            signing_dialogue, SigningDialogue
+        ):  # pragma: no cover
+            self.logger.error(
+                "[{}]: Could not construct signing dialogue. Aborting!".format(
+                    self.agent_name
+                )
+            )
+            return
+
+        if signing_msg.performative == SigningMessage.Performative.SIGN_MESSAGES:
+            self._handle_messages_signing(signing_msg, signing_dialogue)
+        else:
+            self._handle_transactions_signing(signing_msg, signing_dialogue)
+
+    def _handle_messages_signing(
+        self, signing_msg: SigningMessage, signing_dialogue: SigningDialogue
+    ) -> None:
+        """
+        Handle a batch of messages for signing.
+
+        The batch is signed as a whole: if any message cannot be signed, the reply is an error.
+
+        :param signing_msg: the signing message
+        :param signing_dialogue: the signing dialogue
+        """
+        performative = SigningMessage.Performative.ERROR
+        kwargs = {
+            "error_code": SigningMessage.ErrorCode.UNSUCCESSFUL_MESSAGE_SIGNING,
+        }  # type: Dict[str, Any]
+        signed_messages: List[SignedMessage] = []
+        for raw_message in signing_msg.raw_messages:
+            signed_message = self.wallet.sign_message(
+                raw_message.ledger_id,
+                raw_message.body,
+                raw_message.is_deprecated_mode,
+            )
+            if signed_message is None:
+                break
+            signed_messages.append(
+                SignedMessage(
+                    raw_message.ledger_id,
+                    signed_message,
+                    raw_message.is_deprecated_mode,
+                )
+            )
+        else:
+            performative = SigningMessage.Performative.SIGNED_MESSAGES
+            kwargs.pop("error_code")
+            kwargs["signed_messages"] = SignedMessages(signed_messages)
+        signing_msg_response = signing_dialogue.reply(
+            performative=performative,
+            target_message=signing_msg,
+            **kwargs,
+        )
+        self.message_out_queue.put(signing_msg_response)
+
+    def _handle_transactions_signing(
+        self, signing_msg: SigningMessage, signing_dialogue: SigningDialogue
+    ) -> None:
+        """
+        Handle a batch of transactions for signing.
+
+        The batch is signed as a whole: if any transaction cannot be signed, the reply is an error.
+
+        :param signing_msg: the signing message
+        :param signing_dialogue: the signing dialogue
+        """
+        performative = SigningMessage.Performative.ERROR
+        kwargs = {
+            "error_code": SigningMessage.ErrorCode.UNSUCCESSFUL_TRANSACTION_SIGNING,
+        }  # type: Dict[str, Any]
+        signed_transactions: List[SignedTransaction] = []
+        for raw_transaction in signing_msg.raw_transactions:
+            signed_tx = self.wallet.sign_transaction(
+                raw_transaction.ledger_id, raw_transaction.body
+            )
+            if signed_tx is None:
+                break
+            signed_transactions.append(
+                SignedTransaction(raw_transaction.ledger_id, signed_tx)
+            )
+        else:
+            performative = SigningMessage.Performative.SIGNED_TRANSACTIONS
+            kwargs.pop("error_code")
+            kwargs["signed_transactions"] = SignedTransactions(signed_transactions)
+        signing_msg_response = signing_dialogue.reply(
+            performative=performative,
+            target_message=signing_msg,
+            **kwargs,
+        )
+        self.message_out_queue.put(signing_msg_response)
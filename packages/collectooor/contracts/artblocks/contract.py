@@ -118,19 +118,119 @@ class ArtBlocksContract(Contract):
             project_id -= 1
         if project_id == 0:
             return {"project_id": None}
-        project_details = instance.functions.projectDetails(project_id).call()
-        project_script = instance.functions.projectScriptByIndex(
-            project_id, script_info[1] - 1
-        ).call()
-        result = {
-            "artist_address": project_info[0],
-            "price_per_token_in_wei": project_info[1],
+        return _get_project_result(instance, project_id, project_info, script_info)
+
+    @classmethod
+    def get_active_projects(
+        cls,
+        ledger_api: LedgerApi,
+        contract_address: str,
+        starting_id: Optional[int] = None,
+        max_projects: int = 1,
+    ) -> JSONLike:
+        """
+        Handler method for the 'get_active_projects' requests.
+
+        Works backwards like 'get_active_project', but collects up to
+        'max_projects' active projects in one request.
+
+        :param ledger_api: the ledger apis.
+        :param contract_address: the contract address.
+        :param starting_id: the starting id of projects from which to work backwards.
+        :param max_projects: the maximum number of projects to collect.
+        :return: the details of the projects, newest first; fewer than 'max_projects' when the scan is exhausted.
+        """
+        instance = cls.get_instance(ledger_api, contract_address)
+        if starting_id is None:
+            project_id = instance.functions.nextProjectId().call() - 1
+        else:
+            project_id = starting_id - 1
+        projects = []
+        while project_id > 0 and len(projects) < max_projects:
+            project_info = instance.functions.projectTokenInfo(project_id).call()
+            if project_info[4]:
+                script_info = instance.functions.projectScriptInfo(project_id).call()
+                if not script_info[5]:
+                    projects.append(
+                        _get_project_result(
+                            instance, project_id, project_info, script_info
+                        )
+                    )
+            project_id -= 1
+        return {"projects": projects}
+
+    @classmethod
+    def get_upcoming_project(
+        cls,
+        ledger_api: LedgerApi,
+        contract_address: str,
+    ) -> JSONLike:
+        """
+        Handler method for the 'get_upcoming_project' requests.
+
+        The upcoming project is the newest one, if it is not active yet and
+        has mints left: projects are announced before they are activated.
+
+        :param ledger_api: the ledger apis.
+        :param contract_address: the contract address.
+        :return: the details of the project, or a None project id.
+        """
+        instance = cls.get_instance(ledger_api, contract_address)
+        project_id = instance.functions.nextProjectId().call() - 1
+        if project_id <= 0:
+            return {"project_id": None}
+        project_info = instance.functions.projectTokenInfo(project_id).call()
+        if project_info[4] or project_info[2] >= project_info[3]:
+            return {"project_id": None}
+        script_info = instance.functions.projectScriptInfo(project_id).call()
+        return _get_project_result(instance, project_id, project_info, script_info)
+
+    @classmethod
+    def get_project_state(
+        cls,
+        ledger_api: LedgerApi,
+        contract_address: str,
+        project_id: int,
+    ) -> JSONLike:
+        """
+        Handler method for the 'get_project_state' requests.
+
+        :param ledger_api: the ledger apis.
+        :param contract_address: the contract address.
+        :param project_id: the project id.
+        :return: the state of the project, and the next project id.
+        """
+        instance = cls.get_instance(ledger_api, contract_address)
+        project_info = instance.functions.projectTokenInfo(project_id).call()
+        script_info = instance.functions.projectScriptInfo(project_id).call()
+        return {
             "project_id": project_id,
-            "project_name": project_details[0],
-            "artist": project_details[1],
-            "description": project_details[2],
-            "website": project_details[3],
-            "script": project_script,
-            "ipfs_hash": script_info[3],
+            "price_per_token_in_wei": project_info[1],
+            "invocations": project_info[2],
+            "max_invocations": project_info[3],
+            "active": project_info[4],
+            "paused": script_info[5],
+            "next_project_id": instance.functions.nextProjectId().call(),
         }
-        return result
+
+
+def _get_project_result(
+    instance: Any, project_id: int, project_info: Any, script_info: Any
+) -> JSONLike:
+    """Get the details of a project, from its token and script info."""
+    project_details = instance.functions.projectDetails(project_id).call()
+    project_script = instance.functions.projectScriptByIndex(
+        project_id, script_info[1] - 1
+    ).call()
+    result = {
+        "artist_address": project_info[0],
+        "price_per_token_in_wei": project_info[1],
+        "project_id": project_id,
+        "project_name": project_details[0],
+        "artist": project_details[1],
+        "description": project_details[2],
+        "website": project_details[3],
+        "script": project_script,
+        "ipfs_hash": script_info[3],
+    }
+    return result
@@ -19,10 +19,15 @@
 
 """This package contains a scaffold of a behaviour."""
 
+import asyncio
 import binascii
 import datetime
-from typing import Any, Callable, Dict, Optional, cast
+import math
+import time
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, cast
 
+from aea.protocols.base import Message
 from aea.protocols.dialogue.base import Dialogue
 from aea.skills.behaviours import TickerBehaviour
 
@@ -35,11 +40,37 @@ from packages.collectooor.skills.monitor.dialogues import (
     ContractApiDialogues,
     LedgerApiDialogue,
     LedgerApiDialogues,
+    RemovableDialoguesMixin,
     SigningDialogue,
     SigningDialogues,
 )
-from packages.collectooor.skills.monitor.models import Requests
+from packages.collectooor.skills.monitor.history import (
+    DEFAULT_ARCHIVE_BACKUPS,
+    DEFAULT_ARCHIVE_MAX_BYTES,
+    DEFAULT_HISTORY_SIZE,
+    PeriodArchive,
+    PeriodHistory,
+    PeriodSummary,
+)
+from packages.collectooor.skills.monitor.journal import PeriodJournal
+from packages.collectooor.skills.monitor.models import (
+    BlockClock,
+    GasTemplates,
+    NonceManager,
+    PendingRequest,
+    Requests,
+    SafeTxHasher,
+)
+from packages.collectooor.skills.monitor.signatures import SignatureClient
+from packages.collectooor.skills.monitor.tracing import (
+    PeriodTimeline,
+    Stage,
+    TraceExporter,
+)
 from packages.fetchai.connections.ledger.base import CONNECTION_ID as LEDGER_API_ADDRESS
+from packages.fetchai.connections.ledger.base import (
+    RequestDispatcher as LedgerRequestDispatcher,
+)
 from packages.fetchai.protocols.contract_api import ContractApiMessage
 from packages.fetchai.protocols.ledger_api import LedgerApiMessage
 from packages.fetchai.protocols.ledger_api.custom_types import (
@@ -49,11 +80,51 @@ from packages.fetchai.protocols.ledger_api.custom_types import (
 from packages.open_aea.protocols.signing import SigningMessage
 from packages.open_aea.protocols.signing.custom_types import (
     RawMessage,
+    RawMessages,
     RawTransaction,
+    RawTransactions,
     SignedTransaction,
     Terms,
 )
-from packages.valory.contracts.gnosis_safe.contract import GnosisSafeContract
+from packages.valory.contracts.gnosis_safe.contract import (
+    GnosisSafeContract,
+    MULTISEND_CALL_ONLY_CONTRACT,
+    SafeOperation,
+)
+
+
+# the connection polls for the receipt and then for the transaction
+RECEIPT_REQUEST_TIMEOUT = (
+    2 * LedgerRequestDispatcher.MAX_ATTEMPTS * LedgerRequestDispatcher.TIMEOUT + 60
+)
+DEFAULT_PREPARATION_MAX_AGE = 60.0
+DEFAULT_SIGNING_BATCH_WINDOW = 0.02
+DEFAULT_SIGNATURE_POLL_INTERVAL = 0.5
+# the revert reasons of the Safe for signatures not matching its owners and nonce
+SIGNATURE_REVERT_PREFIX = "GS02"
+# the least time between two reads of the block header, as a share of the block interval
+HEADER_POLL_FRACTION = 0.1
+# nodes only accept a transaction replacing a pending one with the same
+# nonce if it raises all its fees by at least 10%
+MIN_REPLACEMENT_FEE_BUMP = 1.1
+DEFAULT_REPLACEMENT_FEE_BUMP = 1.125
+DEFAULT_MAX_REPLACEMENTS = 3
+FEE_FIELDS = ("gasPrice", "maxFeePerGas", "maxPriorityFeePerGas")
+
+
+def bump_fees(transaction: Dict[str, Any], factor: float) -> Dict[str, Any]:
+    """
+    Get a copy of a raw transaction with its fees raised, to replace it.
+
+    :param transaction: the raw transaction.
+    :param factor: the factor the fees are multiplied by.
+    :return: the raw transaction with the raised fees.
+    """
+    bumped = dict(transaction)
+    for name in FEE_FIELDS:
+        if name in bumped:
+            bumped[name] = math.ceil(bumped[name] * factor)
+    return bumped
 
 
 class Period:  # pylint: disable=too-many-instance-attributes
@@ -64,22 +135,73 @@ class Period:  # pylint: disable=too-many-instance-attributes
         period_id: int,
         seconds_between_periods: int,
         starting_id: Optional[int] = None,
+        is_prepared: bool = False,
+        parent_id: Optional[int] = None,
     ):
         """Constructor of period."""
         self.period_id = period_id
         self.seconds_between_periods = seconds_between_periods
         self.starting_id = starting_id
+        # the id of the period which picked the project of this one, if another
+        self.parent_id = parent_id
         self.active_project: Optional[int] = None
         self.project_details: Optional[dict] = None
         self.is_request_in_flight = False
         self.data: Optional[bytes] = None
+        # the number of tokens of each project bought by the purchase
+        self.n_tokens = 1
+        # the details and the purchase data, once read, of the projects
+        # bought along with the active one by the same Safe transaction
+        self.bundled_projects: List[dict] = []
+        self.bundled_data: List[Any] = []
         self.gnosis_hash: Optional[str] = None
+        # the account and Safe nonces reserved for the purchase
+        self.nonces: Optional[Tuple[int, int]] = None
         self.signed_message: Optional[str] = None
+        # the signatures of the Safe transaction hash by the owners, once
+        # enough of them have signed, and the collection state
+        self.signatures_by_owner: Optional[Dict[str, str]] = None
+        self.is_signature_submitted = False
+        self.next_signature_poll_at = 0.0
         self.raw_transaction: Optional[RawTransaction] = None
+        # the gas estimated by the simulation of the raw transaction, once it
+        # succeeded, the number of simulations that did not by project, and
+        # the projects skipped because the minter refuses their purchase
+        self.simulated_gas: Optional[int] = None
+        self.simulation_failures: Dict[int, int] = {}
+        self.skipped_projects: Set[int] = set()
         self.signed_transaction: Optional[SignedTransaction] = None
         self.tx_digest: Optional[TransactionDigest] = None
+        # the digests of the transaction and of the ones replacing it, in the
+        # order they were sent, the block after which the last one is
+        # replaced, and the monotonic times of the first broadcast and of the
+        # next lookup of the digests
+        self.tx_digests: List[str] = []
+        self.n_replacements = 0
+        self.replacement_block: Optional[int] = None
+        self.broadcast_at: Optional[float] = None
+        self.next_watch_at = 0.0
+        # the dialogues of the broadcasts by digest, until a receipt is
+        # requested in them, which ends them
+        self.transaction_dialogues: Dict[str, LedgerApiDialogue] = {}
         self._tx_receipt: Optional[TransactionReceipt] = None
         self.finish_time: Optional[datetime.datetime] = None
+        # the failed attempts at requests, in all and at the request of the
+        # current stage, which a successful response resets
+        self.n_timeouts = 0
+        self.n_request_failures = 0
+        self.is_failed = False
+        # whether the period was resumed from the journal after a restart
+        self.is_resumed = False
+        # whether the purchase is prepared before the project goes active,
+        # and whether it did, so that the transaction can be broadcast
+        self.is_prepared = is_prepared
+        self.is_dropped = False
+        # monotonic time the prepared transaction was signed at
+        self.prepared_at: Optional[float] = None
+        # monotonic time before which no new project discovery request is sent
+        self.next_discovery_at = 0.0
+        self.timeline = PeriodTimeline()
 
     @property
     def tx_receipt(self) -> Optional[TransactionReceipt]:
@@ -92,6 +214,82 @@ class Period:  # pylint: disable=too-many-instance-attributes
         self._tx_receipt = tx_receipt
         self.finish_time = datetime.datetime.now()
 
+    @property
+    def purchases(self) -> List[Tuple[int, int, Any]]:
+        """Get the project id, the price per token and the purchase data of each project bought by the period."""
+        projects = [cast(dict, self.project_details), *self.bundled_projects]
+        data = [self.data, *self.bundled_data]
+        data += [None] * (len(projects) - len(data))
+        return [
+            (details["project_id"], details["price_per_token_in_wei"], project_data)
+            for details, project_data in zip(projects, data)
+        ]
+
+    @property
+    def n_simulation_failures(self) -> int:
+        """Get the number of failed simulations, for all the projects of the period."""
+        return sum(self.simulation_failures.values())
+
+    def fail(self) -> None:
+        """Mark the period as failed."""
+        self.is_failed = True
+        self.is_request_in_flight = False
+        self.finish_time = datetime.datetime.now()
+
+    def summary(self) -> PeriodSummary:
+        """Get the compact summary of the period."""
+        receipt = self.tx_receipt.receipt if self.tx_receipt is not None else {}
+        return PeriodSummary(
+            period_id=self.period_id,
+            project_id=self.active_project,
+            value=(
+                sum(price * self.n_tokens for _, price, _ in self.purchases)
+                if self.project_details is not None
+                else None
+            ),
+            gas_used=receipt.get("gasUsed"),
+            simulated_gas=self.simulated_gas,
+            tx_digest=self.tx_digest.body if self.tx_digest is not None else None,
+            is_failed=self.is_failed,
+            rpc_count=self.timeline.rpc_count,
+            stage_durations=self.timeline.durations(),
+        )
+
+    def to_record(self) -> Dict[str, Any]:
+        """Get the full record of the period."""
+        return {
+            "period_id": self.period_id,
+            "parent_id": self.parent_id,
+            "project_id": self.active_project,
+            "project_details": self.project_details,
+            "n_tokens": self.n_tokens,
+            "data": self.data,
+            "bundled_projects": self.bundled_projects,
+            "bundled_data": self.bundled_data,
+            "gnosis_hash": self.gnosis_hash,
+            "nonces": self.nonces,
+            "signed_message": self.signed_message,
+            "raw_transaction": (
+                self.raw_transaction.body if self.raw_transaction is not None else None
+            ),
+            "simulated_gas": self.simulated_gas,
+            "signed_transaction": (
+                self.signed_transaction.body
+                if self.signed_transaction is not None
+                else None
+            ),
+            "tx_digest": self.tx_digest.body if self.tx_digest is not None else None,
+            "tx_digests": self.tx_digests,
+            "n_replacements": self.n_replacements,
+            "tx_receipt": (
+                self.tx_receipt.receipt if self.tx_receipt is not None else None
+            ),
+            "is_failed": self.is_failed,
+            "n_timeouts": self.n_timeouts,
+            "finish_time": self.finish_time,
+            "stage_durations": self.timeline.durations(),
+        }
+
     def is_done(self) -> bool:
         """Check if the period is done."""
         return (
@@ -103,7 +301,16 @@ class Period:  # pylint: disable=too-many-instance-attributes
 
 
 class Monitoring(TickerBehaviour):  # pylint: disable=too-many-instance-attributes
-    """This class scaffolds a behaviour."""
+    """
+    Purchase the acceptable Art Blocks projects through the Safe.
+
+    Up to 'max_concurrent_periods' periods are in flight at once, each
+    moving to its next stage as soon as a response updates its state; the
+    behaviour also wakes up when a request expires or a period waits until
+    a given time, e.g. to scan for new projects again, so the ticks are
+    only a fallback. The optional features are described where their
+    arguments are read, in '__init__'.
+    """
 
     def __init__(self, *args: Any, **kwargs: Any):
         """Init the monitoring behaviour."""
@@ -119,145 +326,992 @@ class Monitoring(TickerBehaviour):  # pylint: disable=too-many-instance-attribut
             "safe_contract", "0x2caB92c1E9D2a701Ca0411b0ff35A0907Ca31F7f"
         )
         self.seconds_between_periods = kwargs.pop("seconds_between_periods", 30)
+        self.request_timeout: Optional[float] = kwargs.pop("request_timeout", None)
+        self.receipt_request_timeout = kwargs.pop(
+            "receipt_request_timeout", RECEIPT_REQUEST_TIMEOUT
+        )
+        self.max_request_retries = kwargs.pop("max_request_retries", 3)
+        # queue the hashes and transactions to sign for 'signing_batch_window'
+        # seconds and sign them with one request; the decision maker must
+        # support the batch performatives of the signing protocol, as the one
+        # shipped with the collectooor agent does
+        self.batch_signing = bool(kwargs.pop("batch_signing", False))
+        # simulate the raw transactions against the pending block before
+        # signing them; a project whose purchase would fail is skipped
+        self.simulate_transactions = bool(kwargs.pop("simulate_transactions", False))
+        # get the fees for this urgency from the fee oracle of the connection
+        self.fee_urgency: Optional[str] = kwargs.pop("fee_urgency", None)
+        # look the broadcast transactions up once per block, and replace the
+        # last one with bumped fees when none is mined within that many
+        # blocks, up to 'max_replacements' times
+        self.replacement_deadline_blocks: Optional[int] = kwargs.pop(
+            "replacement_deadline_blocks", None
+        )
+        self.replacement_fee_bump = float(
+            kwargs.pop("replacement_fee_bump", DEFAULT_REPLACEMENT_FEE_BUMP)
+        )
+        self.max_replacements = int(
+            kwargs.pop("max_replacements", DEFAULT_MAX_REPLACEMENTS)
+        )
+        # collect the signatures of the co-owners of a Safe with a threshold
+        # above 1 through this signature aggregation service
+        signature_service_url: Optional[str] = kwargs.pop("signature_service_url", None)
+        self.signature_poll_interval = float(
+            kwargs.pop("signature_poll_interval", DEFAULT_SIGNATURE_POLL_INTERVAL)
+        )
+        self.signing_batch_window = float(
+            kwargs.pop("signing_batch_window", DEFAULT_SIGNING_BATCH_WINDOW)
+        )
+        # the tokens of each project bought per purchase, with one MultiSend call
+        self.batch_size = int(kwargs.pop("batch_size", 1))
+        # the projects a period picks at once, within 'period_budget_in_wei';
+        # each one but the first is purchased by a sibling period, unless
+        # 'bundle_projects' buys them all with one MultiSend call
+        self.max_projects_per_period = int(kwargs.pop("max_projects_per_period", 1))
+        self.period_budget_in_wei: Optional[int] = kwargs.pop(
+            "period_budget_in_wei", None
+        )
+        self.bundle_projects = bool(kwargs.pop("bundle_projects", False))
+        self.multisend_contract = kwargs.pop(
+            "multisend_contract", MULTISEND_CALL_ONLY_CONTRACT
+        )
+        # a new period starts discovering the next project as soon as the
+        # newest one has found its own, up to this many periods in flight
+        self.max_concurrent_periods = int(kwargs.pop("max_concurrent_periods", 1))
+        self.discovery_interval = float(kwargs.pop("discovery_interval", 0.5))
+        trace_file: Optional[str] = kwargs.pop("trace_file", None)
+        history_size = int(kwargs.pop("history_size", DEFAULT_HISTORY_SIZE))
+        archive_file: Optional[str] = kwargs.pop("archive_file", None)
+        archive_max_bytes = int(
+            kwargs.pop("archive_max_bytes", DEFAULT_ARCHIVE_MAX_BYTES)
+        )
+        archive_backups = int(kwargs.pop("archive_backups", DEFAULT_ARCHIVE_BACKUPS))
+        journal_file: Optional[str] = kwargs.pop("journal_file", None)
+        # sign the purchase of the announced project ahead of its drop, in
+        # a period of its own, and prepare it again when older than
+        # 'preparation_max_age' seconds
+        self.prepare_purchases = bool(kwargs.pop("prepare_purchases", False))
+        self.preparation_max_age = float(
+            kwargs.pop("preparation_max_age", DEFAULT_PREPARATION_MAX_AGE)
+        )
+        # the start timestamps or blocks of the drops known in advance, by
+        # project id; their prepared purchases are sent for the first block
+        # the projects are active in
+        self.drop_schedule: Dict[int, Dict[str, int]] = {
+            int(project_id): {key: int(value) for key, value in start.items()}
+            for project_id, start in kwargs.pop("drop_schedule", {}).items()
+        }
         super().__init__(*args, **kwargs)
-        self.periods: Dict[int, Period] = {}
+        if self.max_concurrent_periods < 1:
+            raise ValueError("max_concurrent_periods must be at least 1")
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if self.max_projects_per_period < 1:
+            raise ValueError("max_projects_per_period must be at least 1")
+        if (
+            self.replacement_deadline_blocks is not None
+            and self.replacement_deadline_blocks < 1
+        ):
+            raise ValueError("replacement_deadline_blocks must be at least 1")
+        if self.replacement_fee_bump < MIN_REPLACEMENT_FEE_BUMP:
+            raise ValueError(
+                f"replacement_fee_bump must be at least {MIN_REPLACEMENT_FEE_BUMP}"
+            )
+        for start in self.drop_schedule.values():
+            if set(start) not in ({"timestamp"}, {"block"}):
+                raise ValueError(
+                    "the start of a drop must be either a timestamp or a block"
+                )
+        self._trace_exporter = (
+            TraceExporter(trace_file) if trace_file is not None else None
+        )
+        self.history = PeriodHistory(
+            history_size,
+            archive=(
+                PeriodArchive(archive_file, archive_max_bytes, archive_backups)
+                if archive_file is not None
+                else None
+            ),
+        )
+        self._journal = (
+            PeriodJournal(journal_file) if journal_file is not None else None
+        )
+        self._signature_client = (
+            SignatureClient(signature_service_url)
+            if signature_service_url is not None
+            else None
+        )
+        # the owners and the threshold of the Safe, once read
+        self._safe_owners: Optional[Tuple[List[str], int]] = None
+        self.in_flight_periods: Dict[int, Period] = {}
         self.count = 0
         self._active_period: Optional[Period] = None
+        self._prepared_period: Optional[Period] = None
+        self._is_acting = False
+        # whether the behaviour was woken up while acting
+        self._is_wake_pending = False
+        # monotonic time the next block header is read at
+        self._next_header_at = 0.0
+        # the next wake up, and the monotonic time it is scheduled at
+        self._wake_handle: Optional[asyncio.TimerHandle] = None
+        self._wake_handle_at = 0.0
+        # the periods waiting for their Safe hash or raw transaction to be
+        # signed in the next batch, and the monotonic time the batch is sent at
+        self._messages_to_sign: List[Period] = []
+        self._transactions_to_sign: List[Period] = []
+        self._signing_batch_at: Optional[float] = None
+        self._signing_batch_handle: Optional[asyncio.TimerHandle] = None
 
     @property
     def active_period(self) -> Period:
-        """Get the active period."""
+        """Get the active period, i.e. the most recently started one."""
         if self._active_period is None:
             raise ValueError("active period not set")
         return self._active_period
 
+    @property
+    def safe_tx_hasher(self) -> SafeTxHasher:
+        """Get the Safe transaction hasher."""
+        return cast(SafeTxHasher, self.context.safe_tx_hasher)
+
+    @property
+    def nonce_manager(self) -> NonceManager:
+        """Get the nonce manager."""
+        return cast(NonceManager, self.context.nonce_manager)
+
+    @property
+    def gas_templates(self) -> GasTemplates:
+        """Get the gas limits of the Safe transaction templates."""
+        return cast(GasTemplates, self.context.gas_templates)
+
+    @property
+    def block_clock(self) -> BlockClock:
+        """Get the model of the block cadence."""
+        return cast(BlockClock, self.context.block_clock)
+
     def set_next_period(self) -> None:
         """Set the next period."""
         current_period = self._active_period
         starting_id = current_period.starting_id if current_period is not None else None
         new_period = Period(self.count, self.seconds_between_periods, starting_id)
-        self.periods[self.count] = new_period
+        self.in_flight_periods[self.count] = new_period
         self._active_period = new_period
         self.context.logger.info(f"starting new period with id={self.count}")
         self.count += 1
 
+    def set_sibling_period(self, period: Period) -> Period:
+        """Set a period purchasing one more of the projects picked by a period."""
+        sibling = Period(
+            self.count, self.seconds_between_periods, parent_id=period.period_id
+        )
+        self.in_flight_periods[self.count] = sibling
+        self._journal_record(sibling, parent_id=period.period_id)
+        self.context.logger.info(
+            f"starting new period with id={self.count} from period with id={period.period_id}"
+        )
+        self.count += 1
+        return sibling
+
+    def set_prepared_period(self) -> None:
+        """Set the period preparing the purchase of the upcoming project."""
+        period = Period(self.count, self.seconds_between_periods, is_prepared=True)
+        self.in_flight_periods[self.count] = period
+        self._prepared_period = period
+        self.context.logger.info(f"starting new prepared period with id={self.count}")
+        self.count += 1
+
     def setup(self) -> None:
         """Implement the setup."""
-        self.set_next_period()
+        self._resume_periods()
+        if self._should_start_period():
+            self.set_next_period()
+
+    def _resume_periods(self) -> None:
+        """
+        Resume the periods left unfinished by a previous run, from the journal.
+
+        A period with a transaction digest waits for its receipt; a period
+        with a signed transaction broadcasts it again. Any other period
+        resumes from its Safe transaction hash, or from an earlier stage,
+        since its nonces may have been reserved again by now.
+        """
+        if self._journal is None:
+            return
+        for period_id, state in self._journal.replay().items():
+            period = Period(
+                period_id, self.seconds_between_periods, state.get("starting_id")
+            )
+            period.is_resumed = True
+            period.is_prepared = state.get("is_prepared", False)
+            period.parent_id = state.get("parent_id")
+            period.active_project = state.get("active_project")
+            period.project_details = state.get("project_details")
+            period.n_tokens = state.get("n_tokens", 1)
+            period.data = state.get("data")
+            period.bundled_projects = state.get("bundled_projects", [])
+            period.bundled_data = state.get("bundled_data", [])
+            if "signed_transaction" in state:
+                # a prepared transaction is only journaled once its project is active
+                period.is_dropped = period.is_prepared
+                ledger_id = state["ledger_id"]
+                period.nonces = cast(Tuple[int, int], tuple(state["nonces"]))
+                period.gnosis_hash = state["gnosis_hash"]
+                period.signed_message = state["signed_message"]
+                period.raw_transaction = RawTransaction(
+                    ledger_id, state["raw_transaction"]
+                )
+                period.signed_transaction = SignedTransaction(
+                    ledger_id, state["signed_transaction"]
+                )
+                self.nonce_manager.restore(period.nonces)
+                if "tx_digest" in state:
+                    period.tx_digest = TransactionDigest(ledger_id, state["tx_digest"])
+                    period.tx_digests = state.get("tx_digests", [state["tx_digest"]])
+                    period.n_replacements = len(period.tx_digests) - 1
+            self.in_flight_periods[period_id] = period
+            if period.is_prepared:
+                self._prepared_period = period
+            elif period.parent_id is None:
+                self._active_period = period
+            self.context.logger.info(
+                f"resuming period with id={period_id} from the journal."
+            )
+        if self._journal.last_period_id is not None:
+            self.count = self._journal.last_period_id + 1
+
+    def _journal_record(self, period: Period, **fields: Any) -> None:
+        """Record a state transition of a period in the journal, if enabled."""
+        if self._journal is not None:
+            self._journal.record(period.period_id, **fields)
+
+    def _retire_done_periods(self) -> None:
+        """Move the done periods from the in-flight ones to the history."""
+        for period_id, period in list(self.in_flight_periods.items()):
+            if not period.is_done():
+                continue
+            del self.in_flight_periods[period_id]
+            if period is self._prepared_period:
+                self._prepared_period = None
+            if self._journal is not None:
+                self._journal.finish(period_id)
+            self._export_trace(period)
+            self.history.add(period.summary(), period.to_record())
+            self._end_transaction_dialogues(period)
+
+    def _should_start_period(self) -> bool:
+        """Check whether a new period can start; the prepared and sibling ones do not count."""
+        n_periods = sum(
+            not period.is_prepared and period.parent_id is None
+            for period in self.in_flight_periods.values()
+        )
+        if n_periods == 0:
+            return True
+        return (
+            n_periods < self.max_concurrent_periods
+            and self.active_period.active_project is not None
+        )
 
     def act(self) -> None:
         """Implement the act."""
-        if self.active_period.is_done():
+        if self._is_acting:
+            # e.g. a response handled while acting: act again once done
+            self._is_wake_pending = True
+            return
+        self._is_acting = True
+        try:
+            self._is_wake_pending = True
+            while self._is_wake_pending:
+                self._is_wake_pending = False
+                self._act_once()
+            self._schedule_wake()
+        finally:
+            self._is_acting = False
+
+    def _act_once(self) -> None:
+        """Expire the requests, start the periods due and move each one to its next stage."""
+        cast(Requests, self.context.requests).expire()
+
+        self._retire_done_periods()
+        if self._should_start_period():
             self.set_next_period()
+        if self.prepare_purchases and self._prepared_period is None:
+            self.set_prepared_period()
 
+        for period in list(self.in_flight_periods.values()):
+            if not (
+                period.is_failed
+                or period.is_request_in_flight
+                or period.finish_time is not None
+            ):
+                self._act_period(period)
+        self._act_signing_batch()
+        if self._journal is not None:
+            self._journal.sync()
+
+    def wake(self) -> None:
+        """Act right away, instead of waiting for the next tick."""
+        self.act()
+
+    def _wake_at(self, wake_at: float) -> None:
+        """Act at a monotonic time, instead of waiting for the next tick after it; an earlier wake up is kept."""
+        now = time.monotonic()
+        handle = self._wake_handle
+        if handle is not None and not handle.cancelled():
+            if now < self._wake_handle_at <= wake_at:
+                return
+            handle.cancel()
+        loop = asyncio.get_event_loop()
+        self._wake_handle = loop.call_later(max(wake_at - now, 0.0), self.wake)
+        self._wake_handle_at = wake_at
+
+    def _schedule_wake(self) -> None:
+        """Wake up at the next time a request expires or a period waits for, as the ticks may be far apart."""
+        now = time.monotonic()
+        deadlines = [
+            cast(Requests, self.context.requests).next_deadline,
+            self._next_header_at,
+        ]
+        for period in self.in_flight_periods.values():
+            if not (period.is_failed or period.finish_time is not None):
+                deadlines += [
+                    period.next_discovery_at,
+                    period.next_signature_poll_at,
+                    period.next_watch_at,
+                ]
+        upcoming = [
+            deadline
+            for deadline in deadlines
+            if deadline is not None and deadline > now
+        ]
+        if len(upcoming) > 0:
+            self._wake_at(min(upcoming))
+
+    def _on_response(
+        self,
+        periods: List[Period],
+        request_callback: Callable,
+        error_callback: Optional[Callable[[Message], None]],
+        message: Message,
+    ) -> None:
+        """
+        Call the callback of a request with its response, or the error one with an error, then wake up.
+
+        :param periods: the periods the request was made for, whose stage succeeds with a response
+        :param request_callback: the callback of the response
+        :param error_callback: the callback of an error response, if not handled by the request callback
+        :param message: the response
+        """
         if (
-            self.active_period.active_project is None
-            and not self.active_period.is_request_in_flight
+            error_callback is not None
+            and message.performative == type(message).Performative.ERROR
         ):
+            error_callback(message)
+        else:
+            request_callback(message)
+            for period in periods:
+                period.n_request_failures = 0
+        self.wake()
+
+    def _act_period(self, period: Period) -> None:  # pylint: disable=too-many-branches
+        """Send the request of the current stage of a period, if none is in flight."""
+        if period.is_prepared and not period.is_dropped:
+            self._check_preparation(period)
+        if (
+            period.active_project is None
+            and not period.is_request_in_flight
+            and time.monotonic() >= period.next_discovery_at
+        ):
+            period.timeline.start(Stage.PROJECT_DISCOVERY)
+            if period.is_prepared:
+                self.send_contract_api_request(
+                    period=period,
+                    request_callback=partial(self.handle_upcoming_project, period),
+                    performative=ContractApiMessage.Performative.GET_STATE,  # type: ignore
+                    contract_address=self.artblocks_contract,
+                    contract_id=str(ArtBlocksContract.contract_id),
+                    contract_callable="get_upcoming_project",
+                )
+                return
+            if self.max_projects_per_period > 1:
+                self.send_contract_api_request(
+                    period=period,
+                    request_callback=partial(self.handle_active_projects, period),
+                    performative=ContractApiMessage.Performative.GET_STATE,  # type: ignore
+                    contract_address=self.artblocks_contract,
+                    contract_id=str(ArtBlocksContract.contract_id),
+                    contract_callable="get_active_projects",
+                    starting_id=period.starting_id,
+                    max_projects=self.max_projects_per_period,
+                )
+                return
             self.send_contract_api_request(
-                request_callback=self.handle_active_project_id,
+                period=period,
+                request_callback=partial(self.handle_active_project_id, period),
                 performative=ContractApiMessage.Performative.GET_STATE,  # type: ignore
                 contract_address=self.artblocks_contract,
                 contract_id=str(ArtBlocksContract.contract_id),
                 contract_callable="get_active_project",
-                starting_id=self.active_period.starting_id,
+                starting_id=period.starting_id,
             )
         if (
-            self.active_period.active_project is not None
-            and self.active_period.data is None
-            and not self.active_period.is_request_in_flight
+            period.active_project is not None
+            and not self._has_purchase_data(period)
+            and not period.is_request_in_flight
         ):
+            period.timeline.start(Stage.PURCHASE_DATA)
+            # the data of the active project, then of each bundled one
+            project_id = (
+                period.active_project
+                if period.data is None
+                else period.bundled_projects[len(period.bundled_data)]["project_id"]
+            )
             self.send_contract_api_request(
-                request_callback=self.handle_purchase_data,
+                period=period,
+                request_callback=partial(self.handle_purchase_data, period),
                 performative=ContractApiMessage.Performative.GET_STATE,  # type: ignore
                 contract_address=self.artblocks_periphery_contract,
                 contract_id=str(ArtBlocksPeripheryContract.contract_id),
                 contract_callable="purchase_data",
-                project_id=self.active_period.active_project,
+                project_id=project_id,
             )
         if (
-            self.active_period.data is not None
-            and self.active_period.project_details is not None
-            and self.active_period.gnosis_hash is None
-            and not self.active_period.is_request_in_flight
+            period.active_project is not None
+            and self._has_purchase_data(period)
+            and period.project_details is not None
+            and period.gnosis_hash is None
+            and not period.is_request_in_flight
         ):
-            self.send_contract_api_request(
-                request_callback=self.handle_gnosis_hash,
-                performative=ContractApiMessage.Performative.GET_STATE,  # type: ignore
-                contract_address=self.safe_contract,
-                contract_id=str(GnosisSafeContract.contract_id),
-                contract_callable="get_raw_safe_transaction_hash",
-                to_address=self.artblocks_periphery_contract,
-                value=self.active_period.project_details["price_per_token_in_wei"],
-                data=self.active_period.data,
-                safe_tx_gas=self.safe_tx_gas,
-            )
+            self._act_gnosis_hash(period)
         if (
-            self.active_period.gnosis_hash is not None
-            and self.active_period.signed_message is None
-            and not self.active_period.is_request_in_flight
+            period.gnosis_hash is not None
+            and period.signed_message is None
+            and not period.is_request_in_flight
         ):
-            safe_tx_hash_bytes = binascii.unhexlify(self.active_period.gnosis_hash)
-            self.send_signing_request(
-                request_callback=self.handle_signing_message_response,
-                raw_message=safe_tx_hash_bytes,
-                is_deprecated_mode=True,
-            )
+            period.timeline.start(Stage.MESSAGE_SIGNING, is_rpc=False)
+            if self.batch_signing:
+                self._queue_for_signing(self._messages_to_sign, period)
+            else:
+                safe_tx_hash_bytes = binascii.unhexlify(period.gnosis_hash)
+                self.send_signing_request(
+                    period=period,
+                    request_callback=partial(
+                        self.handle_signing_message_response, period
+                    ),
+                    raw_message=safe_tx_hash_bytes,
+                    is_deprecated_mode=True,
+                )
         if (
-            self.active_period.signed_message is not None
-            and self.active_period.project_details is not None
-            and self.active_period.raw_transaction is None
-            and not self.active_period.is_request_in_flight
+            self._signature_client is not None
+            and period.signed_message is not None
+            and period.signatures_by_owner is None
+            and not period.is_request_in_flight
         ):
+            self._act_signature_collection(period)
+        if (
+            period.signed_message is not None
+            and period.project_details is not None
+            and period.raw_transaction is None
+            and (self._signature_client is None or period.signatures_by_owner)
+            and not period.is_request_in_flight
+        ):
+            period.timeline.start(Stage.RAW_SAFE_TX)
+            to_address, value, data, operation = self._get_safe_call(period)
             self.send_contract_api_request(
-                request_callback=self.handle_gnosis_tx,
+                period=period,
+                request_callback=partial(self.handle_gnosis_tx, period),
                 performative=ContractApiMessage.Performative.GET_RAW_TRANSACTION,  # type: ignore
                 contract_address=self.safe_contract,
                 contract_id=str(GnosisSafeContract.contract_id),
                 contract_callable="get_raw_safe_transaction",
                 sender_address=self.context.agent_address,
-                owners=(self.context.agent_address,),
-                to_address=self.artblocks_periphery_contract,
-                value=self.active_period.project_details["price_per_token_in_wei"],
-                data=self.active_period.data,
-                signatures_by_owner={
-                    self.context.agent_address: self.active_period.signed_message
-                },
+                owners=tuple(self._get_signatures_by_owner(period)),
+                to_address=to_address,
+                value=value,
+                data=data,
+                signatures_by_owner=self._get_signatures_by_owner(period),
+                operation=operation,
                 safe_tx_gas=self.safe_tx_gas,
+                nonce=cast(Tuple[int, int], period.nonces)[0],
+                gas=self.gas_templates.get(self._get_gas_template_key(period)),
+                urgency=self.fee_urgency,
             )
         if (
-            self.active_period.raw_transaction is not None
-            and self.active_period.signed_transaction is None
-            and not self.active_period.is_request_in_flight
+            period.raw_transaction is not None
+            and period.simulated_gas is None
+            and self._should_simulate(period)
+            and not period.is_request_in_flight
         ):
-            self.send_transaction_signing_request(
-                request_callback=self.handle_signing_transaction_response,
-                raw_transaction=self.active_period.raw_transaction,
+            period.timeline.start(Stage.SIMULATION)
+            self.send_contract_api_request(
+                period=period,
+                request_callback=partial(self.handle_simulation, period),
+                performative=ContractApiMessage.Performative.GET_STATE,  # type: ignore
+                contract_address=self.safe_contract,
+                contract_id=str(GnosisSafeContract.contract_id),
+                contract_callable="simulate_safe_transaction",
+                transaction=period.raw_transaction.body,
             )
         if (
-            self.active_period.signed_transaction is not None
-            and self.active_period.tx_digest is None
-            and not self.active_period.is_request_in_flight
+            period.raw_transaction is not None
+            and period.signed_transaction is None
+            and (period.simulated_gas is not None or not self._should_simulate(period))
+            and not period.is_request_in_flight
+        ):
+            period.timeline.start(Stage.TX_SIGNING, is_rpc=False)
+            if self.batch_signing:
+                self._queue_for_signing(self._transactions_to_sign, period)
+            else:
+                self.send_transaction_signing_request(
+                    period=period,
+                    request_callback=partial(
+                        self.handle_signing_transaction_response, period
+                    ),
+                    raw_transaction=period.raw_transaction,
+                )
+        if (
+            period.signed_transaction is not None
+            and period.is_prepared
+            and not period.is_dropped
+            and not period.is_request_in_flight
+        ):
+            self._act_drop_wait(period)
+        if (
+            period.signed_transaction is not None
+            and period.tx_digest is None
+            and (not period.is_prepared or period.is_dropped)
+            and not period.is_request_in_flight
         ):
+            period.timeline.start(Stage.BROADCAST)
             self.send_transaction_request(
-                request_callback=self.handle_transaction_response,
-                signed_transaction=self.active_period.signed_transaction,
+                period=period,
+                request_callback=partial(self.handle_transaction_response, period),
+                signed_transaction=period.signed_transaction,
             )
         if (
-            self.active_period.tx_digest is not None
-            and self.active_period.tx_receipt is None
-            and not self.active_period.is_request_in_flight
+            period.tx_digest is not None
+            and period.tx_receipt is None
+            and self.replacement_deadline_blocks is not None
+            and not period.is_request_in_flight
         ):
+            self._act_watch(period)
+        if (
+            period.tx_digest is not None
+            and period.tx_receipt is None
+            and self.replacement_deadline_blocks is None
+            and not period.is_request_in_flight
+        ):
+            period.timeline.start(Stage.RECEIPT)
             self.send_transaction_receipt_request(
-                request_callback=self.handle_transaction_receipt_response,
-                transaction_digest=self.active_period.tx_digest,
+                period=period,
+                request_callback=partial(
+                    self.handle_transaction_receipt_response, period
+                ),
+                transaction_digest=period.tx_digest,
             )
 
+    def _act_watch(self, period: Period) -> None:
+        """Look the digests of a period up, once per block, until one of them is mined."""
+        now = time.monotonic()
+        if now < period.next_watch_at:
+            return
+        period.timeline.start(Stage.RECEIPT)
+        self.send_contract_api_request(
+            period=period,
+            request_callback=partial(self.handle_mined_transaction, period, now),
+            performative=ContractApiMessage.Performative.GET_STATE,  # type: ignore
+            contract_address=self.safe_contract,
+            contract_id=str(GnosisSafeContract.contract_id),
+            contract_callable="get_mined_transaction",
+            tx_hashes=tuple(period.tx_digests),
+        )
+
+    def _replace_transaction(self, period: Period) -> None:
+        """Raise the fees of the stuck transaction of a period, to sign and broadcast it again."""
+        raw_transaction = cast(RawTransaction, period.raw_transaction)
+        period.raw_transaction = RawTransaction(
+            raw_transaction.ledger_id,
+            bump_fees(raw_transaction.body, self.replacement_fee_bump),
+        )
+        period.signed_transaction = None
+        period.tx_digest = None
+        period.replacement_block = None
+        period.n_replacements += 1
+        self.context.logger.info(
+            f"transaction {period.tx_digests[-1]} of period with id={period.period_id} "
+            f"is stuck, replacing it ({period.n_replacements}/{self.max_replacements})."
+        )
+
+    def _act_gnosis_hash(self, period: Period) -> None:
+        """Hash the Safe transaction of a period, reading its domain or nonces if needed."""
+        if not self.safe_tx_hasher.is_ready:
+            period.timeline.start(Stage.GNOSIS_HASH)
+            self.send_contract_api_request(
+                period=period,
+                request_callback=partial(self.handle_safe_domain, period),
+                performative=ContractApiMessage.Performative.GET_STATE,  # type: ignore
+                contract_address=self.safe_contract,
+                contract_id=str(GnosisSafeContract.contract_id),
+                contract_callable="get_safe_domain",
+            )
+            return
+        prepared_period = self._prepared_period
+        if (
+            not period.is_prepared
+            and prepared_period is not None
+            and prepared_period.nonces is not None
+            and not prepared_period.is_dropped
+        ):
+            # the purchase of an active project goes first
+            if prepared_period.is_request_in_flight:
+                return
+            self._unprepare(prepared_period)
+        if self.nonce_manager.needs_sync:
+            if not self.nonce_manager.can_sync:
+                # wait for the outstanding reservations to be settled
+                return
+            period.timeline.start(Stage.GNOSIS_HASH)
+            self.send_contract_api_request(
+                period=period,
+                request_callback=partial(self.handle_nonces, period),
+                performative=ContractApiMessage.Performative.GET_STATE,  # type: ignore
+                contract_address=self.safe_contract,
+                contract_id=str(GnosisSafeContract.contract_id),
+                contract_callable="get_nonces",
+                sender_address=self.context.agent_address,
+            )
+            return
+        period.nonces = self.nonce_manager.reserve()
+        self.compute_gnosis_hash(period)
+
+    def _act_drop_wait(self, period: Period) -> None:
+        """Wait for the project of a prepared period to go active, or for its scheduled start."""
+        now = time.monotonic()
+        start = self.drop_schedule.get(cast(int, period.active_project))
+        if start is not None:
+            if self.block_clock.is_ready:
+                send_at = self.block_clock.get_send_time(**start)
+                if now >= send_at:
+                    self.context.logger.info(
+                        f"sending prepared transaction for the drop of project "
+                        f"{period.active_project} at {start}."
+                    )
+                    self._release_prepared(period)
+                    return
+                self._wake_at(send_at)
+                if send_at - now < self.discovery_interval:
+                    # no request in flight when the transaction must be sent
+                    return
+            if now >= self._next_header_at:
+                self.send_block_header_request(
+                    period, partial(self.handle_block_header, period, now)
+                )
+                return
+        if now >= period.next_discovery_at:
+            period.timeline.start(Stage.DROP_WAIT)
+            self.send_contract_api_request(
+                period=period,
+                request_callback=partial(self.handle_project_state, period),
+                performative=ContractApiMessage.Performative.GET_STATE,  # type: ignore
+                contract_address=self.artblocks_contract,
+                contract_id=str(ArtBlocksContract.contract_id),
+                contract_callable="get_project_state",
+                project_id=period.active_project,
+            )
+
+    def _release_prepared(self, period: Period) -> None:
+        """Let the prepared transaction of a period be broadcast."""
+        period.timeline.end(Stage.DROP_WAIT)
+        period.is_dropped = True
+        self._journal_signed_transaction(period)
+
+    def _check_preparation(self, period: Period) -> None:
+        """Throw away the prepared transaction of a period, if stale."""
+        if period.is_request_in_flight or period.nonces is None:
+            return
+        if self.nonce_manager.is_stale(period.nonces):
+            self.context.logger.info(
+                f"nonces of prepared period with id={period.period_id} changed."
+            )
+            self._unprepare(period)
+        elif (
+            period.prepared_at is not None
+            and time.monotonic() - period.prepared_at > self.preparation_max_age
+        ):
+            self.context.logger.info(
+                f"transaction of prepared period with id={period.period_id} is stale."
+            )
+            self._unprepare(period)
+
+    def _unprepare(self, period: Period, keep_project: bool = True) -> None:
+        """
+        Throw away the prepared transaction of a period, giving its nonces back.
+
+        :param period: the prepared period.
+        :param keep_project: whether the period keeps its project, or looks for another one.
+        """
+        if period.nonces is not None:
+            self.nonce_manager.release(period.nonces)
+        period.nonces = None
+        period.gnosis_hash = None
+        period.signed_message = None
+        period.signatures_by_owner = None
+        period.is_signature_submitted = False
+        period.raw_transaction = None
+        period.simulated_gas = None
+        period.signed_transaction = None
+        period.prepared_at = None
+        if not keep_project:
+            period.active_project = None
+            period.project_details = None
+            period.data = None
+            period.bundled_projects = []
+            period.bundled_data = []
+            self._journal_record(
+                period,
+                active_project=None,
+                project_details=None,
+                data=None,
+                bundled_projects=[],
+                bundled_data=[],
+            )
+
+    def _should_simulate(self, period: Period) -> bool:
+        """Check whether the transaction of a period is simulated before it is signed."""
+        # a prepared transaction is built before its project is active, so
+        # it would not succeed; it is broadcast as soon as the drop happens
+        return self.simulate_transactions and not period.is_prepared
+
+    @staticmethod
+    def _has_purchase_data(period: Period) -> bool:
+        """Check whether the purchase data of all the projects of a period are read."""
+        return period.data is not None and len(period.bundled_data) == len(
+            period.bundled_projects
+        )
+
+    def _get_safe_call(self, period: Period) -> Tuple[str, int, Any, int]:
+        """
+        Get the call executed by the Safe transaction of a period.
+
+        One token of one project is bought with a plain call; several tokens,
+        of one or several projects, with one MultiSend call.
+
+        :param period: the period.
+        :return: the to address, the value, the data and the operation of the call.
+        """
+        purchases = [
+            (
+                SafeOperation.CALL.value,
+                self.artblocks_periphery_contract,
+                price,
+                data,
+            )
+            for _, price, data in period.purchases
+            for _ in range(period.n_tokens)
+        ]
+        if len(purchases) == 1:
+            _, to_address, value, data = purchases[0]
+            return to_address, value, data, SafeOperation.CALL.value
+        # the value is sent by each call, from the balance of the Safe
+        return (
+            self.multisend_contract,
+            0,
+            GnosisSafeContract.encode_multisend(purchases),
+            SafeOperation.DELEGATE_CALL.value,
+        )
+
+    def _get_gas_template_key(self, period: Period) -> Tuple:
+        """Get the gas template of the Safe transaction of a period."""
+        to_address, _, data, _ = self._get_safe_call(period)
+        return self.gas_templates.get_key(
+            self.safe_contract,
+            to_address,
+            data,
+            n_signers=len(self._get_signatures_by_owner(period)),
+        )
+
+    def _get_signatures_by_owner(self, period: Period) -> Dict[str, str]:
+        """Get the owner signatures of the Safe transaction of a period."""
+        if period.signatures_by_owner is not None:
+            return period.signatures_by_owner
+        return {self.context.agent_address: cast(str, period.signed_message)}
+
+    def _act_signature_collection(self, period: Period) -> None:
+        """Collect the signatures of the co-owners of the Safe for the hash of a period."""
+        if self._safe_owners is None:
+            self.send_contract_api_request(
+                period=period,
+                request_callback=partial(self.handle_safe_owners, period),
+                performative=ContractApiMessage.Performative.GET_STATE,  # type: ignore
+                contract_address=self.safe_contract,
+                contract_id=str(GnosisSafeContract.contract_id),
+                contract_callable="get_safe_owners",
+            )
+            return
+        owners, threshold = self._safe_owners
+        if threshold <= 1:
+            period.signatures_by_owner = self._get_signatures_by_owner(period)
+            return
+        client = cast(SignatureClient, self._signature_client)
+        safe_tx_hash = cast(str, period.gnosis_hash)
+        period.timeline.start(Stage.SIGNATURE_COLLECTION, is_rpc=False)
+        if not period.is_signature_submitted:
+
+            def submit() -> Dict[str, Any]:
+                client.open(safe_tx_hash, owners, threshold, self._get_review(period))
+                return client.submit(
+                    safe_tx_hash,
+                    self.context.agent_address,
+                    cast(str, period.signed_message),
+                )
+
+            self._run_in_executor(
+                period, submit, partial(self.handle_signatures, period)
+            )
+        elif time.monotonic() >= period.next_signature_poll_at:
+            self._run_in_executor(
+                period,
+                partial(client.get, safe_tx_hash),
+                partial(self.handle_signatures, period),
+            )
+
+    def _get_review(self, period: Period) -> Dict[str, Any]:
+        """Get the Safe transaction of a period, for the co-owners to review."""
+        to_address, value, data, operation = self._get_safe_call(period)
+        return {
+            "safe": self.safe_contract,
+            "to": to_address,
+            "value": value,
+            "data": data if isinstance(data, str) else "0x" + bytes(data).hex(),
+            "operation": operation,
+            "safe_tx_gas": self.safe_tx_gas,
+            "safe_nonce": cast(Tuple[int, int], period.nonces)[1],
+        }
+
+    def _run_in_executor(
+        self, period: Period, func: Callable[[], Any], callback: Callable[[Any], None]
+    ) -> None:
+        """
+        Run a blocking call for a period in an executor, then call back with its result.
+
+        A failed call is retried on the next tick, up to 'max_request_retries'
+        times in a row, like an expired request.
+
+        :param period: the period the call is made for.
+        :param func: the blocking call.
+        :param callback: the callback, called on the event loop with the result.
+        """
+        period.is_request_in_flight = True
+        future = asyncio.get_event_loop().run_in_executor(None, func)
+
+        def on_done(done: "asyncio.Future") -> None:
+            period.is_request_in_flight = False
+            error = done.exception()
+            if error is not None:
+                self.context.logger.warning(
+                    f"call of period with id={period.period_id} failed: {error}"
+                )
+                self._retry_request(period, "call")
+                return
+            callback(done.result())
+            period.n_request_failures = 0
+            self.wake()
+
+        future.add_done_callback(on_done)
+
+    def handle_safe_owners(self, period: Period, message: ContractApiMessage) -> None:
+        """Callback handler for the Safe owners request."""
+        period.is_request_in_flight = False
+        if not message.performative == ContractApiMessage.Performative.STATE:
+            raise ValueError("wrong performative")
+        body = message.state.body
+        self._safe_owners = (
+            cast(List[str], body["owners"]),
+            cast(int, body["threshold"]),
+        )
+        self.context.logger.info(f"found Safe owners: {body}")
+
+    def handle_signatures(self, period: Period, state: Dict[str, Any]) -> None:
+        """Callback handler for the signatures collected for the hash of a period."""
+        if state["safe_tx_hash"] != period.gnosis_hash:
+            # the hash changed while the call was in flight
+            return
+        period.is_signature_submitted = True
+        if not state["is_ready"]:
+            period.next_signature_poll_at = (
+                time.monotonic() + self.signature_poll_interval
+            )
+            return
+        period.timeline.end(Stage.SIGNATURE_COLLECTION)
+        period.signatures_by_owner = cast(Dict[str, str], state["signatures"])
+        self.context.logger.info(
+            f"found signatures of owners: {list(period.signatures_by_owner)}"
+        )
+
+    def _queue_for_signing(self, queue: List[Period], period: Period) -> None:
+        """Queue a period for the next signing batch, starting the batch window if needed."""
+        queue.append(period)
+        period.is_request_in_flight = True
+        if self._signing_batch_at is None:
+            self._signing_batch_at = time.monotonic() + self.signing_batch_window
+
+    def _act_signing_batch(self) -> None:
+        """Send the queued signing requests once the batch window is over."""
+        if self._signing_batch_at is None:
+            return
+        if time.monotonic() < self._signing_batch_at:
+            if self._signing_batch_handle is None:
+                self._signing_batch_handle = asyncio.get_event_loop().call_later(
+                    self._signing_batch_at - time.monotonic(), self._end_signing_batch
+                )
+            return
+        self._signing_batch_at = None
+        messages_to_sign, self._messages_to_sign = self._messages_to_sign, []
+        transactions_to_sign, self._transactions_to_sign = (
+            self._transactions_to_sign,
+            [],
+        )
+        if messages_to_sign:
+            self.send_signing_batch_request(messages_to_sign)
+        if transactions_to_sign:
+            self.send_transaction_signing_batch_request(transactions_to_sign)
+
+    def _end_signing_batch(self) -> None:
+        """Act at the end of the signing batch window."""
+        self._signing_batch_handle = None
+        self.wake()
+
     def teardown(self) -> None:
         """Implement the task teardown."""
+        if self._wake_handle is not None:
+            self._wake_handle.cancel()
+        if self._signing_batch_handle is not None:
+            self._signing_batch_handle.cancel()
+        if self._journal is not None:
+            self._journal.close()
+        for period in self.in_flight_periods.values():
+            self._export_trace(period)
+
+    def _export_trace(self, period: Period) -> None:
+        """Export the stage timeline of a period as trace spans, if enabled."""
+        if self._trace_exporter is None:
+            return
+        attributes: Dict[str, Any] = {
+            "period.id": period.period_id,
+            "period.failed": period.is_failed,
+        }
+        if period.active_project is not None:
+            attributes["project.id"] = period.active_project
+        if period.tx_digest is not None:
+            attributes["tx.digest"] = period.tx_digest.body
+        self._trace_exporter.export(period.timeline.to_otlp_spans(attributes))
+        self.context.logger.debug(
+            f"stage durations of period with id={period.period_id}: "
+            f"{period.timeline.durations()}"
+        )
 
     def send_contract_api_request(  # pylint: disable=too-many-arguments
         self,
+        period: Period,
         request_callback: Callable,
         performative: ContractApiMessage.Performative,
         contract_address: Optional[str],
@@ -268,6 +1322,7 @@ class Monitoring(TickerBehaviour):  # pylint: disable=too-many-instance-attribut
         """
         Request contract safe transaction hash
 
+        :param period: the period the request is made for
         :param request_callback: the request callback handler
         :param performative: the message performative
         :param contract_address: the contract address
@@ -296,32 +1351,189 @@ class Monitoring(TickerBehaviour):  # pylint: disable=too-many-instance-attribut
             contract_api_dialogue,
         )
         contract_api_dialogue.terms = self._get_default_terms()
-        request_nonce = self._get_request_nonce_from_dialogue(contract_api_dialogue)
-        cast(Requests, self.context.requests).request_id_to_callback[
-            request_nonce
-        ] = request_callback
+        self._register_request(period, contract_api_dialogue, request_callback)
         self.context.outbox.put_message(message=contract_api_msg)
-        self.active_period.is_request_in_flight = True
+        period.is_request_in_flight = True
 
-    def handle_active_project_id(self, message: ContractApiMessage) -> None:
+    def handle_active_project_id(
+        self, period: Period, message: ContractApiMessage
+    ) -> None:
         """Callback handler for the active project id request."""
-        self.active_period.is_request_in_flight = False
+        period.is_request_in_flight = False
         if not message.performative == ContractApiMessage.Performative.STATE:
             raise ValueError("wrong performative")
         project_id = cast(Optional[int], message.state.body["project_id"])
         if project_id is None:
+            # the scan is exhausted, restart it from the newest project
+            period.starting_id = None
+            period.next_discovery_at = time.monotonic() + self.discovery_interval
             return
         project_details = message.state.body
+        if project_id in period.skipped_projects:
+            period.starting_id = project_id
+            return
+        if self._is_project_in_flight(period, project_id):
+            self.context.logger.info(
+                f"project {project_id} is being purchased by another period. "
+                "Continue searching..."
+            )
+            period.starting_id = project_id
+            return
         if not self.is_acceptable_project(project_details):
             self.context.logger.info(
                 f"found unsuitable project: {project_details}. Continue searching..."
             )
-            self.active_period.starting_id = project_id
+            period.starting_id = project_id
+            return
+        self._set_project(period, project_details)
+
+    def handle_active_projects(
+        self, period: Period, message: ContractApiMessage
+    ) -> None:
+        """Callback handler for the active projects request."""
+        period.is_request_in_flight = False
+        if not message.performative == ContractApiMessage.Performative.STATE:
+            raise ValueError("wrong performative")
+        projects = cast(List[dict], message.state.body["projects"])
+        budget = self.period_budget_in_wei
+        picked = []
+        for project_details in projects:
+            if (
+                project_details["project_id"] in period.skipped_projects
+                or self._is_project_in_flight(period, project_details["project_id"])
+                or not self.is_acceptable_project(project_details)
+            ):
+                continue
+            cost = project_details["price_per_token_in_wei"] * self.batch_size
+            if budget is not None:
+                if cost > budget:
+                    continue
+                budget -= cost
+            picked.append(project_details)
+        if len(projects) < self.max_projects_per_period:
+            # the scan is exhausted, restart it from the newest project
+            period.starting_id = None
+            if len(picked) == 0:
+                period.next_discovery_at = time.monotonic() + self.discovery_interval
+        elif len(picked) == 0:
+            period.starting_id = projects[-1]["project_id"]
+        if len(picked) == 0:
+            return
+        if self.bundle_projects:
+            self._set_project(period, picked[0], bundled_projects=picked[1:])
+            return
+        self._set_project(period, picked[0])
+        for project_details in picked[1:]:
+            sibling = self.set_sibling_period(period)
+            sibling.timeline.start(Stage.PROJECT_DISCOVERY, is_rpc=False)
+            self._set_project(sibling, project_details)
+
+    def _set_project(
+        self,
+        period: Period,
+        project_details: dict,
+        bundled_projects: Optional[List[dict]] = None,
+    ) -> None:
+        """
+        Set the project a period purchases.
+
+        :param period: the period.
+        :param project_details: the details of the project.
+        :param bundled_projects: the details of the projects bought along with it, if any.
+        """
+        period.active_project = project_details["project_id"]
+        period.project_details = project_details
+        period.bundled_projects = list(bundled_projects or [])
+        period.bundled_data = []
+        period.n_tokens = self.batch_size
+        self._journal_record(
+            period,
+            active_project=period.active_project,
+            project_details=project_details,
+            bundled_projects=period.bundled_projects,
+            bundled_data=[],
+            n_tokens=period.n_tokens,
+        )
+        period.timeline.end(Stage.PROJECT_DISCOVERY)
+        self.context.logger.info(f"found suitable project: {period.project_details}.")
+        for details in period.bundled_projects:
+            self.context.logger.info(f"found suitable bundled project: {details}.")
+
+    def handle_upcoming_project(
+        self, period: Period, message: ContractApiMessage
+    ) -> None:
+        """Callback handler for the upcoming project request."""
+        period.is_request_in_flight = False
+        if not message.performative == ContractApiMessage.Performative.STATE:
+            raise ValueError("wrong performative")
+        project_id = cast(Optional[int], message.state.body["project_id"])
+        project_details = message.state.body
+        if project_id is None or not self.is_acceptable_project(project_details):
+            period.next_discovery_at = time.monotonic() + self.discovery_interval
+            return
+        period.active_project = project_id
+        period.project_details = project_details
+        period.n_tokens = self.batch_size
+        self._journal_record(
+            period,
+            is_prepared=True,
+            active_project=project_id,
+            project_details=project_details,
+            n_tokens=period.n_tokens,
+        )
+        period.timeline.end(Stage.PROJECT_DISCOVERY)
+        self.context.logger.info(
+            f"found upcoming project: {period.project_details}. Preparing purchase..."
+        )
+
+    def handle_project_state(self, period: Period, message: ContractApiMessage) -> None:
+        """Callback handler for the state of the project of a prepared period."""
+        period.is_request_in_flight = False
+        if not message.performative == ContractApiMessage.Performative.STATE:
+            raise ValueError("wrong performative")
+        state = message.state.body
+        period.next_discovery_at = time.monotonic() + self.discovery_interval
+        project_details = cast(dict, period.project_details)
+        if (
+            state["next_project_id"] != cast(int, period.active_project) + 1
+            or state["invocations"] >= state["max_invocations"]
+        ):
+            self.context.logger.info(
+                f"project {period.active_project} is no longer upcoming."
+            )
+            self._unprepare(period, keep_project=False)
+            return
+        if state["price_per_token_in_wei"] != project_details["price_per_token_in_wei"]:
+            self._unprepare(period)
+            project_details = {
+                **project_details,
+                "price_per_token_in_wei": state["price_per_token_in_wei"],
+            }
+            if not self.is_acceptable_project(project_details):
+                self._unprepare(period, keep_project=False)
+                return
+            period.project_details = project_details
+            self._journal_record(period, project_details=project_details)
+            self.context.logger.info(
+                f"price of project {period.active_project} changed. Preparing again..."
+            )
             return
-        self.active_period.active_project = project_id
-        self.active_period.project_details = project_details
+        if not state["active"] or state["paused"]:
+            return
+        self._release_prepared(period)
         self.context.logger.info(
-            f"found suitable project: {self.active_period.project_details}."
+            f"project {period.active_project} is active, sending prepared transaction."
+        )
+
+    def _is_project_in_flight(self, period: Period, project_id: int) -> bool:
+        """Check whether another in-flight period is purchasing the project."""
+        return any(
+            other is not period
+            and not other.is_failed
+            and other.tx_receipt is None
+            and other.project_details is not None
+            and any(project_id == other_id for other_id, _, _ in other.purchases)
+            for other in self.in_flight_periods.values()
         )
 
     def is_acceptable_project(self, project_details: dict) -> bool:
@@ -329,40 +1541,281 @@ class Monitoring(TickerBehaviour):  # pylint: disable=too-many-instance-attribut
         # very simplified atm, just checking for price to be max 1 ETH
         return project_details["price_per_token_in_wei"] <= self.max_eth_in_wei
 
-    def handle_purchase_data(self, message: ContractApiMessage) -> None:
+    def handle_purchase_data(self, period: Period, message: ContractApiMessage) -> None:
         """Callback handler for the purchase data request."""
-        self.active_period.is_request_in_flight = False
+        period.is_request_in_flight = False
         if not message.performative == ContractApiMessage.Performative.STATE:
             raise ValueError("wrong performative")
         data = cast(Optional[bytes], message.state.body["data"])
-        self.active_period.data = data
-        self.context.logger.info(f"found data: {str(self.active_period.data)}")
+        if period.data is None:
+            period.data = data
+            self._journal_record(period, data=data)
+        else:
+            period.bundled_data.append(data)
+            self._journal_record(period, bundled_data=period.bundled_data)
+        if self._has_purchase_data(period):
+            period.timeline.end(Stage.PURCHASE_DATA)
+        self.context.logger.info(f"found data: {str(data)}")
 
-    def handle_gnosis_hash(self, message: ContractApiMessage) -> None:
-        """Callback handler for the gnosis hash request."""
-        self.active_period.is_request_in_flight = False
+    def handle_safe_domain(self, period: Period, message: ContractApiMessage) -> None:
+        """Callback handler for the Safe domain request."""
+        period.is_request_in_flight = False
         if not message.performative == ContractApiMessage.Performative.STATE:
             raise ValueError("wrong performative")
-        gnosis_hash = cast(str, message.state.body["tx_hash"])
-        self.active_period.gnosis_hash = gnosis_hash[2:]
-        self.context.logger.info(f"found tx_hash: {self.active_period.gnosis_hash}")
+        body = message.state.body
+        self.safe_tx_hasher.set_domain(
+            cast(int, body["chain_id"]),
+            self.safe_contract,
+            cast(str, body["safe_version"]),
+        )
+        self.context.logger.info(f"found Safe domain: {body}")
 
-    def handle_gnosis_tx(self, message: ContractApiMessage) -> None:
+    def handle_nonces(self, period: Period, message: ContractApiMessage) -> None:
+        """Callback handler for the nonces request."""
+        period.is_request_in_flight = False
+        if not message.performative == ContractApiMessage.Performative.STATE:
+            raise ValueError("wrong performative")
+        body = message.state.body
+        if self.nonce_manager.sync(
+            cast(int, body["sender_nonce"]), cast(int, body["safe_nonce"])
+        ):
+            self.context.logger.info(f"found nonces: {body}")
+
+    def compute_gnosis_hash(self, period: Period) -> None:
+        """Compute the hash of the Safe transaction of a period locally."""
+        period.timeline.start(Stage.GNOSIS_HASH, is_rpc=False)
+        to_address, value, data, operation = self._get_safe_call(period)
+        period.gnosis_hash = self.safe_tx_hasher.get_safe_tx_hash(
+            to_address=to_address,
+            value=value,
+            data=data,
+            safe_nonce=cast(Tuple[int, int], period.nonces)[1],
+            operation=operation,
+            safe_tx_gas=self.safe_tx_gas,
+        )
+        period.timeline.end(Stage.GNOSIS_HASH)
+        self.context.logger.info(f"found tx_hash: {period.gnosis_hash}")
+
+    def handle_gnosis_tx(self, period: Period, message: ContractApiMessage) -> None:
         """Callback handler for the gnosis tx request."""
-        self.active_period.is_request_in_flight = False
+        period.is_request_in_flight = False
         if not message.performative == ContractApiMessage.Performative.RAW_TRANSACTION:
             raise ValueError("wrong performative")
+        period.timeline.end(Stage.RAW_SAFE_TX)
         raw_tx = message.raw_transaction
-        self.active_period.raw_transaction = raw_tx
+        period.raw_transaction = raw_tx
+        self.gas_templates.learn(
+            self._get_gas_template_key(period), cast(int, raw_tx.body["gas"])
+        )
+        self.context.logger.info(f"found raw transaction: {period.raw_transaction}")
+
+    def handle_simulation(self, period: Period, message: ContractApiMessage) -> None:
+        """
+        Callback handler for the simulation of the raw transaction.
+
+        A transaction whose signatures the Safe rejects, or whose call fails
+        without a reason, is built again; one whose call the minter reverts,
+        e.g. because the project sold out or its price changed, skips the
+        project for the rest of the period; the projects of a bundled
+        purchase are then bought by a period each. After 'max_request_retries'
+        failed simulations for the same project the period fails.
+
+        :param period: the period the simulation was made for
+        :param message: the response
+        """
+        period.is_request_in_flight = False
+        if not message.performative == ContractApiMessage.Performative.STATE:
+            raise ValueError("wrong performative")
+        period.timeline.end(Stage.SIMULATION)
+        simulation = message.state.body
+        gas_limit = cast(int, cast(RawTransaction, period.raw_transaction).body["gas"])
+        gas = cast(Optional[int], simulation["gas"])
+        if simulation["is_success"] and cast(int, gas) <= gas_limit:
+            period.simulated_gas = gas
+            self.context.logger.info(
+                f"simulated transaction of period with id={period.period_id} "
+                f"at block {simulation['block']}: gas={gas}."
+            )
+            return
+        project_id = cast(int, period.active_project)
+        n_failures = period.simulation_failures.get(project_id, 0) + 1
+        period.simulation_failures[project_id] = n_failures
+        if n_failures > self.max_request_retries:
+            self.context.logger.error(
+                f"simulation failed too many times ({simulation}), "
+                f"failing period with id={period.period_id}."
+            )
+            period.fail()
+            self._settle_failed_nonces(period)
+            return
+        if simulation["is_success"]:
+            self.context.logger.info(
+                f"simulated gas {gas} is above the gas limit {gas_limit}, "
+                "the gas will be estimated again."
+            )
+            self.gas_templates.observe(
+                self._get_gas_template_key(period), gas_limit, cast(int, gas), 0
+            )
+            period.raw_transaction = None
+            return
+        call_reason = cast(Optional[str], simulation["call_revert_reason"])
+        if call_reason == "":
+            # not refused by the minter, e.g. out of gas: the transaction is at fault
+            self.context.logger.info(
+                "the call of the Safe failed without a reason, rebuilding the "
+                f"transaction of period with id={period.period_id}."
+            )
+            self._unprepare(period)
+            return
+        reason = cast(str, simulation["revert_reason"])
+        if call_reason is None and reason.startswith(SIGNATURE_REVERT_PREFIX):
+            # most likely the Safe nonce moved, e.g. by a transaction of a co-owner
+            self.context.logger.info(
+                f"simulation reverted with {reason}, rebuilding the transaction "
+                f"of period with id={period.period_id}."
+            )
+            self.nonce_manager.invalidate(cast(Tuple[int, int], period.nonces))
+            period.nonces = None
+            self._unprepare(period)
+            return
+        if len(period.bundled_projects) > 0:
+            # the project the minter refuses is not known: buy each one on its own
+            self.context.logger.info(
+                f"simulation of the bundled purchase of period with "
+                f"id={period.period_id} failed with '{call_reason or reason}', "
+                "purchasing the projects separately."
+            )
+            bundled_projects = period.bundled_projects
+            period.bundled_projects = []
+            period.bundled_data = []
+            self._journal_record(period, bundled_projects=[], bundled_data=[])
+            self._unprepare(period)
+            for project_details in bundled_projects:
+                sibling = self.set_sibling_period(period)
+                sibling.timeline.start(Stage.PROJECT_DISCOVERY, is_rpc=False)
+                self._set_project(sibling, project_details)
+            return
         self.context.logger.info(
-            f"found raw transaction: {self.active_period.raw_transaction}"
+            f"simulation of the purchase of project {project_id} failed with "
+            f"'{call_reason or reason}', skipping the project."
         )
+        period.skipped_projects.add(project_id)
+        self._unprepare(period, keep_project=False)
+        if period.parent_id is not None:
+            # a sibling period only purchases the project picked for it
+            period.fail()
+            return
+        period.starting_id = project_id
 
     @classmethod
     def _get_request_nonce_from_dialogue(cls, dialogue: Dialogue) -> str:
         """Get the request nonce for the request, from the protocol's dialogue."""
         return dialogue.dialogue_label.dialogue_reference[0]
 
+    def _get_dialogues(self, dialogue: Dialogue) -> RemovableDialoguesMixin:
+        """Get the dialogues model a dialogue is kept in, named after its protocol."""
+        protocol_name = dialogue.message_class.protocol_id.name
+        return cast(
+            RemovableDialoguesMixin, getattr(self.context, f"{protocol_name}_dialogues")
+        )
+
+    def _register_request(  # pylint: disable=too-many-arguments
+        self,
+        period: Period,
+        dialogue: Dialogue,
+        request_callback: Callable,
+        timeout: Optional[float] = None,
+        handles_errors: bool = False,
+    ) -> None:
+        """
+        Register the request in the 'Requests' model, with a deadline.
+
+        :param period: the period the request is made for
+        :param dialogue: the request dialogue
+        :param request_callback: the request callback handler
+        :param timeout: the request timeout in seconds
+        :param handles_errors: whether the callback handles an error response, instead of it being retried
+        """
+        cast(Requests, self.context.requests).register(
+            self._get_request_nonce_from_dialogue(dialogue),
+            partial(
+                self._on_response,
+                [period],
+                request_callback,
+                None if handles_errors else partial(self.handle_request_error, period),
+            ),
+            timeout=timeout if timeout is not None else self.request_timeout,
+            timeout_callback=partial(self.handle_request_timeout, period),
+            dialogue=dialogue,
+            dialogues=self._get_dialogues(dialogue),
+        )
+
+    def handle_request_timeout(self, period: Period, request: PendingRequest) -> None:
+        """
+        Callback handler for an expired request.
+
+        The request of the current stage is retried on the next tick, up to
+        'max_request_retries' times in a row; after that the period fails.
+
+        :param period: the period the request was made for
+        :param request: the expired request
+        """
+        self._retry_request(period, f"request with nonce {request.request_nonce}")
+
+    def handle_request_error(self, period: Period, message: Message) -> None:
+        """
+        Callback handler for an error response.
+
+        The error counts as a failed attempt at the request, like a timeout.
+
+        :param period: the period the request was made for
+        :param message: the error response
+        """
+        self.context.logger.warning(
+            f"request of period with id={period.period_id} failed: {message}"
+        )
+        self._retry_request(
+            period, f"request with nonce {message.dialogue_reference[0]}"
+        )
+
+    def _retry_request(self, period: Period, request: str) -> None:
+        """
+        Count a failed attempt at the request of the current stage of a period.
+
+        The request is sent again on the next tick, up to 'max_request_retries'
+        times in a row; after that the period fails. A successful response
+        gives the next stage a full budget again.
+
+        :param period: the period the request was made for
+        :param request: the description of the request, for the logs
+        """
+        period.is_request_in_flight = False
+        period.n_timeouts += 1
+        period.n_request_failures += 1
+        if period.n_request_failures > self.max_request_retries:
+            self.context.logger.error(
+                f"{request} failed too many times, "
+                f"failing period with id={period.period_id}."
+            )
+            period.fail()
+            self._settle_failed_nonces(period)
+            return
+        self.context.logger.info(
+            f"retrying {request} of period with id={period.period_id} "
+            f"({period.n_request_failures}/{self.max_request_retries})."
+        )
+
+    def _settle_failed_nonces(self, period: Period) -> None:
+        """Release the nonces of a failed period, or invalidate them if possibly used."""
+        if period.nonces is None:
+            return
+        if period.signed_transaction is None or (
+            period.is_prepared and not period.is_dropped
+        ):
+            self.nonce_manager.release(period.nonces)
+        else:
+            self.nonce_manager.invalidate(period.nonces)
+
     def _get_default_terms(self) -> Terms:
         """
         Get default transaction terms.
@@ -379,8 +1832,25 @@ class Monitoring(TickerBehaviour):  # pylint: disable=too-many-instance-attribut
         )
         return terms
 
+    def _get_signing_terms(self) -> Terms:
+        """
+        Get the terms of the requests to the decision maker.
+
+        :return: terms
+        """
+        terms = Terms(
+            ledger_id=self.context.default_ledger_id,
+            sender_address=self.context.agent_address,
+            counterparty_address="",
+            amount_by_currency_id={},
+            quantities_by_good_id={},
+            nonce="",
+        )
+        return terms
+
     def send_signing_request(
         self,
+        period: Period,
         request_callback: Callable,
         raw_message: bytes,
         is_deprecated_mode: bool = False,
@@ -395,75 +1865,176 @@ class Monitoring(TickerBehaviour):  # pylint: disable=too-many-instance-attribut
                 raw_message,
                 is_deprecated_mode=is_deprecated_mode,
             ),
-            terms=Terms(
-                ledger_id=self.context.default_ledger_id,
-                sender_address="",
-                counterparty_address="",
-                amount_by_currency_id={},
-                quantities_by_good_id={},
-                nonce="",
-            ),
+            terms=self._get_signing_terms(),
         )
-        request_nonce = self._get_request_nonce_from_dialogue(signing_dialogue)
-        cast(Requests, self.context.requests).request_id_to_callback[
-            request_nonce
-        ] = request_callback
+        self._register_request(period, signing_dialogue, request_callback)
         self.context.decision_maker_message_queue.put_nowait(signing_msg)
-        self.active_period.is_request_in_flight = True
+        period.is_request_in_flight = True
 
-    def handle_signing_message_response(self, message: SigningMessage) -> None:
+    def handle_signing_message_response(
+        self, period: Period, message: SigningMessage
+    ) -> None:
         """Callback handler for the gnosis hash request."""
-        self.active_period.is_request_in_flight = False
+        period.is_request_in_flight = False
         if not message.performative == SigningMessage.Performative.SIGNED_MESSAGE:
             raise ValueError("wrong performative")
-        signed_message = cast(str, message.signed_message.body)
-        self.active_period.signed_message = signed_message[2:]
-        self.context.logger.info(
-            f"found signed_message: {self.active_period.signed_message}"
-        )
+        self._set_signed_message(period, cast(str, message.signed_message.body))
+
+    def _set_signed_message(self, period: Period, signed_message: str) -> None:
+        """Set the signature of the Safe transaction hash of a period."""
+        period.timeline.end(Stage.MESSAGE_SIGNING)
+        period.signed_message = signed_message[2:]
+        self.context.logger.info(f"found signed_message: {period.signed_message}")
 
     def send_transaction_signing_request(
         self,
+        period: Period,
         request_callback: Callable,
         raw_transaction: RawTransaction,
     ) -> None:
         """Send a transaction signing request."""
         signing_dialogues = cast(SigningDialogues, self.context.signing_dialogues)
-        terms = Terms(
-            self.context.default_ledger_id,
-            self.context.agent_address,
-            counterparty_address="",
-            amount_by_currency_id={},
-            quantities_by_good_id={},
-            nonce="",
-        )
         signing_msg, signing_dialogue = signing_dialogues.create(
             counterparty=self.context.decision_maker_address,
             performative=SigningMessage.Performative.SIGN_TRANSACTION,
             raw_transaction=raw_transaction,
-            terms=terms,
+            terms=self._get_signing_terms(),
         )
         signing_dialogue = cast(SigningDialogue, signing_dialogue)
-        request_nonce = self._get_request_nonce_from_dialogue(signing_dialogue)
-        cast(Requests, self.context.requests).request_id_to_callback[
-            request_nonce
-        ] = request_callback
+        self._register_request(period, signing_dialogue, request_callback)
         self.context.decision_maker_message_queue.put_nowait(signing_msg)
-        self.active_period.is_request_in_flight = True
+        period.is_request_in_flight = True
 
-    def handle_signing_transaction_response(self, message: SigningMessage) -> None:
+    def handle_signing_transaction_response(
+        self, period: Period, message: SigningMessage
+    ) -> None:
         """Callback handler for the gnosis hash request."""
-        self.active_period.is_request_in_flight = False
+        period.is_request_in_flight = False
         if not message.performative == SigningMessage.Performative.SIGNED_TRANSACTION:
             raise ValueError("wrong performative")
-        signed_transaction = message.signed_transaction
-        self.active_period.signed_transaction = signed_transaction
+        self._set_signed_transaction(period, message.signed_transaction)
+
+    def _set_signed_transaction(
+        self, period: Period, signed_transaction: SignedTransaction
+    ) -> None:
+        """Set the signed transaction of a period."""
+        period.timeline.end(Stage.TX_SIGNING)
+        period.signed_transaction = signed_transaction
+        if period.is_prepared and not period.is_dropped:
+            period.prepared_at = time.monotonic()
+        else:
+            self._journal_signed_transaction(period)
         self.context.logger.info(
-            f"found signed_transaction: {self.active_period.signed_transaction}"
+            f"found signed_transaction: {period.signed_transaction}"
         )
 
+    def send_signing_batch_request(self, periods: List[Period]) -> None:
+        """Send one request to sign the Safe transaction hashes of several periods."""
+        signing_dialogues = cast(SigningDialogues, self.context.signing_dialogues)
+        signing_msg, signing_dialogue = signing_dialogues.create(
+            counterparty=self.context.decision_maker_address,
+            performative=SigningMessage.Performative.SIGN_MESSAGES,
+            raw_messages=RawMessages(
+                RawMessage(
+                    self.context.default_ledger_id,
+                    binascii.unhexlify(cast(str, period.gnosis_hash)),
+                    is_deprecated_mode=True,
+                )
+                for period in periods
+            ),
+            terms=self._get_signing_terms(),
+        )
+        self._register_batch_request(
+            periods,
+            signing_dialogue,
+            partial(self.handle_signing_messages_response, periods),
+        )
+        self.context.decision_maker_message_queue.put_nowait(signing_msg)
+
+    def handle_signing_messages_response(
+        self, periods: List[Period], message: SigningMessage
+    ) -> None:
+        """Callback handler for the batch signing request of Safe transaction hashes."""
+        for period in periods:
+            period.is_request_in_flight = False
+        if not message.performative == SigningMessage.Performative.SIGNED_MESSAGES:
+            raise ValueError("wrong performative")
+        for period, signed_message in zip(periods, message.signed_messages):
+            self._set_signed_message(period, cast(str, signed_message.body))
+
+    def send_transaction_signing_batch_request(self, periods: List[Period]) -> None:
+        """Send one request to sign the raw transactions of several periods."""
+        signing_dialogues = cast(SigningDialogues, self.context.signing_dialogues)
+        signing_msg, signing_dialogue = signing_dialogues.create(
+            counterparty=self.context.decision_maker_address,
+            performative=SigningMessage.Performative.SIGN_TRANSACTIONS,
+            raw_transactions=RawTransactions(
+                cast(RawTransaction, period.raw_transaction) for period in periods
+            ),
+            terms=self._get_signing_terms(),
+        )
+        self._register_batch_request(
+            periods,
+            signing_dialogue,
+            partial(self.handle_signing_transactions_response, periods),
+        )
+        self.context.decision_maker_message_queue.put_nowait(signing_msg)
+
+    def handle_signing_transactions_response(
+        self, periods: List[Period], message: SigningMessage
+    ) -> None:
+        """Callback handler for the batch signing request of raw transactions."""
+        for period in periods:
+            period.is_request_in_flight = False
+        if not message.performative == SigningMessage.Performative.SIGNED_TRANSACTIONS:
+            raise ValueError("wrong performative")
+        for period, signed_transaction in zip(periods, message.signed_transactions):
+            self._set_signed_transaction(period, signed_transaction)
+
+    def _register_batch_request(
+        self, periods: List[Period], dialogue: Dialogue, request_callback: Callable
+    ) -> None:
+        """Register a request made for several periods, each timing out or failing with it."""
+
+        def handle_timeout(request: PendingRequest) -> None:
+            for period in periods:
+                self.handle_request_timeout(period, request)
+
+        def handle_error(message: Message) -> None:
+            for period in periods:
+                self.handle_request_error(period, message)
+
+        cast(Requests, self.context.requests).register(
+            self._get_request_nonce_from_dialogue(dialogue),
+            partial(self._on_response, periods, request_callback, handle_error),
+            timeout=self.request_timeout,
+            timeout_callback=handle_timeout,
+            dialogue=dialogue,
+            dialogues=self._get_dialogues(dialogue),
+        )
+
+    def _journal_signed_transaction(self, period: Period) -> None:
+        """Record the signed transaction of a period, before it is broadcast."""
+        if self._journal is None:
+            return
+        signed_transaction = cast(SignedTransaction, period.signed_transaction)
+        self._journal_record(
+            period,
+            ledger_id=signed_transaction.ledger_id,
+            nonces=period.nonces,
+            gnosis_hash=period.gnosis_hash,
+            signed_message=period.signed_message,
+            raw_transaction=cast(RawTransaction, period.raw_transaction).body,
+            signed_transaction=signed_transaction.body,
+        )
+        # the record must be on disk first
+        self._journal.sync()
+
     def send_transaction_request(
-        self, request_callback: Callable, signed_transaction: SignedTransaction
+        self,
+        period: Period,
+        request_callback: Callable,
+        signed_transaction: SignedTransaction,
     ) -> None:
         """Send a transaction request."""
         ledger_api_dialogues = cast(
@@ -475,53 +2046,282 @@ class Monitoring(TickerBehaviour):  # pylint: disable=too-many-instance-attribut
             signed_transaction=signed_transaction,
         )
         ledger_api_dialogue = cast(LedgerApiDialogue, ledger_api_dialogue)
-        request_nonce = self._get_request_nonce_from_dialogue(ledger_api_dialogue)
-        cast(Requests, self.context.requests).request_id_to_callback[
-            request_nonce
-        ] = request_callback
+        self._register_request(
+            period, ledger_api_dialogue, request_callback, handles_errors=True
+        )
         self.context.outbox.put_message(message=ledger_api_msg)
-        self.active_period.is_request_in_flight = True
+        period.is_request_in_flight = True
 
-    def handle_transaction_response(self, message: LedgerApiMessage) -> None:
+    def handle_transaction_response(
+        self, period: Period, message: LedgerApiMessage
+    ) -> None:
         """Callback handler for the gnosis hash request."""
-        self.active_period.is_request_in_flight = False
-        if not message.performative == LedgerApiMessage.Performative.TRANSACTION_DIGEST:
+        period.is_request_in_flight = False
+        if (
+            message.performative == LedgerApiMessage.Performative.ERROR
+            and period.is_resumed
+        ):
+            # the transaction was most likely broadcast before the restart
+            signed_transaction = cast(SignedTransaction, period.signed_transaction)
+            tx_digest = TransactionDigest(
+                signed_transaction.ledger_id, signed_transaction.body["hash"]
+            )
+        elif (
+            message.performative == LedgerApiMessage.Performative.ERROR
+            and len(period.tx_digests) > 0
+        ):
+            # the replacement came too late or was underpriced; the
+            # transactions sent before it are still looked up
+            self.context.logger.info(
+                f"replacement of {period.tx_digests[-1]} failed: {message.message}"
+            )
+            period.timeline.end(Stage.BROADCAST)
+            period.tx_digest = TransactionDigest(
+                cast(SignedTransaction, period.signed_transaction).ledger_id,
+                period.tx_digests[-1],
+            )
+            return
+        elif message.performative == LedgerApiMessage.Performative.ERROR:
+            self.handle_request_error(period, message)
+            return
+        elif (
+            not message.performative == LedgerApiMessage.Performative.TRANSACTION_DIGEST
+        ):
             raise ValueError("wrong performative")
-        tx_digest = message.transaction_digest
-        self.active_period.tx_digest = tx_digest
-        self.context.logger.info(
-            f"found tx_digest: {self.active_period.tx_digest.body}"
+        else:
+            tx_digest = message.transaction_digest
+            ledger_api_dialogues = cast(
+                LedgerApiDialogues, self.context.ledger_api_dialogues
+            )
+            period.transaction_dialogues[tx_digest.body] = cast(
+                LedgerApiDialogue, ledger_api_dialogues.get_dialogue(message)
+            )
+        period.timeline.end(Stage.BROADCAST)
+        period.tx_digest = tx_digest
+        period.tx_digests.append(tx_digest.body)
+        if period.broadcast_at is None:
+            period.broadcast_at = time.monotonic()
+        self._journal_record(
+            period, tx_digest=tx_digest.body, tx_digests=period.tx_digests
         )
+        self.context.logger.info(f"found tx_digest: {period.tx_digest.body}")
 
-    def send_transaction_receipt_request(
-        self, request_callback: Callable, transaction_digest: TransactionDigest
+    def send_block_header_request(
+        self, period: Period, request_callback: Callable
     ) -> None:
-        """Send a transaction receipt request."""
+        """Send a request for the latest block header."""
         ledger_api_dialogues = cast(
             LedgerApiDialogues, self.context.ledger_api_dialogues
         )
         ledger_api_msg, ledger_api_dialogue = ledger_api_dialogues.create(
             counterparty=str(LEDGER_API_ADDRESS),
-            performative=LedgerApiMessage.Performative.GET_TRANSACTION_RECEIPT,
-            transaction_digest=transaction_digest,
+            performative=LedgerApiMessage.Performative.GET_STATE,
+            ledger_id=self.context.default_ledger_id,
+            callable="getBlock",
+            args=("latest",),
+            kwargs=LedgerApiMessage.Kwargs({}),
         )
         ledger_api_dialogue = cast(LedgerApiDialogue, ledger_api_dialogue)
-        request_nonce = self._get_request_nonce_from_dialogue(ledger_api_dialogue)
-        cast(Requests, self.context.requests).request_id_to_callback[
-            request_nonce
-        ] = request_callback
+        self._register_request(period, ledger_api_dialogue, request_callback)
+        self.context.outbox.put_message(message=ledger_api_msg)
+        period.timeline.start(Stage.DROP_WAIT)
+        period.is_request_in_flight = True
+
+    def handle_block_header(
+        self, period: Period, sent_at: float, message: LedgerApiMessage
+    ) -> None:
+        """Callback handler for the block header request."""
+        period.is_request_in_flight = False
+        if not message.performative == LedgerApiMessage.Performative.STATE:
+            raise ValueError("wrong performative")
+        header = message.state.body
+        self._next_header_at = self._observe_block(
+            cast(int, header["number"]), cast(int, header["timestamp"]), sent_at
+        )
+
+    def _observe_block(self, number: int, timestamp: int, sent_at: float) -> float:
+        """
+        Feed a block to the block clock.
+
+        :param number: the number of the block.
+        :param timestamp: the timestamp of the block.
+        :param sent_at: the monotonic time the request which read the block was sent at.
+        :return: the monotonic time to read the next block at.
+        """
+        now = time.monotonic()
+        block_clock = self.block_clock
+        block_clock.observe(number, timestamp, round_trip=now - sent_at)
+        if not block_clock.is_ready:
+            return now + self.discovery_interval
+        # read the next block as soon as it is expected
+        return max(
+            block_clock.get_block_time(block_clock.latest_block + 1)
+            + block_clock.latency,
+            now + HEADER_POLL_FRACTION * block_clock.block_interval,
+        )
+
+    def send_transaction_receipt_request(
+        self,
+        period: Period,
+        request_callback: Callable,
+        transaction_digest: TransactionDigest,
+    ) -> None:
+        """Send a transaction receipt request, in the dialogue of the broadcast if still open."""
+        ledger_api_dialogue = period.transaction_dialogues.pop(
+            transaction_digest.body, None
+        )
+        if ledger_api_dialogue is not None:
+            ledger_api_msg = ledger_api_dialogue.reply(
+                performative=LedgerApiMessage.Performative.GET_TRANSACTION_RECEIPT,
+                transaction_digest=transaction_digest,
+            )
+        else:
+            ledger_api_dialogues = cast(
+                LedgerApiDialogues, self.context.ledger_api_dialogues
+            )
+            ledger_api_msg, ledger_api_dialogue = ledger_api_dialogues.create(
+                counterparty=str(LEDGER_API_ADDRESS),
+                performative=LedgerApiMessage.Performative.GET_TRANSACTION_RECEIPT,
+                transaction_digest=transaction_digest,
+            )
+            ledger_api_dialogue = cast(LedgerApiDialogue, ledger_api_dialogue)
+        self._register_request(
+            period,
+            ledger_api_dialogue,
+            request_callback,
+            timeout=self.receipt_request_timeout,
+        )
         self.context.outbox.put_message(message=ledger_api_msg)
         self.context.logger.info("sending transaction receipt request.")
-        self.active_period.is_request_in_flight = True
+        period.is_request_in_flight = True
 
-    def handle_transaction_receipt_response(self, message: LedgerApiMessage) -> None:
+    def handle_transaction_receipt_response(
+        self, period: Period, message: LedgerApiMessage
+    ) -> None:
         """Callback handler for the gnosis hash request."""
-        self.active_period.is_request_in_flight = False
+        period.is_request_in_flight = False
         if (
             not message.performative
             == LedgerApiMessage.Performative.TRANSACTION_RECEIPT
         ):
             raise ValueError("wrong performative")
-        tx_receipt = message.transaction_receipt
-        self.active_period.tx_receipt = tx_receipt
-        self.context.logger.info(f"found tx_receipt: {self.active_period.tx_receipt}")
+        period.timeline.end(Stage.RECEIPT)
+        self._set_tx_receipt(period, message.transaction_receipt)
+
+    def handle_mined_transaction(
+        self, period: Period, sent_at: float, message: ContractApiMessage
+    ) -> None:
+        """
+        Callback handler for the lookup of the digests of a period.
+
+        The period is resolved by the receipt of whichever transaction is
+        mined. Otherwise, the last one sent is replaced once
+        'replacement_deadline_blocks' blocks were produced since it was
+        sent, up to 'max_replacements' times; after that, the period fails
+        if none is mined within 'receipt_request_timeout' seconds of the
+        first broadcast.
+
+        :param period: the period the lookup was made for
+        :param sent_at: the monotonic time the lookup was sent at
+        :param message: the response
+        """
+        period.is_request_in_flight = False
+        if not message.performative == ContractApiMessage.Performative.STATE:
+            raise ValueError("wrong performative")
+        state = message.state.body
+        block = cast(int, state["block"])
+        period.next_watch_at = self._observe_block(
+            block, cast(int, state["timestamp"]), sent_at
+        )
+        tx_hash = cast(Optional[str], state["tx_hash"])
+        if tx_hash is not None:
+            ledger_id = message.state.ledger_id
+            period.timeline.end(Stage.RECEIPT)
+            period.tx_digest = TransactionDigest(ledger_id, tx_hash)
+            self._set_tx_receipt(
+                period,
+                TransactionReceipt(
+                    ledger_id,
+                    cast(Dict[str, Any], state["receipt"]),
+                    cast(Dict[str, Any], state["transaction"]),
+                ),
+            )
+            return
+        if period.replacement_block is None:
+            period.replacement_block = block + cast(
+                int, self.replacement_deadline_blocks
+            )
+        if block < period.replacement_block:
+            return
+        if period.n_replacements < self.max_replacements:
+            self._replace_transaction(period)
+            return
+        if (
+            time.monotonic() - cast(float, period.broadcast_at)
+            > self.receipt_request_timeout
+        ):
+            self.context.logger.error(
+                f"none of the transactions {period.tx_digests} was mined, "
+                f"failing period with id={period.period_id}."
+            )
+            period.fail()
+            self._settle_failed_nonces(period)
+
+    def _end_transaction_dialogues(self, period: Period) -> None:
+        """
+        End the broadcast dialogues of a finished period no receipt was requested in.
+
+        A receipt is requested in each of them, e.g. for the digests looked up
+        with 'get_mined_transaction' instead; its response ends the dialogue
+        and is dropped.
+
+        :param period: the period
+        """
+        requests = cast(Requests, self.context.requests)
+        for tx_digest, dialogue in period.transaction_dialogues.items():
+            message = dialogue.reply(
+                performative=LedgerApiMessage.Performative.GET_TRANSACTION_RECEIPT,
+                transaction_digest=TransactionDigest(
+                    self.context.default_ledger_id, tx_digest
+                ),
+            )
+            requests.register(
+                self._get_request_nonce_from_dialogue(dialogue),
+                lambda _message: None,
+                timeout=self.receipt_request_timeout,
+                dialogue=dialogue,
+                dialogues=self._get_dialogues(dialogue),
+            )
+            self.context.outbox.put_message(message=message)
+        period.transaction_dialogues.clear()
+
+    def _set_tx_receipt(self, period: Period, tx_receipt: TransactionReceipt) -> None:
+        """Set the receipt of the transaction of a period, and settle its nonces."""
+        period.tx_receipt = tx_receipt
+        self._observe_gas(period, tx_receipt)
+        if period.simulated_gas is not None and "gasUsed" in tx_receipt.receipt:
+            self.context.logger.info(
+                f"gas used {tx_receipt.receipt['gasUsed']}, "
+                f"simulated {period.simulated_gas}."
+            )
+        if period.nonces is not None:
+            if tx_receipt.receipt.get("status") == 1:
+                self.nonce_manager.confirm(period.nonces)
+            else:
+                # the account nonce is used, but not the Safe nonce
+                self.nonce_manager.invalidate(period.nonces)
+        self.context.logger.info(f"found tx_receipt: {period.tx_receipt}")
+
+    def _observe_gas(self, period: Period, tx_receipt: TransactionReceipt) -> None:
+        """Drop the gas template of a period if its receipt shows the gas limit was too tight."""
+        if period.raw_transaction is None or "gasUsed" not in tx_receipt.receipt:
+            return
+        if self.gas_templates.observe(
+            self._get_gas_template_key(period),
+            cast(int, period.raw_transaction.body["gas"]),
+            cast(int, tx_receipt.receipt["gasUsed"]),
+            cast(int, tx_receipt.receipt.get("status")),
+        ):
+            self.context.logger.info(
+                "gas used close to the limit, the gas will be estimated again."
+            )
@@ -24,6 +24,7 @@ from typing import Any, Optional, Type
 from aea.exceptions import enforce
 from aea.helpers.transaction.base import Terms
 from aea.protocols.base import Address, Message
+from aea.protocols.dialogue.base import BasicDialoguesStorage
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 from aea.protocols.dialogue.base import DialogueLabel as BaseDialogueLabel
 from aea.skills.base import Model
@@ -49,10 +50,26 @@ from packages.open_aea.protocols.signing.dialogues import (
 )
 
 
+class RemovableDialoguesMixin:  # pylint: disable=too-few-public-methods
+    """Stop keeping track of dialogues which will not go on."""
+
+    _dialogues_storage: BasicDialoguesStorage
+
+    def remove(self, dialogue: BaseDialogue) -> None:
+        """
+        Remove a dialogue, e.g. one whose response is no longer waited for.
+
+        A message arriving later in the dialogue is unidentified.
+
+        :param dialogue: the dialogue
+        """
+        self._dialogues_storage.remove(dialogue.dialogue_label)
+
+
 SigningDialogue = BaseSigningDialogue
 
 
-class SigningDialogues(Model, BaseSigningDialogues):
+class SigningDialogues(Model, RemovableDialoguesMixin, BaseSigningDialogues):
     """This class keeps track of all signing dialogues."""
 
     def __init__(self, **kwargs: Any) -> None:
@@ -84,7 +101,7 @@ class SigningDialogues(Model, BaseSigningDialogues):
 LedgerApiDialogue = BaseLedgerApiDialogue
 
 
-class LedgerApiDialogues(Model, BaseLedgerApiDialogues):
+class LedgerApiDialogues(Model, RemovableDialoguesMixin, BaseLedgerApiDialogues):
     """The dialogues class keeps track of all dialogues."""
 
     def __init__(self, **kwargs: Any) -> None:
@@ -159,7 +176,7 @@ class ContractApiDialogue(  # pylint: disable=too-few-public-methods
         self._terms = terms
 
 
-class ContractApiDialogues(Model, BaseContractApiDialogues):
+class ContractApiDialogues(Model, RemovableDialoguesMixin, BaseContractApiDialogues):
     """The dialogues class keeps track of all dialogues."""
 
     def __init__(self, **kwargs: Any) -> None:
@@ -68,7 +68,8 @@ class AbstractResponseHandler(Handler, ABC):
             3. Check whether the performative is in the set of allowed performative;
                 if not, log a message and return.
             4. Try to recover the callback of the request associated to the response
-                from the 'Requests' model; if no callback is present, log a message and return.
+                from the 'Requests' model; if no callback is present (e.g. the request
+                has already expired), log a message and return.
             5. If the above check have passed, then call the callback with the received message.
 
         :param message: the message to handle.
@@ -89,9 +90,7 @@ class AbstractResponseHandler(Handler, ABC):
             return
 
         request_nonce = protocol_dialogue.dialogue_label.dialogue_reference[0]
-        callback = cast(Requests, self.context.requests).request_id_to_callback.pop(
-            request_nonce, None
-        )
+        callback = cast(Requests, self.context.requests).pop_callback(request_nonce)
         if callback is None:
             self._handle_no_callback(message, protocol_dialogue)
             return
@@ -180,6 +179,8 @@ class SigningHandler(AbstractResponseHandler):
         {
             SigningMessage.Performative.SIGNED_MESSAGE,
             SigningMessage.Performative.SIGNED_TRANSACTION,
+            SigningMessage.Performative.SIGNED_MESSAGES,
+            SigningMessage.Performative.SIGNED_TRANSACTIONS,
             SigningMessage.Performative.ERROR,
         }
     )
@@ -195,6 +196,7 @@ class LedgerApiHandler(AbstractResponseHandler):
             LedgerApiMessage.Performative.RAW_TRANSACTION,
             LedgerApiMessage.Performative.TRANSACTION_DIGEST,
             LedgerApiMessage.Performative.TRANSACTION_RECEIPT,
+            LedgerApiMessage.Performative.STATE,
             LedgerApiMessage.Performative.ERROR,
         }
     )
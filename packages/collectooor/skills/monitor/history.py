@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the bounded history of the finished periods and its archive."""
+
+import json
+import os
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, Optional
+
+
+DEFAULT_HISTORY_SIZE = 100
+DEFAULT_ARCHIVE_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_ARCHIVE_BACKUPS = 5
+
+
+class PeriodSummary:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """A compact record of a finished period."""
+
+    __slots__ = (
+        "period_id",
+        "project_id",
+        "value",
+        "gas_used",
+        "simulated_gas",
+        "tx_digest",
+        "is_failed",
+        "rpc_count",
+        "stage_durations",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        period_id: int,
+        project_id: Optional[int],
+        value: Optional[int],
+        gas_used: Optional[int],
+        simulated_gas: Optional[int],
+        tx_digest: Optional[str],
+        is_failed: bool,
+        rpc_count: int,
+        stage_durations: Dict[str, float],
+    ) -> None:
+        """
+        Initialize the summary.
+
+        :param period_id: the id of the period.
+        :param project_id: the id of the project purchased, if any.
+        :param value: the price paid, in wei.
+        :param gas_used: the gas used by the purchase transaction.
+        :param simulated_gas: the gas estimated by the simulation of the purchase transaction, if simulated.
+        :param tx_digest: the digest of the purchase transaction.
+        :param is_failed: whether the period failed.
+        :param rpc_count: the number of requests sent to the ledger connection.
+        :param stage_durations: the duration of each stage, in seconds.
+        """
+        self.period_id = period_id
+        self.project_id = project_id
+        self.value = value
+        self.gas_used = gas_used
+        self.simulated_gas = simulated_gas
+        self.tx_digest = tx_digest
+        self.is_failed = is_failed
+        self.rpc_count = rpc_count
+        self.stage_durations = stage_durations
+
+    def to_json(self) -> Dict[str, Any]:
+        """Get the summary as a JSON-serializable dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class PeriodArchive:  # pylint: disable=too-few-public-methods
+    """
+    An append-only archive of full period records, one JSON object per line.
+
+    When the file would grow beyond 'max_bytes', it is rotated like a
+    logging.handlers.RotatingFileHandler does: 'path' is renamed 'path.1',
+    'path.1' is renamed 'path.2' and so on, keeping 'backups' old files.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_ARCHIVE_MAX_BYTES,
+        backups: int = DEFAULT_ARCHIVE_BACKUPS,
+    ) -> None:
+        """
+        Initialize the archive.
+
+        :param path: the path of the archive file.
+        :param max_bytes: the size above which the file is rotated.
+        :param backups: the number of rotated files to keep.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Append a record, rotating the file first if needed.
+
+        :param record: the record; values that are not JSON-serializable are stored as strings.
+        """
+        line = json.dumps(record, default=str) + "\n"
+        if self._should_rotate(len(line.encode())):
+            self._rotate()
+        with open(self.path, "a") as f:
+            f.write(line)
+
+    def _should_rotate(self, n_bytes: int) -> bool:
+        """Check whether appending some bytes would make the file too large."""
+        if self.max_bytes <= 0 or not os.path.exists(self.path):
+            return False
+        return os.path.getsize(self.path) + n_bytes > self.max_bytes
+
+    def _rotate(self) -> None:
+        """Rotate the archive files."""
+        if self.backups <= 0:
+            os.remove(self.path)
+            return
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+
+class PeriodHistory:
+    """The summaries of the most recent finished periods, in a ring buffer."""
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_HISTORY_SIZE,
+        archive: Optional[PeriodArchive] = None,
+    ) -> None:
+        """
+        Initialize the history.
+
+        :param max_size: the number of summaries kept; the oldest ones are dropped.
+        :param archive: the archive of the full records, if any.
+        """
+        if max_size < 1:
+            raise ValueError("the history size must be at least 1")
+        self._summaries: Deque[PeriodSummary] = deque(maxlen=max_size)
+        self.archive = archive
+        self.n_periods = 0
+
+    def __len__(self) -> int:
+        """Get the number of summaries kept."""
+        return len(self._summaries)
+
+    def __iter__(self) -> Iterator[PeriodSummary]:
+        """Iterate over the summaries kept, from the oldest."""
+        return iter(self._summaries)
+
+    def add(self, summary: PeriodSummary, record: Dict[str, Any]) -> None:
+        """
+        Add a finished period.
+
+        :param summary: the summary of the period.
+        :param record: the full record of the period, archived if enabled.
+        """
+        self._summaries.append(summary)
+        self.n_periods += 1
+        if self.archive is not None:
+            self.archive.append(record)
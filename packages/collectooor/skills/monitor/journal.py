@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the write-ahead journal of the periods."""
+
+import json
+import os
+from typing import Any, Dict, IO, Optional
+
+
+DEFAULT_COMPACT_AFTER = 100
+
+
+class PeriodJournal:
+    """
+    A write-ahead journal of the state transitions of the periods.
+
+    Each transition is appended as one JSON line with the id of the period
+    and the fields it set. Lines are written as they come but only synced to
+    disk by 'sync', so that the transitions of a whole act share one fsync.
+
+    The journal keeps the state of the unfinished periods in memory; once
+    'compact_after' periods have finished, the file is rewritten with only
+    that state, so it does not grow with the life of the agent.
+    """
+
+    def __init__(self, path: str, compact_after: int = DEFAULT_COMPACT_AFTER):
+        """
+        Initialize the journal.
+
+        :param path: the path of the journal file.
+        :param compact_after: the number of finished periods after which the file is compacted.
+        """
+        self.path = path
+        self.compact_after = compact_after
+        self._file: Optional[IO[str]] = None
+        self._is_dirty = False
+        self._n_finished = 0
+        self.live: Dict[int, Dict[str, Any]] = {}
+        self.last_period_id: Optional[int] = None
+
+    def replay(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Read the journal back, and compact it.
+
+        :return: the state of the unfinished periods, by period id, in order.
+        """
+        self.live = {}
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # a torn write at the tail, from a crash while appending
+                        break
+                    self._apply(entry)
+        self.compact()
+        return dict(sorted(self.live.items()))
+
+    def record(self, period_id: int, **fields: Any) -> None:
+        """
+        Record the fields set by a transition of a period.
+
+        :param period_id: the id of the period.
+        :param fields: the fields set, JSON-serializable.
+        """
+        entry = {"period_id": period_id, **fields}
+        self._apply(entry)
+        self._open().write(json.dumps(entry) + "\n")
+        self._is_dirty = True
+
+    def finish(self, period_id: int) -> None:
+        """
+        Record that a period is finished, so it is not resumed.
+
+        :param period_id: the id of the period.
+        """
+        self.record(period_id, finished=True)
+        self._n_finished += 1
+        if self._n_finished >= self.compact_after:
+            self.sync()
+            self.compact()
+
+    def sync(self) -> None:
+        """Flush the recorded transitions to disk."""
+        if self._file is None or not self._is_dirty:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._is_dirty = False
+
+    def compact(self) -> None:
+        """Rewrite the journal with only the state of the unfinished periods."""
+        self.close()
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            for period_id, fields in sorted(self.live.items()):
+                f.write(json.dumps({"period_id": period_id, **fields}) + "\n")
+            if self.last_period_id is not None and self.last_period_id not in self.live:
+                # keep the last period id, so that ids are not reused
+                entry = {"period_id": self.last_period_id, "finished": True}
+                f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._n_finished = 0
+
+    def close(self) -> None:
+        """Sync and close the journal file."""
+        if self._file is None:
+            return
+        self.sync()
+        self._file.close()
+        self._file = None
+
+    def _open(self) -> IO[str]:
+        """Get the journal file, opened for appending."""
+        if self._file is None:
+            self._file = open(self.path, "a")  # pylint: disable=consider-using-with
+        return self._file
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        """Apply an entry to the state of the unfinished periods."""
+        fields = dict(entry)
+        period_id = fields.pop("period_id")
+        if self.last_period_id is None or period_id > self.last_period_id:
+            self.last_period_id = period_id
+        if fields.pop("finished", False):
+            self.live.pop(period_id, None)
+            return
+        self.live.setdefault(period_id, {}).update(fields)
@@ -19,9 +19,164 @@
 
 """This package contains a scaffold of a model."""
 
-from typing import Any, Callable, Dict
+import heapq
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Set, Tuple
 
+from aea.protocols.dialogue.base import Dialogue
 from aea.skills.base import Model
+from eth_abi import encode_abi
+from eth_utils import keccak
+from hexbytes import HexBytes
+from packaging.version import Version
+
+from packages.collectooor.skills.monitor.dialogues import RemovableDialoguesMixin
+
+
+DEFAULT_REQUEST_TIMEOUT = 60.0
+DEFAULT_TIMER_TICK = 0.5
+DEFAULT_WHEEL_SIZE = 512
+DEFAULT_RESYNC_INTERVAL = 60.0
+DEFAULT_GAS_CLOSE_RATIO = 0.9
+DEFAULT_MAX_HEADERS = 32
+DEFAULT_WINDOW_POSITION = 0.5
+DEFAULT_LATENCY_SMOOTHING = 0.2
+NULL_ADDRESS = "0x" + "0" * 40
+SAFE_TX_FIELDS = (
+    "address to,uint256 value,bytes data,uint8 operation,uint256 safeTxGas,"
+    "uint256 {base_gas_name},uint256 gasPrice,address gasToken,"
+    "address refundReceiver,uint256 nonce"
+)
+
+
+class TimerWheel:
+    """
+    A hashed timer wheel.
+
+    Deadlines are hashed into a fixed number of slots, each slot covering
+    'tick' seconds. Scheduling and cancelling are O(1); advancing the wheel
+    only visits the slots whose time has passed, so expiry is O(1) amortized
+    per entry, since an entry is only looked at when its slot comes around.
+    """
+
+    def __init__(
+        self,
+        tick: float = DEFAULT_TIMER_TICK,
+        wheel_size: int = DEFAULT_WHEEL_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the wheel.
+
+        :param tick: the duration of a slot, in seconds.
+        :param wheel_size: the number of slots.
+        :param clock: the monotonic clock used to read the current time.
+        """
+        if tick <= 0 or wheel_size <= 0:
+            raise ValueError("tick and wheel_size must be positive")
+        self._tick = tick
+        self._wheel_size = wheel_size
+        self._clock = clock
+        self._slots: List[Set[Hashable]] = [set() for _ in range(wheel_size)]
+        # mapping from key to (slot index, absolute deadline tick)
+        self._entries: Dict[Hashable, Tuple[int, int]] = {}
+        self._current_tick = self._to_tick(clock())
+
+    def _to_tick(self, timestamp: float) -> int:
+        """Convert a timestamp to an absolute tick number."""
+        return int(timestamp // self._tick)
+
+    def now(self) -> float:
+        """Get the current time of the wheel's clock."""
+        return self._clock()
+
+    def __len__(self) -> int:
+        """Get the number of scheduled entries."""
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check whether the key is scheduled."""
+        return key in self._entries
+
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """
+        Schedule a key to expire at the given deadline.
+
+        :param key: the key; scheduling an existing key reschedules it.
+        :param deadline: the deadline, in the clock's time base.
+        """
+        self.cancel(key)
+        deadline_tick = max(self._to_tick(deadline), self._current_tick + 1)
+        slot = deadline_tick % self._wheel_size
+        self._slots[slot].add(key)
+        self._entries[key] = (slot, deadline_tick)
+
+    def cancel(self, key: Hashable) -> bool:
+        """
+        Cancel a scheduled key.
+
+        :param key: the key.
+        :return: True if the key was scheduled, False otherwise.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._slots[entry[0]].discard(key)
+        return True
+
+    def advance(self, now: Optional[float] = None) -> List[Hashable]:
+        """
+        Advance the wheel up to the given time.
+
+        :param now: the current time; read from the clock if not provided.
+        :return: the keys whose deadline has passed.
+        """
+        now = self._clock() if now is None else now
+        target_tick = self._to_tick(now)
+        expired: List[Hashable] = []
+        # a full rotation visits every slot; more steps would be redundant
+        steps = min(target_tick - self._current_tick, self._wheel_size)
+        for step in range(1, steps + 1):
+            slot = self._slots[(self._current_tick + step) % self._wheel_size]
+            for key in [k for k in slot if self._entries[k][1] <= target_tick]:
+                slot.discard(key)
+                del self._entries[key]
+                expired.append(key)
+        self._current_tick = max(self._current_tick, target_tick)
+        return expired
+
+
+class PendingRequest:  # pylint: disable=too-few-public-methods
+    """A request waiting for its response."""
+
+    __slots__ = (
+        "request_nonce",
+        "callback",
+        "timeout_callback",
+        "deadline",
+        "dialogue",
+        "dialogues",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        request_nonce: str,
+        callback: Callable,
+        deadline: float,
+        timeout_callback: Optional[Callable[["PendingRequest"], None]] = None,
+        dialogue: Optional[Dialogue] = None,
+        dialogues: Optional[RemovableDialoguesMixin] = None,
+    ) -> None:
+        """Initialize the pending request."""
+        self.request_nonce = request_nonce
+        self.callback = callback
+        self.deadline = deadline
+        self.timeout_callback = timeout_callback
+        # the dialogue of the request, removed from its dialogues on expiry
+        self.dialogue = dialogue
+        self.dialogues = dialogues
 
 
 class Requests(Model):
@@ -29,7 +184,523 @@ class Requests(Model):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the state."""
+        self.request_timeout = float(
+            kwargs.pop("request_timeout", DEFAULT_REQUEST_TIMEOUT)
+        )
+        timer_tick = float(kwargs.pop("timer_tick", DEFAULT_TIMER_TICK))
+        timer_wheel_size = int(kwargs.pop("timer_wheel_size", DEFAULT_WHEEL_SIZE))
+        super().__init__(*args, **kwargs)
+
+        # mapping from dialogue reference nonce to the pending request
+        self.pending_requests: Dict[str, PendingRequest] = {}
+        self._timer_wheel = TimerWheel(tick=timer_tick, wheel_size=timer_wheel_size)
+
+    def register(  # pylint: disable=too-many-arguments
+        self,
+        request_nonce: str,
+        callback: Callable,
+        timeout: Optional[float] = None,
+        timeout_callback: Optional[Callable[[PendingRequest], None]] = None,
+        dialogue: Optional[Dialogue] = None,
+        dialogues: Optional[RemovableDialoguesMixin] = None,
+    ) -> PendingRequest:
+        """
+        Register a request waiting for a response.
+
+        :param request_nonce: the dialogue reference nonce of the request.
+        :param callback: the callback to call with the response.
+        :param timeout: seconds after which the request expires; defaults to 'request_timeout'.
+        :param timeout_callback: the callback to call with the request on expiry.
+        :param dialogue: the dialogue of the request, removed on expiry.
+        :param dialogues: the dialogues the dialogue of the request is kept in.
+        :return: the pending request.
+        """
+        timeout = self.request_timeout if timeout is None else timeout
+        deadline = self._timer_wheel.now() + timeout
+        request = PendingRequest(
+            request_nonce,
+            callback,
+            deadline,
+            timeout_callback=timeout_callback,
+            dialogue=dialogue,
+            dialogues=dialogues,
+        )
+        self.pending_requests[request_nonce] = request
+        self._timer_wheel.schedule(request_nonce, deadline)
+        return request
+
+    def pop(self, request_nonce: str) -> Optional[PendingRequest]:
+        """
+        Remove a pending request, e.g. because its response arrived.
+
+        :param request_nonce: the dialogue reference nonce of the request.
+        :return: the pending request, or None if it is unknown or expired.
+        """
+        request = self.pending_requests.pop(request_nonce, None)
+        if request is not None:
+            self._timer_wheel.cancel(request_nonce)
+        return request
+
+    def pop_callback(self, request_nonce: str) -> Optional[Callable]:
+        """
+        Remove a pending request and get its callback.
+
+        :param request_nonce: the dialogue reference nonce of the request.
+        :return: the callback, or None if the request is unknown or expired.
+        """
+        request = self.pop(request_nonce)
+        return request.callback if request is not None else None
+
+    @property
+    def next_deadline(self) -> Optional[float]:
+        """Get the earliest deadline of the pending requests, if any."""
+        return min(
+            (request.deadline for request in self.pending_requests.values()),
+            default=None,
+        )
+
+    def expire(self, now: Optional[float] = None) -> List[PendingRequest]:
+        """
+        Expire the requests whose deadline has passed.
+
+        For each expired request, the timeout callback, if any, is called
+        and the dialogue of the request, if any, is removed from its
+        dialogues, so that a response which never arrives does not keep it
+        forever; a late response is then unidentified, and dropped.
+
+        :param now: the current monotonic time; read from the clock if not provided.
+        :return: the expired requests.
+        """
+        expired = []
+        for request_nonce in self._timer_wheel.advance(now):
+            request = self.pending_requests.pop(str(request_nonce), None)
+            if request is None:  # pragma: nocover
+                continue
+            expired.append(request)
+        for request in expired:
+            self.context.logger.warning(
+                f"request with nonce {request.request_nonce} timed out."
+            )
+            if request.timeout_callback is not None:
+                request.timeout_callback(request)
+            if request.dialogue is not None and request.dialogues is not None:
+                request.dialogues.remove(request.dialogue)
+        return expired
+
+
+class SafeTxHasher(Model):
+    """
+    Compute the EIP-712 hash of Safe transactions locally.
+
+    The domain separator only depends on the chain id, the Safe address and
+    the Safe version, so it is computed once; the Safe nonce is given by the
+    caller, see 'NonceManager'.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the hasher."""
+        super().__init__(*args, **kwargs)
+        self.domain_separator: Optional[bytes] = None
+        self.safe_tx_typehash: Optional[bytes] = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Check whether the domain is known."""
+        return self.domain_separator is not None
+
+    def set_domain(self, chain_id: int, safe_address: str, safe_version: str) -> None:
+        """
+        Set the domain of the Safe, computing its separator.
+
+        :param chain_id: the chain id.
+        :param safe_address: the address of the Safe.
+        :param safe_version: the version of the Safe contract.
+        """
+        version = Version(safe_version)
+        # Safes >= 1.3.0 added `chainId` to the domain
+        if version >= Version("1.3.0"):
+            self.domain_separator = keccak(
+                encode_abi(
+                    ["bytes32", "uint256", "address"],
+                    [
+                        keccak(
+                            text="EIP712Domain(uint256 chainId,address verifyingContract)"
+                        ),
+                        chain_id,
+                        safe_address,
+                    ],
+                )
+            )
+        else:
+            self.domain_separator = keccak(
+                encode_abi(
+                    ["bytes32", "address"],
+                    [
+                        keccak(text="EIP712Domain(address verifyingContract)"),
+                        safe_address,
+                    ],
+                )
+            )
+        # Safes >= 1.0.0 renamed `dataGas` to `baseGas`
+        base_gas_name = "baseGas" if version >= Version("1.0.0") else "dataGas"
+        self.safe_tx_typehash = keccak(
+            text=f"SafeTx({SAFE_TX_FIELDS.format(base_gas_name=base_gas_name)})"
+        )
+
+    def get_safe_tx_hash(  # pylint: disable=too-many-arguments
+        self,
+        to_address: str,
+        value: int,
+        data: bytes,
+        safe_nonce: int,
+        operation: int = 0,
+        safe_tx_gas: int = 0,
+        base_gas: int = 0,
+        gas_price: int = 0,
+        gas_token: str = NULL_ADDRESS,
+        refund_receiver: str = NULL_ADDRESS,
+    ) -> str:
+        """
+        Get the hash of a Safe transaction.
+
+        :param to_address: the tx recipient address
+        :param value: the ETH value of the transaction
+        :param data: the data of the transaction, as bytes or hex encoded
+        :param safe_nonce: the Safe nonce of the transaction
+        :param operation: the operation type of the Safe transaction
+        :param safe_tx_gas: the gas that should be used for the Safe transaction
+        :param base_gas: the gas costs that are independent of the transaction execution
+        :param gas_price: the gas price that should be used for the payment calculation
+        :param gas_token: the token address used for the payment, or the null address for ETH
+        :param refund_receiver: the receiver of the gas payment, or the null address for tx.origin
+        :return: the hash, hex encoded without the '0x' prefix
+        """
+        if self.domain_separator is None:
+            raise ValueError("the Safe domain must be set first")
+        struct_hash = keccak(
+            encode_abi(
+                [
+                    "bytes32",
+                    "address",
+                    "uint256",
+                    "bytes32",
+                    "uint8",
+                    "uint256",
+                    "uint256",
+                    "uint256",
+                    "address",
+                    "address",
+                    "uint256",
+                ],
+                [
+                    self.safe_tx_typehash,
+                    to_address,
+                    value,
+                    keccak(HexBytes(data)),
+                    operation,
+                    safe_tx_gas,
+                    base_gas,
+                    gas_price,
+                    gas_token,
+                    refund_receiver,
+                    safe_nonce,
+                ],
+            )
+        )
+        return keccak(b"\x19\x01" + self.domain_separator + struct_hash).hex()
+
+
+class NonceManager(Model):
+    """
+    Track the next nonces of the agent's account and of the Safe locally.
+
+    Each purchase reserves a pair of nonces: one for the transaction sent by
+    the account, one for the Safe transaction it executes. Since the account
+    nonce orders the transactions on chain, the Safe nonces are used in the
+    same order, and several purchases can be in flight at once.
+
+    A pair released by a purchase that failed before its broadcast is handed
+    out again first, filling the gap it left. When the outcome of a purchase
+    is unknown, or its Safe transaction reverted, the nonces are read from
+    the chain again, once no reservation is outstanding; they are also read
+    again every 'resync_interval' seconds of idleness, to catch transactions
+    sent by others.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the manager."""
+        self.resync_interval = float(
+            kwargs.pop("resync_interval", DEFAULT_RESYNC_INTERVAL)
+        )
+        super().__init__(*args, **kwargs)
+        self._clock: Callable[[], float] = time.monotonic
+        self._next: Optional[Tuple[int, int]] = None
+        self._released: List[Tuple[int, int]] = []
+        self._synced_at = 0.0
+        self.reserved: Set[Tuple[int, int]] = set()
+
+    @property
+    def needs_sync(self) -> bool:
+        """Check whether the nonces must be read from the chain."""
+        if self._next is None:
+            return True
+        return (
+            len(self.reserved) == 0
+            and self._clock() - self._synced_at > self.resync_interval
+        )
+
+    @property
+    def can_sync(self) -> bool:
+        """Check whether the nonces read from the chain can be used."""
+        return len(self.reserved) == 0
+
+    def sync(self, account_nonce: int, safe_nonce: int) -> bool:
+        """
+        Set the next nonces, as read from the chain.
+
+        :param account_nonce: the transaction count of the account.
+        :param safe_nonce: the nonce of the Safe.
+        :return: whether the nonces were set; they are not if a reservation was made meanwhile.
+        """
+        if not self.can_sync:
+            return False
+        self._next = (account_nonce, safe_nonce)
+        self._released = []
+        self._synced_at = self._clock()
+        return True
+
+    def reserve(self) -> Tuple[int, int]:
+        """
+        Reserve the next pair of nonces.
+
+        :return: the account nonce and the Safe nonce.
+        """
+        if self._next is None:
+            raise ValueError("the nonces must be synced first")
+        if len(self._released) > 0:
+            nonces = heapq.heappop(self._released)
+        else:
+            nonces = self._next
+            self._next = (nonces[0] + 1, nonces[1] + 1)
+        self.reserved.add(nonces)
+        return nonces
+
+    def restore(self, nonces: Tuple[int, int]) -> None:
+        """Mark a pair of nonces reserved before a restart as reserved again."""
+        self.reserved.add(nonces)
+
+    def is_stale(self, nonces: Tuple[int, int]) -> bool:
+        """
+        Check whether a reserved pair of nonces may no longer be usable next.
+
+        :param nonces: the pair of nonces.
+        :return: whether the pair was invalidated, or a lower pair was given back.
+        """
+        return (
+            self._next is None
+            or nonces not in self.reserved
+            or any(released < nonces for released in self._released)
+        )
+
+    def confirm(self, nonces: Tuple[int, int]) -> None:
+        """Account for a pair of nonces used on chain."""
+        self.reserved.discard(nonces)
+
+    def release(self, nonces: Tuple[int, int]) -> None:
+        """Give back a pair of nonces that was not used on chain."""
+        if nonces in self.reserved:
+            self.reserved.discard(nonces)
+            heapq.heappush(self._released, nonces)
+
+    def invalidate(self, nonces: Tuple[int, int]) -> None:
+        """Forget the next nonces, as the use of a pair of nonces is unknown."""
+        self.reserved.discard(nonces)
+        self._next = None
+
+
+class GasTemplates(Model):
+    """
+    Remember the gas limits of the Safe transactions, by template.
+
+    The purchases of the same project produce 'execTransaction' calls that
+    only differ in their nonces and signatures, so they need the same gas.
+    A template is identified by the Safe, the target, the selector and the
+    length of the calldata and the number of signers; the gas limit
+    estimated for the first transaction of a template is reused for the
+    next ones, without estimating it again, until a receipt shows that the
+    gas used came within 'close_ratio' of the limit, or the transaction
+    failed.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the templates."""
+        self.close_ratio = float(kwargs.pop("close_ratio", DEFAULT_GAS_CLOSE_RATIO))
         super().__init__(*args, **kwargs)
+        self._gas_limits: Dict[Tuple, int] = {}
+        self.n_reused = 0
+
+    @staticmethod
+    def get_key(
+        safe_address: str, to_address: str, data: Any, n_signers: int
+    ) -> Tuple[str, str, str, int, int]:
+        """
+        Get the template of a Safe transaction.
+
+        :param safe_address: the address of the Safe.
+        :param to_address: the target of the Safe transaction.
+        :param data: the calldata of the Safe transaction, as bytes or hex string.
+        :param n_signers: the number of signatures.
+        :return: the key of the template.
+        """
+        data_bytes = bytes(HexBytes(data))
+        return (
+            safe_address.lower(),
+            to_address.lower(),
+            data_bytes[:4].hex(),
+            len(data_bytes),
+            n_signers,
+        )
+
+    def get(self, key: Tuple) -> Optional[int]:
+        """Get the gas limit learned for a template, if any."""
+        gas_limit = self._gas_limits.get(key)
+        if gas_limit is not None:
+            self.n_reused += 1
+        return gas_limit
+
+    def learn(self, key: Tuple, gas_limit: int) -> None:
+        """Remember the gas limit estimated for a template."""
+        self._gas_limits.setdefault(key, gas_limit)
+
+    def observe(self, key: Tuple, gas_limit: int, gas_used: int, status: int) -> bool:
+        """
+        Check a receipt of a transaction built from a template.
+
+        :param key: the key of the template.
+        :param gas_limit: the gas limit of the transaction.
+        :param gas_used: the gas used, from the receipt.
+        :param status: the status, from the receipt.
+        :return: whether the template was dropped, so that the gas is estimated again.
+        """
+        if status == 1 and gas_used < self.close_ratio * gas_limit:
+            return False
+        return self._gas_limits.pop(key, None) is not None
+
+
+class BlockClock(Model):
+    """
+    Model the cadence of the blocks from recent headers.
+
+    Each header is recorded with the monotonic time it was seen at. The
+    block interval is averaged over the last 'max_headers' headers; the
+    monotonic time a block is produced at is its timestamp plus the
+    smallest offset seen between the monotonic clock and the block
+    timestamps, since a header can only be seen after its block.
+
+    A transaction lands in the first block produced after it reaches the
+    node. To land in the first block eligible for a drop, it must reach
+    the node between the block before and that block: it is sent at
+    'window_position' of that window, less the latency to the node, so
+    that the errors of the model are tolerated on both sides.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the clock."""
+        max_headers = int(kwargs.pop("max_headers", DEFAULT_MAX_HEADERS))
+        self.window_position = float(
+            kwargs.pop("window_position", DEFAULT_WINDOW_POSITION)
+        )
+        super().__init__(*args, **kwargs)
+        if max_headers < 2:
+            raise ValueError("max_headers must be at least 2")
+        if not 0.0 <= self.window_position < 1.0:
+            raise ValueError("window_position must be in [0, 1)")
+        self._clock: Callable[[], float] = time.monotonic
+        # (block number, block timestamp, monotonic time seen at)
+        self._headers: Deque[Tuple[int, int, float]] = deque(maxlen=max_headers)
+        self.latency = 0.0
+
+    @property
+    def is_ready(self) -> bool:
+        """Check whether the cadence is known."""
+        return len(self._headers) >= 2 and self.block_interval > 0
+
+    @property
+    def latest_block(self) -> int:
+        """Get the number of the latest block seen."""
+        if len(self._headers) == 0:
+            raise ValueError("no block seen yet")
+        return self._headers[-1][0]
+
+    @property
+    def block_interval(self) -> float:
+        """Get the average seconds between two blocks."""
+        first_number, first_timestamp, _ = self._headers[0]
+        last_number, last_timestamp, _ = self._headers[-1]
+        if last_number == first_number:
+            return 0.0
+        return (last_timestamp - first_timestamp) / (last_number - first_number)
+
+    def observe(
+        self, number: int, timestamp: int, round_trip: Optional[float] = None
+    ) -> bool:
+        """
+        Record a block header, as just received.
+
+        :param number: the block number.
+        :param timestamp: the block timestamp.
+        :param round_trip: the seconds taken by the request of the header, to estimate the latency to the node.
+        :return: whether the block is newer than the ones seen before.
+        """
+        if round_trip is not None:
+            self.latency += DEFAULT_LATENCY_SMOOTHING * (round_trip / 2 - self.latency)
+        if len(self._headers) > 0 and number <= self._headers[-1][0]:
+            return False
+        self._headers.append((number, timestamp, self._clock()))
+        return True
+
+    def get_block_time(self, number: int) -> float:
+        """
+        Predict the monotonic time a block is produced at.
+
+        :param number: the block number.
+        :return: the monotonic time.
+        """
+        last_number, last_timestamp, _ = self._headers[-1]
+        offset = min(seen_at - timestamp for _, timestamp, seen_at in self._headers)
+        return offset + last_timestamp + (number - last_number) * self.block_interval
+
+    def get_first_eligible_block(
+        self, timestamp: Optional[int] = None, block: Optional[int] = None
+    ) -> int:
+        """
+        Predict the first block eligible for a drop.
+
+        :param timestamp: the block timestamp the drop starts at.
+        :param block: the block number the drop starts at.
+        :return: the block number.
+        """
+        last_number, last_timestamp, _ = self._headers[-1]
+        if block is not None:
+            return max(block, last_number + 1)
+        if timestamp is None:
+            raise ValueError("either the timestamp or the block must be given")
+        n_blocks = math.ceil((timestamp - last_timestamp) / self.block_interval)
+        return last_number + max(n_blocks, 1)
+
+    def get_send_time(
+        self, timestamp: Optional[int] = None, block: Optional[int] = None
+    ) -> float:
+        """
+        Get the monotonic time to send a transaction at, to land in the first eligible block of a drop.
 
-        # mapping from dialogue reference nonce to a callback
-        self.request_id_to_callback: Dict[str, Callable] = {}
+        :param timestamp: the block timestamp the drop starts at.
+        :param block: the block number the drop starts at.
+        :return: the monotonic time.
+        """
+        number = self.get_first_eligible_block(timestamp, block)
+        return (
+            self.get_block_time(number - 1)
+            + self.window_position * self.block_interval
+            - self.latency
+        )
@@ -0,0 +1,434 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the collection of the signatures of the owners of a Safe."""
+
+import binascii
+import json
+import re
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from eth_account import Account
+
+
+DEFAULT_CLIENT_TIMEOUT = 5.0
+SIGNATURE_LENGTH = 65
+
+
+class SafeTransactionSignatures:
+    """The signatures collected for a Safe transaction hash."""
+
+    __slots__ = ("safe_tx_hash", "owners", "threshold", "transaction", "signatures")
+
+    def __init__(
+        self,
+        safe_tx_hash: str,
+        owners: Sequence[str],
+        threshold: int,
+        transaction: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Initialize the signatures of a Safe transaction.
+
+        :param safe_tx_hash: the Safe transaction hash, hex encoded without prefix.
+        :param owners: the owners of the Safe.
+        :param threshold: the number of signatures the Safe requires.
+        :param transaction: the Safe transaction, for the co-owners to review.
+        """
+        self.safe_tx_hash = safe_tx_hash
+        self.owners = tuple(owners)
+        self.threshold = threshold
+        self.transaction = transaction
+        self.signatures: Dict[str, str] = {}
+
+    @property
+    def pending_owners(self) -> List[str]:
+        """Get the owners who have not signed yet."""
+        return [owner for owner in self.owners if owner not in self.signatures]
+
+    @property
+    def is_ready(self) -> bool:
+        """Check whether enough owners have signed."""
+        return len(self.signatures) >= self.threshold
+
+    @property
+    def packed_signatures(self) -> Optional[str]:
+        """Get the signatures packed as the Safe expects them, sorted by owner, once ready."""
+        if not self.is_ready:
+            return None
+        return "".join(
+            self.signatures[owner] for owner in sorted(self.signatures, key=str.lower)
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        """Get the state as a JSON-serializable dictionary."""
+        return {
+            "safe_tx_hash": self.safe_tx_hash,
+            "owners": list(self.owners),
+            "threshold": self.threshold,
+            "transaction": self.transaction,
+            "signatures": dict(self.signatures),
+            "pending_owners": self.pending_owners,
+            "is_ready": self.is_ready,
+            "packed_signatures": self.packed_signatures,
+        }
+
+
+class SignatureAggregator:
+    """
+    Collect the signatures of the owners of a Safe, per Safe transaction hash.
+
+    The proposer of a transaction opens it with the owners and the threshold
+    of the Safe; then each owner submits its signature of the hash, which is
+    checked against the owner's address, until the threshold is reached.
+    """
+
+    def __init__(self, verify_signatures: bool = True) -> None:
+        """
+        Initialize the aggregator.
+
+        :param verify_signatures: whether to check that a signature is made by its owner.
+        """
+        self.verify_signatures = verify_signatures
+        self._transactions: Dict[str, SafeTransactionSignatures] = {}
+        self._lock = threading.Lock()
+
+    def open(
+        self,
+        safe_tx_hash: str,
+        owners: Sequence[str],
+        threshold: int,
+        transaction: Optional[Dict[str, Any]] = None,
+    ) -> SafeTransactionSignatures:
+        """
+        Open the collection of the signatures of a Safe transaction hash, if not open yet.
+
+        :param safe_tx_hash: the Safe transaction hash, hex encoded.
+        :param owners: the owners of the Safe.
+        :param threshold: the number of signatures the Safe requires.
+        :param transaction: the Safe transaction, for the co-owners to review.
+        :return: the signatures collected so far.
+        """
+        safe_tx_hash = _normalize_hex(safe_tx_hash)
+        if not 1 <= threshold <= len(owners):
+            raise ValueError(f"invalid threshold {threshold} for {len(owners)} owners")
+        with self._lock:
+            signatures = self._transactions.get(safe_tx_hash)
+            if signatures is None:
+                signatures = SafeTransactionSignatures(
+                    safe_tx_hash, owners, threshold, transaction
+                )
+                self._transactions[safe_tx_hash] = signatures
+            elif (
+                set(map(str.lower, signatures.owners)) != set(map(str.lower, owners))
+                or signatures.threshold != threshold
+            ):
+                raise ValueError(
+                    f"Safe transaction {safe_tx_hash} is open with other owners"
+                )
+            return signatures
+
+    def submit(
+        self, safe_tx_hash: str, owner: str, signature: str
+    ) -> SafeTransactionSignatures:
+        """
+        Submit the signature of an owner.
+
+        :param safe_tx_hash: the Safe transaction hash, hex encoded.
+        :param owner: the address of the owner.
+        :param signature: the signature of the hash by the owner, hex encoded.
+        :return: the signatures collected so far.
+        """
+        safe_tx_hash = _normalize_hex(safe_tx_hash)
+        signature = _normalize_hex(signature)
+        with self._lock:
+            signatures = self._transactions.get(safe_tx_hash)
+            if signatures is None:
+                raise KeyError(f"Safe transaction {safe_tx_hash} is not open")
+            owner = _find_owner(signatures.owners, owner)
+            if len(signature) != 2 * SIGNATURE_LENGTH:
+                raise ValueError(f"invalid signature length for owner {owner}")
+            if self.verify_signatures:
+                signer = Account.recoverHash(
+                    binascii.unhexlify(safe_tx_hash),
+                    signature=binascii.unhexlify(signature),
+                )
+                if signer.lower() != owner.lower():
+                    raise ValueError(f"signature not made by owner {owner}")
+            signatures.signatures[owner] = signature
+            return signatures
+
+    def get(self, safe_tx_hash: str) -> Optional[SafeTransactionSignatures]:
+        """Get the signatures collected for a Safe transaction hash, if open."""
+        with self._lock:
+            return self._transactions.get(_normalize_hex(safe_tx_hash))
+
+    def get_pending(self, owner: str) -> List[SafeTransactionSignatures]:
+        """Get the Safe transactions not ready yet which an owner has not signed."""
+        with self._lock:
+            return [
+                signatures
+                for signatures in self._transactions.values()
+                if not signatures.is_ready
+                and owner.lower() in map(str.lower, signatures.pending_owners)
+            ]
+
+    def close(self, safe_tx_hash: str) -> None:
+        """Stop collecting the signatures of a Safe transaction hash."""
+        with self._lock:
+            self._transactions.pop(_normalize_hex(safe_tx_hash), None)
+
+
+class SignatureServer:
+    """
+    A local HTTP stand-in of the signature aggregation service.
+
+    It serves a 'SignatureAggregator' from a thread of its own:
+
+    - 'PUT /transactions/<hash>' opens a Safe transaction, with a JSON body
+      holding its 'owners', 'threshold' and optionally its 'transaction';
+    - 'POST /transactions/<hash>/signatures' submits the 'signature' of an
+      'owner';
+    - 'GET /transactions/<hash>' gets the signatures collected so far;
+    - 'GET /transactions?pending_owner=<address>' lists the transactions an
+      owner has yet to sign.
+    """
+
+    def __init__(
+        self,
+        aggregator: Optional[SignatureAggregator] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        Initialize the server.
+
+        :param aggregator: the aggregator to serve; a new one by default.
+        :param host: the host to listen on.
+        :param port: the port to listen on; any free port by default.
+        """
+        self.aggregator = (
+            aggregator if aggregator is not None else SignatureAggregator()
+        )
+        self._server = ThreadingHTTPServer((host, port), _make_request_handler(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Get the base URL of the server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        """Start serving, in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def route(
+        self, method: str, path: str, body: Optional[Dict[str, Any]]
+    ) -> Tuple[int, Any]:
+        """
+        Serve a request.
+
+        :param method: the HTTP method.
+        :param path: the path of the request, with its query.
+        :param body: the JSON body of the request, if any.
+        :return: the HTTP status and the JSON response.
+        """
+        url = urllib.parse.urlparse(path)
+        match = re.fullmatch(r"/transactions(?:/(\w+)(/signatures)?)?", url.path)
+        if match is None:
+            return 404, {"error": "not found"}
+        safe_tx_hash, is_signatures = match.groups()
+        body = body or {}
+        try:
+            if safe_tx_hash is None and method == "GET":
+                query = urllib.parse.parse_qs(url.query)
+                owner = query.get("pending_owner", [""])[0]
+                pending = self.aggregator.get_pending(owner)
+                return 200, [signatures.to_json() for signatures in pending]
+            if safe_tx_hash is None:
+                return 405, {"error": "method not allowed"}
+            if is_signatures and method == "POST":
+                signatures = self.aggregator.submit(
+                    safe_tx_hash, body["owner"], body["signature"]
+                )
+                return 200, signatures.to_json()
+            if not is_signatures and method == "PUT":
+                signatures = self.aggregator.open(
+                    safe_tx_hash,
+                    body["owners"],
+                    int(body["threshold"]),
+                    body.get("transaction"),
+                )
+                return 200, signatures.to_json()
+            if not is_signatures and method == "GET":
+                found = self.aggregator.get(safe_tx_hash)
+                if found is None:
+                    return 404, {
+                        "error": f"Safe transaction {safe_tx_hash} is not open"
+                    }
+                return 200, found.to_json()
+        except KeyError as e:
+            return 404, {"error": str(e)}
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        return 405, {"error": "method not allowed"}
+
+
+class SignatureClient:
+    """
+    A client of the signature aggregation service.
+
+    Its calls block until the service answers; they are meant to run in an
+    executor, off the event loop of the agent.
+    """
+
+    def __init__(self, url: str, timeout: float = DEFAULT_CLIENT_TIMEOUT) -> None:
+        """
+        Initialize the client.
+
+        :param url: the base URL of the service.
+        :param timeout: the timeout of a call, in seconds.
+        """
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def open(
+        self,
+        safe_tx_hash: str,
+        owners: Sequence[str],
+        threshold: int,
+        transaction: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Open the collection of the signatures of a Safe transaction hash."""
+        return self._call(
+            "PUT",
+            f"/transactions/{safe_tx_hash}",
+            {
+                "owners": list(owners),
+                "threshold": threshold,
+                "transaction": transaction,
+            },
+        )
+
+    def submit(self, safe_tx_hash: str, owner: str, signature: str) -> Dict[str, Any]:
+        """Submit the signature of an owner."""
+        return self._call(
+            "POST",
+            f"/transactions/{safe_tx_hash}/signatures",
+            {"owner": owner, "signature": signature},
+        )
+
+    def get(self, safe_tx_hash: str) -> Dict[str, Any]:
+        """Get the signatures collected for a Safe transaction hash."""
+        return self._call("GET", f"/transactions/{safe_tx_hash}")
+
+    def get_pending(self, owner: str) -> List[Dict[str, Any]]:
+        """Get the Safe transactions an owner has yet to sign."""
+        query = urllib.parse.urlencode({"pending_owner": owner})
+        return self._call("GET", f"/transactions?{query}")
+
+    def _call(self, method: str, path: str, body: Optional[Dict] = None) -> Any:
+        """Call the service; raise a ValueError if it answers with an error."""
+        data = json.dumps(body).encode() if body is not None else None
+        request = urllib.request.Request(  # nosec
+            self.url + path,
+            data=data,
+            method=method,
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(  # nosec
+                request, timeout=self.timeout
+            ) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            raise ValueError(
+                f"signature service error {e.code}: {json.loads(e.read()).get('error')}"
+            ) from e
+
+
+def _make_request_handler(server: SignatureServer) -> type:
+    """Make the request handler class of a signature server."""
+
+    class RequestHandler(BaseHTTPRequestHandler):
+        """Serve the requests with the routes of the server."""
+
+        def do_GET(self) -> None:  # pylint: disable=invalid-name
+            """Serve a GET request."""
+            self._serve("GET")
+
+        def do_PUT(self) -> None:  # pylint: disable=invalid-name
+            """Serve a PUT request."""
+            self._serve("PUT")
+
+        def do_POST(self) -> None:  # pylint: disable=invalid-name
+            """Serve a POST request."""
+            self._serve("POST")
+
+        def _serve(self, method: str) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                body = json.loads(self.rfile.read(length)) if length > 0 else None
+            except ValueError:
+                status, response = 400, {"error": "invalid JSON body"}
+            else:
+                status, response = server.route(method, self.path, body)
+            payload = json.dumps(response).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(  # pylint: disable=redefined-builtin
+            self, format: str, *args: Any
+        ) -> None:
+            """Do not log the requests."""
+
+    return RequestHandler
+
+
+def _normalize_hex(value: str) -> str:
+    """Get a hex string in lower case, without prefix."""
+    value = value.lower()
+    return value[2:] if value.startswith("0x") else value
+
+
+def _find_owner(owners: Sequence[str], owner: str) -> str:
+    """Get an owner as listed, matching the address in any case."""
+    for listed in owners:
+        if listed.lower() == owner.lower():
+            return listed
+    raise ValueError(f"{owner} is not an owner of the Safe")
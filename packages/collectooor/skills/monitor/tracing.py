@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the stage timeline of a period and its trace exporter."""
+
+import json
+import secrets
+import time
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional
+
+
+SCOPE_NAME = "collectooor/monitor"
+
+
+class Stage(Enum):
+    """The stages of a purchase."""
+
+    PROJECT_DISCOVERY = "project_discovery"
+    PURCHASE_DATA = "purchase_data"
+    GNOSIS_HASH = "gnosis_hash"
+    MESSAGE_SIGNING = "message_signing"
+    SIGNATURE_COLLECTION = "signature_collection"
+    RAW_SAFE_TX = "raw_safe_tx"
+    SIMULATION = "simulation"
+    TX_SIGNING = "tx_signing"
+    DROP_WAIT = "drop_wait"
+    BROADCAST = "broadcast"
+    RECEIPT = "receipt"
+
+
+class StageSpan:  # pylint: disable=too-few-public-methods
+    """The timing of a stage of a period."""
+
+    __slots__ = ("stage", "start", "end", "rpc_count")
+
+    def __init__(self, stage: Stage, start: float) -> None:
+        """
+        Initialize the span.
+
+        :param stage: the stage.
+        :param start: the monotonic time the stage started at.
+        """
+        self.stage = stage
+        self.start = start
+        self.end: Optional[float] = None
+        self.rpc_count = 0
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Get the duration of the stage, in seconds."""
+        return None if self.end is None else self.end - self.start
+
+
+class PeriodTimeline:
+    """
+    The timeline of the stages of a period.
+
+    A stage has one span each time it runs, e.g. once more when the raw
+    transaction is built again after a failed simulation. Timestamps are
+    taken from the monotonic clock; the offset to the wall clock is
+    recorded once, when the timeline is created, to export them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the timeline."""
+        self.created_at = time.monotonic()
+        self._wall_clock_offset = time.time() - self.created_at
+        # the spans of each stage, in the order they started
+        self.spans: Dict[Stage, List[StageSpan]] = {}
+
+    def _iter_spans(self) -> Iterator[StageSpan]:
+        """Iterate over the spans of all the stages."""
+        for spans in self.spans.values():
+            yield from spans
+
+    def start(self, stage: Stage, is_rpc: bool = True) -> StageSpan:
+        """
+        Start a stage, or count one more request for a started stage which has not ended.
+
+        :param stage: the stage.
+        :param is_rpc: whether the request of the stage goes to the ledger connection.
+        :return: the span of the stage.
+        """
+        spans = self.spans.setdefault(stage, [])
+        if len(spans) == 0 or spans[-1].end is not None:
+            spans.append(StageSpan(stage, time.monotonic()))
+        span = spans[-1]
+        if is_rpc:
+            span.rpc_count += 1
+        return span
+
+    def end(self, stage: Stage) -> None:
+        """
+        End a stage.
+
+        :param stage: the stage.
+        """
+        spans = self.spans.get(stage)
+        if spans and spans[-1].end is None:
+            spans[-1].end = time.monotonic()
+
+    @property
+    def rpc_count(self) -> int:
+        """Get the number of requests sent to the ledger connection over all the stages."""
+        return sum(span.rpc_count for span in self._iter_spans())
+
+    @property
+    def end_time(self) -> Optional[float]:
+        """Get the monotonic time of the end of the last ended stage."""
+        ends = [span.end for span in self._iter_spans() if span.end is not None]
+        return max(ends) if len(ends) > 0 else None
+
+    def durations(self) -> Dict[str, float]:
+        """Get the duration of each stage which ended at least once, over all its ended spans, in seconds."""
+        durations: Dict[str, float] = {}
+        for span in self._iter_spans():
+            if span.end is not None:
+                durations[span.stage.value] = (
+                    durations.get(span.stage.value, 0.0) + span.end - span.start
+                )
+        return durations
+
+    def _to_unix_nano(self, timestamp: float) -> str:
+        """Convert a monotonic timestamp to a wall-clock time in nanoseconds."""
+        return str(int((timestamp + self._wall_clock_offset) * 1e9))
+
+    def to_otlp_spans(
+        self, attributes: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert the timeline to spans, in the OpenTelemetry (OTLP/JSON) format.
+
+        A root span covers the whole period, with one child span per run of a stage.
+
+        :param attributes: the attributes of the root span.
+        :return: the spans.
+        """
+        trace_id = secrets.token_hex(16)
+        root_id = secrets.token_hex(8)
+        end = self.end_time if self.end_time is not None else time.monotonic()
+        spans = [
+            _otlp_span(
+                trace_id,
+                root_id,
+                None,
+                "period",
+                self._to_unix_nano(self.created_at),
+                self._to_unix_nano(end),
+                {**(attributes or {}), "rpc.count": self.rpc_count},
+            )
+        ]
+        for span in self._iter_spans():
+            spans.append(
+                _otlp_span(
+                    trace_id,
+                    secrets.token_hex(8),
+                    root_id,
+                    span.stage.value,
+                    self._to_unix_nano(span.start),
+                    self._to_unix_nano(span.end if span.end is not None else end),
+                    {"rpc.count": span.rpc_count, "stage.ended": span.end is not None},
+                )
+            )
+        return spans
+
+
+def _otlp_span(  # pylint: disable=too-many-arguments
+    trace_id: str,
+    span_id: str,
+    parent_span_id: Optional[str],
+    name: str,
+    start_time_unix_nano: str,
+    end_time_unix_nano: str,
+    attributes: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Build a span in the OTLP/JSON format."""
+    span = {
+        "traceId": trace_id,
+        "spanId": span_id,
+        "name": name,
+        "kind": 1,
+        "startTimeUnixNano": start_time_unix_nano,
+        "endTimeUnixNano": end_time_unix_nano,
+        "attributes": [
+            _otlp_attribute(key, value) for key, value in attributes.items()
+        ],
+    }
+    if parent_span_id is not None:
+        span["parentSpanId"] = parent_span_id
+    return span
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    """Build an attribute in the OTLP/JSON format."""
+    if isinstance(value, bool):
+        typed_value: Dict[str, Any] = {"boolValue": value}
+    elif isinstance(value, int):
+        typed_value = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed_value = {"doubleValue": value}
+    else:
+        typed_value = {"stringValue": str(value)}
+    return {"key": key, "value": typed_value}
+
+
+class TraceExporter:  # pylint: disable=too-few-public-methods
+    """Append period traces to a local file, one OTLP/JSON export request per line."""
+
+    def __init__(self, path: str, service_name: str = "collectooor") -> None:
+        """
+        Initialize the exporter.
+
+        :param path: the path of the trace file.
+        :param service_name: the name of the service the traces are attributed to.
+        """
+        self.path = path
+        self.service_name = service_name
+
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        """
+        Export spans.
+
+        :param spans: the spans, in the OTLP/JSON format.
+        """
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            _otlp_attribute("service.name", self.service_name)
+                        ]
+                    },
+                    "scopeSpans": [{"scope": {"name": SCOPE_NAME}, "spans": spans}],
+                }
+            ]
+        }
+        with open(self.path, "a") as f:
+            f.write(json.dumps(request) + "\n")
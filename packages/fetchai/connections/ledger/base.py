@@ -18,11 +18,12 @@
 # ------------------------------------------------------------------------------
 """This module contains base classes for the ledger API connection."""
 import asyncio
+import time
 from abc import ABC, abstractmethod
 from asyncio import Task
 from concurrent.futures._base import Executor
 from logging import Logger
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union, cast
 
 from aea.configurations.base import PublicId
 from aea.crypto.base import LedgerApi
@@ -32,6 +33,10 @@ from aea.mail.base import Envelope
 from aea.protocols.base import Message
 from aea.protocols.dialogue.base import Dialogue, Dialogues
 
+from packages.fetchai.connections.ledger.fees import FeeOracle
+from packages.fetchai.connections.ledger.metrics import LedgerConnectionMetrics
+from packages.fetchai.connections.ledger.pool import EndpointPool
+
 
 CONNECTION_ID = PublicId.from_str("fetchai/ledger:0.18.0")
 
@@ -48,48 +53,102 @@ class RequestDispatcher(ABC):
         connection_state: AsyncState,
         loop: Optional[asyncio.AbstractEventLoop] = None,
         executor: Optional[Executor] = None,
-        api_configs: Optional[Dict[str, Dict[str, str]]] = None,
+        api_configs: Optional[
+            Dict[str, Union[Dict[str, str], List[Dict[str, str]]]]
+        ] = None,
+        metrics: Optional[LedgerConnectionMetrics] = None,
+        fee_oracle: Optional[FeeOracle] = None,
+        endpoint_pool: Optional[EndpointPool] = None,
     ):
         """
         Initialize the request dispatcher.
 
         :param loop: the asyncio loop.
         :param executor: an executor.
+        :param metrics: the metrics to record the requests in.
+        :param fee_oracle: the oracle handing out the fees of transactions by urgency, if any.
+        :param endpoint_pool: the pool routing the requests of the ledgers with several endpoints, if any.
         """
         self.connection_state = connection_state
         self.loop = loop if loop is not None else asyncio.get_event_loop()
         self.executor = executor
         self._api_configs = api_configs
         self.logger = logger
+        self.metrics = metrics if metrics is not None else LedgerConnectionMetrics()
+        self.fee_oracle = fee_oracle
+        self.endpoint_pool = endpoint_pool
 
     def api_config(self, ledger_id: str) -> Dict[str, str]:
-        """Get api config."""
+        """Get api config; for a ledger with several endpoints, the one of the first."""
         config = {}  # type: Dict[str, str]
         if self._api_configs is not None and ledger_id in self._api_configs:
-            config = self._api_configs[ledger_id]
+            configs = self._api_configs[ledger_id]
+            config = configs[0] if isinstance(configs, list) else configs
         return config
 
+    def get_api(self, ledger_id: str) -> LedgerApi:
+        """
+        Get the ledger API to serve a request with.
+
+        For a ledger configured with a list of endpoints, it is the API of
+        the endpoint the pool routes requests to.
+
+        :param ledger_id: the ledger id.
+        :return: the ledger API.
+        """
+        configs = (
+            self._api_configs.get(ledger_id) if self._api_configs is not None else None
+        )
+        if isinstance(configs, list) and self.endpoint_pool is not None:
+            self.endpoint_pool.get_endpoints(
+                ledger_id,
+                cast(List[Dict[str, Any]], configs),
+                lambda config: self.ledger_api_registry.make(ledger_id, **config),
+            )
+            return self.endpoint_pool.select(ledger_id).api
+        return self.ledger_api_registry.make(ledger_id, **self.api_config(ledger_id))
+
     async def run_async(
         self,
         func: Callable[[Any], Task],
         api: LedgerApi,
         message: Message,
         dialogue: Dialogue,
+        dispatched_at: Optional[float] = None,
     ) -> Union[Message, Task]:
         """
         Run a function in executor.
 
+        The time spent waiting for the executor, the time spent running
+        and the end-to-end latency are recorded in the metrics.
+
         :param func: the function to execute.
         :param args: the arguments to pass to the function.
+        :param dispatched_at: the monotonic time the request was dispatched at.
         :return: the return value of the function.
         """
+        dispatched_at = time.monotonic() if dispatched_at is None else dispatched_at
+        labels = self.get_metric_labels(message)
+
+        def timed_func(*args: Any) -> Union[Message, Task]:
+            started_at = time.monotonic()
+            self.metrics.queue_wait.observe(started_at - dispatched_at, **labels)
+            try:
+                return func(*args)
+            finally:
+                self.metrics.run_time.observe(time.monotonic() - started_at, **labels)
+
         try:
             response = await self.loop.run_in_executor(
-                self.executor, func, api, message, dialogue
+                self.executor, timed_func, api, message, dialogue
             )
             return response
         except Exception as e:  # pylint: disable=broad-except
+            self.metrics.errors.inc(exception=type(e).__name__, **labels)
             return self.get_error_message(e, api, message, dialogue)
+        finally:
+            self.metrics.latency.observe(time.monotonic() - dispatched_at, **labels)
+            self.metrics.in_flight.dec(**labels)
 
     def dispatch(self, envelope: Envelope) -> Task:
         """
@@ -100,9 +159,11 @@ class RequestDispatcher(ABC):
         """
         if not isinstance(envelope.message, Message):  # pragma: nocover
             raise ValueError("Ledger connection expects non-serialized messages.")
+        dispatched_at = time.monotonic()
         message = envelope.message
         ledger_id = self.get_ledger_id(message)
-        api = self.ledger_api_registry.make(ledger_id, **self.api_config(ledger_id))
+        api = self.get_api(ledger_id)
+        self.metrics.instrument_api(api)
         dialogue = self.dialogues.update(message)
         if dialogue is None:
             raise ValueError(  # pragma: nocover
@@ -110,7 +171,21 @@ class RequestDispatcher(ABC):
             )
         performative = message.performative
         handler = self.get_handler(performative)
-        return self.loop.create_task(self.run_async(handler, api, message, dialogue))
+        labels = self.get_metric_labels(message)
+        self.metrics.requests.inc(**labels)
+        self.metrics.in_flight.inc(**labels)
+        return self.loop.create_task(
+            self.run_async(handler, api, message, dialogue, dispatched_at)
+        )
+
+    def get_metric_labels(self, message: Message) -> Dict[str, str]:
+        """
+        Get the labels to record the metrics of a request with.
+
+        :param message: the request message.
+        :return: the labels.
+        """
+        return {"performative": str(message.performative.value)}
 
     def get_handler(self, performative: Any) -> Callable[[Any], Task]:
         """
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the multi-endpoint broadcaster of the ledger API connection."""
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Optional, Sequence, Set, Tuple
+from urllib.parse import urlsplit
+
+from aea.common import JSONLike
+from aea.crypto.base import LedgerApi
+
+from packages.fetchai.connections.ledger.metrics import LedgerConnectionMetrics
+
+
+DEFAULT_MAX_WORKERS = 16
+
+_default_logger = logging.getLogger("aea.packages.fetchai.connections.ledger.broadcast")
+
+
+def get_endpoint_label(address: str) -> str:
+    """
+    Get the label of an endpoint in the metrics: its host and port.
+
+    The path and the credentials of the address, which often carry an API
+    key, are left out.
+
+    :param address: the address of the endpoint.
+    :return: the label.
+    """
+    parts = urlsplit(address)
+    if parts.hostname is None:
+        return address
+    return parts.hostname if parts.port is None else f"{parts.hostname}:{parts.port}"
+
+
+class Broadcaster:
+    """
+    Send a signed transaction to several endpoints of a ledger at once.
+
+    The transaction is sent to every endpoint from a thread of its own; the
+    first digest an endpoint accepts it with is returned, while the others
+    keep propagating it in the background. The time each endpoint takes to
+    accept or reject the transaction is recorded in the metrics, by endpoint.
+    """
+
+    def __init__(
+        self,
+        metrics: Optional[LedgerConnectionMetrics] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        logger: logging.Logger = _default_logger,
+    ) -> None:
+        """
+        Initialize the broadcaster.
+
+        :param metrics: the metrics to record the broadcasts in.
+        :param max_workers: the most transactions sent at once, over all the endpoints.
+        :param logger: the logger.
+        """
+        self.metrics = metrics if metrics is not None else LedgerConnectionMetrics()
+        self.max_workers = int(max_workers)
+        self.logger = logger
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def send(
+        self, apis: Sequence[Tuple[str, LedgerApi]], tx_signed: JSONLike
+    ) -> Optional[str]:
+        """
+        Send a signed transaction to all the endpoints, in parallel.
+
+        :param apis: the label and the ledger API of each endpoint.
+        :param tx_signed: the signed transaction.
+        :return: the first digest returned by an endpoint, or None if all of them rejected the transaction.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix="ledger-broadcast"
+            )
+        sent_at = time.monotonic()
+        endpoints: Dict[Future, str] = {}
+        for endpoint, api in apis:
+            future = self._executor.submit(
+                self._send, endpoint, api, tx_signed, sent_at
+            )
+            endpoints[future] = endpoint
+        pending: Set[Future] = set(endpoints)
+        while len(pending) > 0:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                digest = future.result()
+                if digest is not None:
+                    self.metrics.broadcast_firsts.inc(endpoint=endpoints[future])
+                    return digest
+        return None
+
+    def _send(
+        self, endpoint: str, api: LedgerApi, tx_signed: JSONLike, sent_at: float
+    ) -> Optional[str]:
+        """Send a signed transaction to one endpoint, recording the time it takes."""
+        digest: Optional[str] = None
+        try:
+            digest = api.send_signed_transaction(tx_signed)
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.warning(f"broadcast to {endpoint} failed: {e}")
+        self.metrics.broadcast_latency.observe(
+            time.monotonic() - sent_at,
+            endpoint=endpoint,
+            outcome="accepted" if digest is not None else "rejected",
+        )
+        return digest
+
+    def close(self) -> None:
+        """Stop the threads, once the broadcasts in progress are done."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
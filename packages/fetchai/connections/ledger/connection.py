@@ -21,19 +21,26 @@
 import asyncio
 from asyncio import Task
 from collections import deque
-from typing import Any, Deque, Dict, List, Optional, cast
+from typing import Any, Deque, Dict, List, Optional, Union, cast
 
 from aea.connections.base import Connection, ConnectionStates
 from aea.mail.base import Envelope
 from aea.protocols.base import Message
 
 from packages.fetchai.connections.ledger.base import CONNECTION_ID, RequestDispatcher
+from packages.fetchai.connections.ledger.broadcast import Broadcaster
 from packages.fetchai.connections.ledger.contract_dispatcher import (
     ContractApiRequestDispatcher,
 )
+from packages.fetchai.connections.ledger.fees import FeeOracle
 from packages.fetchai.connections.ledger.ledger_dispatcher import (
     LedgerApiRequestDispatcher,
 )
+from packages.fetchai.connections.ledger.metrics import (
+    LedgerConnectionMetrics,
+    MetricsExporter,
+)
+from packages.fetchai.connections.ledger.pool import EndpointPool
 from packages.fetchai.protocols.contract_api import ContractApiMessage
 from packages.fetchai.protocols.ledger_api import LedgerApiMessage
 
@@ -54,9 +61,22 @@ class LedgerConnection(Connection):
         self.receiving_tasks: List[asyncio.Future] = []
         self.task_to_request: Dict[asyncio.Future, Envelope] = {}
         self.done_tasks: Deque[asyncio.Future] = deque()
-        self.api_configs = self.configuration.config.get(
-            "ledger_apis", {}
-        )  # type: Dict[str, Dict[str, str]]
+        self.api_configs: Dict[
+            str, Union[Dict[str, str], List[Dict[str, str]]]
+        ] = self.configuration.config.get("ledger_apis", {})
+        self.metrics = LedgerConnectionMetrics()
+        metrics_config = self.configuration.config.get("metrics") or {}
+        self._metrics_exporter = MetricsExporter(self.metrics, **metrics_config)
+        fee_oracle_config = self.configuration.config.get("fee_oracle") or {}
+        self.fee_oracle = FeeOracle(**fee_oracle_config)
+        broadcast_config = self.configuration.config.get("broadcast") or {}
+        self.broadcaster = Broadcaster(
+            self.metrics, logger=self.logger, **broadcast_config
+        )
+        endpoint_pool_config = self.configuration.config.get("endpoint_pool") or {}
+        self.endpoint_pool = EndpointPool(
+            self.metrics, logger=self.logger, **endpoint_pool_config
+        )
 
     @property
     def event_new_receiving_task(self) -> asyncio.Event:
@@ -76,14 +96,23 @@ class LedgerConnection(Connection):
             loop=self.loop,
             api_configs=self.api_configs,
             logger=self.logger,
+            metrics=self.metrics,
+            fee_oracle=self.fee_oracle,
+            endpoint_pool=self.endpoint_pool,
+            broadcaster=self.broadcaster,
         )
         self._contract_dispatcher = ContractApiRequestDispatcher(
             self._state,
             loop=self.loop,
             api_configs=self.api_configs,
             logger=self.logger,
+            metrics=self.metrics,
+            fee_oracle=self.fee_oracle,
+            endpoint_pool=self.endpoint_pool,
         )
         self._event_new_receiving_task = asyncio.Event(loop=self.loop)
+        await self._metrics_exporter.start()
+        await self.endpoint_pool.start()
 
         self.state = ConnectionStates.connected
 
@@ -100,6 +129,9 @@ class LedgerConnection(Connection):
         self._ledger_dispatcher = None
         self._contract_dispatcher = None
         self._event_new_receiving_task = None
+        self.broadcaster.close()
+        await self.endpoint_pool.stop()
+        await self._metrics_exporter.stop()
 
         self.state = ConnectionStates.disconnected
 
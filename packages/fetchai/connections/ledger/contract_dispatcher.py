@@ -21,7 +21,7 @@
 import inspect
 import logging
 from collections.abc import Mapping
-from typing import Any, Callable, Optional, Union, cast
+from typing import Any, Callable, Dict, Optional, Union, cast
 
 from aea.common import JSONLike
 from aea.contracts import Contract, contract_registry
@@ -104,6 +104,12 @@ class ContractApiRequestDispatcher(RequestDispatcher):
         message = cast(ContractApiMessage, message)
         return message.ledger_id
 
+    def get_metric_labels(self, message: Message) -> Dict[str, str]:
+        """Get the metric labels, including the contract callable."""
+        labels = super().get_metric_labels(message)
+        labels["callable"] = cast(ContractApiMessage, message).callable
+        return labels
+
     def get_error_message(
         self, e: Exception, api: LedgerApi, message: Message, dialogue: BaseDialogue,
     ) -> ContractApiMessage:
@@ -151,11 +157,17 @@ class ContractApiRequestDispatcher(RequestDispatcher):
             response = response_builder(data, dialogue)
         except AEAException as e:
             self.logger.error(f"Exception during contract request: {str(e)}")
+            self.metrics.errors.inc(
+                exception=type(e).__name__, **self.get_metric_labels(message)
+            )
             response = self.get_error_message(e, ledger_api, message, dialogue)
         except Exception as e:  # pylint: disable=broad-except  # pragma: nocover
             self.logger.error(
                 f"An error occurred while processing the contract api request: '{str(e)}'."
             )
+            self.metrics.errors.inc(
+                exception=type(e).__name__, **self.get_metric_labels(message)
+            )
             response = self.get_error_message(e, ledger_api, message, dialogue)
         return response
 
@@ -291,18 +303,45 @@ class ContractApiRequestDispatcher(RequestDispatcher):
         self, api: LedgerApi, message: ContractApiMessage, contract: Contract,
     ) -> Union[bytes, JSONLike]:
         """Get the data from the contract method, either from the stub or from the callable specified by the message."""
+        kwargs = self._get_kwargs(api, message)
         # first, check if the custom handler for this type of request has been implemented.
-        data = self._call_stub(api, message, contract)
+        data = self._call_stub(api, message, contract, kwargs)
         if data is not None:
             return data
 
         # then, check if there is the handler for the provided callable.
-        data = self._validate_and_call_callable(api, message, contract)
+        data = self._validate_and_call_callable(api, message, contract, kwargs)
         return data
 
+    def _get_kwargs(
+        self, api: LedgerApi, message: ContractApiMessage
+    ) -> Dict[str, Any]:
+        """
+        Get the keyword arguments of the contract method.
+
+        An 'urgency' argument is replaced by the 'fees' handed out by the
+        fee oracle for that urgency; it is dropped if there is no oracle.
+
+        :param api: the ledger api object.
+        :param message: the contract api request.
+        :return: the keyword arguments.
+        """
+        kwargs = dict(message.kwargs.body)
+        urgency = kwargs.pop("urgency", None)
+        if urgency is not None and self.fee_oracle is not None:
+            kwargs["fees"] = self.fee_oracle.get_fees(
+                api,
+                urgency,
+                self.api_config(message.ledger_id).get("gas_price_api_key"),
+            )
+        return kwargs
+
     @staticmethod
     def _call_stub(
-        ledger_api: LedgerApi, message: ContractApiMessage, contract: Contract
+        ledger_api: LedgerApi,
+        message: ContractApiMessage,
+        contract: Contract,
+        kwargs: Dict[str, Any],
     ) -> Optional[Union[bytes, JSONLike]]:
         """Try to call stub methods associated to the contract API request performative."""
         try:
@@ -312,14 +351,11 @@ class ContractApiRequestDispatcher(RequestDispatcher):
                 ContractApiMessage.Performative.GET_RAW_MESSAGE,
                 ContractApiMessage.Performative.GET_RAW_TRANSACTION,
             ]:
-                args, kwargs = (
-                    [ledger_api, message.contract_address],
-                    message.kwargs.body,
-                )
+                args = [ledger_api, message.contract_address]
             elif message.performative in [  # pragma: nocover
                 ContractApiMessage.Performative.GET_DEPLOY_TRANSACTION,
             ]:
-                args, kwargs = [ledger_api], message.kwargs.body
+                args = [ledger_api]
             else:  # pragma: nocover
                 raise AEAException(f"Unexpected performative: {message.performative}")
             data = method(*args, **kwargs)
@@ -329,7 +365,10 @@ class ContractApiRequestDispatcher(RequestDispatcher):
 
     @staticmethod
     def _validate_and_call_callable(
-        api: LedgerApi, message: ContractApiMessage, contract: Contract
+        api: LedgerApi,
+        message: ContractApiMessage,
+        contract: Contract,
+        kwargs: Dict[str, Any],
     ) -> Union[bytes, JSONLike]:
         """
         Validate a Contract callable, given the performative.
@@ -344,6 +383,7 @@ class ContractApiRequestDispatcher(RequestDispatcher):
         :param api: the ledger api object.
         :param message: the contract api request.
         :param contract: the contract instance.
+        :param kwargs: the keyword arguments of the method.
         :return: the data generated by the method.
         """
         try:
@@ -362,7 +402,7 @@ class ContractApiRequestDispatcher(RequestDispatcher):
                 raise AEAException(
                     f"Expected two or more positional arguments, got {len(full_args_spec.args)}"
                 )
-            return method_to_call(api, message.contract_address, **message.kwargs.body)
+            return method_to_call(api, message.contract_address, **kwargs)
         if message.performative in [
             ContractApiMessage.Performative.GET_DEPLOY_TRANSACTION,
         ]:
@@ -370,7 +410,7 @@ class ContractApiRequestDispatcher(RequestDispatcher):
                 raise AEAException(
                     f"Expected one or more positional arguments, got {len(full_args_spec.args)}"
                 )
-            return method_to_call(api, **message.kwargs.body)
+            return method_to_call(api, **kwargs)
         raise AEAException(  # pragma: nocover
             f"Unexpected performative: {message.performative}"
         )
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the fee oracle of the ledger API connection."""
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aea.crypto.base import LedgerApi
+
+
+DEFAULT_BLOCK_TIME = 12.0
+DEFAULT_WINDOW_BLOCKS = 20
+DEFAULT_MIN_PRIORITY_FEE = 10 ** 9
+
+# the reward percentile each urgency pays, the multiple of the next base fee
+# its fee cap allows for, and the gas station speed used without fee history
+URGENCY_LEVELS: Dict[str, Tuple[int, float, str]] = {
+    "background": (10, 1.25, "average"),
+    "standard": (50, 2.0, "fast"),
+    "competitive": (90, 2.0, "fastest"),
+}
+REWARD_PERCENTILES = sorted({level[0] for level in URGENCY_LEVELS.values()})
+# a legacy gas price covers the base fee of a full block after the next one
+LEGACY_BASE_FEE_HEADROOM = 1.125
+METHOD_NOT_FOUND = -32601
+
+
+def _to_int(value: Any) -> int:
+    """Convert a JSON-RPC quantity to an integer."""
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+def _is_method_unsupported(error: ValueError) -> bool:
+    """Check whether a JSON-RPC error is the node not supporting the method."""
+    details = error.args[0] if len(error.args) > 0 else None
+    if isinstance(details, dict):
+        if details.get("code") == METHOD_NOT_FOUND:
+            return True
+        details = details.get("message")
+    message = str(details).lower()
+    return any(
+        marker in message for marker in ("not supported", "does not exist", "not found")
+    )
+
+
+class FeeOracle:
+    """
+    Hand out transaction fees by urgency, from the recent fee history of the chain.
+
+    The priority fees paid at 'REWARD_PERCENTILES' in each of the last
+    'window_blocks' blocks are read with 'eth_feeHistory'. The latest block
+    number is checked at most once per 'block_time' seconds however many
+    requests ask for fees; the first read fills the window, the next ones
+    only read the blocks after the newest one read, if any. An urgency pays
+    the median over the window of its percentile,
+    no less than 'min_priority_fee', with a fee cap of a multiple of the
+    base fee of the next block.
+
+    With 'eip1559', the fees are the 'maxFeePerGas' and
+    'maxPriorityFeePerGas' of a type-2 transaction; otherwise a legacy
+    'gasPrice' is computed from the same history. On a chain without fee
+    history, the gas price comes from the gas station if a
+    'gas_price_api_key' is configured for the ledger, or from the node.
+    """
+
+    def __init__(
+        self,
+        block_time: float = DEFAULT_BLOCK_TIME,
+        window_blocks: int = DEFAULT_WINDOW_BLOCKS,
+        min_priority_fee: int = DEFAULT_MIN_PRIORITY_FEE,
+        eip1559: bool = False,
+    ) -> None:
+        """
+        Initialize the oracle.
+
+        :param block_time: the seconds between two blocks, i.e. between two checks for new blocks.
+        :param window_blocks: the number of blocks the priority fees are taken over.
+        :param min_priority_fee: the least priority fee handed out, in wei.
+        :param eip1559: whether to hand out type-2 fees, or a legacy gas price; off by default, as the signer of the ethereum ledger plugin only signs legacy transactions.
+        """
+        if window_blocks < 1:
+            raise ValueError("window_blocks must be at least 1")
+        self.block_time = float(block_time)
+        self.window_blocks = int(window_blocks)
+        self.min_priority_fee = int(min_priority_fee)
+        self.eip1559 = bool(eip1559)
+        self._lock = threading.Lock()
+        self._clock: Callable[[], float] = time.monotonic
+        # the rewards at 'REWARD_PERCENTILES' of each block in the window, by block number
+        self._rewards: "OrderedDict[int, List[int]]" = OrderedDict()
+        self._next_base_fee: Optional[int] = None
+        # the block after the newest one whose rewards were read
+        self._next_block: Optional[int] = None
+        self._sampled_at: Optional[float] = None
+        self._is_supported = True
+        self.n_samples = 0
+        self.n_requests = 0
+
+    def get_fees(
+        self,
+        api: LedgerApi,
+        urgency: str,
+        gas_price_api_key: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """
+        Get the fees of a transaction.
+
+        :param api: the ledger API, backed by web3.
+        :param urgency: the urgency of the transaction, one of 'URGENCY_LEVELS'.
+        :param gas_price_api_key: the key of the gas station, used on chains without fee history.
+        :return: the fee fields of the transaction.
+        """
+        if urgency not in URGENCY_LEVELS:
+            raise ValueError(
+                f"unknown urgency '{urgency}', expected one of {list(URGENCY_LEVELS)}"
+            )
+        percentile, base_fee_multiple, speed = URGENCY_LEVELS[urgency]
+        with self._lock:
+            self.n_requests += 1
+            if self._is_supported and self._is_due():
+                self._sample(api)
+            is_supported = self._is_supported
+            next_base_fee = self._next_base_fee or 0
+            priority_fee = self._get_priority_fee(REWARD_PERCENTILES.index(percentile))
+        if not is_supported:
+            # read for each request, so not under the lock
+            return {
+                "gasPrice": self._get_legacy_gas_price(api, speed, gas_price_api_key)
+            }
+        if not self.eip1559:
+            return {
+                "gasPrice": math.ceil(next_base_fee * LEGACY_BASE_FEE_HEADROOM)
+                + priority_fee
+            }
+        return {
+            "maxFeePerGas": math.ceil(next_base_fee * base_fee_multiple) + priority_fee,
+            "maxPriorityFeePerGas": priority_fee,
+        }
+
+    def _is_due(self) -> bool:
+        """Check whether a block may have been produced since the last check."""
+        return (
+            self._sampled_at is None
+            or self._clock() - self._sampled_at >= self.block_time
+        )
+
+    def _sample(self, api: LedgerApi) -> None:
+        """Read the fee history of the blocks produced since the last read, if any."""
+        now = self._clock()
+        try:
+            latest = _to_int(api.api.manager.request_blocking("eth_blockNumber", []))
+            if self._next_block is not None and latest < self._next_block:
+                # no new block: check again after 'block_time'
+                self._sampled_at = now
+                return
+            n_blocks = self.window_blocks
+            if self._next_block is not None:
+                n_blocks = min(latest + 1 - self._next_block, self.window_blocks)
+            history = api.api.manager.request_blocking(
+                "eth_feeHistory", [hex(n_blocks), hex(latest), REWARD_PERCENTILES]
+            )
+        except ValueError as e:
+            if _is_method_unsupported(e):
+                # a chain without EIP-1559
+                self._is_supported = False
+                return
+            if self._next_base_fee is None:
+                raise
+            # keep the window read last; the read is retried on the next request
+            return
+        self.n_samples += 1
+        self._sampled_at = now
+        oldest_block = _to_int(history["oldestBlock"])
+        block_rewards = history.get("reward") or []
+        for offset, rewards in enumerate(block_rewards):
+            self._rewards[oldest_block + offset] = [_to_int(value) for value in rewards]
+        self._next_block = oldest_block + len(block_rewards)
+        # the blocks older than the window, by number, even if some were never read
+        while (
+            len(self._rewards) > 0
+            and next(iter(self._rewards)) < self._next_block - self.window_blocks
+        ):
+            self._rewards.popitem(last=False)
+        # the base fees include the one of the block after the newest
+        self._next_base_fee = _to_int(history["baseFeePerGas"][-1])
+
+    def _get_priority_fee(self, index: int) -> int:
+        """Get the median over the window of the rewards at a percentile."""
+        rewards = sorted(
+            block_rewards[index] for block_rewards in self._rewards.values()
+        )
+        if len(rewards) == 0:
+            return self.min_priority_fee
+        return max(rewards[len(rewards) // 2], self.min_priority_fee)
+
+    @staticmethod
+    def _get_legacy_gas_price(
+        api: LedgerApi, speed: str, gas_price_api_key: Optional[str]
+    ) -> int:
+        """Get a legacy gas price, from the gas station if configured or from the node."""
+        if gas_price_api_key is None:
+            return api.api.eth.gasPrice
+        # only needed on chains without fee history
+        from aea_ledger_ethereum.ethereum import (  # pylint: disable=import-outside-toplevel
+            get_gas_price_strategy,
+        )
+
+        return get_gas_price_strategy(speed, gas_price_api_key)(api.api, {})
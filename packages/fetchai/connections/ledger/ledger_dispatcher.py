@@ -19,7 +19,7 @@
 """This module contains the implementation of the ledger API request dispatcher."""
 import logging
 import time
-from typing import Any, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 from aea.connections.base import ConnectionStates
 from aea.crypto.base import LedgerApi
@@ -29,6 +29,10 @@ from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 from aea.protocols.dialogue.base import Dialogues as BaseDialogues
 
 from packages.fetchai.connections.ledger.base import CONNECTION_ID, RequestDispatcher
+from packages.fetchai.connections.ledger.broadcast import (
+    Broadcaster,
+    get_endpoint_label,
+)
 from packages.fetchai.protocols.ledger_api.custom_types import TransactionReceipt
 from packages.fetchai.protocols.ledger_api.dialogues import LedgerApiDialogue
 from packages.fetchai.protocols.ledger_api.dialogues import (
@@ -79,8 +83,11 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
         """Initialize the dispatcher."""
         logger = kwargs.pop("logger", None)
         logger = logger if logger is not None else _default_logger
+        self.broadcaster: Optional[Broadcaster] = kwargs.pop("broadcaster", None)
         super().__init__(logger, *args, **kwargs)
         self._ledger_api_dialogues = LedgerApiDialogues()
+        # the ledger APIs of the broadcast endpoints, by ledger id
+        self._broadcast_apis: Dict[str, List[Tuple[str, LedgerApi]]] = {}
 
     def get_ledger_id(self, message: Message) -> str:
         """Get the ledger id from message."""
@@ -267,13 +274,25 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
         """
         Send the request 'send_signed_tx'.
 
+        With 'broadcast_addresses' configured for the ledger, the transaction
+        is sent to them and to the ledger API at once, and the first digest
+        returned is the response.
+
         :param api: the API object.
         :param message: the Ledger API message
         :return: None
         """
-        transaction_digest = api.send_signed_transaction(
-            message.signed_transaction.body
-        )
+        broadcast_apis = self._get_broadcast_apis(message.signed_transaction.ledger_id)
+        if self.broadcaster is not None and len(broadcast_apis) > 0:
+            transaction_digest = self.broadcaster.send(
+                [(self._get_endpoint(message.signed_transaction.ledger_id, api), api)]
+                + broadcast_apis,
+                message.signed_transaction.body,
+            )
+        else:
+            transaction_digest = api.send_signed_transaction(
+                message.signed_transaction.body
+            )
         if transaction_digest is None:  # pragma: nocover
             response = self.get_error_message(
                 ValueError("No transaction_digest returned"), api, message, dialogue
@@ -291,6 +310,37 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
             )
         return response
 
+    def _get_endpoint(self, ledger_id: str, api: LedgerApi) -> str:
+        """Get the label of the endpoint of a ledger API."""
+        label = None
+        if self.endpoint_pool is not None:
+            label = self.endpoint_pool.get_label(ledger_id, api)
+        if label is None:
+            label = get_endpoint_label(
+                self.api_config(ledger_id).get("address", "default")
+            )
+        return label
+
+    def _get_broadcast_apis(self, ledger_id: str) -> List[Tuple[str, LedgerApi]]:
+        """
+        Get the ledger APIs of the broadcast endpoints of a ledger.
+
+        :param ledger_id: the ledger id.
+        :return: the label and the ledger API of each broadcast endpoint.
+        """
+        if ledger_id not in self._broadcast_apis:
+            config = dict(self.api_config(ledger_id))
+            addresses = cast(List[str], config.pop("broadcast_addresses", None) or [])
+            apis = []
+            for address in addresses:
+                api = self.ledger_api_registry.make(
+                    ledger_id, **{**config, "address": address}
+                )
+                self.metrics.instrument_api(api)
+                apis.append((get_endpoint_label(address), api))
+            self._broadcast_apis[ledger_id] = apis
+        return self._broadcast_apis[ledger_id]
+
     def get_error_message(
         self, e: Exception, api: LedgerApi, message: Message, dialogue: BaseDialogue,
     ) -> LedgerApiMessage:
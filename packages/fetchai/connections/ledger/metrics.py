@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the latency and throughput metrics of the ledger API connection."""
+import asyncio
+import bisect
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+
+from aea.crypto.base import LedgerApi
+
+
+Labels = Tuple[Tuple[str, str], ...]
+
+# seconds; covers in-memory calls up to receipts polled for minutes
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+    float("inf"),
+)
+# seconds a scraper has to send its request before the connection is closed
+REQUEST_READ_TIMEOUT = 5.0
+
+RPC_METRICS_MIDDLEWARE = "ledger_connection_rpc_metrics"
+
+
+def _to_labels(labels: Dict[str, str]) -> Labels:
+    """Convert a label mapping to a hashable, sorted tuple."""
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    """Format labels in the Prometheus text exposition format."""
+    items = list(labels) + ([extra] if extra is not None else [])
+    if len(items) == 0:
+        return ""
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace('"', '\\"')) for key, value in items
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric(ABC):
+    """Base class for a labelled metric."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, description: str) -> None:
+        """
+        Initialize the metric.
+
+        :param name: the metric name.
+        :param description: the metric description.
+        """
+        self.name = name
+        self.description = description
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def samples(self) -> List[str]:
+        """Get the samples in the text exposition format."""
+
+    def render(self) -> str:
+        """Render the metric in the text exposition format."""
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """A monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, description: str) -> None:
+        """Initialize the counter."""
+        super().__init__(name, description)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Increment the counter."""
+        key = _to_labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels: str) -> float:
+        """Get the value of the counter."""
+        return self._values.get(_to_labels(labels), 0)
+
+    def samples(self) -> List[str]:
+        """Get the samples in the text exposition format."""
+        with self._lock:
+            values = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(key)} {_format_value(value)}"
+            for key, value in values
+        ]
+
+
+class Gauge(Counter):
+    """A value that can go up and down."""
+
+    type_name = "gauge"
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        """Decrement the gauge."""
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """A histogram of observations over fixed buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """
+        Initialize the histogram.
+
+        :param name: the metric name.
+        :param description: the metric description.
+        :param buckets: the sorted upper bounds of the buckets, ending in +Inf.
+        """
+        super().__init__(name, description)
+        if buckets[-1] != float("inf"):
+            buckets = buckets + (float("inf"),)
+        self.buckets = buckets
+        # mapping from labels to (per-bucket counts, sum, count)
+        self._values: Dict[Labels, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation."""
+        key = _to_labels(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total, count = self._values.get(
+                key, ([0] * len(self.buckets), 0.0, 0)
+            )
+            counts[index] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    def count(self, **labels: str) -> int:
+        """Get the number of observations."""
+        return self._values.get(_to_labels(labels), ([], 0.0, 0))[2]
+
+    def sum(self, **labels: str) -> float:
+        """Get the sum of the observations."""
+        return self._values.get(_to_labels(labels), ([], 0.0, 0))[1]
+
+    def samples(self) -> List[str]:
+        """Get the samples in the text exposition format."""
+        with self._lock:
+            values = [
+                (key, list(counts), total, count)
+                for key, (counts, total, count) in self._values.items()
+            ]
+        lines = []
+        for key, counts, total, count in values:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                bucket_labels = _format_labels(key, ("le", _format_value(bound)))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {repr(total)}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+
+class LedgerConnectionMetrics:
+    """The metrics collected by the ledger API connection."""
+
+    def __init__(self, prefix: str = "ledger_connection") -> None:
+        """
+        Initialize the metrics.
+
+        :param prefix: the prefix of the metric names.
+        """
+        self.queue_wait = Histogram(
+            f"{prefix}_queue_wait_seconds",
+            "Time between dispatching a request and the executor starting it.",
+        )
+        self.run_time = Histogram(
+            f"{prefix}_run_time_seconds",
+            "Time spent by the executor serving a request.",
+        )
+        self.latency = Histogram(
+            f"{prefix}_latency_seconds",
+            "Time between dispatching a request and its response being ready.",
+        )
+        self.in_flight = Gauge(
+            f"{prefix}_requests_in_flight",
+            "Number of requests dispatched and not yet responded to.",
+        )
+        self.requests = Counter(
+            f"{prefix}_requests_total", "Number of requests dispatched."
+        )
+        self.errors = Counter(
+            f"{prefix}_errors_total", "Number of requests failed, by exception type."
+        )
+        self.rpc_calls = Counter(
+            f"{prefix}_rpc_calls_total", "Number of RPC calls made to the ledger node."
+        )
+        self.broadcast_latency = Histogram(
+            f"{prefix}_broadcast_latency_seconds",
+            "Time for an endpoint to accept or reject a broadcast transaction.",
+        )
+        self.broadcast_firsts = Counter(
+            f"{prefix}_broadcast_firsts_total",
+            "Number of broadcast transactions an endpoint was the first to accept.",
+        )
+        self.failovers = Counter(
+            f"{prefix}_failovers_total",
+            "Number of RPC calls retried on another endpoint, by failed endpoint.",
+        )
+
+    @property
+    def all_metrics(self) -> List[Metric]:
+        """Get all the metrics."""
+        return [
+            self.queue_wait,
+            self.run_time,
+            self.latency,
+            self.in_flight,
+            self.requests,
+            self.errors,
+            self.rpc_calls,
+            self.broadcast_latency,
+            self.broadcast_firsts,
+            self.failovers,
+        ]
+
+    def render(self) -> str:
+        """Render all the metrics in the Prometheus text exposition format."""
+        return "\n".join(metric.render() for metric in self.all_metrics) + "\n"
+
+    def dump(self, path: str) -> None:
+        """
+        Atomically write the metrics to a file.
+
+        :param path: the path of the dump file.
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+    def instrument_api(self, api: LedgerApi) -> None:
+        """
+        Count the RPC calls made through a ledger API.
+
+        Only APIs backed by a web3 instance are instrumented. The middleware
+        is injected at the innermost layer, so that only calls actually
+        reaching the provider are counted.
+
+        :param api: the ledger API.
+        """
+        web3 = getattr(api, "api", None)
+        onion = getattr(web3, "middleware_onion", None)
+        if onion is None or RPC_METRICS_MIDDLEWARE in onion:
+            return
+        onion.inject(self._rpc_middleware, name=RPC_METRICS_MIDDLEWARE, layer=0)
+
+    def _rpc_middleware(self, make_request: Callable, _web3: Any) -> Callable:
+        """Build a web3 middleware counting RPC calls by method."""
+
+        def middleware(method: str, params: Any) -> Any:
+            self.rpc_calls.inc(method=str(method))
+            return make_request(method, params)
+
+        return middleware
+
+
+class MetricsExporter:
+    """Expose the connection metrics over HTTP and/or a dump file."""
+
+    def __init__(
+        self,
+        metrics: LedgerConnectionMetrics,
+        host: str = "127.0.0.1",
+        port: Optional[int] = None,
+        dump_file: Optional[str] = None,
+        dump_interval: float = 10.0,
+    ) -> None:
+        """
+        Initialize the exporter.
+
+        :param metrics: the metrics to export.
+        :param host: the host to serve the metrics on.
+        :param port: the port to serve the metrics on; no server if None.
+        :param dump_file: the file to periodically dump the metrics to; no dump if None.
+        :param dump_interval: the seconds between two dumps.
+        """
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self.dump_file = dump_file
+        self.dump_interval = dump_interval
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._dump_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start serving and dumping the metrics."""
+        if self.port is not None:
+            self._server = await asyncio.start_server(
+                self._serve, host=self.host, port=self.port
+            )
+        if self.dump_file is not None:
+            self._dump_task = asyncio.ensure_future(self._dump_loop())
+
+    async def stop(self) -> None:
+        """Stop serving and dumping the metrics."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._dump_task is not None:
+            self._dump_task.cancel()
+            self._dump_task = None
+        if self.dump_file is not None:
+            self.metrics.dump(self.dump_file)
+
+    async def _dump_loop(self) -> None:
+        """Periodically dump the metrics."""
+        while True:
+            await asyncio.sleep(self.dump_interval)
+            self.metrics.dump(cast(str, self.dump_file))
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer any HTTP request with the metrics; close idle connections."""
+        try:
+            try:
+                await asyncio.wait_for(
+                    reader.readuntil(b"\r\n\r\n"), REQUEST_READ_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                return
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                pass
+            body = self.metrics.render().encode("utf-8")
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                + f"Content-Length: {len(body)}\r\n".encode("ascii")
+                + b"Connection: close\r\n\r\n"
+                + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the endpoint pool of the ledger API connection."""
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, cast
+
+from aea.crypto.base import LedgerApi
+
+from packages.fetchai.connections.ledger.broadcast import get_endpoint_label
+from packages.fetchai.connections.ledger.metrics import LedgerConnectionMetrics
+
+
+DEFAULT_CHECK_INTERVAL = 5.0
+DEFAULT_MAX_LAG_BLOCKS = 2
+DEFAULT_LATENCY_SMOOTHING = 0.3
+FAILOVER_MIDDLEWARE = "ledger_connection_failover"
+
+_default_logger = logging.getLogger("aea.packages.fetchai.connections.ledger.pool")
+
+
+class Endpoint:  # pylint: disable=too-few-public-methods
+    """An endpoint of a ledger, with its health as last observed."""
+
+    def __init__(self, label: str, api: LedgerApi, index: int) -> None:
+        """
+        Initialize the endpoint.
+
+        :param label: the label of the endpoint, its host and port.
+        :param api: the ledger API of the endpoint.
+        :param index: the position of the endpoint in the configuration.
+        """
+        self.label = label
+        self.api = api
+        self.index = index
+        self.is_healthy = True
+        # the smoothed response time, in seconds, and the latest block seen
+        self.latency: Optional[float] = None
+        self.head: Optional[int] = None
+
+    @property
+    def provider(self) -> Any:
+        """Get the web3 provider of the endpoint, if the API is backed by web3."""
+        return getattr(getattr(self.api, "api", None), "provider", None)
+
+
+class EndpointPool:
+    """
+    Route the requests for a ledger to the best of its endpoints.
+
+    The endpoints of a ledger are checked every 'check_interval' seconds,
+    in the background, by reading their head block; an endpoint is
+    healthy if the check succeeded, and synced if its head is at most
+    'max_lag_blocks' behind the highest head of the pool. Requests go to
+    the healthy, synced endpoint with the lowest response time, smoothed
+    over the checks and the requests.
+
+    For web3-backed APIs, an RPC call failing at the transport level, e.g.
+    a refused connection, a timeout or an HTTP error, marks its endpoint as
+    unhealthy until the next check and is retried on the other endpoints,
+    best first. An error returned by the node, e.g. a revert, is not.
+    """
+
+    def __init__(
+        self,
+        metrics: Optional[LedgerConnectionMetrics] = None,
+        check_interval: float = DEFAULT_CHECK_INTERVAL,
+        max_lag_blocks: int = DEFAULT_MAX_LAG_BLOCKS,
+        latency_smoothing: float = DEFAULT_LATENCY_SMOOTHING,
+        logger: logging.Logger = _default_logger,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        :param metrics: the metrics to record the failovers in.
+        :param check_interval: the seconds between two health checks of the endpoints.
+        :param max_lag_blocks: the most blocks an endpoint can be behind the others and still get requests.
+        :param latency_smoothing: the weight of the latest response time in the smoothed one.
+        :param logger: the logger.
+        """
+        self.metrics = metrics if metrics is not None else LedgerConnectionMetrics()
+        self.check_interval = float(check_interval)
+        self.max_lag_blocks = int(max_lag_blocks)
+        self.latency_smoothing = float(latency_smoothing)
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, List[Endpoint]] = {}
+        self._check_task: Optional[asyncio.Task] = None
+
+    def get_endpoints(
+        self,
+        ledger_id: str,
+        configs: Sequence[Dict[str, Any]],
+        make_api: Callable[[Dict[str, Any]], LedgerApi],
+    ) -> List[Endpoint]:
+        """
+        Get the endpoints of a ledger, making their APIs on first use.
+
+        :param ledger_id: the ledger id.
+        :param configs: the configuration of each endpoint.
+        :param make_api: the factory of the ledger API of an endpoint, from its configuration.
+        :return: the endpoints.
+        """
+        with self._lock:
+            endpoints = self._endpoints.get(ledger_id)
+            if endpoints is None:
+                endpoints = []
+                for index, config in enumerate(configs):
+                    endpoint = Endpoint(
+                        get_endpoint_label(config.get("address", str(index))),
+                        make_api(config),
+                        index,
+                    )
+                    self._instrument(ledger_id, endpoint)
+                    endpoints.append(endpoint)
+                self._endpoints[ledger_id] = endpoints
+            return endpoints
+
+    def select(self, ledger_id: str) -> Endpoint:
+        """
+        Select the endpoint of a ledger requests go to.
+
+        :param ledger_id: the ledger id.
+        :return: the healthy, synced endpoint with the lowest response time, or the best one left if none is.
+        """
+        return self._rank(ledger_id)[0]
+
+    def get_label(self, ledger_id: str, api: LedgerApi) -> Optional[str]:
+        """
+        Get the label of the endpoint of a ledger API.
+
+        :param ledger_id: the ledger id.
+        :param api: the ledger API.
+        :return: the label, if the API is the one of an endpoint of the pool.
+        """
+        for endpoint in self._endpoints.get(ledger_id, []):
+            if endpoint.api is api:
+                return endpoint.label
+        return None
+
+    def _rank(self, ledger_id: str) -> List[Endpoint]:
+        """Rank the endpoints of a ledger, the one requests go to first."""
+        endpoints = self._endpoints[ledger_id]
+        heads = [endpoint.head for endpoint in endpoints if endpoint.head is not None]
+        highest = max(heads) if len(heads) > 0 else None
+
+        def key(endpoint: Endpoint) -> Any:
+            is_synced = (
+                highest is None
+                or endpoint.head is None
+                or highest - endpoint.head <= self.max_lag_blocks
+            )
+            # the endpoints not measured yet are kept in the configured order
+            latency = endpoint.latency if endpoint.latency is not None else 0.0
+            return (not (endpoint.is_healthy and is_synced), latency, endpoint.index)
+
+        return sorted(endpoints, key=key)
+
+    def _observe(self, endpoint: Endpoint, latency: float) -> None:
+        """Record a response time of an endpoint."""
+        if endpoint.latency is None:
+            endpoint.latency = latency
+            return
+        endpoint.latency += self.latency_smoothing * (latency - endpoint.latency)
+
+    def _instrument(self, ledger_id: str, endpoint: Endpoint) -> None:
+        """Retry the RPC calls of an endpoint failing at the transport level on the others."""
+        onion = getattr(getattr(endpoint.api, "api", None), "middleware_onion", None)
+        if onion is None or FAILOVER_MIDDLEWARE in onion:
+            return
+
+        def build(make_request: Callable, _web3: Any) -> Callable:
+            def middleware(method: str, params: Any) -> Any:
+                others = [
+                    other
+                    for other in self._rank(ledger_id)
+                    if other is not endpoint and other.provider is not None
+                ]
+                candidates = [(endpoint, make_request)] + [
+                    (other, other.provider.make_request) for other in others
+                ]
+                error: Optional[OSError] = None
+                for candidate, request in candidates:
+                    if candidate is not endpoint:
+                        # the provider is called past the middlewares counting the calls
+                        self.metrics.rpc_calls.inc(method=str(method))
+                    started_at = time.monotonic()
+                    try:
+                        response = request(method, params)
+                    except OSError as e:
+                        # requests' exceptions are OSErrors as well
+                        self._mark_unhealthy(candidate, e)
+                        error = e
+                        continue
+                    self._observe(candidate, time.monotonic() - started_at)
+                    if candidate is not endpoint:
+                        self.metrics.failovers.inc(endpoint=endpoint.label)
+                    return response
+                # the endpoint itself was tried first, so there is an error
+                raise cast(OSError, error)
+
+            return middleware
+
+        onion.inject(build, name=FAILOVER_MIDDLEWARE, layer=0)
+
+    def _mark_unhealthy(self, endpoint: Endpoint, error: Exception) -> None:
+        """Stop routing requests to an endpoint until its next successful check."""
+        if endpoint.is_healthy:
+            self.logger.warning(f"endpoint {endpoint.label} failed: {error}")
+        endpoint.is_healthy = False
+
+    def check(self, endpoint: Endpoint) -> None:
+        """
+        Check the health of an endpoint, by reading its head block.
+
+        The provider is called directly, so that the check is neither
+        retried on another endpoint nor counted as a request of the agent.
+
+        :param endpoint: the endpoint.
+        """
+        provider = endpoint.provider
+        if provider is None:
+            return
+        started_at = time.monotonic()
+        try:
+            response = provider.make_request("eth_blockNumber", [])
+            head = int(response["result"], 16)
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            self._mark_unhealthy(endpoint, e)
+            return
+        self._observe(endpoint, time.monotonic() - started_at)
+        endpoint.head = head
+        if not endpoint.is_healthy:
+            self.logger.info(f"endpoint {endpoint.label} is healthy again.")
+        endpoint.is_healthy = True
+
+    async def start(self) -> None:
+        """Start checking the endpoints in the background."""
+        if self._check_task is None:
+            self._check_task = asyncio.ensure_future(self._check_loop())
+
+    async def stop(self) -> None:
+        """Stop checking the endpoints."""
+        if self._check_task is not None:
+            self._check_task.cancel()
+            self._check_task = None
+
+    async def _check_loop(self) -> None:
+        """Periodically check all the endpoints, at once."""
+        loop = asyncio.get_event_loop()
+        while True:
+            endpoints = [
+                endpoint
+                for ledger_endpoints in list(self._endpoints.values())
+                for endpoint in ledger_endpoints
+            ]
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(None, self.check, endpoint)
+                    for endpoint in endpoints
+                )
+            )
+            await asyncio.sleep(self.check_interval)
@@ -20,7 +20,7 @@
 """
 This module contains the support resources for the signing protocol.
 
-It was created with protocol buffer compiler version `libprotoc 3.17.3` and aea version `1.1.0`.
+It was created with protocol buffer compiler version `libprotoc 3.13.0` and aea version `1.1.0`.
 """
 
 from packages.open_aea.protocols.signing.message import SigningMessage
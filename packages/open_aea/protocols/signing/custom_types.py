@@ -20,7 +20,7 @@
 """This module contains class representations corresponding to every custom type in the protocol specification."""
 
 from enum import Enum
-from typing import Any
+from typing import Any, Generic, Iterable, Iterator, Tuple, Type, TypeVar
 
 from aea.helpers.transaction.base import RawMessage as BaseRawMessage
 from aea.helpers.transaction.base import RawTransaction as BaseRawTransaction
@@ -67,3 +67,109 @@ RawTransaction = BaseRawTransaction
 SignedMessage = BaseSignedMessage
 SignedTransaction = BaseSignedTransaction
 Terms = BaseTerms
+
+
+ItemType = TypeVar("ItemType")
+
+
+class _Batch(Generic[ItemType]):
+    """A base class for the custom types holding a batch of items, in order."""
+
+    item_class: Type[Any]
+    items_field: str
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Iterable[ItemType]) -> None:
+        """
+        Initialise an instance of the batch.
+
+        :param items: the items of the batch, in order.
+        """
+        self._items: Tuple[ItemType, ...] = tuple(items)
+        for item in self._items:
+            if not isinstance(item, self.item_class):
+                raise ValueError(
+                    f"Invalid item for {type(self).__name__}. Expected '{self.item_class.__name__}'. Found '{type(item)}'."
+                )
+
+    def __iter__(self) -> Iterator[ItemType]:
+        """Iterate over the items, in order."""
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        """Get the number of items."""
+        return len(self._items)
+
+    def __getitem__(self, index: int) -> ItemType:
+        """Get an item by index."""
+        return self._items[index]
+
+    @classmethod
+    def encode(cls, batch_protobuf_object: Any, batch_object: "_Batch") -> None:
+        """
+        Encode an instance of this class into the protocol buffer object.
+
+        :param batch_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :param batch_object: an instance of this class to be encoded in the protocol buffer object.
+        """
+        items_protobuf_object = getattr(batch_protobuf_object, cls.items_field)
+        for item in batch_object:
+            cls.item_class.encode(items_protobuf_object.add(), item)
+
+    @classmethod
+    def decode(cls, batch_protobuf_object: Any) -> Any:
+        """
+        Decode a protocol buffer object that corresponds with this class into an instance of this class.
+
+        :param batch_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :return: a new instance of this class that matches the protocol buffer object.
+        """
+        return cls(
+            cls.item_class.decode(item_protobuf_object)
+            for item_protobuf_object in getattr(batch_protobuf_object, cls.items_field)
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        """Check equality."""
+        return isinstance(other, type(self)) and self._items == other._items
+
+    def __str__(self) -> str:
+        """Get string representation."""
+        return f"{type(self).__name__}: items={list(map(str, self._items))}"
+
+
+class RawMessages(_Batch[RawMessage]):
+    """This class represents a batch of raw messages, to be signed together."""
+
+    item_class = RawMessage
+    items_field = "raw_messages"
+
+    __slots__ = ()
+
+
+class RawTransactions(_Batch[RawTransaction]):
+    """This class represents a batch of raw transactions, to be signed together."""
+
+    item_class = RawTransaction
+    items_field = "raw_transactions"
+
+    __slots__ = ()
+
+
+class SignedMessages(_Batch[SignedMessage]):
+    """This class represents a batch of signed messages, in the order of the request."""
+
+    item_class = SignedMessage
+    items_field = "signed_messages"
+
+    __slots__ = ()
+
+
+class SignedTransactions(_Batch[SignedTransaction]):
+    """This class represents a batch of signed transactions, in the order of the request."""
+
+    item_class = SignedTransaction
+    items_field = "signed_transactions"
+
+    __slots__ = ()
@@ -41,12 +41,16 @@ class SigningDialogue(Dialogue):
         {
             SigningMessage.Performative.SIGN_TRANSACTION,
             SigningMessage.Performative.SIGN_MESSAGE,
+            SigningMessage.Performative.SIGN_TRANSACTIONS,
+            SigningMessage.Performative.SIGN_MESSAGES,
         }
     )
     TERMINAL_PERFORMATIVES = frozenset(
         {
             SigningMessage.Performative.SIGNED_TRANSACTION,
             SigningMessage.Performative.SIGNED_MESSAGE,
+            SigningMessage.Performative.SIGNED_TRANSACTIONS,
+            SigningMessage.Performative.SIGNED_MESSAGES,
             SigningMessage.Performative.ERROR,
         }
     )
@@ -58,14 +62,28 @@ class SigningDialogue(Dialogue):
                 SigningMessage.Performative.ERROR,
             }
         ),
+        SigningMessage.Performative.SIGN_MESSAGES: frozenset(
+            {
+                SigningMessage.Performative.SIGNED_MESSAGES,
+                SigningMessage.Performative.ERROR,
+            }
+        ),
         SigningMessage.Performative.SIGN_TRANSACTION: frozenset(
             {
                 SigningMessage.Performative.SIGNED_TRANSACTION,
                 SigningMessage.Performative.ERROR,
             }
         ),
+        SigningMessage.Performative.SIGN_TRANSACTIONS: frozenset(
+            {
+                SigningMessage.Performative.SIGNED_TRANSACTIONS,
+                SigningMessage.Performative.ERROR,
+            }
+        ),
         SigningMessage.Performative.SIGNED_MESSAGE: frozenset(),
+        SigningMessage.Performative.SIGNED_MESSAGES: frozenset(),
         SigningMessage.Performative.SIGNED_TRANSACTION: frozenset(),
+        SigningMessage.Performative.SIGNED_TRANSACTIONS: frozenset(),
     }
 
     class Role(Dialogue.Role):
@@ -33,15 +33,27 @@ from packages.open_aea.protocols.signing.custom_types import (
 from packages.open_aea.protocols.signing.custom_types import (
     RawMessage as CustomRawMessage,
 )
+from packages.open_aea.protocols.signing.custom_types import (
+    RawMessages as CustomRawMessages,
+)
 from packages.open_aea.protocols.signing.custom_types import (
     RawTransaction as CustomRawTransaction,
 )
+from packages.open_aea.protocols.signing.custom_types import (
+    RawTransactions as CustomRawTransactions,
+)
 from packages.open_aea.protocols.signing.custom_types import (
     SignedMessage as CustomSignedMessage,
 )
+from packages.open_aea.protocols.signing.custom_types import (
+    SignedMessages as CustomSignedMessages,
+)
 from packages.open_aea.protocols.signing.custom_types import (
     SignedTransaction as CustomSignedTransaction,
 )
+from packages.open_aea.protocols.signing.custom_types import (
+    SignedTransactions as CustomSignedTransactions,
+)
 from packages.open_aea.protocols.signing.custom_types import Terms as CustomTerms
 
 
@@ -53,19 +65,27 @@ DEFAULT_BODY_SIZE = 4
 class SigningMessage(Message):
     """A protocol for communication between skills and decision maker."""
 
-    protocol_id = PublicId.from_str("open_aea/signing:1.0.0")
-    protocol_specification_id = PublicId.from_str("open_aea/signing:1.0.0")
+    protocol_id = PublicId.from_str("open_aea/signing:1.1.0")
+    protocol_specification_id = PublicId.from_str("open_aea/signing:1.1.0")
 
     ErrorCode = CustomErrorCode
 
     RawMessage = CustomRawMessage
 
+    RawMessages = CustomRawMessages
+
     RawTransaction = CustomRawTransaction
 
+    RawTransactions = CustomRawTransactions
+
     SignedMessage = CustomSignedMessage
 
+    SignedMessages = CustomSignedMessages
+
     SignedTransaction = CustomSignedTransaction
 
+    SignedTransactions = CustomSignedTransactions
+
     Terms = CustomTerms
 
     class Performative(Message.Performative):
@@ -73,9 +93,13 @@ class SigningMessage(Message):
 
         ERROR = "error"
         SIGN_MESSAGE = "sign_message"
+        SIGN_MESSAGES = "sign_messages"
         SIGN_TRANSACTION = "sign_transaction"
+        SIGN_TRANSACTIONS = "sign_transactions"
         SIGNED_MESSAGE = "signed_message"
+        SIGNED_MESSAGES = "signed_messages"
         SIGNED_TRANSACTION = "signed_transaction"
+        SIGNED_TRANSACTIONS = "signed_transactions"
 
         def __str__(self) -> str:
             """Get the string representation."""
@@ -84,9 +108,13 @@ class SigningMessage(Message):
     _performatives = {
         "error",
         "sign_message",
+        "sign_messages",
         "sign_transaction",
+        "sign_transactions",
         "signed_message",
+        "signed_messages",
         "signed_transaction",
+        "signed_transactions",
     }
     __slots__: Tuple[str, ...] = tuple()
 
@@ -97,9 +125,13 @@ class SigningMessage(Message):
             "message_id",
             "performative",
             "raw_message",
+            "raw_messages",
             "raw_transaction",
+            "raw_transactions",
             "signed_message",
+            "signed_messages",
             "signed_transaction",
+            "signed_transactions",
             "target",
             "terms",
         )
@@ -169,18 +201,38 @@ class SigningMessage(Message):
         enforce(self.is_set("raw_message"), "'raw_message' content is not set.")
         return cast(CustomRawMessage, self.get("raw_message"))
 
+    @property
+    def raw_messages(self) -> CustomRawMessages:
+        """Get the 'raw_messages' content from the message."""
+        enforce(self.is_set("raw_messages"), "'raw_messages' content is not set.")
+        return cast(CustomRawMessages, self.get("raw_messages"))
+
     @property
     def raw_transaction(self) -> CustomRawTransaction:
         """Get the 'raw_transaction' content from the message."""
         enforce(self.is_set("raw_transaction"), "'raw_transaction' content is not set.")
         return cast(CustomRawTransaction, self.get("raw_transaction"))
 
+    @property
+    def raw_transactions(self) -> CustomRawTransactions:
+        """Get the 'raw_transactions' content from the message."""
+        enforce(
+            self.is_set("raw_transactions"), "'raw_transactions' content is not set."
+        )
+        return cast(CustomRawTransactions, self.get("raw_transactions"))
+
     @property
     def signed_message(self) -> CustomSignedMessage:
         """Get the 'signed_message' content from the message."""
         enforce(self.is_set("signed_message"), "'signed_message' content is not set.")
         return cast(CustomSignedMessage, self.get("signed_message"))
 
+    @property
+    def signed_messages(self) -> CustomSignedMessages:
+        """Get the 'signed_messages' content from the message."""
+        enforce(self.is_set("signed_messages"), "'signed_messages' content is not set.")
+        return cast(CustomSignedMessages, self.get("signed_messages"))
+
     @property
     def signed_transaction(self) -> CustomSignedTransaction:
         """Get the 'signed_transaction' content from the message."""
@@ -190,6 +242,15 @@ class SigningMessage(Message):
         )
         return cast(CustomSignedTransaction, self.get("signed_transaction"))
 
+    @property
+    def signed_transactions(self) -> CustomSignedTransactions:
+        """Get the 'signed_transactions' content from the message."""
+        enforce(
+            self.is_set("signed_transactions"),
+            "'signed_transactions' content is not set.",
+        )
+        return cast(CustomSignedTransactions, self.get("signed_transactions"))
+
     @property
     def terms(self) -> CustomTerms:
         """Get the 'terms' content from the message."""
@@ -270,6 +331,34 @@ class SigningMessage(Message):
                         type(self.raw_message)
                     ),
                 )
+            elif self.performative == SigningMessage.Performative.SIGN_TRANSACTIONS:
+                expected_nb_of_contents = 2
+                enforce(
+                    isinstance(self.terms, CustomTerms),
+                    "Invalid type for content 'terms'. Expected 'Terms'. Found '{}'.".format(
+                        type(self.terms)
+                    ),
+                )
+                enforce(
+                    isinstance(self.raw_transactions, CustomRawTransactions),
+                    "Invalid type for content 'raw_transactions'. Expected 'RawTransactions'. Found '{}'.".format(
+                        type(self.raw_transactions)
+                    ),
+                )
+            elif self.performative == SigningMessage.Performative.SIGN_MESSAGES:
+                expected_nb_of_contents = 2
+                enforce(
+                    isinstance(self.terms, CustomTerms),
+                    "Invalid type for content 'terms'. Expected 'Terms'. Found '{}'.".format(
+                        type(self.terms)
+                    ),
+                )
+                enforce(
+                    isinstance(self.raw_messages, CustomRawMessages),
+                    "Invalid type for content 'raw_messages'. Expected 'RawMessages'. Found '{}'.".format(
+                        type(self.raw_messages)
+                    ),
+                )
             elif self.performative == SigningMessage.Performative.SIGNED_TRANSACTION:
                 expected_nb_of_contents = 1
                 enforce(
@@ -286,6 +375,22 @@ class SigningMessage(Message):
                         type(self.signed_message)
                     ),
                 )
+            elif self.performative == SigningMessage.Performative.SIGNED_TRANSACTIONS:
+                expected_nb_of_contents = 1
+                enforce(
+                    isinstance(self.signed_transactions, CustomSignedTransactions),
+                    "Invalid type for content 'signed_transactions'. Expected 'SignedTransactions'. Found '{}'.".format(
+                        type(self.signed_transactions)
+                    ),
+                )
+            elif self.performative == SigningMessage.Performative.SIGNED_MESSAGES:
+                expected_nb_of_contents = 1
+                enforce(
+                    isinstance(self.signed_messages, CustomSignedMessages),
+                    "Invalid type for content 'signed_messages'. Expected 'SignedMessages'. Found '{}'.".format(
+                        type(self.signed_messages)
+                    ),
+                )
             elif self.performative == SigningMessage.Performative.ERROR:
                 expected_nb_of_contents = 1
                 enforce(
@@ -30,9 +30,13 @@ from packages.open_aea.protocols.signing import signing_pb2
 from packages.open_aea.protocols.signing.custom_types import (
     ErrorCode,
     RawMessage,
+    RawMessages,
     RawTransaction,
+    RawTransactions,
     SignedMessage,
+    SignedMessages,
     SignedTransaction,
+    SignedTransactions,
     Terms,
 )
 from packages.open_aea.protocols.signing.message import SigningMessage
@@ -75,6 +79,20 @@ class SigningSerializer(Serializer):
             raw_message = msg.raw_message
             RawMessage.encode(performative.raw_message, raw_message)
             signing_msg.sign_message.CopyFrom(performative)
+        elif performative_id == SigningMessage.Performative.SIGN_TRANSACTIONS:
+            performative = signing_pb2.SigningMessage.Sign_Transactions_Performative()  # type: ignore
+            terms = msg.terms
+            Terms.encode(performative.terms, terms)
+            raw_transactions = msg.raw_transactions
+            RawTransactions.encode(performative.raw_transactions, raw_transactions)
+            signing_msg.sign_transactions.CopyFrom(performative)
+        elif performative_id == SigningMessage.Performative.SIGN_MESSAGES:
+            performative = signing_pb2.SigningMessage.Sign_Messages_Performative()  # type: ignore
+            terms = msg.terms
+            Terms.encode(performative.terms, terms)
+            raw_messages = msg.raw_messages
+            RawMessages.encode(performative.raw_messages, raw_messages)
+            signing_msg.sign_messages.CopyFrom(performative)
         elif performative_id == SigningMessage.Performative.SIGNED_TRANSACTION:
             performative = signing_pb2.SigningMessage.Signed_Transaction_Performative()  # type: ignore
             signed_transaction = msg.signed_transaction
@@ -87,6 +105,18 @@ class SigningSerializer(Serializer):
             signed_message = msg.signed_message
             SignedMessage.encode(performative.signed_message, signed_message)
             signing_msg.signed_message.CopyFrom(performative)
+        elif performative_id == SigningMessage.Performative.SIGNED_TRANSACTIONS:
+            performative = signing_pb2.SigningMessage.Signed_Transactions_Performative()  # type: ignore
+            signed_transactions = msg.signed_transactions
+            SignedTransactions.encode(
+                performative.signed_transactions, signed_transactions
+            )
+            signing_msg.signed_transactions.CopyFrom(performative)
+        elif performative_id == SigningMessage.Performative.SIGNED_MESSAGES:
+            performative = signing_pb2.SigningMessage.Signed_Messages_Performative()  # type: ignore
+            signed_messages = msg.signed_messages
+            SignedMessages.encode(performative.signed_messages, signed_messages)
+            signing_msg.signed_messages.CopyFrom(performative)
         elif performative_id == SigningMessage.Performative.ERROR:
             performative = signing_pb2.SigningMessage.Error_Performative()  # type: ignore
             error_code = msg.error_code
@@ -137,6 +167,20 @@ class SigningSerializer(Serializer):
             pb2_raw_message = signing_pb.sign_message.raw_message
             raw_message = RawMessage.decode(pb2_raw_message)
             performative_content["raw_message"] = raw_message
+        elif performative_id == SigningMessage.Performative.SIGN_TRANSACTIONS:
+            pb2_terms = signing_pb.sign_transactions.terms
+            terms = Terms.decode(pb2_terms)
+            performative_content["terms"] = terms
+            pb2_raw_transactions = signing_pb.sign_transactions.raw_transactions
+            raw_transactions = RawTransactions.decode(pb2_raw_transactions)
+            performative_content["raw_transactions"] = raw_transactions
+        elif performative_id == SigningMessage.Performative.SIGN_MESSAGES:
+            pb2_terms = signing_pb.sign_messages.terms
+            terms = Terms.decode(pb2_terms)
+            performative_content["terms"] = terms
+            pb2_raw_messages = signing_pb.sign_messages.raw_messages
+            raw_messages = RawMessages.decode(pb2_raw_messages)
+            performative_content["raw_messages"] = raw_messages
         elif performative_id == SigningMessage.Performative.SIGNED_TRANSACTION:
             pb2_signed_transaction = signing_pb.signed_transaction.signed_transaction
             signed_transaction = SignedTransaction.decode(pb2_signed_transaction)
@@ -145,6 +189,14 @@ class SigningSerializer(Serializer):
             pb2_signed_message = signing_pb.signed_message.signed_message
             signed_message = SignedMessage.decode(pb2_signed_message)
             performative_content["signed_message"] = signed_message
+        elif performative_id == SigningMessage.Performative.SIGNED_TRANSACTIONS:
+            pb2_signed_transactions = signing_pb.signed_transactions.signed_transactions
+            signed_transactions = SignedTransactions.decode(pb2_signed_transactions)
+            performative_content["signed_transactions"] = signed_transactions
+        elif performative_id == SigningMessage.Performative.SIGNED_MESSAGES:
+            pb2_signed_messages = signing_pb.signed_messages.signed_messages
+            signed_messages = SignedMessages.decode(pb2_signed_messages)
+            performative_content["signed_messages"] = signed_messages
         elif performative_id == SigningMessage.Performative.ERROR:
             pb2_error_code = signing_pb.error.error_code
             error_code = ErrorCode.decode(pb2_error_code)
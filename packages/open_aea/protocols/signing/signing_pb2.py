@@ -14,17 +14,17 @@ _sym_db = _symbol_database.Default()
 
 DESCRIPTOR = _descriptor.FileDescriptor(
     name="signing.proto",
-    package="aea.open_aea.signing.v1_0_0",
+    package="aea.open_aea.signing.v1_1_0",
     syntax="proto3",
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_pb=b'\n\rsigning.proto\x12\x1b\x61\x65\x61.open_aea.signing.v1_0_0"\xbc\x0c\n\x0eSigningMessage\x12O\n\x05\x65rror\x18\x05 \x01(\x0b\x32>.aea.open_aea.signing.v1_0_0.SigningMessage.Error_PerformativeH\x00\x12]\n\x0csign_message\x18\x06 \x01(\x0b\x32\x45.aea.open_aea.signing.v1_0_0.SigningMessage.Sign_Message_PerformativeH\x00\x12\x65\n\x10sign_transaction\x18\x07 \x01(\x0b\x32I.aea.open_aea.signing.v1_0_0.SigningMessage.Sign_Transaction_PerformativeH\x00\x12\x61\n\x0esigned_message\x18\x08 \x01(\x0b\x32G.aea.open_aea.signing.v1_0_0.SigningMessage.Signed_Message_PerformativeH\x00\x12i\n\x12signed_transaction\x18\t \x01(\x0b\x32K.aea.open_aea.signing.v1_0_0.SigningMessage.Signed_Transaction_PerformativeH\x00\x1a\xbd\x01\n\tErrorCode\x12W\n\nerror_code\x18\x01 \x01(\x0e\x32\x43.aea.open_aea.signing.v1_0_0.SigningMessage.ErrorCode.ErrorCodeEnum"W\n\rErrorCodeEnum\x12 \n\x1cUNSUCCESSFUL_MESSAGE_SIGNING\x10\x00\x12$\n UNSUCCESSFUL_TRANSACTION_SIGNING\x10\x01\x1a!\n\nRawMessage\x12\x13\n\x0braw_message\x18\x01 \x01(\x0c\x1a)\n\x0eRawTransaction\x12\x17\n\x0fraw_transaction\x18\x01 \x01(\x0c\x1a\'\n\rSignedMessage\x12\x16\n\x0esigned_message\x18\x01 \x01(\x0c\x1a/\n\x11SignedTransaction\x12\x1a\n\x12signed_transaction\x18\x01 \x01(\x0c\x1a\x16\n\x05Terms\x12\r\n\x05terms\x18\x01 \x01(\x0c\x1a\xb6\x01\n\x1dSign_Transaction_Performative\x12@\n\x05terms\x18\x01 \x01(\x0b\x32\x31.aea.open_aea.signing.v1_0_0.SigningMessage.Terms\x12S\n\x0fraw_transaction\x18\x02 \x01(\x0b\x32:.aea.open_aea.signing.v1_0_0.SigningMessage.RawTransaction\x1a\xaa\x01\n\x19Sign_Message_Performative\x12@\n\x05terms\x18\x01 \x01(\x0b\x32\x31.aea.open_aea.signing.v1_0_0.SigningMessage.Terms\x12K\n\x0braw_message\x18\x02 \x01(\x0b\x32\x36.aea.open_aea.signing.v1_0_0.SigningMessage.RawMessage\x1a|\n\x1fSigned_Transaction_Performative\x12Y\n\x12signed_transaction\x18\x01 \x01(\x0b\x32=.aea.open_aea.signing.v1_0_0.SigningMessage.SignedTransaction\x1ap\n\x1bSigned_Message_Performative\x12Q\n\x0esigned_message\x18\x01 \x01(\x0b\x32\x39.aea.open_aea.signing.v1_0_0.SigningMessage.SignedMessage\x1a_\n\x12\x45rror_Performative\x12I\n\nerror_code\x18\x01 \x01(\x0b\x32\x35.aea.open_aea.signing.v1_0_0.SigningMessage.ErrorCodeB\x0e\n\x0cperformativeb\x06proto3',
+    serialized_pb=b'\n\rsigning.proto\x12\x1b\x61\x65\x61.open_aea.signing.v1_1_0"\xd8\x17\n\x0eSigningMessage\x12O\n\x05\x65rror\x18\x05 \x01(\x0b\x32>.aea.open_aea.signing.v1_1_0.SigningMessage.Error_PerformativeH\x00\x12]\n\x0csign_message\x18\x06 \x01(\x0b\x32\x45.aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Message_PerformativeH\x00\x12\x65\n\x10sign_transaction\x18\x07 \x01(\x0b\x32I.aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Transaction_PerformativeH\x00\x12\x61\n\x0esigned_message\x18\x08 \x01(\x0b\x32G.aea.open_aea.signing.v1_1_0.SigningMessage.Signed_Message_PerformativeH\x00\x12i\n\x12signed_transaction\x18\t \x01(\x0b\x32K.aea.open_aea.signing.v1_1_0.SigningMessage.Signed_Transaction_PerformativeH\x00\x12_\n\rsign_messages\x18\n \x01(\x0b\x32\x46.aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Messages_PerformativeH\x00\x12g\n\x11sign_transactions\x18\x0b \x01(\x0b\x32J.aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Transactions_PerformativeH\x00\x12\x63\n\x0fsigned_messages\x18\x0c \x01(\x0b\x32H.aea.open_aea.signing.v1_1_0.SigningMessage.Signed_Messages_PerformativeH\x00\x12k\n\x13signed_transactions\x18\r \x01(\x0b\x32L.aea.open_aea.signing.v1_1_0.SigningMessage.Signed_Transactions_PerformativeH\x00\x1a\xbd\x01\n\tErrorCode\x12W\n\nerror_code\x18\x01 \x01(\x0e\x32\x43.aea.open_aea.signing.v1_1_0.SigningMessage.ErrorCode.ErrorCodeEnum"W\n\rErrorCodeEnum\x12 \n\x1cUNSUCCESSFUL_MESSAGE_SIGNING\x10\x00\x12$\n UNSUCCESSFUL_TRANSACTION_SIGNING\x10\x01\x1a!\n\nRawMessage\x12\x13\n\x0braw_message\x18\x01 \x01(\x0c\x1a[\n\x0bRawMessages\x12L\n\x0craw_messages\x18\x01 \x03(\x0b\x32\x36.aea.open_aea.signing.v1_1_0.SigningMessage.RawMessage\x1a)\n\x0eRawTransaction\x12\x17\n\x0fraw_transaction\x18\x01 \x01(\x0c\x1ag\n\x0fRawTransactions\x12T\n\x10raw_transactions\x18\x01 \x03(\x0b\x32:.aea.open_aea.signing.v1_1_0.SigningMessage.RawTransaction\x1a\'\n\rSignedMessage\x12\x16\n\x0esigned_message\x18\x01 \x01(\x0c\x1a\x64\n\x0eSignedMessages\x12R\n\x0fsigned_messages\x18\x01 \x03(\x0b\x32\x39.aea.open_aea.signing.v1_1_0.SigningMessage.SignedMessage\x1a/\n\x11SignedTransaction\x12\x1a\n\x12signed_transaction\x18\x01 \x01(\x0c\x1ap\n\x12SignedTransactions\x12Z\n\x13signed_transactions\x18\x01 \x03(\x0b\x32=.aea.open_aea.signing.v1_1_0.SigningMessage.SignedTransaction\x1a\x16\n\x05Terms\x12\r\n\x05terms\x18\x01 \x01(\x0c\x1a\xb6\x01\n\x1dSign_Transaction_Performative\x12@\n\x05terms\x18\x01 \x01(\x0b\x32\x31.aea.open_aea.signing.v1_1_0.SigningMessage.Terms\x12S\n\x0fraw_transaction\x18\x02 \x01(\x0b\x32:.aea.open_aea.signing.v1_1_0.SigningMessage.RawTransaction\x1a\xaa\x01\n\x19Sign_Message_Performative\x12@\n\x05terms\x18\x01 \x01(\x0b\x32\x31.aea.open_aea.signing.v1_1_0.SigningMessage.Terms\x12K\n\x0braw_message\x18\x02 \x01(\x0b\x32\x36.aea.open_aea.signing.v1_1_0.SigningMessage.RawMessage\x1a\xb9\x01\n\x1eSign_Transactions_Performative\x12@\n\x05terms\x18\x01 \x01(\x0b\x32\x31.aea.open_aea.signing.v1_1_0.SigningMessage.Terms\x12U\n\x10raw_transactions\x18\x02 \x01(\x0b\x32;.aea.open_aea.signing.v1_1_0.SigningMessage.RawTransactions\x1a\xad\x01\n\x1aSign_Messages_Performative\x12@\n\x05terms\x18\x01 \x01(\x0b\x32\x31.aea.open_aea.signing.v1_1_0.SigningMessage.Terms\x12M\n\x0craw_messages\x18\x02 \x01(\x0b\x32\x37.aea.open_aea.signing.v1_1_0.SigningMessage.RawMessages\x1a|\n\x1fSigned_Transaction_Performative\x12Y\n\x12signed_transaction\x18\x01 \x01(\x0b\x32=.aea.open_aea.signing.v1_1_0.SigningMessage.SignedTransaction\x1ap\n\x1bSigned_Message_Performative\x12Q\n\x0esigned_message\x18\x01 \x01(\x0b\x32\x39.aea.open_aea.signing.v1_1_0.SigningMessage.SignedMessage\x1a\x7f\n Signed_Transactions_Performative\x12[\n\x13signed_transactions\x18\x01 \x01(\x0b\x32>.aea.open_aea.signing.v1_1_0.SigningMessage.SignedTransactions\x1as\n\x1cSigned_Messages_Performative\x12S\n\x0fsigned_messages\x18\x01 \x01(\x0b\x32:.aea.open_aea.signing.v1_1_0.SigningMessage.SignedMessages\x1a_\n\x12\x45rror_Performative\x12I\n\nerror_code\x18\x01 \x01(\x0b\x32\x35.aea.open_aea.signing.v1_1_0.SigningMessage.ErrorCodeB\x0e\n\x0cperformativeb\x06proto3',
 )
 
 
 _SIGNINGMESSAGE_ERRORCODE_ERRORCODEENUM = _descriptor.EnumDescriptor(
     name="ErrorCodeEnum",
-    full_name="aea.open_aea.signing.v1_0_0.SigningMessage.ErrorCode.ErrorCodeEnum",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.ErrorCode.ErrorCodeEnum",
     filename=None,
     file=DESCRIPTOR,
     create_key=_descriptor._internal_create_key,
@@ -48,15 +48,15 @@ _SIGNINGMESSAGE_ERRORCODE_ERRORCODEENUM = _descriptor.EnumDescriptor(
     ],
     containing_type=None,
     serialized_options=None,
-    serialized_start=653,
-    serialized_end=740,
+    serialized_start=1065,
+    serialized_end=1152,
 )
 _sym_db.RegisterEnumDescriptor(_SIGNINGMESSAGE_ERRORCODE_ERRORCODEENUM)
 
 
 _SIGNINGMESSAGE_ERRORCODE = _descriptor.Descriptor(
     name="ErrorCode",
-    full_name="aea.open_aea.signing.v1_0_0.SigningMessage.ErrorCode",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.ErrorCode",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
@@ -64,7 +64,7 @@ _SIGNINGMESSAGE_ERRORCODE = _descriptor.Descriptor(
     fields=[
         _descriptor.FieldDescriptor(
             name="error_code",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.ErrorCode.error_code",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.ErrorCode.error_code",
             index=0,
             number=1,
             type=14,
@@ -90,13 +90,13 @@ _SIGNINGMESSAGE_ERRORCODE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=551,
-    serialized_end=740,
+    serialized_start=963,
+    serialized_end=1152,
 )
 
 _SIGNINGMESSAGE_RAWMESSAGE = _descriptor.Descriptor(
     name="RawMessage",
-    full_name="aea.open_aea.signing.v1_0_0.SigningMessage.RawMessage",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.RawMessage",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
@@ -104,7 +104,7 @@ _SIGNINGMESSAGE_RAWMESSAGE = _descriptor.Descriptor(
     fields=[
         _descriptor.FieldDescriptor(
             name="raw_message",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.RawMessage.raw_message",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.RawMessage.raw_message",
             index=0,
             number=1,
             type=12,
@@ -130,13 +130,53 @@ _SIGNINGMESSAGE_RAWMESSAGE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=742,
-    serialized_end=775,
+    serialized_start=1154,
+    serialized_end=1187,
+)
+
+_SIGNINGMESSAGE_RAWMESSAGES = _descriptor.Descriptor(
+    name="RawMessages",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.RawMessages",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="raw_messages",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.RawMessages.raw_messages",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1189,
+    serialized_end=1280,
 )
 
 _SIGNINGMESSAGE_RAWTRANSACTION = _descriptor.Descriptor(
     name="RawTransaction",
-    full_name="aea.open_aea.signing.v1_0_0.SigningMessage.RawTransaction",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.RawTransaction",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
@@ -144,7 +184,7 @@ _SIGNINGMESSAGE_RAWTRANSACTION = _descriptor.Descriptor(
     fields=[
         _descriptor.FieldDescriptor(
             name="raw_transaction",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.RawTransaction.raw_transaction",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.RawTransaction.raw_transaction",
             index=0,
             number=1,
             type=12,
@@ -170,13 +210,53 @@ _SIGNINGMESSAGE_RAWTRANSACTION = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=777,
-    serialized_end=818,
+    serialized_start=1282,
+    serialized_end=1323,
+)
+
+_SIGNINGMESSAGE_RAWTRANSACTIONS = _descriptor.Descriptor(
+    name="RawTransactions",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.RawTransactions",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="raw_transactions",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.RawTransactions.raw_transactions",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1325,
+    serialized_end=1428,
 )
 
 _SIGNINGMESSAGE_SIGNEDMESSAGE = _descriptor.Descriptor(
     name="SignedMessage",
-    full_name="aea.open_aea.signing.v1_0_0.SigningMessage.SignedMessage",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.SignedMessage",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
@@ -184,7 +264,7 @@ _SIGNINGMESSAGE_SIGNEDMESSAGE = _descriptor.Descriptor(
     fields=[
         _descriptor.FieldDescriptor(
             name="signed_message",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.SignedMessage.signed_message",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.SignedMessage.signed_message",
             index=0,
             number=1,
             type=12,
@@ -210,13 +290,53 @@ _SIGNINGMESSAGE_SIGNEDMESSAGE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=820,
-    serialized_end=859,
+    serialized_start=1430,
+    serialized_end=1469,
+)
+
+_SIGNINGMESSAGE_SIGNEDMESSAGES = _descriptor.Descriptor(
+    name="SignedMessages",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.SignedMessages",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="signed_messages",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.SignedMessages.signed_messages",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1471,
+    serialized_end=1571,
 )
 
 _SIGNINGMESSAGE_SIGNEDTRANSACTION = _descriptor.Descriptor(
     name="SignedTransaction",
-    full_name="aea.open_aea.signing.v1_0_0.SigningMessage.SignedTransaction",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.SignedTransaction",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
@@ -224,7 +344,7 @@ _SIGNINGMESSAGE_SIGNEDTRANSACTION = _descriptor.Descriptor(
     fields=[
         _descriptor.FieldDescriptor(
             name="signed_transaction",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.SignedTransaction.signed_transaction",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.SignedTransaction.signed_transaction",
             index=0,
             number=1,
             type=12,
@@ -250,13 +370,53 @@ _SIGNINGMESSAGE_SIGNEDTRANSACTION = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=861,
-    serialized_end=908,
+    serialized_start=1573,
+    serialized_end=1620,
+)
+
+_SIGNINGMESSAGE_SIGNEDTRANSACTIONS = _descriptor.Descriptor(
+    name="SignedTransactions",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.SignedTransactions",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="signed_transactions",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.SignedTransactions.signed_transactions",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1622,
+    serialized_end=1734,
 )
 
 _SIGNINGMESSAGE_TERMS = _descriptor.Descriptor(
     name="Terms",
-    full_name="aea.open_aea.signing.v1_0_0.SigningMessage.Terms",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Terms",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
@@ -264,7 +424,7 @@ _SIGNINGMESSAGE_TERMS = _descriptor.Descriptor(
     fields=[
         _descriptor.FieldDescriptor(
             name="terms",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.Terms.terms",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Terms.terms",
             index=0,
             number=1,
             type=12,
@@ -290,13 +450,13 @@ _SIGNINGMESSAGE_TERMS = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=910,
-    serialized_end=932,
+    serialized_start=1736,
+    serialized_end=1758,
 )
 
 _SIGNINGMESSAGE_SIGN_TRANSACTION_PERFORMATIVE = _descriptor.Descriptor(
     name="Sign_Transaction_Performative",
-    full_name="aea.open_aea.signing.v1_0_0.SigningMessage.Sign_Transaction_Performative",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Transaction_Performative",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
@@ -304,7 +464,7 @@ _SIGNINGMESSAGE_SIGN_TRANSACTION_PERFORMATIVE = _descriptor.Descriptor(
     fields=[
         _descriptor.FieldDescriptor(
             name="terms",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.Sign_Transaction_Performative.terms",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Transaction_Performative.terms",
             index=0,
             number=1,
             type=11,
@@ -323,7 +483,7 @@ _SIGNINGMESSAGE_SIGN_TRANSACTION_PERFORMATIVE = _descriptor.Descriptor(
         ),
         _descriptor.FieldDescriptor(
             name="raw_transaction",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.Sign_Transaction_Performative.raw_transaction",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Transaction_Performative.raw_transaction",
             index=1,
             number=2,
             type=11,
@@ -349,13 +509,13 @@ _SIGNINGMESSAGE_SIGN_TRANSACTION_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=935,
-    serialized_end=1117,
+    serialized_start=1761,
+    serialized_end=1943,
 )
 
 _SIGNINGMESSAGE_SIGN_MESSAGE_PERFORMATIVE = _descriptor.Descriptor(
     name="Sign_Message_Performative",
-    full_name="aea.open_aea.signing.v1_0_0.SigningMessage.Sign_Message_Performative",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Message_Performative",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
@@ -363,7 +523,7 @@ _SIGNINGMESSAGE_SIGN_MESSAGE_PERFORMATIVE = _descriptor.Descriptor(
     fields=[
         _descriptor.FieldDescriptor(
             name="terms",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.Sign_Message_Performative.terms",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Message_Performative.terms",
             index=0,
             number=1,
             type=11,
@@ -382,7 +542,125 @@ _SIGNINGMESSAGE_SIGN_MESSAGE_PERFORMATIVE = _descriptor.Descriptor(
         ),
         _descriptor.FieldDescriptor(
             name="raw_message",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.Sign_Message_Performative.raw_message",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Message_Performative.raw_message",
+            index=1,
+            number=2,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1946,
+    serialized_end=2116,
+)
+
+_SIGNINGMESSAGE_SIGN_TRANSACTIONS_PERFORMATIVE = _descriptor.Descriptor(
+    name="Sign_Transactions_Performative",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Transactions_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="terms",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Transactions_Performative.terms",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="raw_transactions",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Transactions_Performative.raw_transactions",
+            index=1,
+            number=2,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=2119,
+    serialized_end=2304,
+)
+
+_SIGNINGMESSAGE_SIGN_MESSAGES_PERFORMATIVE = _descriptor.Descriptor(
+    name="Sign_Messages_Performative",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Messages_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="terms",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Messages_Performative.terms",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="raw_messages",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Messages_Performative.raw_messages",
             index=1,
             number=2,
             type=11,
@@ -408,13 +686,13 @@ _SIGNINGMESSAGE_SIGN_MESSAGE_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1120,
-    serialized_end=1290,
+    serialized_start=2307,
+    serialized_end=2480,
 )
 
 _SIGNINGMESSAGE_SIGNED_TRANSACTION_PERFORMATIVE = _descriptor.Descriptor(
     name="Signed_Transaction_Performative",
-    full_name="aea.open_aea.signing.v1_0_0.SigningMessage.Signed_Transaction_Performative",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Signed_Transaction_Performative",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
@@ -422,7 +700,7 @@ _SIGNINGMESSAGE_SIGNED_TRANSACTION_PERFORMATIVE = _descriptor.Descriptor(
     fields=[
         _descriptor.FieldDescriptor(
             name="signed_transaction",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.Signed_Transaction_Performative.signed_transaction",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Signed_Transaction_Performative.signed_transaction",
             index=0,
             number=1,
             type=11,
@@ -448,13 +726,13 @@ _SIGNINGMESSAGE_SIGNED_TRANSACTION_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1292,
-    serialized_end=1416,
+    serialized_start=2482,
+    serialized_end=2606,
 )
 
 _SIGNINGMESSAGE_SIGNED_MESSAGE_PERFORMATIVE = _descriptor.Descriptor(
     name="Signed_Message_Performative",
-    full_name="aea.open_aea.signing.v1_0_0.SigningMessage.Signed_Message_Performative",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Signed_Message_Performative",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
@@ -462,7 +740,7 @@ _SIGNINGMESSAGE_SIGNED_MESSAGE_PERFORMATIVE = _descriptor.Descriptor(
     fields=[
         _descriptor.FieldDescriptor(
             name="signed_message",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.Signed_Message_Performative.signed_message",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Signed_Message_Performative.signed_message",
             index=0,
             number=1,
             type=11,
@@ -488,13 +766,93 @@ _SIGNINGMESSAGE_SIGNED_MESSAGE_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1418,
-    serialized_end=1530,
+    serialized_start=2608,
+    serialized_end=2720,
+)
+
+_SIGNINGMESSAGE_SIGNED_TRANSACTIONS_PERFORMATIVE = _descriptor.Descriptor(
+    name="Signed_Transactions_Performative",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Signed_Transactions_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="signed_transactions",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Signed_Transactions_Performative.signed_transactions",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=2722,
+    serialized_end=2849,
+)
+
+_SIGNINGMESSAGE_SIGNED_MESSAGES_PERFORMATIVE = _descriptor.Descriptor(
+    name="Signed_Messages_Performative",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Signed_Messages_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="signed_messages",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Signed_Messages_Performative.signed_messages",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=2851,
+    serialized_end=2966,
 )
 
 _SIGNINGMESSAGE_ERROR_PERFORMATIVE = _descriptor.Descriptor(
     name="Error_Performative",
-    full_name="aea.open_aea.signing.v1_0_0.SigningMessage.Error_Performative",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Error_Performative",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
@@ -502,7 +860,7 @@ _SIGNINGMESSAGE_ERROR_PERFORMATIVE = _descriptor.Descriptor(
     fields=[
         _descriptor.FieldDescriptor(
             name="error_code",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.Error_Performative.error_code",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.Error_Performative.error_code",
             index=0,
             number=1,
             type=11,
@@ -528,13 +886,13 @@ _SIGNINGMESSAGE_ERROR_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1532,
-    serialized_end=1627,
+    serialized_start=2968,
+    serialized_end=3063,
 )
 
 _SIGNINGMESSAGE = _descriptor.Descriptor(
     name="SigningMessage",
-    full_name="aea.open_aea.signing.v1_0_0.SigningMessage",
+    full_name="aea.open_aea.signing.v1_1_0.SigningMessage",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
@@ -542,7 +900,7 @@ _SIGNINGMESSAGE = _descriptor.Descriptor(
     fields=[
         _descriptor.FieldDescriptor(
             name="error",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.error",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.error",
             index=0,
             number=5,
             type=11,
@@ -561,7 +919,7 @@ _SIGNINGMESSAGE = _descriptor.Descriptor(
         ),
         _descriptor.FieldDescriptor(
             name="sign_message",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.sign_message",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.sign_message",
             index=1,
             number=6,
             type=11,
@@ -580,7 +938,7 @@ _SIGNINGMESSAGE = _descriptor.Descriptor(
         ),
         _descriptor.FieldDescriptor(
             name="sign_transaction",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.sign_transaction",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.sign_transaction",
             index=2,
             number=7,
             type=11,
@@ -599,7 +957,7 @@ _SIGNINGMESSAGE = _descriptor.Descriptor(
         ),
         _descriptor.FieldDescriptor(
             name="signed_message",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.signed_message",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.signed_message",
             index=3,
             number=8,
             type=11,
@@ -618,7 +976,7 @@ _SIGNINGMESSAGE = _descriptor.Descriptor(
         ),
         _descriptor.FieldDescriptor(
             name="signed_transaction",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.signed_transaction",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.signed_transaction",
             index=4,
             number=9,
             type=11,
@@ -635,19 +993,103 @@ _SIGNINGMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="sign_messages",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.sign_messages",
+            index=5,
+            number=10,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="sign_transactions",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.sign_transactions",
+            index=6,
+            number=11,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="signed_messages",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.signed_messages",
+            index=7,
+            number=12,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="signed_transactions",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.signed_transactions",
+            index=8,
+            number=13,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
     extensions=[],
     nested_types=[
         _SIGNINGMESSAGE_ERRORCODE,
         _SIGNINGMESSAGE_RAWMESSAGE,
+        _SIGNINGMESSAGE_RAWMESSAGES,
         _SIGNINGMESSAGE_RAWTRANSACTION,
+        _SIGNINGMESSAGE_RAWTRANSACTIONS,
         _SIGNINGMESSAGE_SIGNEDMESSAGE,
+        _SIGNINGMESSAGE_SIGNEDMESSAGES,
         _SIGNINGMESSAGE_SIGNEDTRANSACTION,
+        _SIGNINGMESSAGE_SIGNEDTRANSACTIONS,
         _SIGNINGMESSAGE_TERMS,
         _SIGNINGMESSAGE_SIGN_TRANSACTION_PERFORMATIVE,
         _SIGNINGMESSAGE_SIGN_MESSAGE_PERFORMATIVE,
+        _SIGNINGMESSAGE_SIGN_TRANSACTIONS_PERFORMATIVE,
+        _SIGNINGMESSAGE_SIGN_MESSAGES_PERFORMATIVE,
         _SIGNINGMESSAGE_SIGNED_TRANSACTION_PERFORMATIVE,
         _SIGNINGMESSAGE_SIGNED_MESSAGE_PERFORMATIVE,
+        _SIGNINGMESSAGE_SIGNED_TRANSACTIONS_PERFORMATIVE,
+        _SIGNINGMESSAGE_SIGNED_MESSAGES_PERFORMATIVE,
         _SIGNINGMESSAGE_ERROR_PERFORMATIVE,
     ],
     enum_types=[],
@@ -658,7 +1100,7 @@ _SIGNINGMESSAGE = _descriptor.Descriptor(
     oneofs=[
         _descriptor.OneofDescriptor(
             name="performative",
-            full_name="aea.open_aea.signing.v1_0_0.SigningMessage.performative",
+            full_name="aea.open_aea.signing.v1_1_0.SigningMessage.performative",
             index=0,
             containing_type=None,
             create_key=_descriptor._internal_create_key,
@@ -666,7 +1108,7 @@ _SIGNINGMESSAGE = _descriptor.Descriptor(
         ),
     ],
     serialized_start=47,
-    serialized_end=1643,
+    serialized_end=3079,
 )
 
 _SIGNINGMESSAGE_ERRORCODE.fields_by_name[
@@ -675,9 +1117,25 @@ _SIGNINGMESSAGE_ERRORCODE.fields_by_name[
 _SIGNINGMESSAGE_ERRORCODE.containing_type = _SIGNINGMESSAGE
 _SIGNINGMESSAGE_ERRORCODE_ERRORCODEENUM.containing_type = _SIGNINGMESSAGE_ERRORCODE
 _SIGNINGMESSAGE_RAWMESSAGE.containing_type = _SIGNINGMESSAGE
+_SIGNINGMESSAGE_RAWMESSAGES.fields_by_name[
+    "raw_messages"
+].message_type = _SIGNINGMESSAGE_RAWMESSAGE
+_SIGNINGMESSAGE_RAWMESSAGES.containing_type = _SIGNINGMESSAGE
 _SIGNINGMESSAGE_RAWTRANSACTION.containing_type = _SIGNINGMESSAGE
+_SIGNINGMESSAGE_RAWTRANSACTIONS.fields_by_name[
+    "raw_transactions"
+].message_type = _SIGNINGMESSAGE_RAWTRANSACTION
+_SIGNINGMESSAGE_RAWTRANSACTIONS.containing_type = _SIGNINGMESSAGE
 _SIGNINGMESSAGE_SIGNEDMESSAGE.containing_type = _SIGNINGMESSAGE
+_SIGNINGMESSAGE_SIGNEDMESSAGES.fields_by_name[
+    "signed_messages"
+].message_type = _SIGNINGMESSAGE_SIGNEDMESSAGE
+_SIGNINGMESSAGE_SIGNEDMESSAGES.containing_type = _SIGNINGMESSAGE
 _SIGNINGMESSAGE_SIGNEDTRANSACTION.containing_type = _SIGNINGMESSAGE
+_SIGNINGMESSAGE_SIGNEDTRANSACTIONS.fields_by_name[
+    "signed_transactions"
+].message_type = _SIGNINGMESSAGE_SIGNEDTRANSACTION
+_SIGNINGMESSAGE_SIGNEDTRANSACTIONS.containing_type = _SIGNINGMESSAGE
 _SIGNINGMESSAGE_TERMS.containing_type = _SIGNINGMESSAGE
 _SIGNINGMESSAGE_SIGN_TRANSACTION_PERFORMATIVE.fields_by_name[
     "terms"
@@ -693,6 +1151,20 @@ _SIGNINGMESSAGE_SIGN_MESSAGE_PERFORMATIVE.fields_by_name[
     "raw_message"
 ].message_type = _SIGNINGMESSAGE_RAWMESSAGE
 _SIGNINGMESSAGE_SIGN_MESSAGE_PERFORMATIVE.containing_type = _SIGNINGMESSAGE
+_SIGNINGMESSAGE_SIGN_TRANSACTIONS_PERFORMATIVE.fields_by_name[
+    "terms"
+].message_type = _SIGNINGMESSAGE_TERMS
+_SIGNINGMESSAGE_SIGN_TRANSACTIONS_PERFORMATIVE.fields_by_name[
+    "raw_transactions"
+].message_type = _SIGNINGMESSAGE_RAWTRANSACTIONS
+_SIGNINGMESSAGE_SIGN_TRANSACTIONS_PERFORMATIVE.containing_type = _SIGNINGMESSAGE
+_SIGNINGMESSAGE_SIGN_MESSAGES_PERFORMATIVE.fields_by_name[
+    "terms"
+].message_type = _SIGNINGMESSAGE_TERMS
+_SIGNINGMESSAGE_SIGN_MESSAGES_PERFORMATIVE.fields_by_name[
+    "raw_messages"
+].message_type = _SIGNINGMESSAGE_RAWMESSAGES
+_SIGNINGMESSAGE_SIGN_MESSAGES_PERFORMATIVE.containing_type = _SIGNINGMESSAGE
 _SIGNINGMESSAGE_SIGNED_TRANSACTION_PERFORMATIVE.fields_by_name[
     "signed_transaction"
 ].message_type = _SIGNINGMESSAGE_SIGNEDTRANSACTION
@@ -701,6 +1173,14 @@ _SIGNINGMESSAGE_SIGNED_MESSAGE_PERFORMATIVE.fields_by_name[
     "signed_message"
 ].message_type = _SIGNINGMESSAGE_SIGNEDMESSAGE
 _SIGNINGMESSAGE_SIGNED_MESSAGE_PERFORMATIVE.containing_type = _SIGNINGMESSAGE
+_SIGNINGMESSAGE_SIGNED_TRANSACTIONS_PERFORMATIVE.fields_by_name[
+    "signed_transactions"
+].message_type = _SIGNINGMESSAGE_SIGNEDTRANSACTIONS
+_SIGNINGMESSAGE_SIGNED_TRANSACTIONS_PERFORMATIVE.containing_type = _SIGNINGMESSAGE
+_SIGNINGMESSAGE_SIGNED_MESSAGES_PERFORMATIVE.fields_by_name[
+    "signed_messages"
+].message_type = _SIGNINGMESSAGE_SIGNEDMESSAGES
+_SIGNINGMESSAGE_SIGNED_MESSAGES_PERFORMATIVE.containing_type = _SIGNINGMESSAGE
 _SIGNINGMESSAGE_ERROR_PERFORMATIVE.fields_by_name[
     "error_code"
 ].message_type = _SIGNINGMESSAGE_ERRORCODE
@@ -720,6 +1200,18 @@ _SIGNINGMESSAGE.fields_by_name[
 _SIGNINGMESSAGE.fields_by_name[
     "signed_transaction"
 ].message_type = _SIGNINGMESSAGE_SIGNED_TRANSACTION_PERFORMATIVE
+_SIGNINGMESSAGE.fields_by_name[
+    "sign_messages"
+].message_type = _SIGNINGMESSAGE_SIGN_MESSAGES_PERFORMATIVE
+_SIGNINGMESSAGE.fields_by_name[
+    "sign_transactions"
+].message_type = _SIGNINGMESSAGE_SIGN_TRANSACTIONS_PERFORMATIVE
+_SIGNINGMESSAGE.fields_by_name[
+    "signed_messages"
+].message_type = _SIGNINGMESSAGE_SIGNED_MESSAGES_PERFORMATIVE
+_SIGNINGMESSAGE.fields_by_name[
+    "signed_transactions"
+].message_type = _SIGNINGMESSAGE_SIGNED_TRANSACTIONS_PERFORMATIVE
 _SIGNINGMESSAGE.oneofs_by_name["performative"].fields.append(
     _SIGNINGMESSAGE.fields_by_name["error"]
 )
@@ -750,6 +1242,30 @@ _SIGNINGMESSAGE.oneofs_by_name["performative"].fields.append(
 _SIGNINGMESSAGE.fields_by_name[
     "signed_transaction"
 ].containing_oneof = _SIGNINGMESSAGE.oneofs_by_name["performative"]
+_SIGNINGMESSAGE.oneofs_by_name["performative"].fields.append(
+    _SIGNINGMESSAGE.fields_by_name["sign_messages"]
+)
+_SIGNINGMESSAGE.fields_by_name[
+    "sign_messages"
+].containing_oneof = _SIGNINGMESSAGE.oneofs_by_name["performative"]
+_SIGNINGMESSAGE.oneofs_by_name["performative"].fields.append(
+    _SIGNINGMESSAGE.fields_by_name["sign_transactions"]
+)
+_SIGNINGMESSAGE.fields_by_name[
+    "sign_transactions"
+].containing_oneof = _SIGNINGMESSAGE.oneofs_by_name["performative"]
+_SIGNINGMESSAGE.oneofs_by_name["performative"].fields.append(
+    _SIGNINGMESSAGE.fields_by_name["signed_messages"]
+)
+_SIGNINGMESSAGE.fields_by_name[
+    "signed_messages"
+].containing_oneof = _SIGNINGMESSAGE.oneofs_by_name["performative"]
+_SIGNINGMESSAGE.oneofs_by_name["performative"].fields.append(
+    _SIGNINGMESSAGE.fields_by_name["signed_transactions"]
+)
+_SIGNINGMESSAGE.fields_by_name[
+    "signed_transactions"
+].containing_oneof = _SIGNINGMESSAGE.oneofs_by_name["performative"]
 DESCRIPTOR.message_types_by_name["SigningMessage"] = _SIGNINGMESSAGE
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
@@ -763,7 +1279,7 @@ SigningMessage = _reflection.GeneratedProtocolMessageType(
             {
                 "DESCRIPTOR": _SIGNINGMESSAGE_ERRORCODE,
                 "__module__": "signing_pb2"
-                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_0_0.SigningMessage.ErrorCode)
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.ErrorCode)
             },
         ),
         "RawMessage": _reflection.GeneratedProtocolMessageType(
@@ -772,7 +1288,16 @@ SigningMessage = _reflection.GeneratedProtocolMessageType(
             {
                 "DESCRIPTOR": _SIGNINGMESSAGE_RAWMESSAGE,
                 "__module__": "signing_pb2"
-                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_0_0.SigningMessage.RawMessage)
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.RawMessage)
+            },
+        ),
+        "RawMessages": _reflection.GeneratedProtocolMessageType(
+            "RawMessages",
+            (_message.Message,),
+            {
+                "DESCRIPTOR": _SIGNINGMESSAGE_RAWMESSAGES,
+                "__module__": "signing_pb2"
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.RawMessages)
             },
         ),
         "RawTransaction": _reflection.GeneratedProtocolMessageType(
@@ -781,7 +1306,16 @@ SigningMessage = _reflection.GeneratedProtocolMessageType(
             {
                 "DESCRIPTOR": _SIGNINGMESSAGE_RAWTRANSACTION,
                 "__module__": "signing_pb2"
-                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_0_0.SigningMessage.RawTransaction)
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.RawTransaction)
+            },
+        ),
+        "RawTransactions": _reflection.GeneratedProtocolMessageType(
+            "RawTransactions",
+            (_message.Message,),
+            {
+                "DESCRIPTOR": _SIGNINGMESSAGE_RAWTRANSACTIONS,
+                "__module__": "signing_pb2"
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.RawTransactions)
             },
         ),
         "SignedMessage": _reflection.GeneratedProtocolMessageType(
@@ -790,7 +1324,16 @@ SigningMessage = _reflection.GeneratedProtocolMessageType(
             {
                 "DESCRIPTOR": _SIGNINGMESSAGE_SIGNEDMESSAGE,
                 "__module__": "signing_pb2"
-                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_0_0.SigningMessage.SignedMessage)
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.SignedMessage)
+            },
+        ),
+        "SignedMessages": _reflection.GeneratedProtocolMessageType(
+            "SignedMessages",
+            (_message.Message,),
+            {
+                "DESCRIPTOR": _SIGNINGMESSAGE_SIGNEDMESSAGES,
+                "__module__": "signing_pb2"
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.SignedMessages)
             },
         ),
         "SignedTransaction": _reflection.GeneratedProtocolMessageType(
@@ -799,7 +1342,16 @@ SigningMessage = _reflection.GeneratedProtocolMessageType(
             {
                 "DESCRIPTOR": _SIGNINGMESSAGE_SIGNEDTRANSACTION,
                 "__module__": "signing_pb2"
-                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_0_0.SigningMessage.SignedTransaction)
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.SignedTransaction)
+            },
+        ),
+        "SignedTransactions": _reflection.GeneratedProtocolMessageType(
+            "SignedTransactions",
+            (_message.Message,),
+            {
+                "DESCRIPTOR": _SIGNINGMESSAGE_SIGNEDTRANSACTIONS,
+                "__module__": "signing_pb2"
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.SignedTransactions)
             },
         ),
         "Terms": _reflection.GeneratedProtocolMessageType(
@@ -808,7 +1360,7 @@ SigningMessage = _reflection.GeneratedProtocolMessageType(
             {
                 "DESCRIPTOR": _SIGNINGMESSAGE_TERMS,
                 "__module__": "signing_pb2"
-                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_0_0.SigningMessage.Terms)
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.Terms)
             },
         ),
         "Sign_Transaction_Performative": _reflection.GeneratedProtocolMessageType(
@@ -817,7 +1369,7 @@ SigningMessage = _reflection.GeneratedProtocolMessageType(
             {
                 "DESCRIPTOR": _SIGNINGMESSAGE_SIGN_TRANSACTION_PERFORMATIVE,
                 "__module__": "signing_pb2"
-                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_0_0.SigningMessage.Sign_Transaction_Performative)
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Transaction_Performative)
             },
         ),
         "Sign_Message_Performative": _reflection.GeneratedProtocolMessageType(
@@ -826,7 +1378,25 @@ SigningMessage = _reflection.GeneratedProtocolMessageType(
             {
                 "DESCRIPTOR": _SIGNINGMESSAGE_SIGN_MESSAGE_PERFORMATIVE,
                 "__module__": "signing_pb2"
-                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_0_0.SigningMessage.Sign_Message_Performative)
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Message_Performative)
+            },
+        ),
+        "Sign_Transactions_Performative": _reflection.GeneratedProtocolMessageType(
+            "Sign_Transactions_Performative",
+            (_message.Message,),
+            {
+                "DESCRIPTOR": _SIGNINGMESSAGE_SIGN_TRANSACTIONS_PERFORMATIVE,
+                "__module__": "signing_pb2"
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Transactions_Performative)
+            },
+        ),
+        "Sign_Messages_Performative": _reflection.GeneratedProtocolMessageType(
+            "Sign_Messages_Performative",
+            (_message.Message,),
+            {
+                "DESCRIPTOR": _SIGNINGMESSAGE_SIGN_MESSAGES_PERFORMATIVE,
+                "__module__": "signing_pb2"
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.Sign_Messages_Performative)
             },
         ),
         "Signed_Transaction_Performative": _reflection.GeneratedProtocolMessageType(
@@ -835,7 +1405,7 @@ SigningMessage = _reflection.GeneratedProtocolMessageType(
             {
                 "DESCRIPTOR": _SIGNINGMESSAGE_SIGNED_TRANSACTION_PERFORMATIVE,
                 "__module__": "signing_pb2"
-                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_0_0.SigningMessage.Signed_Transaction_Performative)
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.Signed_Transaction_Performative)
             },
         ),
         "Signed_Message_Performative": _reflection.GeneratedProtocolMessageType(
@@ -844,7 +1414,25 @@ SigningMessage = _reflection.GeneratedProtocolMessageType(
             {
                 "DESCRIPTOR": _SIGNINGMESSAGE_SIGNED_MESSAGE_PERFORMATIVE,
                 "__module__": "signing_pb2"
-                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_0_0.SigningMessage.Signed_Message_Performative)
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.Signed_Message_Performative)
+            },
+        ),
+        "Signed_Transactions_Performative": _reflection.GeneratedProtocolMessageType(
+            "Signed_Transactions_Performative",
+            (_message.Message,),
+            {
+                "DESCRIPTOR": _SIGNINGMESSAGE_SIGNED_TRANSACTIONS_PERFORMATIVE,
+                "__module__": "signing_pb2"
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.Signed_Transactions_Performative)
+            },
+        ),
+        "Signed_Messages_Performative": _reflection.GeneratedProtocolMessageType(
+            "Signed_Messages_Performative",
+            (_message.Message,),
+            {
+                "DESCRIPTOR": _SIGNINGMESSAGE_SIGNED_MESSAGES_PERFORMATIVE,
+                "__module__": "signing_pb2"
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.Signed_Messages_Performative)
             },
         ),
         "Error_Performative": _reflection.GeneratedProtocolMessageType(
@@ -853,25 +1441,33 @@ SigningMessage = _reflection.GeneratedProtocolMessageType(
             {
                 "DESCRIPTOR": _SIGNINGMESSAGE_ERROR_PERFORMATIVE,
                 "__module__": "signing_pb2"
-                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_0_0.SigningMessage.Error_Performative)
+                # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage.Error_Performative)
             },
         ),
         "DESCRIPTOR": _SIGNINGMESSAGE,
         "__module__": "signing_pb2"
-        # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_0_0.SigningMessage)
+        # @@protoc_insertion_point(class_scope:aea.open_aea.signing.v1_1_0.SigningMessage)
     },
 )
 _sym_db.RegisterMessage(SigningMessage)
 _sym_db.RegisterMessage(SigningMessage.ErrorCode)
 _sym_db.RegisterMessage(SigningMessage.RawMessage)
+_sym_db.RegisterMessage(SigningMessage.RawMessages)
 _sym_db.RegisterMessage(SigningMessage.RawTransaction)
+_sym_db.RegisterMessage(SigningMessage.RawTransactions)
 _sym_db.RegisterMessage(SigningMessage.SignedMessage)
+_sym_db.RegisterMessage(SigningMessage.SignedMessages)
 _sym_db.RegisterMessage(SigningMessage.SignedTransaction)
+_sym_db.RegisterMessage(SigningMessage.SignedTransactions)
 _sym_db.RegisterMessage(SigningMessage.Terms)
 _sym_db.RegisterMessage(SigningMessage.Sign_Transaction_Performative)
 _sym_db.RegisterMessage(SigningMessage.Sign_Message_Performative)
+_sym_db.RegisterMessage(SigningMessage.Sign_Transactions_Performative)
+_sym_db.RegisterMessage(SigningMessage.Sign_Messages_Performative)
 _sym_db.RegisterMessage(SigningMessage.Signed_Transaction_Performative)
 _sym_db.RegisterMessage(SigningMessage.Signed_Message_Performative)
+_sym_db.RegisterMessage(SigningMessage.Signed_Transactions_Performative)
+_sym_db.RegisterMessage(SigningMessage.Signed_Messages_Performative)
 _sym_db.RegisterMessage(SigningMessage.Error_Performative)
 
 
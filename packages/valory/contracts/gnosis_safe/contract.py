@@ -22,14 +22,17 @@ import binascii
 import logging
 import secrets
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
 
 from aea.common import JSONLike
 from aea.configurations.base import PublicId
 from aea.contracts.base import Contract
 from aea.crypto.base import LedgerApi
 from aea_ledger_ethereum import EthereumApi
+from eth_abi import decode_abi, encode_abi
+from eth_abi.exceptions import DecodingError
 from eth_typing import ChecksumAddress, HexAddress, HexStr
+from eth_utils import keccak, to_checksum_address
 from hexbytes import HexBytes
 from packaging.version import Version
 from py_eth_sig_utils.eip712 import encode_typed_data
@@ -47,9 +50,213 @@ NULL_ADDRESS: str = "0x" + "0" * 40
 SAFE_CONTRACT = "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"
 DEFAULT_CALLBACK_HANDLER = "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"
 PROXY_FACTORY_CONTRACT = "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"
+# the MultiSendCallOnly contract of the v1.3.0 deployments; the Safe must
+# delegate call it, and it rejects the delegate calls among its transactions
+MULTISEND_CALL_ONLY_CONTRACT = "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"
+MULTISEND_SELECTOR = keccak(text="multiSend(bytes)")[:4]
+REVERT_SELECTOR = keccak(text="Error(string)")[:4]
+# the fields of a transaction a simulation depends on
+SIMULATED_FIELDS = ("from", "to", "value", "data")
 SAFE_DEPLOYED_BYTECODE = "0x608060405273ffffffffffffffffffffffffffffffffffffffff600054167fa619486e0000000000000000000000000000000000000000000000000000000060003514156050578060005260206000f35b3660008037600080366000845af43d6000803e60008114156070573d6000fd5b3d6000f3fea2646970667358221220d1429297349653a4918076d650332de1a1068c5f3e07c5c82360c277770b955264736f6c63430007060033"
 
 
+# the events emitted by the Safe when its owners or threshold change
+OWNERS_EVENT_SIGNATURES = (
+    "AddedOwner(address)",
+    "RemovedOwner(address)",
+    "ChangedThreshold(uint256)",
+)
+
+
+class SafeMetadata:  # pylint: disable=too-few-public-methods
+    """The metadata of a deployed Safe."""
+
+    __slots__ = ("chain_id", "version", "owners", "threshold", "owners_filter_id")
+
+    def __init__(self, chain_id: int, version: str) -> None:
+        """Initialize the metadata."""
+        self.chain_id = chain_id
+        self.version = version
+        self.owners: Optional[List[str]] = None
+        self.threshold: Optional[int] = None
+        self.owners_filter_id: Optional[str] = None
+
+
+class SafeMetadataCache:
+    """
+    A cache of Safe metadata, keyed by (chain id, Safe address).
+
+    The chain id and the Safe version never change, so they are read once.
+    The owners and the threshold only change through Safe transactions, so
+    they are read again only when a log filter on the Safe reports one of the
+    events emitted by such a transaction.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._chain_ids: Dict[str, int] = {}
+        self._entries: Dict[Tuple[int, str], SafeMetadata] = {}
+        self.rpcs_saved = 0
+
+    @staticmethod
+    def _endpoint(ledger_api: EthereumApi) -> str:
+        """Get a key identifying the node a ledger API talks to."""
+        provider = ledger_api.api.provider
+        return str(getattr(provider, "endpoint_uri", None) or id(provider))
+
+    def get_chain_id(self, ledger_api: EthereumApi) -> int:
+        """Get the chain id of the node of a ledger API."""
+        endpoint = self._endpoint(ledger_api)
+        chain_id = self._chain_ids.get(endpoint)
+        if chain_id is None:
+            chain_id = ledger_api.api.eth.chainId
+            self._chain_ids[endpoint] = chain_id
+        else:
+            self.rpcs_saved += 1
+        return chain_id
+
+    def get(self, ledger_api: EthereumApi, safe_contract: Any) -> SafeMetadata:
+        """
+        Get the metadata of a Safe, reading its version if not cached.
+
+        :param ledger_api: the ledger API object
+        :param safe_contract: the web3 instance of the Safe contract
+        :return: the metadata
+        """
+        chain_id = self.get_chain_id(ledger_api)
+        metadata = self._entries.get((chain_id, safe_contract.address))
+        if metadata is None:
+            metadata = SafeMetadata(
+                chain_id,
+                safe_contract.functions.VERSION().call(block_identifier="latest"),
+            )
+            self._entries[(chain_id, safe_contract.address)] = metadata
+        else:
+            self.rpcs_saved += 1
+        return metadata
+
+    def get_owners(
+        self, ledger_api: EthereumApi, safe_contract: Any
+    ) -> Tuple[List[str], int]:
+        """
+        Get the owners and the threshold of a Safe.
+
+        :param ledger_api: the ledger API object
+        :param safe_contract: the web3 instance of the Safe contract
+        :return: the owners and the threshold
+        """
+        metadata = self.get(ledger_api, safe_contract)
+        if metadata.owners is not None and not self._owners_changed(
+            ledger_api, safe_contract, metadata
+        ):
+            # one filter poll instead of the two calls
+            self.rpcs_saved += 1
+            return metadata.owners, cast(int, metadata.threshold)
+        if metadata.owners_filter_id is None:
+            metadata.owners_filter_id = ledger_api.api.eth.filter(
+                {
+                    "address": safe_contract.address,
+                    "topics": [
+                        [
+                            ledger_api.api.keccak(text=signature).hex()
+                            for signature in OWNERS_EVENT_SIGNATURES
+                        ]
+                    ],
+                }
+            ).filter_id
+        metadata.owners = safe_contract.functions.getOwners().call(
+            block_identifier="latest"
+        )
+        metadata.threshold = safe_contract.functions.getThreshold().call(
+            block_identifier="latest"
+        )
+        return cast(List[str], metadata.owners), cast(int, metadata.threshold)
+
+    @staticmethod
+    def _owners_changed(
+        ledger_api: EthereumApi, safe_contract: Any, metadata: SafeMetadata
+    ) -> bool:
+        """Check whether the owners or the threshold of a Safe changed."""
+        try:
+            changes = ledger_api.api.eth.getFilterChanges(metadata.owners_filter_id)
+        except ValueError:
+            # nodes drop filters that are not polled for a while
+            _logger.info(f"owners filter of Safe {safe_contract.address} expired.")
+            metadata.owners_filter_id = None
+            return True
+        return len(changes) > 0
+
+
+class SafeSimulationCache:
+    """
+    A cache of the simulations of Safe transactions, keyed by (chain id, transaction, block).
+
+    A simulation only holds on top of the block it was run against, so only
+    the simulations against the latest block seen are kept.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._block: Optional[int] = None
+        self._entries: Dict[Tuple[int, bytes], JSONLike] = {}
+        self.n_hits = 0
+
+    @staticmethod
+    def get_key(chain_id: int, transaction: Dict[str, Any]) -> Tuple[int, bytes]:
+        """
+        Get the key of a transaction.
+
+        :param chain_id: the chain id.
+        :param transaction: the fields of the call simulated.
+        :return: the key, made of the chain id and a digest of the fields.
+        """
+        fields = "|".join(
+            f"{name}={transaction.get(name)}" for name in SIMULATED_FIELDS
+        )
+        return chain_id, keccak(text=fields)
+
+    def get(self, key: Tuple[int, bytes], block: int) -> Optional[JSONLike]:
+        """Get the simulation of a transaction against a block, if cached."""
+        if block != self._block:
+            return None
+        simulation = self._entries.get(key)
+        if simulation is not None:
+            self.n_hits += 1
+        return simulation
+
+    def put(self, key: Tuple[int, bytes], block: int, simulation: JSONLike) -> None:
+        """Cache the simulation of a transaction against a block."""
+        if self._block is None or block > self._block:
+            self._block = block
+            self._entries = {}
+        if block == self._block:
+            self._entries[key] = simulation
+
+
+def get_revert_reason(error: ValueError) -> Optional[str]:
+    """
+    Get the reason of a reverted call from the error raised by web3.
+
+    :param error: the error raised for the JSON-RPC error response.
+    :return: the reason, decoded from the 'Error(string)' data if any; None if the error is not a revert.
+    """
+    details = error.args[0] if len(error.args) > 0 else None
+    if not isinstance(details, dict):
+        details = {"message": str(details)}
+    message = str(details.get("message", ""))
+    data = details.get("data")
+    if isinstance(data, str) and HexBytes(data)[:4] == REVERT_SELECTOR:
+        try:
+            (reason,) = decode_abi(["string"], bytes(HexBytes(data))[4:])
+            return reason
+        except DecodingError:  # pragma: nocover
+            pass
+    if "revert" not in message.lower() and data is None:
+        return None
+    _, _, reason = message.partition("execution reverted:")
+    return reason.strip() or message
+
+
 def _get_nonce() -> int:
     """Generate a nonce for the Safe deployment."""
     return secrets.SystemRandom().randint(0, 2 ** 256 - 1)
@@ -72,6 +279,58 @@ class GnosisSafeContract(Contract):
     """The Gnosis Safe contract."""
 
     contract_id = PUBLIC_ID
+    metadata_cache = SafeMetadataCache()
+    simulation_cache = SafeSimulationCache()
+
+    @staticmethod
+    def encode_multisend(transactions: Sequence[Tuple[int, str, int, Any]]) -> str:
+        """
+        Encode transactions into the data of a MultiSend call.
+
+        The Safe executes the call with a delegate call to the MultiSend
+        contract, so each transaction is sent by the Safe, with its own value.
+
+        :param transactions: the (operation, to address, value, data) of each transaction; data as bytes or hex encoded
+        :return: the data of the 'multiSend' call, hex encoded
+        """
+        packed = b""
+        for operation, to_address, value, data in transactions:
+            data_bytes = bytes(HexBytes(data))
+            packed += (
+                operation.to_bytes(1, "big")
+                + bytes(HexBytes(to_address))
+                + value.to_bytes(32, "big")
+                + len(data_bytes).to_bytes(32, "big")
+                + data_bytes
+            )
+        return "0x" + (MULTISEND_SELECTOR + encode_abi(["bytes"], [packed])).hex()
+
+    @staticmethod
+    def decode_multisend(data: Any) -> List[Tuple[int, str, int, bytes]]:
+        """
+        Decode the transactions of the data of a MultiSend call.
+
+        :param data: the data of the 'multiSend' call, as bytes or hex encoded
+        :return: the (operation, to address, value, data) of each transaction
+        """
+        data_bytes = bytes(HexBytes(data))
+        if data_bytes[:4] != MULTISEND_SELECTOR:
+            raise ValueError("not a 'multiSend' call")
+        (packed,) = decode_abi(["bytes"], data_bytes[4:])
+        transactions = []
+        offset = 0
+        while offset < len(packed):
+            length = int.from_bytes(packed[offset + 53 : offset + 85], "big")
+            transactions.append(
+                (
+                    packed[offset],
+                    to_checksum_address(packed[offset + 1 : offset + 21]),
+                    int.from_bytes(packed[offset + 21 : offset + 53], "big"),
+                    packed[offset + 85 : offset + 85 + length],
+                )
+            )
+            offset += 85 + length
+        return transactions
 
     @classmethod
     def get_raw_transaction(
@@ -244,6 +503,54 @@ class GnosisSafeContract(Contract):
         )
         return tx_params, contract_address
 
+    @classmethod
+    def get_safe_domain(cls, ledger_api: LedgerApi, contract_address: str) -> JSONLike:
+        """
+        Get the EIP-712 domain of the Safe.
+
+        :param ledger_api: the ledger API object
+        :param contract_address: the contract address
+        :return: the chain id and the Safe version
+        """
+        ledger_api = cast(EthereumApi, ledger_api)
+        safe_contract = cls.get_instance(ledger_api, contract_address)
+        metadata = cls.metadata_cache.get(ledger_api, safe_contract)
+        return dict(chain_id=metadata.chain_id, safe_version=metadata.version)
+
+    @classmethod
+    def get_nonces(
+        cls, ledger_api: LedgerApi, contract_address: str, sender_address: str
+    ) -> JSONLike:
+        """
+        Get the current nonces of the Safe and of an account sending its transactions.
+
+        :param ledger_api: the ledger API object
+        :param contract_address: the contract address
+        :param sender_address: the address of the sender
+        :return: the Safe nonce and the transaction count of the sender
+        """
+        ledger_api = cast(EthereumApi, ledger_api)
+        safe_contract = cls.get_instance(ledger_api, contract_address)
+        safe_nonce = safe_contract.functions.nonce().call(block_identifier="latest")
+        sender_nonce = ledger_api.api.eth.getTransactionCount(
+            ledger_api.api.toChecksumAddress(sender_address)
+        )
+        return dict(safe_nonce=safe_nonce, sender_nonce=sender_nonce)
+
+    @classmethod
+    def get_safe_owners(cls, ledger_api: LedgerApi, contract_address: str) -> JSONLike:
+        """
+        Get the owners and the threshold of the Safe.
+
+        :param ledger_api: the ledger API object
+        :param contract_address: the contract address
+        :return: the owners and the threshold
+        """
+        ledger_api = cast(EthereumApi, ledger_api)
+        safe_contract = cls.get_instance(ledger_api, contract_address)
+        owners, threshold = cls.metadata_cache.get_owners(ledger_api, safe_contract)
+        return dict(owners=owners, threshold=threshold)
+
     @classmethod
     def get_raw_safe_transaction_hash(  # pylint: disable=too-many-arguments,too-many-locals
         cls,
@@ -284,15 +591,16 @@ class GnosisSafeContract(Contract):
         :param chain_id: Ethereum network chain_id is used in hash calculation for Safes >= 1.3.0. If not provided, it will be retrieved from the provided ethereum_client
         :return: the hash of the raw Safe transaction
         """
+        ledger_api = cast(EthereumApi, ledger_api)
         safe_contract = cls.get_instance(ledger_api, contract_address)
         if safe_nonce is None:
             safe_nonce = safe_contract.functions.nonce().call(block_identifier="latest")
-        if safe_version is None:
-            safe_version = safe_contract.functions.VERSION().call(
-                block_identifier="latest"
+        if safe_version is None or chain_id is None:
+            metadata = cls.metadata_cache.get(ledger_api, safe_contract)
+            safe_version = (
+                safe_version if safe_version is not None else metadata.version
             )
-        if chain_id is None:
-            chain_id = ledger_api.api.eth.chainId
+            chain_id = chain_id if chain_id is not None else metadata.chain_id
 
         data_ = HexBytes(data).hex()
 
@@ -365,6 +673,9 @@ class GnosisSafeContract(Contract):
         refund_receiver: str = NULL_ADDRESS,
         safe_nonce: Optional[int] = None,
         safe_version: Optional[str] = None,
+        nonce: Optional[int] = None,
+        gas: Optional[int] = None,
+        fees: Optional[Dict[str, int]] = None,
     ) -> JSONLike:
         """
         Get the raw Safe transaction
@@ -384,8 +695,11 @@ class GnosisSafeContract(Contract):
         :param gas_price: Gas price that should be used for the payment calculation
         :param gas_token: Token address (or `0x000..000` if ETH) that is used for the payment
         :param refund_receiver: Address of receiver of gas payment (or `0x000..000`  if tx.origin).
-        :param safe_nonce: Current nonce of the Safe. If not provided, it will be retrieved from network
-        :param safe_version: Safe version 1.0.0 renamed `baseGas` to `dataGas`. Safe version 1.3.0 added `chainId` to the `domainSeparator`. If not provided, it will be retrieved from network
+        :param safe_nonce: Unused, kept for backward compatibility: the nonce is only part of the signed hash
+        :param safe_version: Unused, kept for backward compatibility: the version is only part of the signed hash
+        :param nonce: the nonce of the sender's transaction. If not provided, it will be retrieved from network
+        :param gas: the gas limit of the sender's transaction. If not provided, it will be estimated and padded
+        :param fees: the 'gasPrice', or the 'maxFeePerGas' and 'maxPriorityFeePerGas', of the sender's transaction. If not provided, the gas price is read from the network
         :return: the raw Safe transaction
         """
         ledger_api = cast(EthereumApi, ledger_api)
@@ -400,13 +714,8 @@ class GnosisSafeContract(Contract):
         # Packed signature data ({bytes32 r}{bytes32 s}{uint8 v})
 
         safe_contract = cls.get_instance(ledger_api, contract_address)
-
-        if safe_nonce is None:
-            safe_nonce = safe_contract.functions.nonce().call(block_identifier="latest")
-        if safe_version is None:
-            safe_version = safe_contract.functions.VERSION().call(
-                block_identifier="latest"
-            )
+        # the nonce and the version only go into the hash signed by the owners
+        del safe_nonce, safe_version
 
         w3_tx = safe_contract.functions.execTransaction(
             to_address,
@@ -420,20 +729,188 @@ class GnosisSafeContract(Contract):
             refund_receiver,
             signatures,
         )
-        tx_gas_price = gas_price or ledger_api.api.eth.gasPrice
-        tx_parameters = {
+        tx_parameters: Dict[str, Any] = {
             "from": sender_address,
-            "gasPrice": tx_gas_price,
+            "chainId": cls.metadata_cache.get_chain_id(ledger_api),
         }
-        transaction_dict = w3_tx.buildTransaction(tx_parameters)
-        transaction_dict["gas"] = Wei(
-            max(transaction_dict["gas"] + 75000, base_gas + safe_tx_gas + 75000)
-        )
-        transaction_dict["nonce"] = ledger_api.api.eth.getTransactionCount(
-            ledger_api.api.toChecksumAddress(sender_address)
+        if fees is not None:
+            tx_parameters.update(fees)
+        else:
+            tx_parameters["gasPrice"] = gas_price or ledger_api.api.eth.gasPrice
+        if gas is not None:
+            # web3 only estimates the gas when it is missing
+            tx_parameters["gas"] = gas
+        transaction_dict = w3_tx.buildTransaction(cast(TxParams, tx_parameters))
+        if "maxFeePerGas" in tx_parameters:
+            # web3 versions without type-2 transactions fill in a gas price
+            transaction_dict.pop("gasPrice", None)
+        if gas is None:
+            transaction_dict["gas"] = Wei(
+                max(transaction_dict["gas"] + 75000, base_gas + safe_tx_gas + 75000)
+            )
+        transaction_dict["nonce"] = (
+            nonce
+            if nonce is not None
+            else ledger_api.api.eth.getTransactionCount(
+                ledger_api.api.toChecksumAddress(sender_address)
+            )
         )
         return transaction_dict
 
+    @classmethod
+    def simulate_safe_transaction(
+        cls,
+        ledger_api: LedgerApi,
+        contract_address: str,
+        transaction: Dict[str, Any],
+    ) -> JSONLike:
+        """
+        Simulate a raw Safe transaction against the pending block, with 'eth_call'.
+
+        With a non-zero safeTxGas, the Safe does not revert when the call it
+        executes fails, it returns false instead; the simulation succeeds
+        only if it returns true. The gas of a successful simulation is
+        estimated against the same block, and the reason a failed call
+        reverted is found by making the call from the Safe. Simulations are
+        cached by transaction and block, so a retry within a block costs one
+        call.
+
+        :param ledger_api: the ledger API object
+        :param contract_address: the contract address
+        :param transaction: the raw Safe transaction, as built by 'get_raw_safe_transaction'
+        :return: whether the transaction would succeed, the revert reason if it reverted, the revert reason of the call of the Safe if it failed, the estimated gas and the latest block
+        """
+        ledger_api = cast(EthereumApi, ledger_api)
+        call = cast(
+            TxParams,
+            {
+                name: transaction[name]
+                for name in SIMULATED_FIELDS
+                if name in transaction
+            },
+        )
+        key = cls.simulation_cache.get_key(
+            cls.metadata_cache.get_chain_id(ledger_api), cast(Dict[str, Any], call)
+        )
+        block = ledger_api.api.eth.blockNumber
+        simulation = cls.simulation_cache.get(key, block)
+        if simulation is not None:
+            return simulation
+        simulation = dict(
+            is_success=False,
+            revert_reason=None,
+            call_revert_reason=None,
+            gas=None,
+            block=block,
+        )
+        try:
+            output = ledger_api.api.eth.call(call, block_identifier="pending")
+            if len(output) >= 32 and int.from_bytes(output[:32], "big") == 1:
+                simulation["is_success"] = True
+                simulation["gas"] = ledger_api.api.eth.estimateGas(
+                    call, block_identifier="pending"
+                )
+            else:
+                simulation["call_revert_reason"] = cls._get_call_revert_reason(
+                    ledger_api, contract_address, transaction
+                )
+        except ValueError as e:
+            reason = get_revert_reason(e)
+            if reason is None:
+                # not a revert, but a failure of the node: not cached
+                raise
+            simulation["revert_reason"] = reason
+        cls.simulation_cache.put(key, block, simulation)
+        return simulation
+
+    @classmethod
+    def _get_call_revert_reason(
+        cls, ledger_api: EthereumApi, contract_address: str, transaction: Dict[str, Any]
+    ) -> str:
+        """
+        Get the reason the call executed by a Safe transaction reverted.
+
+        The Safe only emits an 'ExecutionFailure' event when its call fails,
+        so the call is made again from the Safe, against the pending block.
+        The transactions of a delegate call to 'multiSend' are made one by
+        one, so a failure caused by an earlier one is not found.
+
+        :param ledger_api: the ledger API object
+        :param contract_address: the contract address
+        :param transaction: the raw Safe transaction, as built by 'get_raw_safe_transaction'
+        :return: the revert reason of the first call which reverts with one; empty if none does
+        """
+        instance = cls.get_instance(ledger_api, contract_address)
+        _, args = instance.decode_function_input(transaction["data"])
+        calls = [(args["operation"], args["to"], args["value"], args["data"])]
+        if (
+            args["operation"] == SafeOperation.DELEGATE_CALL.value
+            and bytes(HexBytes(args["data"]))[:4] == MULTISEND_SELECTOR
+        ):
+            # any MultiSend deployment, whichever address the caller configured
+            calls = cls.decode_multisend(args["data"])
+        for operation, to_address, value, data in calls:
+            if operation != SafeOperation.CALL.value:
+                continue
+            call = {
+                "from": to_checksum_address(contract_address),
+                "to": to_checksum_address(to_address),
+                "value": value,
+                "data": HexBytes(data),
+            }
+            try:
+                ledger_api.api.eth.call(
+                    cast(TxParams, call), block_identifier="pending"
+                )
+            except ValueError as e:
+                reason = get_revert_reason(e)
+                if reason is None:
+                    raise
+                return reason
+        return ""
+
+    @classmethod
+    def get_mined_transaction(
+        cls,
+        ledger_api: LedgerApi,
+        contract_address: str,  # pylint: disable=unused-argument
+        tx_hashes: Sequence[str],
+    ) -> JSONLike:
+        """
+        Find which of the transactions sent with the same nonce was mined, if any.
+
+        The transactions replacing one another share their nonce, so at most
+        one of them is mined; they are looked up from the last one sent,
+        the most likely to be mined. The latest block header is read first,
+        so that the caller can track its deadlines in blocks.
+
+        :param ledger_api: the ledger API object
+        :param contract_address: the contract address
+        :param tx_hashes: the hashes of the transactions, in the order they were sent
+        :return: the number and timestamp of the latest block, and the hash, receipt and transaction of the mined one, if any
+        """
+        ledger_api = cast(EthereumApi, ledger_api)
+        header = ledger_api.api.eth.getBlock("latest")
+        result = dict(
+            block=header["number"],
+            timestamp=header["timestamp"],
+            tx_hash=None,
+            receipt=None,
+            transaction=None,
+        )
+        for tx_hash in reversed(tx_hashes):
+            # None while pending, or once replaced
+            receipt = ledger_api.get_transaction_receipt(tx_hash)
+            if receipt is None:
+                continue
+            result.update(
+                tx_hash=tx_hash,
+                receipt=receipt,
+                transaction=ledger_api.get_transaction(tx_hash),
+            )
+            break
+        return result
+
     @classmethod
     def verify_contract(cls, ledger_api: LedgerApi, contract_address: str) -> JSONLike:
         """
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Tests for the fee oracle of the ledger connection."""
+
+from typing import Any, List, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from packages.fetchai.connections.ledger.fees import (
+    FeeOracle,
+    LEGACY_BASE_FEE_HEADROOM,
+    METHOD_NOT_FOUND,
+)
+
+
+GWEI = 10 ** 9
+
+
+class FakeNode:
+    """A node whose blocks pay a priority fee of their number, in gwei, at every percentile."""
+
+    def __init__(self, latest: int, base_fee: int = 100 * GWEI) -> None:
+        """Initialize the node."""
+        self.latest = latest
+        self.base_fee = base_fee
+        self.fee_history_requests: List[Tuple[int, int]] = []
+        self.api = MagicMock()
+        self.api.api.manager.request_blocking.side_effect = self.request
+        self.api.api.eth.gasPrice = 42 * GWEI
+
+    def request(self, method: str, params: List[Any]) -> Any:
+        """Answer a JSON-RPC request."""
+        if method == "eth_blockNumber":
+            return hex(self.latest)
+        assert method == "eth_feeHistory"
+        n_blocks, newest = int(params[0], 16), int(params[1], 16)
+        self.fee_history_requests.append((n_blocks, newest))
+        oldest = newest + 1 - n_blocks
+        return {
+            "oldestBlock": hex(oldest),
+            "reward": [
+                [hex(number * GWEI)] * len(params[2])
+                for number in range(oldest, newest + 1)
+            ],
+            "baseFeePerGas": [hex(self.base_fee)] * (n_blocks + 1),
+        }
+
+
+class TestFeeOracle:
+    """Tests for the FeeOracle."""
+
+    def setup_method(self) -> None:
+        """Set up the tests."""
+        self.now = 0.0
+        self.node = FakeNode(latest=100)
+        self.oracle = FeeOracle(block_time=12.0, window_blocks=5, min_priority_fee=1)
+        self.oracle._clock = lambda: self.now  # pylint: disable=protected-access
+
+    def get_window(self) -> List[int]:
+        """Get the numbers of the blocks in the window of the oracle."""
+        return list(self.oracle._rewards)  # pylint: disable=protected-access
+
+    def get_gas_price(self) -> int:
+        """Get the legacy gas price handed out at the standard urgency."""
+        return self.oracle.get_fees(self.node.api, "standard")["gasPrice"]
+
+    def test_unknown_urgency(self) -> None:
+        """Test that an unknown urgency is refused."""
+        with pytest.raises(ValueError):
+            self.oracle.get_fees(self.node.api, "urgent")
+
+    def test_first_read_fills_the_window(self) -> None:
+        """Test that the first read takes the whole window, and pays its median."""
+        gas_price = self.get_gas_price()
+        assert self.node.fee_history_requests == [(5, 100)]
+        assert self.get_window() == [96, 97, 98, 99, 100]
+        assert gas_price == int(100 * GWEI * LEGACY_BASE_FEE_HEADROOM) + 98 * GWEI
+
+    def test_reads_throttled(self) -> None:
+        """Test that the chain is checked at most once per block time."""
+        self.get_gas_price()
+        self.node.latest = 101
+        self.now = 11.0
+        self.get_gas_price()
+        assert self.oracle.n_samples == 1
+        assert self.oracle.n_requests == 2
+        assert self.node.fee_history_requests == [(5, 100)]
+
+    def test_no_new_block(self) -> None:
+        """Test that the fee history is not read again without a new block."""
+        self.get_gas_price()
+        self.now = 12.0
+        self.get_gas_price()
+        assert self.node.fee_history_requests == [(5, 100)]
+        assert self.get_window() == [96, 97, 98, 99, 100]
+
+    def test_new_blocks_trim_the_window(self) -> None:
+        """Test that only the new blocks are read, and the oldest ones leave the window."""
+        self.get_gas_price()
+        self.node.latest = 102
+        self.now = 12.0
+        gas_price = self.get_gas_price()
+        assert self.node.fee_history_requests == [(5, 100), (2, 102)]
+        assert self.get_window() == [98, 99, 100, 101, 102]
+        assert gas_price == int(100 * GWEI * LEGACY_BASE_FEE_HEADROOM) + 100 * GWEI
+
+    def test_gap_longer_than_the_window(self) -> None:
+        """Test that after a long pause the window only holds the newest blocks."""
+        self.get_gas_price()
+        self.node.latest = 200
+        self.now = 600.0
+        self.get_gas_price()
+        assert self.node.fee_history_requests == [(5, 100), (5, 200)]
+        assert self.get_window() == [196, 197, 198, 199, 200]
+
+    def test_eip1559(self) -> None:
+        """Test that type-2 fees cap the fee at a multiple of the next base fee."""
+        self.oracle.eip1559 = True
+        assert self.oracle.get_fees(self.node.api, "background") == {
+            "maxFeePerGas": int(100 * GWEI * 1.25) + 98 * GWEI,
+            "maxPriorityFeePerGas": 98 * GWEI,
+        }
+
+    def test_min_priority_fee(self) -> None:
+        """Test that the priority fee is no less than the minimum."""
+        self.oracle.min_priority_fee = 1000 * GWEI
+        self.oracle.eip1559 = True
+        fees = self.oracle.get_fees(self.node.api, "competitive")
+        assert fees["maxPriorityFeePerGas"] == 1000 * GWEI
+
+    def test_read_error_keeps_the_window(self) -> None:
+        """Test that a failed read keeps the window read last, and is retried."""
+        self.get_gas_price()
+        self.node.latest = 101
+        self.now = 12.0
+        self.node.api.api.manager.request_blocking.side_effect = ValueError("timeout")
+        self.get_gas_price()
+        assert self.get_window() == [96, 97, 98, 99, 100]
+        self.node.api.api.manager.request_blocking.side_effect = self.node.request
+        self.get_gas_price()
+        assert self.get_window() == [97, 98, 99, 100, 101]
+
+    def test_fee_history_unsupported(self) -> None:
+        """Test that the node gas price is used on a chain without fee history."""
+        self.node.api.api.manager.request_blocking.side_effect = ValueError(
+            {"code": METHOD_NOT_FOUND, "message": "the method does not exist"}
+        )
+        assert self.get_gas_price() == 42 * GWEI
+        assert self.get_gas_price() == 42 * GWEI
+        assert self.node.api.api.manager.request_blocking.call_count == 1
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Tests for the endpoint pool of the ledger connection."""
+
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+from packages.fetchai.connections.ledger.pool import Endpoint, EndpointPool
+
+
+LEDGER_ID = "ethereum"
+
+
+class FakeProvider(BaseProvider):
+    """A provider which answers 'eth_blockNumber' with its head, unless it is down."""
+
+    def __init__(self, head: int = 100) -> None:
+        """Initialize the provider."""
+        super().__init__()
+        self.head = head
+        self.is_down = False
+        self.error: Optional[Dict[str, Any]] = None
+        self.requests: List[str] = []
+
+    def make_request(self, method: Any, params: Any) -> Dict[str, Any]:
+        """Make a JSON-RPC request."""
+        self.requests.append(method)
+        if self.is_down:
+            raise ConnectionError("connection refused")
+        if self.error is not None:
+            return {"jsonrpc": "2.0", "id": 1, "error": self.error}
+        return {"jsonrpc": "2.0", "id": 1, "result": hex(self.head)}
+
+
+class FakeApi:  # pylint: disable=too-few-public-methods
+    """A ledger API backed by web3."""
+
+    def __init__(self, provider: FakeProvider) -> None:
+        """Initialize the API."""
+        self.api = Web3(provider)
+
+
+class TestEndpointPool:
+    """Tests for the EndpointPool."""
+
+    def setup_method(self) -> None:
+        """Set up the tests."""
+        self.providers = [FakeProvider(), FakeProvider(), FakeProvider()]
+        self.pool = EndpointPool(logger=MagicMock())
+        configs = [
+            {"address": f"http://node{index}.io:8545/key", "index": index}
+            for index in range(len(self.providers))
+        ]
+        self.endpoints = self.pool.get_endpoints(
+            LEDGER_ID, configs, lambda config: FakeApi(self.providers[config["index"]])
+        )
+
+    def request(self, endpoint: Endpoint) -> int:
+        """Read the block number through the web3 instance of an endpoint."""
+        return endpoint.api.api.eth.blockNumber
+
+    def test_get_endpoints(self) -> None:
+        """Test that the endpoints are made once, labelled by host and port."""
+        assert [endpoint.label for endpoint in self.endpoints] == [
+            "node0.io:8545",
+            "node1.io:8545",
+            "node2.io:8545",
+        ]
+        assert self.pool.get_endpoints(LEDGER_ID, [], MagicMock()) is self.endpoints
+        assert self.pool.get_label(LEDGER_ID, self.endpoints[1].api) == "node1.io:8545"
+        assert self.pool.get_label(LEDGER_ID, MagicMock()) is None
+
+    def test_select(self) -> None:
+        """Test that requests go to the fastest endpoint, in the configured order until measured."""
+        assert self.pool.select(LEDGER_ID) is self.endpoints[0]
+        self.endpoints[0].latency = 0.3
+        self.endpoints[1].latency = 0.2
+        self.endpoints[2].latency = 0.1
+        assert self.pool.select(LEDGER_ID) is self.endpoints[2]
+
+    def test_select_skips_unhealthy_and_lagging(self) -> None:
+        """Test that unhealthy endpoints and those lagging behind are only used last."""
+        for endpoint, head in zip(self.endpoints, (100, 97, 99)):
+            endpoint.head = head
+        self.endpoints[0].is_healthy = False
+        assert self.pool.select(LEDGER_ID) is self.endpoints[2]
+        self.endpoints[2].is_healthy = False
+        # none is healthy and synced: the best one left
+        assert self.pool.select(LEDGER_ID) is self.endpoints[0]
+
+    def test_check(self) -> None:
+        """Test that a check reads the head of an endpoint and tracks its health."""
+        self.providers[0].head = 123
+        self.pool.check(self.endpoints[0])
+        assert self.endpoints[0].head == 123
+        assert self.endpoints[0].latency is not None
+
+        self.providers[0].is_down = True
+        self.pool.check(self.endpoints[0])
+        assert not self.endpoints[0].is_healthy
+        self.providers[0].is_down = False
+        self.pool.check(self.endpoints[0])
+        assert self.endpoints[0].is_healthy
+
+    def test_failover(self) -> None:
+        """Test that a call failing at the transport level is retried on the others."""
+        self.providers[0].is_down = True
+        self.providers[1].head = 101
+        assert self.request(self.endpoints[0]) == 101
+        assert not self.endpoints[0].is_healthy
+        assert self.pool.metrics.failovers.get(endpoint="node0.io:8545") == 1
+        assert self.providers[2].requests == []
+        assert self.pool.select(LEDGER_ID) is not self.endpoints[0]
+
+    def test_failover_skips_failing_endpoints(self) -> None:
+        """Test that the retries go on until an endpoint answers."""
+        self.providers[0].is_down = True
+        self.providers[1].is_down = True
+        self.providers[2].head = 102
+        assert self.request(self.endpoints[0]) == 102
+        assert not self.endpoints[1].is_healthy
+
+    def test_all_endpoints_down(self) -> None:
+        """Test that the error is raised when every endpoint fails."""
+        for provider in self.providers:
+            provider.is_down = True
+        with pytest.raises(ConnectionError):
+            self.request(self.endpoints[0])
+
+    def test_node_error_not_retried(self) -> None:
+        """Test that an error returned by the node is not retried elsewhere."""
+        self.providers[0].error = {"code": -32000, "message": "execution reverted"}
+        with pytest.raises(ValueError):
+            self.request(self.endpoints[0])
+        assert self.endpoints[0].is_healthy
+        assert self.providers[1].requests == []
+        assert self.pool.metrics.failovers.get(endpoint="node0.io:8545") == 0
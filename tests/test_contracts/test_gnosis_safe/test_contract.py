@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Tests for the gnosis_safe contract."""
+
+import pytest
+from eth_abi import encode_abi
+from eth_utils import keccak, to_checksum_address
+
+from packages.valory.contracts.gnosis_safe.contract import (
+    GnosisSafeContract,
+    SafeOperation,
+)
+
+
+TOKEN_ADDRESS = to_checksum_address("0x" + "7b" * 20)
+OTHER_ADDRESS = to_checksum_address("0x" + "c4" * 20)
+
+
+class TestMultiSend:
+    """Tests for the encoding of MultiSend calls."""
+
+    def test_encode(self) -> None:
+        """Test that the transactions are packed as the MultiSend contract expects."""
+        data = GnosisSafeContract.encode_multisend(
+            [(SafeOperation.CALL.value, TOKEN_ADDRESS, 5, "0xdeadbeef")]
+        )
+        packed = (
+            b"\x00"
+            + bytes.fromhex("7b" * 20)
+            + (5).to_bytes(32, "big")
+            + (4).to_bytes(32, "big")
+            + bytes.fromhex("deadbeef")
+        )
+        expected = keccak(text="multiSend(bytes)")[:4] + encode_abi(["bytes"], [packed])
+        assert data == "0x" + expected.hex()
+
+    def test_round_trip(self) -> None:
+        """Test that decoding the encoded transactions gives them back."""
+        transactions = [
+            (SafeOperation.CALL.value, TOKEN_ADDRESS, 10 ** 18, bytes(range(68))),
+            (SafeOperation.CALL.value, OTHER_ADDRESS, 0, b""),
+            (SafeOperation.DELEGATE_CALL.value, TOKEN_ADDRESS, 0, b"\x01" * 33),
+        ]
+        data = GnosisSafeContract.encode_multisend(transactions)
+        assert GnosisSafeContract.decode_multisend(data) == transactions
+        assert GnosisSafeContract.decode_multisend(bytes.fromhex(data[2:])) == (
+            transactions
+        )
+
+    def test_round_trip_hex_data(self) -> None:
+        """Test that hex encoded data is decoded as bytes."""
+        data = GnosisSafeContract.encode_multisend(
+            [(SafeOperation.CALL.value, TOKEN_ADDRESS.lower(), 1, "0x0102")]
+        )
+        assert GnosisSafeContract.decode_multisend(data) == [
+            (SafeOperation.CALL.value, TOKEN_ADDRESS, 1, b"\x01\x02")
+        ]
+
+    def test_empty(self) -> None:
+        """Test that an empty batch round-trips."""
+        data = GnosisSafeContract.encode_multisend([])
+        assert GnosisSafeContract.decode_multisend(data) == []
+
+    def test_decode_other_call(self) -> None:
+        """Test that the data of another call is not decoded."""
+        with pytest.raises(ValueError):
+            GnosisSafeContract.decode_multisend("0xa9059cbb" + "00" * 64)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Tests for the history of the monitor skill."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from packages.collectooor.skills.monitor.history import (
+    PeriodArchive,
+    PeriodHistory,
+    PeriodSummary,
+)
+
+
+def make_record(period_id: int) -> Dict[str, Any]:
+    """Make a period record which serializes to a fixed size."""
+    return {"period_id": period_id, "padding": "x" * 50}
+
+
+def read_records(path: Path) -> List[int]:
+    """Read the ids of the periods recorded in an archive file."""
+    return [json.loads(line)["period_id"] for line in path.read_text().splitlines()]
+
+
+def make_summary(period_id: int) -> PeriodSummary:
+    """Make the summary of a successful period."""
+    return PeriodSummary(period_id, 1, 10, 21000, 21000, "0x00", False, 5, {})
+
+
+class TestPeriodArchive:
+    """Tests for the PeriodArchive."""
+
+    def test_append(self, tmp_path: Path) -> None:
+        """Test that the records are appended as JSON lines."""
+        path = tmp_path / "periods.jsonl"
+        archive = PeriodArchive(str(path))
+        archive.append(make_record(0))
+        archive.append({"period_id": 1, "path": tmp_path})
+        assert read_records(path) == [0, 1]
+        assert json.loads(path.read_text().splitlines()[1])["path"] == str(tmp_path)
+
+    def test_rotation(self, tmp_path: Path) -> None:
+        """Test that the file is rotated before it grows too large, keeping the backups."""
+        path = tmp_path / "periods.jsonl"
+        line_size = len(json.dumps(make_record(0)) + "\n")
+        archive = PeriodArchive(str(path), max_bytes=2 * line_size, backups=2)
+        for period_id in range(7):
+            archive.append(make_record(period_id))
+        assert read_records(path) == [6]
+        assert read_records(tmp_path / "periods.jsonl.1") == [4, 5]
+        assert read_records(tmp_path / "periods.jsonl.2") == [2, 3]
+        assert not (tmp_path / "periods.jsonl.3").exists()
+
+    def test_rotation_without_backups(self, tmp_path: Path) -> None:
+        """Test that the file is truncated on rotation when no backup is kept."""
+        path = tmp_path / "periods.jsonl"
+        line_size = len(json.dumps(make_record(0)) + "\n")
+        archive = PeriodArchive(str(path), max_bytes=line_size, backups=0)
+        for period_id in range(3):
+            archive.append(make_record(period_id))
+        assert read_records(path) == [2]
+        assert [p.name for p in tmp_path.iterdir()] == ["periods.jsonl"]
+
+    def test_unbounded(self, tmp_path: Path) -> None:
+        """Test that the file is never rotated without a maximum size."""
+        path = tmp_path / "periods.jsonl"
+        archive = PeriodArchive(str(path), max_bytes=0)
+        for period_id in range(5):
+            archive.append(make_record(period_id))
+        assert read_records(path) == list(range(5))
+
+
+class TestPeriodHistory:
+    """Tests for the PeriodHistory."""
+
+    def test_invalid_size(self) -> None:
+        """Test that the history keeps at least one summary."""
+        with pytest.raises(ValueError):
+            PeriodHistory(max_size=0)
+
+    def test_add(self, tmp_path: Path) -> None:
+        """Test that only the most recent summaries are kept, while every record is archived."""
+        path = tmp_path / "periods.jsonl"
+        history = PeriodHistory(max_size=2, archive=PeriodArchive(str(path)))
+        for period_id in range(3):
+            history.add(make_summary(period_id), make_record(period_id))
+        assert len(history) == 2
+        assert [summary.period_id for summary in history] == [1, 2]
+        assert history.n_periods == 3
+        assert read_records(path) == [0, 1, 2]
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Tests for the journal of the monitor skill."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+from packages.collectooor.skills.monitor.journal import PeriodJournal
+
+
+def read_entries(path: Path) -> List[Dict[str, Any]]:
+    """Read the entries of a journal file."""
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestPeriodJournal:
+    """Tests for the PeriodJournal."""
+
+    def setup_method(self) -> None:
+        """Set up the tests."""
+        self.path: Path = Path()
+
+    def make_journal(self, tmp_path: Path, compact_after: int = 100) -> PeriodJournal:
+        """Make a journal in a temporary directory."""
+        self.path = tmp_path / "journal.jsonl"
+        return PeriodJournal(str(self.path), compact_after=compact_after)
+
+    def test_replay_empty(self, tmp_path: Path) -> None:
+        """Test that replaying a missing journal resumes nothing."""
+        journal = self.make_journal(tmp_path)
+        assert journal.replay() == {}
+        assert journal.last_period_id is None
+        assert self.path.read_text() == ""
+
+    def test_replay(self, tmp_path: Path) -> None:
+        """Test that the unfinished periods are resumed with their latest fields."""
+        journal = self.make_journal(tmp_path)
+        journal.record(2, stage="discovery")
+        journal.record(1, stage="discovery")
+        journal.record(1, stage="signature", project_id=7)
+        journal.record(3, stage="discovery")
+        journal.finish(3)
+        journal.close()
+
+        replayed = self.make_journal(tmp_path)
+        assert replayed.replay() == {
+            1: {"stage": "signature", "project_id": 7},
+            2: {"stage": "discovery"},
+        }
+        assert list(replayed.replay()) == [1, 2]
+        assert replayed.last_period_id == 3
+
+    def test_replay_compacts(self, tmp_path: Path) -> None:
+        """Test that replaying rewrites the journal with the unfinished periods only."""
+        journal = self.make_journal(tmp_path)
+        journal.record(1, stage="discovery")
+        journal.record(1, stage="signature")
+        journal.record(2, stage="discovery")
+        journal.finish(2)
+        journal.close()
+
+        self.make_journal(tmp_path).replay()
+        assert read_entries(self.path) == [
+            {"period_id": 1, "stage": "signature"},
+            {"period_id": 2, "finished": True},
+        ]
+
+    def test_replay_torn_tail(self, tmp_path: Path) -> None:
+        """Test that a line torn by a crash while appending is dropped."""
+        journal = self.make_journal(tmp_path)
+        journal.record(1, stage="discovery")
+        journal.close()
+        with open(self.path, "a") as f:
+            f.write('{"period_id": 1, "sta')
+
+        replayed = self.make_journal(tmp_path)
+        assert replayed.replay() == {1: {"stage": "discovery"}}
+        assert read_entries(self.path) == [{"period_id": 1, "stage": "discovery"}]
+
+    def test_compact_after_finished_periods(self, tmp_path: Path) -> None:
+        """Test that the journal is compacted once enough periods have finished."""
+        journal = self.make_journal(tmp_path, compact_after=2)
+        for period_id in range(3):
+            journal.record(period_id, stage="discovery")
+        journal.finish(0)
+        journal.sync()
+        assert len(read_entries(self.path)) == 4
+        journal.finish(1)
+        assert read_entries(self.path) == [{"period_id": 2, "stage": "discovery"}]
+
+        # the file is appended to again after the compaction
+        journal.record(3, stage="discovery")
+        journal.close()
+        assert read_entries(self.path)[-1] == {"period_id": 3, "stage": "discovery"}
+
+    def test_compact_keeps_the_last_period_id(self, tmp_path: Path) -> None:
+        """Test that the id of the last period survives once every period is finished."""
+        journal = self.make_journal(tmp_path, compact_after=1)
+        journal.record(5, stage="discovery")
+        journal.finish(5)
+        assert read_entries(self.path) == [{"period_id": 5, "finished": True}]
+
+        replayed = self.make_journal(tmp_path)
+        assert replayed.replay() == {}
+        assert replayed.last_period_id == 5
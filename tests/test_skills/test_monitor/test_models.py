@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the models of the monitor skill."""
+
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+from eth_account._utils.structured_data.hashing import hash_domain, hash_message
+from eth_utils import keccak
+from packaging.version import Version
+
+from packages.collectooor.skills.monitor.models import (
+    NonceManager,
+    PendingRequest,
+    Requests,
+    SafeTxHasher,
+    TimerWheel,
+)
+
+
+SAFE_ADDRESS = "0x" + "5a" * 20
+TO_ADDRESS = "0x" + "7b" * 20
+GAS_TOKEN = "0x" + "0c" * 20
+REFUND_RECEIVER = "0x" + "d1" * 20
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+    """A clock which only moves when told to."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        """Initialize the clock."""
+        self.now = now
+
+    def __call__(self) -> float:
+        """Get the current time."""
+        return self.now
+
+
+class TestTimerWheel:
+    """Tests for the TimerWheel."""
+
+    def setup_method(self) -> None:
+        """Set up the tests."""
+        self.clock = FakeClock(100.0)
+        self.wheel = TimerWheel(tick=1.0, wheel_size=8, clock=self.clock)
+
+    def test_invalid_arguments(self) -> None:
+        """Test that the tick and the size must be positive."""
+        with pytest.raises(ValueError):
+            TimerWheel(tick=0.0)
+        with pytest.raises(ValueError):
+            TimerWheel(wheel_size=0)
+
+    def test_expiry(self) -> None:
+        """Test that the keys expire once their deadline has passed, and only once."""
+        self.wheel.schedule("a", 102.0)
+        self.wheel.schedule("b", 104.0)
+        assert len(self.wheel) == 2
+        assert self.wheel.advance(101.5) == []
+        assert self.wheel.advance(102.0) == ["a"]
+        assert "a" not in self.wheel
+        assert self.wheel.advance(103.0) == []
+        assert self.wheel.advance(110.0) == ["b"]
+        assert len(self.wheel) == 0
+
+    def test_deadline_in_the_past(self) -> None:
+        """Test that a deadline in the past expires at the next tick."""
+        self.wheel.schedule("a", 50.0)
+        assert self.wheel.advance(100.5) == []
+        assert self.wheel.advance(101.0) == ["a"]
+
+    def test_deadline_beyond_one_rotation(self) -> None:
+        """Test that a key in the slot of an earlier tick waits for its own deadline."""
+        self.wheel.schedule("a", 100.0 + 8 + 2)
+        assert self.wheel.advance(102.0) == []
+        assert self.wheel.advance(109.0) == []
+        assert self.wheel.advance(110.0) == ["a"]
+
+    def test_long_pause(self) -> None:
+        """Test that advancing past several rotations expires every key."""
+        for index in range(5):
+            self.wheel.schedule(index, 101.0 + index)
+        assert sorted(self.wheel.advance(1000.0)) == list(range(5))
+
+    def test_cancel_and_reschedule(self) -> None:
+        """Test that a cancelled key does not expire, and a rescheduled one moves."""
+        self.wheel.schedule("a", 102.0)
+        self.wheel.schedule("b", 102.0)
+        assert self.wheel.cancel("a")
+        assert not self.wheel.cancel("a")
+        self.wheel.schedule("b", 105.0)
+        assert self.wheel.advance(104.0) == []
+        assert self.wheel.advance(105.0) == ["b"]
+
+    def test_advance_reads_the_clock(self) -> None:
+        """Test that the wheel advances to the time of its clock by default."""
+        self.wheel.schedule("a", 101.0)
+        self.clock.now = 101.0
+        assert self.wheel.advance() == ["a"]
+
+
+class TestRequests:
+    """Tests for the Requests model."""
+
+    def setup_method(self) -> None:
+        """Set up the tests."""
+        self.requests = Requests(
+            name="requests", skill_context=MagicMock(), request_timeout=10.0
+        )
+
+    def test_pop(self) -> None:
+        """Test that a request answered in time does not expire."""
+        callback = MagicMock()
+        timeout_callback = MagicMock()
+        request = self.requests.register(
+            "nonce", callback, timeout_callback=timeout_callback
+        )
+        assert self.requests.next_deadline == request.deadline
+        assert self.requests.pop_callback("nonce") is callback
+        assert self.requests.pop("nonce") is None
+        assert self.requests.next_deadline is None
+        assert self.requests.expire(request.deadline + 1.0) == []
+        timeout_callback.assert_not_called()
+
+    def test_expire(self) -> None:
+        """Test that an expired request calls its timeout callback and ends its dialogue."""
+        expired: List[PendingRequest] = []
+        dialogue = MagicMock()
+        dialogues = MagicMock()
+        late = self.requests.register(
+            "late",
+            MagicMock(),
+            timeout=1.0,
+            timeout_callback=expired.append,
+            dialogue=dialogue,
+            dialogues=dialogues,
+        )
+        self.requests.register("pending", MagicMock())
+        assert self.requests.next_deadline == late.deadline
+
+        assert self.requests.expire(late.deadline + 1.0) == [late]
+        assert expired == [late]
+        dialogues.remove.assert_called_once_with(dialogue)
+        assert self.requests.pop("late") is None
+        assert list(self.requests.pending_requests) == ["pending"]
+
+    def test_expire_without_dialogue(self) -> None:
+        """Test that a request registered without its dialogue expires all the same."""
+        request = self.requests.register("nonce", MagicMock(), timeout=1.0)
+        assert self.requests.expire(request.deadline + 1.0) == [request]
+        assert self.requests.pending_requests == {}
+
+
+def get_reference_safe_tx_hash(
+    chain_id: int, safe_version: str, message: Dict[str, Any]
+) -> str:
+    """Get the hash of a Safe transaction, as an EIP-712 library computes it."""
+    version = Version(safe_version)
+    base_gas_name = "baseGas" if version >= Version("1.0.0") else "dataGas"
+    domain_types = [{"name": "verifyingContract", "type": "address"}]
+    domain: Dict[str, Any] = {"verifyingContract": SAFE_ADDRESS}
+    if version >= Version("1.3.0"):
+        domain_types.insert(0, {"name": "chainId", "type": "uint256"})
+        domain["chainId"] = chain_id
+    structured_data = {
+        "types": {
+            "EIP712Domain": domain_types,
+            "SafeTx": [
+                {"name": "to", "type": "address"},
+                {"name": "value", "type": "uint256"},
+                {"name": "data", "type": "bytes"},
+                {"name": "operation", "type": "uint8"},
+                {"name": "safeTxGas", "type": "uint256"},
+                {"name": base_gas_name, "type": "uint256"},
+                {"name": "gasPrice", "type": "uint256"},
+                {"name": "gasToken", "type": "address"},
+                {"name": "refundReceiver", "type": "address"},
+                {"name": "nonce", "type": "uint256"},
+            ],
+        },
+        "primaryType": "SafeTx",
+        "domain": domain,
+        "message": {
+            base_gas_name if key == "baseGas" else key: value
+            for key, value in message.items()
+        },
+    }
+    return keccak(
+        b"\x19\x01" + hash_domain(structured_data) + hash_message(structured_data)
+    ).hex()
+
+
+class TestSafeTxHasher:
+    """Tests for the SafeTxHasher model."""
+
+    def setup_method(self) -> None:
+        """Set up the tests."""
+        self.hasher = SafeTxHasher(name="safe_tx_hasher", skill_context=MagicMock())
+
+    def test_domain_must_be_set(self) -> None:
+        """Test that a hash cannot be computed before the domain is set."""
+        assert not self.hasher.is_ready
+        with pytest.raises(ValueError):
+            self.hasher.get_safe_tx_hash(TO_ADDRESS, 0, b"", 0)
+
+    @pytest.mark.parametrize("safe_version", ["1.3.0", "1.1.1", "0.1.0"])
+    def test_get_safe_tx_hash(self, safe_version: str) -> None:
+        """Test that the hash matches the EIP-712 hash of the Safe transaction."""
+        self.hasher.set_domain(4, SAFE_ADDRESS, safe_version)
+        assert self.hasher.is_ready
+        data = bytes.fromhex("a9059cbb") + bytes(range(64))
+        safe_tx_hash = self.hasher.get_safe_tx_hash(
+            TO_ADDRESS,
+            10 ** 18,
+            data,
+            7,
+            operation=1,
+            safe_tx_gas=50000,
+            base_gas=21000,
+            gas_price=3,
+            gas_token=GAS_TOKEN,
+            refund_receiver=REFUND_RECEIVER,
+        )
+        assert safe_tx_hash == get_reference_safe_tx_hash(
+            4,
+            safe_version,
+            {
+                "to": TO_ADDRESS,
+                "value": 10 ** 18,
+                "data": data,
+                "operation": 1,
+                "safeTxGas": 50000,
+                "baseGas": 21000,
+                "gasPrice": 3,
+                "gasToken": GAS_TOKEN,
+                "refundReceiver": REFUND_RECEIVER,
+                "nonce": 7,
+            },
+        )
+
+    def test_hex_data(self) -> None:
+        """Test that hex encoded data hashes like the bytes it encodes."""
+        self.hasher.set_domain(1, SAFE_ADDRESS, "1.3.0")
+        data = bytes.fromhex("deadbeef")
+        assert self.hasher.get_safe_tx_hash(
+            TO_ADDRESS, 0, "0x" + data.hex(), 1
+        ) == self.hasher.get_safe_tx_hash(TO_ADDRESS, 0, data, 1)
+
+    def test_chain_id_only_in_newer_domains(self) -> None:
+        """Test that the chain id only changes the hash from version 1.3.0 on."""
+        hashes = {}
+        for safe_version in ("1.3.0", "1.1.1"):
+            for chain_id in (1, 4):
+                self.hasher.set_domain(chain_id, SAFE_ADDRESS, safe_version)
+                hashes[(safe_version, chain_id)] = self.hasher.get_safe_tx_hash(
+                    TO_ADDRESS, 0, b"", 0
+                )
+        assert hashes[("1.3.0", 1)] != hashes[("1.3.0", 4)]
+        assert hashes[("1.1.1", 1)] == hashes[("1.1.1", 4)]
+
+
+class TestNonceManager:
+    """Tests for the NonceManager model."""
+
+    def setup_method(self) -> None:
+        """Set up the tests."""
+        self.clock = FakeClock(0.0)
+        self.manager = NonceManager(
+            name="nonce_manager", skill_context=MagicMock(), resync_interval=60.0
+        )
+        self.manager._clock = self.clock  # pylint: disable=protected-access
+
+    def test_reserve_before_sync(self) -> None:
+        """Test that nonces cannot be reserved before they are synced."""
+        assert self.manager.needs_sync
+        with pytest.raises(ValueError):
+            self.manager.reserve()
+
+    def test_reserve(self) -> None:
+        """Test that consecutive reservations get consecutive nonces."""
+        assert self.manager.sync(10, 3)
+        assert not self.manager.needs_sync
+        assert self.manager.reserve() == (10, 3)
+        assert self.manager.reserve() == (11, 4)
+        assert self.manager.reserved == {(10, 3), (11, 4)}
+        self.manager.confirm((10, 3))
+        assert self.manager.reserved == {(11, 4)}
+        assert self.manager.reserve() == (12, 5)
+
+    def test_release_fills_the_gap(self) -> None:
+        """Test that released nonces are handed out again first, lowest first."""
+        self.manager.sync(10, 3)
+        first, second, third = (self.manager.reserve() for _ in range(3))
+        self.manager.release(third)
+        self.manager.release(first)
+        assert self.manager.is_stale(second)
+        assert self.manager.reserve() == first
+        assert not self.manager.is_stale(second)
+        assert self.manager.reserve() == third
+        assert self.manager.reserve() == (13, 6)
+
+    def test_release_unknown(self) -> None:
+        """Test that releasing a pair which is not reserved has no effect."""
+        self.manager.sync(10, 3)
+        nonces = self.manager.reserve()
+        self.manager.confirm(nonces)
+        self.manager.release(nonces)
+        assert self.manager.reserve() == (11, 4)
+
+    def test_invalidate(self) -> None:
+        """Test that invalidating a pair requires a sync before the next reservation."""
+        self.manager.sync(10, 3)
+        first = self.manager.reserve()
+        second = self.manager.reserve()
+        self.manager.invalidate(first)
+        assert self.manager.needs_sync
+        assert self.manager.is_stale(second)
+        with pytest.raises(ValueError):
+            self.manager.reserve()
+
+        # the chain cannot be trusted while a reservation is outstanding
+        assert not self.manager.can_sync
+        assert not self.manager.sync(11, 4)
+        self.manager.release(second)
+        assert self.manager.sync(11, 4)
+        assert self.manager.reserve() == (11, 4)
+
+    def test_resync_when_idle(self) -> None:
+        """Test that the nonces are read again after an idle resync interval."""
+        self.manager.sync(10, 3)
+        nonces = self.manager.reserve()
+        self.clock.now = 120.0
+        assert not self.manager.needs_sync
+        self.manager.confirm(nonces)
+        assert self.manager.needs_sync
+        assert self.manager.sync(12, 3)
+        assert not self.manager.needs_sync
+        assert self.manager.reserve() == (12, 3)
+
+    def test_restore(self) -> None:
+        """Test that a pair restored after a restart blocks the sync."""
+        self.manager.restore((10, 3))
+        assert not self.manager.can_sync
+        self.manager.confirm((10, 3))
+        assert self.manager.sync(11, 4)